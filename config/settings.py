@@ -116,6 +116,18 @@ else:
         }
     }
 
+# Cache shared by gunicorn workers and the Prefect/management processes
+# that rewrite match data (see matching/match_cache.py). The table is
+# created by `manage.py createcachetable` in the release step.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+    }
+    if DATABASE_URL
+    else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -10,6 +10,7 @@ Usage:
     python3 manage.py poll_gmail_inbox --daemon     # Loop every 15 min
     python3 manage.py poll_gmail_inbox --analyze    # Run AI analysis after polling
     python3 manage.py poll_gmail_inbox --max-results 200
+    python3 manage.py poll_gmail_inbox --batched    # Batch fetch, bulk insert, page through all unread
 """
 
 import time
@@ -30,6 +31,9 @@ class Command(BaseCommand):
                             help='Run AI analysis on newly received emails')
         parser.add_argument('--max-results', type=int, default=100,
                             help='Max messages to fetch per run (default: 100)')
+        parser.add_argument('--batched', action='store_true',
+                            help='Use the batched poller (max-results becomes the page size '
+                                 'and all unread pages are processed)')
         parser.add_argument('--analyze-batch', type=int, default=50,
                             help='Max emails to analyze per run (default: 50)')
 
@@ -38,6 +42,7 @@ class Command(BaseCommand):
         run_analysis = options['analyze']
         max_results = options['max_results']
         analyze_batch = options['analyze_batch']
+        self.batched = options['batched']
 
         if daemon:
             self.stdout.write('Starting Gmail monitor daemon (polling every 15 min)...')
@@ -49,10 +54,13 @@ class Command(BaseCommand):
             self._run_once(run_analysis, max_results, analyze_batch)
 
     def _run_once(self, run_analysis: bool, max_results: int, analyze_batch: int):
-        from email_monitor.services.gmail_poller import poll_inbox
+        from email_monitor.services.gmail_poller import poll_inbox, poll_inbox_batched
 
         self.stdout.write('Polling Gmail monitor inbox...')
-        stats = poll_inbox(max_results=max_results)
+        if self.batched:
+            stats = poll_inbox_batched(page_size=max_results)
+        else:
+            stats = poll_inbox(max_results=max_results)
         self.stdout.write(
             self.style.SUCCESS(
                 f'  Processed: {stats["processed"]}, '
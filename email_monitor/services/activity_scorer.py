@@ -56,83 +56,204 @@ def compute_promotion_willingness_score(
     return 0.1  # mails but never promotes — still signals an active list
 
 
-def build_promotion_network(profile_id: str, month: date) -> dict:
-    """
-    Build the promotion_network JSON for a profile from the past 90 days of AI analyses.
-
-    Returns a dict matching the SupabaseProfile.promotion_network schema.
-    """
-    from email_monitor.models import InboundEmail, MonitoredSubscription
-    from django.db.models import Q
-
-    ninety_days_ago = month - timedelta(days=90)
-
-    subscriptions = MonitoredSubscription.objects.filter(profile_id=profile_id)
-    emails = InboundEmail.objects.filter(
-        subscription__in=subscriptions,
-        received_at__date__gte=ninety_days_ago,
-        analyzed_at__isnull=False,
-        analysis__isnull=False,
-    )
+class _PromotionNetworkAccumulator:
+    """Aggregates analysed emails into a promotion_network dict with hash-map lookups."""
 
-    # Aggregate promoted partners across all emails
-    partner_counts: dict[str, dict] = {}
-    own_offers: list[dict] = []
-    promotion_style_counts: dict[str, int] = {}
+    def __init__(self):
+        self.partner_counts: dict[str, dict] = {}
+        self.own_offers: dict[str, dict] = {}   # lowercased name -> offer (insertion-ordered)
+        self.promotion_style_counts: dict[str, int] = {}
+        self.total_emails = 0
 
-    for email_record in emails:
-        analysis = email_record.analysis or {}
+    def add(self, analysis: dict, received_at) -> None:
+        analysis = analysis or {}
+        self.total_emails += 1
+        seen_on = received_at.date().isoformat()
 
         # Count promoted partners
         for partner in analysis.get('promoted_partners', []):
             key = (partner.get('name', '') or '').lower().strip()
             if not key:
                 continue
-            if key not in partner_counts:
-                partner_counts[key] = {
+            entry = self.partner_counts.get(key)
+            if entry is None:
+                entry = self.partner_counts[key] = {
                     'name': partner.get('name', ''),
                     'domain': _extract_domain(partner.get('website_or_url', '')),
                     'product_type': partner.get('product_type', ''),
                     'niche': partner.get('niche', ''),
                     'count': 0,
-                    'first_seen': email_record.received_at.date().isoformat(),
-                    'last_seen': email_record.received_at.date().isoformat(),
+                    'first_seen': seen_on,
+                    'last_seen': seen_on,
                 }
-            partner_counts[key]['count'] += 1
-            partner_counts[key]['last_seen'] = email_record.received_at.date().isoformat()
+            entry['count'] += 1
+            entry['last_seen'] = seen_on
 
         # Own offers (deduplicated by name)
         for offer in analysis.get('own_products_mentioned', []):
             offer_name = (offer.get('name', '') or '').lower()
-            if offer_name and not any(o['name'].lower() == offer_name for o in own_offers):
-                own_offers.append({
+            if offer_name and offer_name not in self.own_offers:
+                self.own_offers[offer_name] = {
                     'name': offer.get('name', ''),
                     'type': offer.get('type', ''),
                     'price_signal': offer.get('price_signal', ''),
-                })
+                }
 
         # Promotion style counts
         style = analysis.get('promotion_style', '')
         if style and style != 'none':
-            promotion_style_counts[style] = promotion_style_counts.get(style, 0) + 1
+            self.promotion_style_counts[style] = self.promotion_style_counts.get(style, 0) + 1
+
+    def to_network(self) -> dict:
+        promoted_partners = sorted(self.partner_counts.values(), key=lambda x: -x['count'])
+        styles = self.promotion_style_counts
+        peak_style = max(styles, key=styles.get) if styles else ''
+
+        # Compute avg emails/week for cadence
+        weeks = max(1, 90 / 7)
+        avg_per_week = self.total_emails / weeks
+
+        return {
+            'promoted_partners': promoted_partners,
+            'own_offers': list(self.own_offers.values()),
+            'promotion_cadence': {
+                'avg_per_week': round(avg_per_week, 2),
+                'style': peak_style,
+            },
+            'total_partner_promotions': sum(p['count'] for p in promoted_partners),
+            'unique_partners': len(promoted_partners),
+        }
+
+
+def build_promotion_network(profile_id: str, month: date) -> dict:
+    """
+    Build the promotion_network JSON for a profile from the past 90 days of AI analyses.
 
-    promoted_partners = sorted(partner_counts.values(), key=lambda x: -x['count'])
-    peak_style = max(promotion_style_counts, key=promotion_style_counts.get) if promotion_style_counts else ''
+    Returns a dict matching the SupabaseProfile.promotion_network schema.
+    """
+    from email_monitor.models import InboundEmail
+
+    ninety_days_ago = month - timedelta(days=90)
+
+    rows = InboundEmail.objects.filter(
+        subscription__profile_id=profile_id,
+        received_at__date__gte=ninety_days_ago,
+        analyzed_at__isnull=False,
+        analysis__isnull=False,
+    ).order_by('received_at').values_list('analysis', 'received_at')
+
+    acc = _PromotionNetworkAccumulator()
+    for analysis, received_at in rows.iterator(chunk_size=2000):
+        acc.add(analysis, received_at)
+    return acc.to_network()
+
+
+def compute_activity_batch(
+    month: date,
+    profile_ids: Optional[list] = None,
+    today: Optional[date] = None,
+) -> dict[str, dict]:
+    """
+    Compute the monthly email-activity inputs for every monitored profile in one scan.
+
+    Streams (profile_id, analysis, analyzed_at, received_at) for all emails in
+    the widest window needed (90-day network, prior-month dormancy check,
+    30-day stats) ordered by profile, and aggregates each profile with hash
+    maps. Bodies are never loaded.
+
+    Returns {profile_id: {total_30d, was_active_prior, promotional, own_product,
+    content_only, partner_promos_30d, partners_promoted, promotion_types,
+    has_own_products, network}}. Profiles in profile_ids with no emails get
+    zeroed stats so callers can still write their scores.
+    """
+    from itertools import groupby
+
+    from email_monitor.models import InboundEmail
 
-    # Compute avg emails/week for cadence
-    total_emails = emails.count()
-    weeks = max(1, 90 / 7)
-    avg_per_week = total_emails / weeks
+    today = today or date.today()
+    thirty_days_ago = today - timedelta(days=30)
+    ninety_days_ago = month - timedelta(days=90)
+    prior_month_start = month - timedelta(days=60)
+    prior_month_end = month - timedelta(days=31)
+    window_start = min(thirty_days_ago, ninety_days_ago, prior_month_start)
+
+    qs = InboundEmail.objects.filter(received_at__date__gte=window_start)
+    if profile_ids is not None:
+        qs = qs.filter(subscription__profile_id__in=profile_ids)
+    rows = qs.order_by('subscription__profile_id', 'received_at').values_list(
+        'subscription__profile_id', 'analysis', 'analyzed_at', 'received_at',
+    )
+
+    results: dict[str, dict] = {}
+    for profile_id, group in groupby(rows.iterator(chunk_size=2000), key=lambda r: r[0]):
+        stats = _empty_activity()
+        network = _PromotionNetworkAccumulator()
+        partners: dict[str, dict] = {}
+
+        for _, analysis, analyzed_at, received_at in group:
+            received_on = received_at.date()
+            if prior_month_start <= received_on < prior_month_end:
+                stats['was_active_prior'] = True
+            if analyzed_at is not None and analysis is not None and received_on >= ninety_days_ago:
+                network.add(analysis, received_at)
+            if received_on < thirty_days_ago:
+                continue
+
+            stats['total_30d'] += 1
+            if analyzed_at is None:
+                continue
 
+            # Count email types from analysis field
+            analysis = analysis or {}
+            etype = analysis.get('email_type', 'content')
+            if etype == 'partner_promotion' or analysis.get('is_promoting_partner'):
+                stats['promotional'] += 1
+                stats['partner_promos_30d'] += 1
+                for partner in analysis.get('promoted_partners', []):
+                    pname = (partner.get('name', '') or '').strip()
+                    if not pname:
+                        continue
+                    if pname not in partners:
+                        partners[pname] = {
+                            'name': pname,
+                            'url': partner.get('website_or_url', ''),
+                            'count': 0,
+                            'affiliate_detected': partner.get('affiliate_link_detected', False),
+                        }
+                    partners[pname]['count'] += 1
+                    ptype = partner.get('product_type', '')
+                    if ptype:
+                        stats['promotion_types'][ptype] = stats['promotion_types'].get(ptype, 0) + 1
+            elif etype == 'own_promotion':
+                stats['own_product'] += 1
+                stats['has_own_products'] = True
+            else:
+                stats['content_only'] += 1
+
+            if analysis.get('own_products_mentioned'):
+                stats['has_own_products'] = True
+
+        stats['partners_promoted'] = list(partners.values())
+        stats['network'] = network.to_network()
+        results[str(profile_id)] = stats
+
+    for profile_id in profile_ids or []:
+        results.setdefault(str(profile_id), _empty_activity())
+    return results
+
+
+def _empty_activity() -> dict:
     return {
-        'promoted_partners': promoted_partners,
-        'own_offers': own_offers,
-        'promotion_cadence': {
-            'avg_per_week': round(avg_per_week, 2),
-            'style': peak_style,
-        },
-        'total_partner_promotions': sum(p['count'] for p in promoted_partners),
-        'unique_partners': len(promoted_partners),
+        'total_30d': 0,
+        'was_active_prior': False,
+        'promotional': 0,
+        'own_product': 0,
+        'content_only': 0,
+        'partner_promos_30d': 0,
+        'partners_promoted': [],
+        'promotion_types': {},
+        'has_own_products': False,
+        'network': _PromotionNetworkAccumulator().to_network(),
     }
 
 
@@ -6,13 +6,21 @@ what products, promotion style, audience signals, and JV readiness indicators.
 
 Pre-filters on link_extractor output to skip AI when affiliate content is
 already confirmed (saves ~30% of AI calls).
+
+batch_analyze_emails() fingerprints each email (64-bit SimHash over body
+word shingles plus normalised link targets) so re-sends, multi-list
+broadcasts and the same promo landing on several monitor addresses are
+analysed once and the result is reused for every near-duplicate.
 """
 
+import hashlib
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +90,105 @@ def _has_confirmed_affiliate(links: list[dict]) -> bool:
     return False
 
 
+def _email_plain_text(body_text: str, body_html: str) -> str:
+    """Use HTML body stripped of tags if available, else plain text."""
+    if body_html:
+        try:
+            from bs4 import BeautifulSoup
+            return BeautifulSoup(body_html, 'html.parser').get_text(separator=' ', strip=True)
+        except Exception:
+            return body_text or ''
+    return body_text or ''
+
+
+# =============================================================================
+# NEAR-DUPLICATE FINGERPRINTING
+# =============================================================================
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4              # 4 x 16-bit bands: any pair within 3 bits shares a band
+NEAR_DUPLICATE_DISTANCE = 3
+
+_TOKEN_RE = re.compile(r'[a-z][a-z0-9\']+')
+
+
+def _fingerprint_features(body: str, links: list[dict]) -> list[str]:
+    """
+    Features for the SimHash: word 3-shingles of the body plus link targets.
+
+    Numbers are dropped (dates, counters, tracking ids) and links are reduced
+    to host + path so per-recipient query strings don't split duplicates.
+    """
+    words = _TOKEN_RE.findall(body.lower())
+    features = [' '.join(words[i:i + 3]) for i in range(max(1, len(words) - 2))] if words else []
+    for link in links or []:
+        url = link.get('url', '') if isinstance(link, dict) else str(link)
+        parsed = urlparse(url)
+        if parsed.netloc:
+            host = parsed.netloc.lower().removeprefix('www.')
+            features.append(f'link:{host}{parsed.path.rstrip("/")}')
+    return features
+
+
+def simhash(features: list[str]) -> int:
+    """64-bit SimHash of a feature list (each feature weighted equally)."""
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value
+
+
+def email_fingerprint(body_text: str, body_html: str, links_extracted: list[dict]) -> Optional[int]:
+    """SimHash fingerprint for an email, or None when there is nothing to hash."""
+    features = _fingerprint_features(_email_plain_text(body_text, body_html), links_extracted)
+    return simhash(features) if features else None
+
+
+def group_near_duplicates(
+    fingerprints: dict[int, Optional[int]],
+    max_distance: int = NEAR_DUPLICATE_DISTANCE,
+) -> dict[int, int]:
+    """
+    Map every id to the id of its group representative.
+
+    Candidates are found through banded buckets (pigeonhole on 16-bit bands)
+    so grouping stays near-linear rather than comparing every pair. Ids with
+    no fingerprint are their own representative.
+    """
+    band_width = SIMHASH_BITS // SIMHASH_BANDS
+    mask = (1 << band_width) - 1
+    buckets: dict[tuple[int, int], list[int]] = {}
+    representative: dict[int, int] = {}
+
+    for item_id, fp in fingerprints.items():
+        if fp is None:
+            representative[item_id] = item_id
+            continue
+        bands = [(b, (fp >> (b * band_width)) & mask) for b in range(SIMHASH_BANDS)]
+        match = None
+        for band in bands:
+            for rep_id in buckets.get(band, ()):
+                if bin(fp ^ fingerprints[rep_id]).count('1') <= max_distance:
+                    match = rep_id
+                    break
+            if match is not None:
+                break
+        if match is not None:
+            representative[item_id] = match
+            continue
+        representative[item_id] = item_id
+        for band in bands:
+            buckets.setdefault(band, []).append(item_id)
+
+    return representative
+
+
 def analyze_email(
     subject: str,
     from_name: str,
@@ -95,15 +202,7 @@ def analyze_email(
     Returns the analysis dict or None on failure.
     Skips AI if link_extractor already flagged known affiliate domains.
     """
-    # Use HTML body stripped of tags if available, else plain text
-    if body_html:
-        try:
-            from bs4 import BeautifulSoup
-            body = BeautifulSoup(body_html, 'html.parser').get_text(separator=' ', strip=True)
-        except Exception:
-            body = body_text
-    else:
-        body = body_text
+    body = _email_plain_text(body_text, body_html)
 
     if not body.strip():
         logger.debug('Empty body — skipping AI analysis')
@@ -142,33 +241,73 @@ def analyze_email(
         return None
 
 
-def batch_analyze_emails(email_ids: list[int]) -> dict[int, Optional[dict]]:
+def batch_analyze_emails(
+    email_ids: list[int],
+    max_workers: int = 4,
+    max_distance: int = NEAR_DUPLICATE_DISTANCE,
+) -> dict[int, Optional[dict]]:
     """
     Analyze a batch of InboundEmail records by ID.
 
-    Updates each record with its analysis result and analyzed_at timestamp.
+    Near-duplicate emails (SimHash within max_distance bits) from the same
+    sender share a single AI call, across all monitor addresses that
+    received them. Grouping never crosses senders: an owner and their
+    affiliates mailing identical swipe copy are classified separately,
+    since from_name decides own vs partner promotion. Unique
+    emails are analysed with up to max_workers concurrent
+    calls. All records are then written with one bulk_update, setting
+    analysis and analyzed_at (None when analysis failed).
     Returns a dict mapping email_id → analysis result.
     """
     from email_monitor.models import InboundEmail
     from django.utils import timezone as tz
 
-    results: dict[int, Optional[dict]] = {}
-    emails = InboundEmail.objects.filter(
-        pk__in=email_ids, analyzed_at__isnull=True
-    ).select_related('subscription')
+    emails = {
+        e.pk: e for e in InboundEmail.objects.filter(
+            pk__in=email_ids, analyzed_at__isnull=True
+        ).only(
+            'id', 'subject', 'from_address', 'from_name',
+            'body_text', 'body_html', 'links_extracted',
+        )
+    }
+    if not emails:
+        return {}
+
+    by_sender: dict[tuple, dict[int, Optional[int]]] = {}
+    for pk, e in emails.items():
+        sender = ((e.from_address or '').lower(), e.from_name or '')
+        by_sender.setdefault(sender, {})[pk] = email_fingerprint(
+            e.body_text, e.body_html, e.links_extracted or [],
+        )
+    representative: dict[int, int] = {}
+    for fingerprints in by_sender.values():
+        representative.update(group_near_duplicates(fingerprints, max_distance=max_distance))
+    unique_ids = sorted(set(representative.values()))
+    logger.info(
+        'Analyzing %d emails: %d unique after near-duplicate grouping',
+        len(emails), len(unique_ids),
+    )
 
-    for inbound in emails:
-        analysis = analyze_email(
+    def _analyze(pk: int) -> Optional[dict]:
+        inbound = emails[pk]
+        return analyze_email(
             subject=inbound.subject,
             from_name=inbound.from_name,
             body_text=inbound.body_text,
             body_html=inbound.body_html,
             links_extracted=inbound.links_extracted or [],
         )
-        InboundEmail.objects.filter(pk=inbound.pk).update(
-            analysis=analysis,
-            analyzed_at=tz.now() if analysis else None,
-        )
-        results[inbound.pk] = analysis
 
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        unique_results = dict(zip(unique_ids, pool.map(_analyze, unique_ids)))
+
+    now = tz.now()
+    results: dict[int, Optional[dict]] = {}
+    for pk, inbound in emails.items():
+        analysis = unique_results[representative[pk]]
+        inbound.analysis = analysis
+        inbound.analyzed_at = now if analysis else None
+        results[pk] = analysis
+
+    InboundEmail.objects.bulk_update(list(emails.values()), ['analysis', 'analyzed_at'], batch_size=500)
     return results
@@ -7,6 +7,11 @@ with how the outreach app refreshes tokens in email_service.py.
 Fetches unread messages, links them to MonitoredSubscription via +addressing
 on the To: header, creates InboundEmail records, and auto-confirms double
 opt-in confirmation emails.
+
+poll_inbox() handles one message at a time. poll_inbox_batched() pages
+through all unread messages, fetches them via the Gmail batch endpoint,
+dedups/creates InboundEmail rows in bulk and marks them read with a single
+batchModify call per page.
 """
 
 import base64
@@ -24,6 +29,9 @@ from django.conf import settings
 logger = logging.getLogger(__name__)
 
 GMAIL_API = 'https://gmail.googleapis.com/gmail/v1'
+GMAIL_BATCH_URL = 'https://gmail.googleapis.com/batch/gmail/v1'
+BATCH_GET_SIZE = 50          # Gmail recommends <= 50 calls per batch request
+BATCH_MODIFY_SIZE = 1000     # batchModify accepts up to 1000 ids
 TOKEN_URI = 'https://oauth2.googleapis.com/token'
 
 CONFIRMATION_SENDERS = re.compile(
@@ -161,6 +169,39 @@ def _click_confirmation_link(url: str) -> bool:
         return False
 
 
+def _parse_message(msg: dict) -> dict:
+    """Pull the headers, bodies and received_at the poller needs out of a full-format message."""
+    headers = msg.get('payload', {}).get('headers', [])
+    date_str = _extract_header(headers, 'Date')
+    try:
+        received_at = email_lib.utils.parsedate_to_datetime(date_str)
+        if received_at.tzinfo is None:
+            received_at = received_at.replace(tzinfo=timezone.utc)
+    except Exception:
+        received_at = datetime.now(timezone.utc)
+
+    body_text, body_html = _extract_body(msg)
+    return {
+        'to_addr': _extract_header(headers, 'To'),
+        'from_addr': _extract_header(headers, 'From'),
+        'subject': _extract_header(headers, 'Subject'),
+        'received_at': received_at,
+        'body_text': body_text,
+        'body_html': body_html,
+    }
+
+
+def _split_from(from_addr: str) -> tuple[str, str]:
+    """Parse "Name <email>" into (from_name, from_email)."""
+    from_name = ''
+    name_match = re.match(r'^"?(.+?)"?\s*<', from_addr)
+    if name_match:
+        from_name = name_match.group(1).strip('"\'')
+    raw_from = re.search(r'<(.+?)>', from_addr)
+    from_email = raw_from.group(1) if raw_from else from_addr
+    return from_name, from_email
+
+
 def poll_inbox(max_results: int = 100) -> dict:
     """
     Poll the monitor Gmail inbox for unread messages.
@@ -192,19 +233,11 @@ def poll_inbox(max_results: int = 100) -> dict:
         msg_id = msg_ref['id']
         try:
             msg = _gmail_get(f'/users/me/messages/{msg_id}', {'format': 'full'})
-            headers = msg.get('payload', {}).get('headers', [])
-            to_addr = _extract_header(headers, 'To')
-            from_addr = _extract_header(headers, 'From')
-            subject = _extract_header(headers, 'Subject')
-            date_str = _extract_header(headers, 'Date')
-
-            # Parse received_at
-            try:
-                received_at = email_lib.utils.parsedate_to_datetime(date_str)
-                if received_at.tzinfo is None:
-                    received_at = received_at.replace(tzinfo=timezone.utc)
-            except Exception:
-                received_at = datetime.now(timezone.utc)
+            parsed = _parse_message(msg)
+            to_addr = parsed['to_addr']
+            from_addr = parsed['from_addr']
+            subject = parsed['subject']
+            received_at = parsed['received_at']
 
             uuid_prefix = _extract_uuid_prefix(to_addr)
             subscription = None
@@ -213,7 +246,7 @@ def poll_inbox(max_results: int = 100) -> dict:
                     monitor_address__icontains=f'+{uuid_prefix}@'
                 ).first()
 
-            body_text, body_html = _extract_body(msg)
+            body_text, body_html = parsed['body_text'], parsed['body_html']
 
             # Handle confirmation emails (auto-click to activate)
             if _is_confirmation_email(from_addr, subject):
@@ -243,13 +276,7 @@ def poll_inbox(max_results: int = 100) -> dict:
 
             links = extract_links(body_html or body_text)
 
-            # Parse "Name <email>" format
-            from_name = ''
-            name_match = re.match(r'^"?(.+?)"?\s*<', from_addr)
-            if name_match:
-                from_name = name_match.group(1).strip('"\'')
-            raw_from = re.search(r'<(.+?)>', from_addr)
-            from_email = raw_from.group(1) if raw_from else from_addr
+            from_name, from_email = _split_from(from_addr)
 
             InboundEmail.objects.create(
                 subscription=subscription,
@@ -274,9 +301,16 @@ def poll_inbox(max_results: int = 100) -> dict:
             logger.exception('Error processing message %s: %s', msg_id, exc)
             stats['errors'] += 1
 
-    # Auto-fail subscriptions stuck in pending_confirm for >48h
+    _fail_stale_pending()
+    return stats
+
+
+def _fail_stale_pending() -> None:
+    """Auto-fail subscriptions stuck in pending_confirm for >48h."""
     from django.utils import timezone as tz
     from datetime import timedelta
+    from email_monitor.models import MonitoredSubscription
+
     stale = MonitoredSubscription.objects.filter(
         status='pending_confirm',
         subscribed_at__lt=tz.now() - timedelta(hours=48),
@@ -284,6 +318,251 @@ def poll_inbox(max_results: int = 100) -> dict:
     if stale:
         logger.info('Auto-failed %d stale pending_confirm subscriptions', stale)
 
+
+# =============================================================================
+# BATCHED POLLING
+# =============================================================================
+
+def _list_unread_ids(page_size: int = 100, max_messages: Optional[int] = None):
+    """Yield pages of unread message ids, following nextPageToken."""
+    page_token = None
+    seen = 0
+    while True:
+        params = {'q': 'is:unread', 'maxResults': page_size}
+        if page_token:
+            params['pageToken'] = page_token
+        result = _gmail_get('/users/me/messages', params)
+        ids = [m['id'] for m in result.get('messages', [])]
+        if max_messages is not None:
+            ids = ids[:max_messages - seen]
+        if ids:
+            seen += len(ids)
+            yield ids
+        page_token = result.get('nextPageToken')
+        if not page_token or (max_messages is not None and seen >= max_messages):
+            return
+
+
+def _build_batch_body(msg_ids: list[str], boundary: str) -> str:
+    parts = []
+    for msg_id in msg_ids:
+        parts.append(
+            f'--{boundary}\r\n'
+            'Content-Type: application/http\r\n'
+            f'Content-ID: <msg-{msg_id}>\r\n\r\n'
+            f'GET /gmail/v1/users/me/messages/{msg_id}?format=full\r\n\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n')
+    return ''.join(parts)
+
+
+def _parse_batch_response(content_type: str, body: str) -> dict[str, tuple[int, dict]]:
+    """Parse a multipart/mixed batch response into {msg_id: (status, json)}."""
+    boundary_match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not boundary_match:
+        return {}
+    results = {}
+    for part in body.split(f'--{boundary_match.group(1)}'):
+        id_match = re.search(r'Content-ID:\s*<response-msg-([^>]+)>', part, re.IGNORECASE)
+        status_match = re.search(r'HTTP/1\.1 (\d{3})', part)
+        if not (id_match and status_match):
+            continue
+        inner = re.split(r'\r?\n\r?\n', part[status_match.start():], maxsplit=1)
+        try:
+            payload = json.loads(inner[1]) if len(inner) > 1 and inner[1].strip() else {}
+        except ValueError:
+            payload = {}
+        results[id_match.group(1)] = (int(status_match.group(1)), payload)
+    return results
+
+
+def _gmail_batch_get(msg_ids: list[str]) -> dict[str, dict]:
+    """
+    Fetch full-format messages through the Gmail batch endpoint.
+
+    Returns {msg_id: message}. Ids whose sub-response failed (or that were
+    missing from the batch response) are retried with a plain GET.
+    """
+    messages: dict[str, dict] = {}
+    for i in range(0, len(msg_ids), BATCH_GET_SIZE):
+        chunk = msg_ids[i:i + BATCH_GET_SIZE]
+        boundary = f'batch_{int(time.time() * 1000)}_{i}'
+        try:
+            token = _get_access_token()
+            resp = requests.post(
+                GMAIL_BATCH_URL,
+                headers={
+                    'Authorization': f'Bearer {token}',
+                    'Content-Type': f'multipart/mixed; boundary={boundary}',
+                },
+                data=_build_batch_body(chunk, boundary).encode('utf-8'),
+                timeout=60,
+            )
+            resp.raise_for_status()
+            parsed = _parse_batch_response(resp.headers.get('Content-Type', ''), resp.text)
+        except Exception as exc:
+            logger.warning('Gmail batch get failed (%d ids): %s', len(chunk), exc)
+            parsed = {}
+
+        for msg_id in chunk:
+            status, payload = parsed.get(msg_id, (0, {}))
+            if status == 200:
+                messages[msg_id] = payload
+                continue
+            try:
+                messages[msg_id] = _gmail_get(f'/users/me/messages/{msg_id}', {'format': 'full'})
+            except Exception as exc:
+                logger.warning('Failed to fetch message %s: %s', msg_id, exc)
+    return messages
+
+
+def _batch_mark_read(msg_ids: list[str]) -> None:
+    """Remove UNREAD from many messages with batchModify."""
+    for i in range(0, len(msg_ids), BATCH_MODIFY_SIZE):
+        chunk = msg_ids[i:i + BATCH_MODIFY_SIZE]
+        try:
+            _gmail_post('/users/me/messages/batchModify',
+                        {'ids': chunk, 'removeLabelIds': ['UNREAD']})
+        except Exception as exc:
+            logger.debug('batchModify failed for %d messages: %s', len(chunk), exc)
+
+
+def _load_subscription_map() -> dict:
+    """Map monitor-address uuid prefix -> MonitoredSubscription in one query."""
+    from email_monitor.models import MonitoredSubscription
+
+    sub_map = {}
+    for sub in MonitoredSubscription.objects.only(
+        'id', 'monitor_address', 'total_emails_received', 'status',
+    ):
+        prefix = _extract_uuid_prefix(sub.monitor_address)
+        if prefix:
+            sub_map[prefix] = sub
+    return sub_map
+
+
+def poll_inbox_batched(page_size: int = 100, max_messages: Optional[int] = None) -> dict:
+    """
+    Batched variant of poll_inbox().
+
+    The unread id list for the run is collected up front, before anything
+    is marked read: marking messages read while following nextPageToken
+    shrinks the is:unread result set under the cursor and skips messages.
+    Then per page_size ids: one dedup query, one Gmail batch fetch for the
+    new ids, one bulk_create, one bulk_update of subscription counters and
+    one batchModify to mark everything read. Subscriptions are preloaded
+    once per run.
+
+    Returns summary: {processed, confirmed, skipped, errors}
+    """
+    from django.db import transaction
+    from django.db.models import F
+
+    from email_monitor.models import InboundEmail, MonitoredSubscription
+    from email_monitor.services.link_extractor import extract_links
+
+    if not all([settings.GMAIL_MONITOR_REFRESH_TOKEN,
+                settings.GMAIL_MONITOR_CLIENT_ID,
+                settings.GMAIL_MONITOR_CLIENT_SECRET]):
+        logger.error('Gmail Monitor credentials not configured.')
+        return {'processed': 0, 'confirmed': 0, 'skipped': 0, 'errors': 1}
+
+    stats = {'processed': 0, 'confirmed': 0, 'skipped': 0, 'errors': 0}
+    sub_map = _load_subscription_map()
+
+    try:
+        unread_ids = [
+            msg_id
+            for ids in _list_unread_ids(page_size=page_size, max_messages=max_messages)
+            for msg_id in ids
+        ]
+        for start in range(0, len(unread_ids), page_size):
+            page_ids = unread_ids[start:start + page_size]
+            logger.info('Processing page of %d unread messages', len(page_ids))
+
+            known = set(
+                InboundEmail.objects.filter(gmail_message_id__in=page_ids)
+                .values_list('gmail_message_id', flat=True)
+            )
+            stats['skipped'] += len(known)
+            to_fetch = [m for m in page_ids if m not in known]
+            fetched = _gmail_batch_get(to_fetch) if to_fetch else {}
+
+            new_emails = []
+            confirmed_sub_ids = set()
+            counters: dict[int, list] = {}   # sub pk -> [count, latest received_at]
+            done_ids = list(known)
+
+            for msg_id in to_fetch:
+                msg = fetched.get(msg_id)
+                if msg is None:
+                    stats['errors'] += 1
+                    continue
+                try:
+                    parsed = _parse_message(msg)
+                    prefix = _extract_uuid_prefix(parsed['to_addr'])
+                    subscription = sub_map.get(prefix) if prefix else None
+
+                    if _is_confirmation_email(parsed['from_addr'], parsed['subject']):
+                        confirm_link = _extract_confirmation_link(parsed['body_text'], parsed['body_html'])
+                        if confirm_link and _click_confirmation_link(confirm_link):
+                            if subscription:
+                                confirmed_sub_ids.add(subscription.pk)
+                            stats['confirmed'] += 1
+                            logger.info('Confirmed subscription via %s', confirm_link[:80])
+                        done_ids.append(msg_id)
+                        continue
+
+                    if subscription is None:
+                        logger.debug('No subscription for To: %s — skipping', parsed['to_addr'])
+                        stats['skipped'] += 1
+                        done_ids.append(msg_id)
+                        continue
+
+                    from_name, from_email = _split_from(parsed['from_addr'])
+                    new_emails.append(InboundEmail(
+                        subscription=subscription,
+                        gmail_message_id=msg_id,
+                        from_address=from_email,
+                        from_name=from_name,
+                        subject=parsed['subject'],
+                        received_at=parsed['received_at'],
+                        body_text=parsed['body_text'][:200_000],
+                        body_html=parsed['body_html'][:200_000],
+                        links_extracted=extract_links(parsed['body_html'] or parsed['body_text']),
+                    ))
+                    entry = counters.setdefault(subscription.pk, [0, parsed['received_at']])
+                    entry[0] += 1
+                    entry[1] = max(entry[1], parsed['received_at'])
+                    done_ids.append(msg_id)
+                except Exception as exc:
+                    logger.exception('Error processing message %s: %s', msg_id, exc)
+                    stats['errors'] += 1
+
+            with transaction.atomic():
+                if new_emails:
+                    InboundEmail.objects.bulk_create(new_emails, ignore_conflicts=True)
+                if confirmed_sub_ids:
+                    MonitoredSubscription.objects.filter(pk__in=confirmed_sub_ids).update(status='active')
+                if counters:
+                    subs = []
+                    for pk, (count, latest) in counters.items():
+                        sub = MonitoredSubscription(pk=pk)
+                        sub.last_email_received_at = latest
+                        sub.total_emails_received = F('total_emails_received') + count
+                        sub.status = 'active'
+                        subs.append(sub)
+                    MonitoredSubscription.objects.bulk_update(
+                        subs, ['last_email_received_at', 'total_emails_received', 'status'],
+                    )
+            stats['processed'] += len(new_emails)
+
+            _batch_mark_read(done_ids)
+    except Exception as exc:
+        logger.error('Batched Gmail poll failed: %s', exc)
+        stats['errors'] += 1
+
+    _fail_stale_pending()
     return stats
 
 
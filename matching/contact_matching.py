@@ -0,0 +1,217 @@
+"""
+Shared partner-matching engine for the contact → Member matching commands
+(match_linkedin_contacts_v2, match_instagram_coaches_v2).
+
+PartnerIndex preprocesses the Member profiles once: keyword sets, IDF-style
+keyword rarity, breadth multipliers and an inverted keyword → partner index.
+
+PartnerIndex.find_best() scores the partners that share a discriminative
+keyword with the contact, then visits the remaining partners in descending
+order of an upper bound on their score and stops as soon as no remaining
+partner can beat the best one found. The winner is the same partner a full
+linear scan would pick (ties still go to the earliest partner).
+
+Usage:
+    index = PartnerIndex(partners)
+    candidates = index.partners_with_keywords(contact_keywords)
+    best_pos, best_score = index.find_best(
+        candidates, score_fn, bound_key=("coach",), bound_fn=bound_fn,
+    )
+
+    for match in match_contacts(find_best_match, contacts, workers=4):
+        ...
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import re
+from collections import defaultdict
+from typing import Callable, Hashable, Iterable, Iterator, Optional
+
+WORD_RE = re.compile(r'\b\w+\b')
+
+
+def breadth_multiplier(niche_count: int) -> float:
+    """Specialists get boosted, generalists penalized.
+
+    1-3 niches = 1.1 (specialist bonus), 4-7 = 1.0, 8-12 = 0.75, 13+ = 0.6
+    """
+    if niche_count <= 3:
+        return 1.1  # Specialist bonus
+    if niche_count <= 7:
+        return 1.0  # Normal
+    if niche_count <= 12:
+        return 0.75  # Generalist penalty
+    return 0.6  # Heavy generalist penalty
+
+
+def keyword_rarity_for(doc_freq_ratio: float) -> float:
+    """IDF-style weight: keywords appearing in 50%+ of partners are "common"."""
+    if doc_freq_ratio > 0.5:
+        return 0.3  # Very common, low value
+    if doc_freq_ratio > 0.25:
+        return 0.6  # Common
+    if doc_freq_ratio > 0.1:
+        return 1.0  # Normal
+    return 1.5  # Rare, high value
+
+
+class PartnerIndex:
+    """Preprocessed partners plus the lookups used to prune scoring."""
+
+    def __init__(self, partners: Iterable):
+        self.partner_data: list[dict] = []
+        self.postings: dict[str, set[int]] = defaultdict(set)
+
+        for pos, p in enumerate(partners):
+            # Combine all text fields for keyword matching
+            all_text = ' '.join(filter(None, [
+                p.niche or '',
+                p.what_you_do or '',
+                p.who_you_serve or '',
+                p.offering or '',
+                p.seeking or '',
+                p.business_focus or '',
+            ])).lower()
+
+            keywords = set(WORD_RE.findall(all_text))
+            for kw in keywords:
+                self.postings[kw].add(pos)
+
+            # Count niches (comma-separated in niche field)
+            niche_text = p.niche or ''
+            niche_count = len([n.strip() for n in niche_text.split(',') if n.strip()])
+
+            self.partner_data.append({
+                'partner': p,
+                'niche': (p.niche or '').lower(),
+                'niche_count': niche_count,
+                'breadth_multiplier': breadth_multiplier(niche_count),
+                'offering': p.offering or p.what_you_do or '',
+                'serves': p.who_you_serve or '',
+                'all_text': all_text,
+                'keywords': keywords,
+                'list_size': p.list_size or 0,
+            })
+
+        total_partners = len(self.partner_data)
+        self.keyword_rarity: dict[str, float] = {
+            kw: keyword_rarity_for(len(positions) / total_partners)
+            for kw, positions in self.postings.items()
+        }
+
+        self._per_partner: dict[Hashable, list] = {}
+        self._substring_hits: dict[tuple[str, str], frozenset[int]] = {}
+        self._bound_orders: dict[Hashable, list[tuple[float, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.partner_data)
+
+    def partners_with_keywords(self, keywords: Iterable[str]) -> set[int]:
+        """Positions of partners whose keyword set contains any of keywords."""
+        found: set[int] = set()
+        for kw in keywords:
+            positions = self.postings.get(kw)
+            if positions:
+                found |= positions
+        return found
+
+    def partners_with_substring(self, field: str, term: str) -> frozenset[int]:
+        """Positions of partners whose lowercased ``field`` contains term (cached)."""
+        key = (field, term)
+        hits = self._substring_hits.get(key)
+        if hits is None:
+            hits = self._substring_hits[key] = frozenset(
+                pos for pos, pd in enumerate(self.partner_data)
+                if term in (pd[field] or '').lower()
+            )
+        return hits
+
+    def per_partner(self, key: Hashable, fn: Callable[[dict], object]) -> list:
+        """fn(partner_data) for every partner, computed once per key."""
+        values = self._per_partner.get(key)
+        if values is None:
+            values = self._per_partner[key] = [fn(pd) for pd in self.partner_data]
+        return values
+
+    def _bound_order(self, key: Hashable, bound_fn: Callable[[int], float]) -> list[tuple[float, int]]:
+        order = self._bound_orders.get(key)
+        if order is None:
+            order = sorted(
+                ((bound_fn(pos), pos) for pos in range(len(self.partner_data))),
+                key=lambda item: (-item[0], item[1]),
+            )
+            self._bound_orders[key] = order
+        return order
+
+    def find_best(
+        self,
+        candidates: set[int],
+        score_fn: Callable[[int], float],
+        bound_key: Hashable,
+        bound_fn: Callable[[int], float],
+    ) -> tuple[Optional[int], float]:
+        """Return (position, score) of the highest-scoring partner.
+
+        candidates: partners sharing a discriminative keyword; always scored.
+        bound_fn(pos): upper bound on score_fn(pos) for partners *outside*
+            candidates. It must depend only on bound_key, since the sorted
+            bound order is cached per key.
+        """
+        best_pos: Optional[int] = None
+        best_score = 0.0
+
+        for pos in sorted(candidates):
+            score = score_fn(pos)
+            if score > best_score:
+                best_pos, best_score = pos, score
+
+        for bound, pos in self._bound_order(bound_key, bound_fn):
+            if bound < best_score or (bound == best_score and pos > best_pos):
+                break  # nobody left can beat (or tie earlier than) the best
+            if pos in candidates:
+                continue
+            score = score_fn(pos)
+            if score > best_score or (score == best_score and pos < best_pos):
+                best_pos, best_score = pos, score
+
+        return best_pos, best_score
+
+
+# ---------- Process fan-out ----------
+
+_worker_fn: Optional[Callable[[dict], Optional[dict]]] = None
+
+
+def _call_worker(contact: dict) -> Optional[dict]:
+    return _worker_fn(contact)
+
+
+def match_contacts(
+    find_best_match: Callable[[dict], Optional[dict]],
+    contacts: list[dict],
+    workers: int = 1,
+    chunksize: int = 500,
+) -> Iterator[Optional[dict]]:
+    """Yield find_best_match(contact) for each contact, in input order.
+
+    With workers > 1 contacts are matched in forked worker processes, which
+    inherit the already-built PartnerIndex instead of re-pickling it.
+    """
+    global _worker_fn
+
+    if workers <= 1 or len(contacts) < 2 * chunksize:
+        yield from map(find_best_match, contacts)
+        return
+
+    # Forked children must not share the parent's DB sockets
+    from django.db import connections
+    connections.close_all()
+
+    _worker_fn = find_best_match
+    try:
+        with multiprocessing.get_context('fork').Pool(workers) as pool:
+            yield from pool.imap(_call_worker, contacts, chunksize=chunksize)
+    finally:
+        _worker_fn = None
@@ -12,19 +12,31 @@ Used by both:
 - scripts/import_apollo_csv.py (CSV import path)
 - scripts/run_apollo_sweep.py (API path)
 - scripts/automated_enrichment_pipeline_safe.py (cascade pipeline)
+
+Apollo answers are cached locally (ApolloResultCache) keyed by the
+normalized lookup (email / LinkedIn / name + domain + company), so repeat
+sweeps never spend credits re-matching the same person. enrich_many()
+coalesces identical lookups across profiles and pipelines bulk_match
+batches concurrently within the rate limit Apollo reports.
 """
 
+import hashlib
 import json
 import logging
 import os
 import re
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 
+from matching.enrichment.result_cache import SqliteTTLCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -188,6 +200,74 @@ def _derive_funding_stage(total_funding: int | None) -> str:
     return "profitable"
 
 
+# --- Result cache ---
+# Bump APOLLO_CACHE_VERSION if the lookup key or stored person shape changes.
+APOLLO_CACHE_VERSION = 1
+APOLLO_CACHE_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "scripts" / "enrichment_batches" / "apollo_cache" / "apollo_results.sqlite3"
+)
+APOLLO_CACHE_TTL_DAYS = float(os.environ.get('APOLLO_CACHE_TTL_DAYS', '90'))
+# "No match" answers expire sooner -- Apollo's database keeps growing
+APOLLO_CACHE_NO_MATCH_TTL_DAYS = float(os.environ.get('APOLLO_CACHE_NO_MATCH_TTL_DAYS', '14'))
+
+# Requests held back from the reported rate-limit budget when pipelining
+RATE_LIMIT_RESERVE = 10
+
+
+def _normalize_lookup_text(value) -> str:
+    return ' '.join(str(value or '').lower().split())
+
+
+def lookup_key(request: Dict) -> str:
+    """Cache / coalescing key for a people/match request (see build_request)."""
+    linkedin = _normalize_lookup_text(request.get('linkedin_url'))
+    linkedin = re.sub(r'^https?://(www\.)?', '', linkedin).rstrip('/')
+    normalized = {
+        'email': _normalize_lookup_text(request.get('email')),
+        'linkedin': linkedin,
+        'domain': _normalize_lookup_text(request.get('domain')).removeprefix('www.'),
+        'first_name': _normalize_lookup_text(request.get('first_name')),
+        'last_name': _normalize_lookup_text(request.get('last_name')),
+        'organization': _normalize_lookup_text(request.get('organization_name')),
+        'v': APOLLO_CACHE_VERSION,
+    }
+    raw = json.dumps(normalized, sort_keys=True)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ApolloResultCache(SqliteTTLCache):
+    """Persistent cache of Apollo person records (or "no match") by lookup key.
+
+    Raw person dicts are stored -- identity validation and field extraction
+    still run against each requesting profile. "No match" answers use the
+    shorter no_match_ttl_days. A TTL of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_days: float = APOLLO_CACHE_TTL_DAYS,
+        no_match_ttl_days: float = APOLLO_CACHE_NO_MATCH_TTL_DAYS,
+    ):
+        super().__init__(path or APOLLO_CACHE_PATH, 'apollo_results', ttl_days, name='Apollo')
+        self.no_match_ttl_seconds = no_match_ttl_days * 86400
+
+    def get(self, key: str) -> Tuple[bool, Optional[Dict]]:
+        """Return (hit, person); person is None for a cached "no match"."""
+        entry = self.lookup(key)
+        if entry is None:
+            return False, None
+        person, age = entry
+        ttl = self.ttl_seconds if person else self.no_match_ttl_seconds
+        if age > ttl:
+            return False, None
+        return True, person
+
+    def put(self, key: str, person: Optional[Dict]) -> None:
+        super().put(key, person or None)
+
+
 class ApolloEnrichmentService:
     """
     Apollo.io enrichment service that captures ALL returned data.
@@ -200,20 +280,43 @@ class ApolloEnrichmentService:
     MAX_BATCH_SIZE = 10
     SOURCE = APOLLO_SOURCE
 
-    def __init__(self, api_key: Optional[str] = None, webhook_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        cache: Optional[ApolloResultCache] = None,
+    ):
         self.api_key = api_key or os.environ.get('APOLLO_API_KEY', '')
         self.webhook_url = webhook_url
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.cache = cache if cache is not None else ApolloResultCache()
+        self.session = self._new_session()
+        self._thread_sessions = threading.local()
+        self._lock = threading.Lock()
+        # Rate limit tracking
+        self.daily_calls = 0
+        self.daily_limit = 2000  # Paid plan default
+        self.last_rate_limit_remaining = None
+        # Counters from the most recent enrich_many() call
+        self.last_run_stats: Dict[str, int] = {}
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({
             'Cache-Control': 'no-cache',
             'Content-Type': 'application/json',
             'accept': 'application/json',
             'x-api-key': self.api_key,
         })
-        # Rate limit tracking
-        self.daily_calls = 0
-        self.daily_limit = 2000  # Paid plan default
-        self.last_rate_limit_remaining = None
+        return session
+
+    def _http(self) -> requests.Session:
+        """self.session on the calling thread, a private session on pipeline workers."""
+        if threading.current_thread() is threading.main_thread():
+            return self.session
+        session = getattr(self._thread_sessions, 'session', None)
+        if session is None:
+            session = self._thread_sessions.session = self._new_session()
+        return session
 
     def needs_enrichment(self, profile: Dict) -> bool:
         """Only call Apollo if profile has Tier 1-2 gaps Apollo can fill."""
@@ -314,19 +417,140 @@ class ApolloEnrichmentService:
         """
         Enrich up to 10 profiles via Apollo people/bulk_match endpoint.
 
+        Cached and duplicate lookups are served without an API call.
+
         Returns list of dicts with all extracted fields mapped by tier.
         """
         if not profiles:
             return []
+        return self.enrich_many(profiles[:self.MAX_BATCH_SIZE], max_concurrency=1)
 
-        batch = profiles[:self.MAX_BATCH_SIZE]
+    def enrich_many(
+        self,
+        profiles: List[Dict],
+        max_concurrency: int = 4,
+        min_batch_interval: float = 0.0,
+        on_batch: Optional[Callable[[List[Dict]], None]] = None,
+    ) -> List[Dict]:
+        """
+        Enrich any number of profiles with as few Apollo credits as possible.
 
-        if self.daily_calls >= self.daily_limit:
-            logger.warning("Apollo daily limit reached (%d calls)", self.daily_calls)
-            return [{'error': 'daily_limit_reached', '_profile_id': p.get('id')} for p in batch]
+        1. Lookups already in the result cache are answered locally.
+        2. Identical lookups across profiles are coalesced into one request.
+        3. The remaining unique lookups go out in bulk_match batches of
+           MAX_BATCH_SIZE, up to max_concurrency at once -- fewer when the
+           last X-RateLimit-Remaining header leaves little headroom. A
+           rate-limited batch is retried once after Retry-After.
 
-        details = [self.build_request(p) for p in batch]
+        Args:
+            profiles: Profile dicts (id, name, company, website, linkedin, email).
+            max_concurrency: Upper bound on bulk_match requests in flight.
+            min_batch_interval: Minimum seconds between batch dispatches.
+            on_batch: Optional callback with each finished batch's results.
 
+        Returns:
+            One result dict per profile, in input order (same shape as
+            enrich_batch). Only the first profile of a fresh lookup carries
+            _credits_consumed=1; cached and coalesced results carry 0.
+        """
+        results: List[Optional[Dict]] = [None] * len(profiles)
+        requests_by_key: Dict[str, Dict] = {}
+        indexes_by_key: Dict[str, List[int]] = {}
+        cache_hits = 0
+
+        for i, profile in enumerate(profiles):
+            request_data = self.build_request(profile)
+            key = lookup_key(request_data)
+            hit, person = self.cache.get(key)
+            if hit:
+                cache_hits += 1
+                results[i] = self._result_for(person, profile, credits=0)
+                results[i]['_cached'] = True
+                continue
+            if key not in requests_by_key:
+                requests_by_key[key] = request_data
+            indexes_by_key.setdefault(key, []).append(i)
+
+        keys = list(requests_by_key)
+        batches = [keys[i:i + self.MAX_BATCH_SIZE] for i in range(0, len(keys), self.MAX_BATCH_SIZE)]
+
+        def run_batch(batch_keys: List[str]) -> Dict:
+            response = self._post_bulk_match([requests_by_key[k] for k in batch_keys])
+            if response.get('error') == 'rate_limited':
+                retry_after = min(response.get('retry_after', 60), 120)
+                logger.warning("Apollo rate limited. Retrying batch in %ds", retry_after)
+                time.sleep(retry_after)
+                response = self._post_bulk_match([requests_by_key[k] for k in batch_keys])
+            return response
+
+        def finish(batch_keys: List[str], response: Dict) -> None:
+            batch_results = []
+            matches = response.get('matches', [])
+            for j, key in enumerate(batch_keys):
+                if 'error' not in response:
+                    person = matches[j] if j < len(matches) else None
+                    self.cache.put(key, person)
+                for n, i in enumerate(indexes_by_key[key]):
+                    if 'error' in response:
+                        result = {'error': response['error'], '_profile_id': profiles[i].get('id')}
+                        if 'retry_after' in response:
+                            result['retry_after'] = response['retry_after']
+                    else:
+                        result = self._result_for(person, profiles[i], credits=1 if n == 0 else 0)
+                    results[i] = result
+                    batch_results.append(result)
+            if on_batch:
+                on_batch(batch_results)
+
+        max_concurrency = max(1, max_concurrency)
+        pending = list(batches)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            in_flight = {}
+            last_dispatch = 0.0
+            while pending or in_flight:
+                while pending and len(in_flight) < self._allowed_concurrency(max_concurrency):
+                    if self.daily_calls >= self.daily_limit:
+                        logger.warning("Apollo daily limit reached (%d calls)", self.daily_calls)
+                        for batch_keys in pending:
+                            finish(batch_keys, {'error': 'daily_limit_reached'})
+                        pending = []
+                        break
+                    delay = last_dispatch + min_batch_interval - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    batch_keys = pending.pop(0)
+                    in_flight[executor.submit(run_batch, batch_keys)] = batch_keys
+                    last_dispatch = time.monotonic()
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(in_flight.pop(future), future.result())
+
+        self.last_run_stats = {
+            'profiles': len(profiles),
+            'cache_hits': cache_hits,
+            'coalesced': len(profiles) - cache_hits - len(keys),
+            'lookups_sent': len(keys),
+            'batches': len(batches),
+        }
+        logger.info(
+            "Apollo enrich_many: %d profiles, %d cache hits, %d coalesced, "
+            "%d lookups in %d batches",
+            len(profiles), cache_hits, self.last_run_stats['coalesced'],
+            len(keys), len(batches),
+        )
+        return results
+
+    def _allowed_concurrency(self, max_concurrency: int) -> int:
+        """Batches allowed in flight given the last reported rate-limit headroom."""
+        remaining = self.last_rate_limit_remaining
+        if remaining is None:
+            return max_concurrency
+        return max(1, min(max_concurrency, remaining - RATE_LIMIT_RESERVE))
+
+    def _post_bulk_match(self, details: List[Dict]) -> Dict:
+        """One people/bulk_match call. Returns {'matches': [...]} or {'error': ...}."""
         query_params = {
             'reveal_personal_emails': 'true',
         }
@@ -335,7 +559,7 @@ class ApolloEnrichmentService:
             query_params['webhook_url'] = self.webhook_url
 
         try:
-            response = self.session.post(
+            response = self._http().post(
                 f"{self.BASE_URL}/people/bulk_match",
                 json={'details': details},
                 params=query_params,
@@ -347,45 +571,42 @@ class ApolloEnrichmentService:
             if response.status_code == 429:
                 retry_after = int(response.headers.get('Retry-After', 60))
                 logger.warning("Apollo rate limited. Retry after %ds", retry_after)
-                return [{'error': 'rate_limited', 'retry_after': retry_after} for _ in batch]
+                return {'error': 'rate_limited', 'retry_after': retry_after}
 
             response.raise_for_status()
             data = response.json()
-            self.daily_calls += len(batch)
-
-            matches = data.get('matches', [])
-            credits_consumed = data.get('credits_consumed', len(matches))
-
-            results = []
-            for i, profile in enumerate(batch):
-                person = matches[i] if i < len(matches) else None
-                if person:
-                    # Identity cross-check before extracting fields
-                    is_valid, validation_issues = ApolloResponseValidator.validate(person, profile)
-                    if validation_issues:
-                        logger.warning(
-                            "Apollo identity cross-check (batch) for %s: %s",
-                            profile.get('name', ''), validation_issues,
-                        )
-                    if not is_valid:
-                        logger.warning(
-                            "Apollo identity mismatch (batch) — skipping enrichment for %s",
-                            profile.get('name', ''),
-                        )
-                        results.append({'error': 'identity_mismatch', '_profile_id': profile.get('id'),
-                                        '_validation_issues': validation_issues})
-                        continue
-                    result = self.extract_all_fields(person, profile)
-                    result['_credits_consumed'] = 1
-                    results.append(result)
-                else:
-                    results.append({'error': 'no_match', '_profile_id': profile.get('id')})
-
-            return results
+            with self._lock:
+                self.daily_calls += len(details)
+
+            return {'matches': data.get('matches', [])}
 
         except requests.exceptions.RequestException as e:
             logger.warning("Apollo bulk match failed: %s", e)
-            return [{'error': str(e), '_profile_id': p.get('id')} for p in batch]
+            return {'error': str(e)}
+
+    def _result_for(self, person: Optional[Dict], profile: Dict, credits: int) -> Dict:
+        """Validate an Apollo person against the requesting profile and extract fields."""
+        if not person:
+            return {'error': 'no_match', '_profile_id': profile.get('id')}
+
+        # Identity cross-check before extracting fields
+        is_valid, validation_issues = ApolloResponseValidator.validate(person, profile)
+        if validation_issues:
+            logger.warning(
+                "Apollo identity cross-check (batch) for %s: %s",
+                profile.get('name', ''), validation_issues,
+            )
+        if not is_valid:
+            logger.warning(
+                "Apollo identity mismatch (batch) — skipping enrichment for %s",
+                profile.get('name', ''),
+            )
+            return {'error': 'identity_mismatch', '_profile_id': profile.get('id'),
+                    '_validation_issues': validation_issues}
+
+        result = self.extract_all_fields(person, profile)
+        result['_credits_consumed'] = credits
+        return result
 
     def search_people(
         self,
@@ -646,7 +867,8 @@ class ApolloEnrichmentService:
         """Track rate limit headers from Apollo responses."""
         remaining = response.headers.get('X-RateLimit-Remaining')
         if remaining is not None:
-            self.last_rate_limit_remaining = int(remaining)
+            with self._lock:
+                self.last_rate_limit_remaining = int(remaining)
             if self.last_rate_limit_remaining < 10:
                 logger.warning(
                     "Apollo rate limit low: %d remaining",
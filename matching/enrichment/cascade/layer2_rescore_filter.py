@@ -6,6 +6,10 @@ bumps scores). Filters by threshold (default 50+) and returns sorted IDs
 for Layer 3 AI enrichment.
 
 Tracks tier promotions (C→B, D→C) for reporting.
+
+Candidates are streamed in keyset-paginated chunks and each chunk's changes
+are written with a single UPDATE ... FROM (VALUES ...), so a full-database
+rescore runs in bounded memory and linear time.
 """
 
 from __future__ import annotations
@@ -18,7 +22,7 @@ import time
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import psycopg2
 import psycopg2.extras
@@ -54,81 +58,107 @@ def _get_conn():
     return psycopg2.connect(db_url, options="-c statement_timeout=120000")
 
 
-def _fetch_profiles_for_rescore(
+RESCORE_COLUMNS = """
+    id, name, email, phone, website, linkedin,
+    bio, jv_history, content_platforms, list_size,
+    social_reach, revenue_tier, booking_link,
+    seeking, offering, who_you_serve,
+    jv_tier, jv_readiness_score,
+    enrichment_metadata, seniority, intent_signal
+"""
+
+
+def _iter_profiles_for_rescore(
+    conn,
     profile_ids: list[str] | None = None,
     tier_filter: set[str] | None = None,
     limit: int | None = None,
-) -> list[dict]:
-    """Fetch profiles that need rescoring."""
-    conn = _get_conn()
+    chunk_size: int = 5000,
+) -> Iterator[list[dict]]:
+    """Yield profiles that need rescoring in chunks of at most chunk_size.
+
+    Full-table runs page by primary key (keyset pagination), so memory is
+    bounded by chunk_size and writes to jv_readiness_score can't shift the
+    cursor. With an explicit id list (or a limit, which first selects the
+    top-N ids by current score) the id list is fetched chunk by chunk.
+    """
     cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
 
     conditions = ["jv_tier IS NOT NULL"]
     params: list = []
-
-    if profile_ids:
-        conditions.append("id = ANY(%s::uuid[])")
-        params.append(profile_ids)
-
     if tier_filter:
         conditions.append("jv_tier = ANY(%s)")
         params.append(list(tier_filter))
 
-    where = " AND ".join(conditions)
-    sql = f"""
-        SELECT id, name, email, phone, website, linkedin,
-               bio, jv_history, content_platforms, list_size,
-               social_reach, revenue_tier, booking_link,
-               seeking, offering, who_you_serve,
-               jv_tier, jv_readiness_score,
-               enrichment_metadata, seniority, intent_signal
-        FROM profiles
-        WHERE {where}
-        ORDER BY jv_readiness_score DESC NULLS LAST
-    """
-    if limit:
-        sql += f" LIMIT {int(limit)}"
-
-    cur.execute(sql, params)
-    rows = [dict(r) for r in cur.fetchall()]
-    cur.close()
-    conn.close()
-    return rows
-
-
-def _batch_update_scores(updates: list[dict]) -> int:
-    """Batch update jv_tier and jv_readiness_score."""
-    if not updates:
-        return 0
-
-    conn = _get_conn()
-    cur = conn.cursor()
-    updated = 0
-
     try:
-        for u in updates:
+        if limit:
+            id_conditions = list(conditions)
+            id_params = list(params)
+            if profile_ids:
+                id_conditions.append("id = ANY(%s::uuid[])")
+                id_params.append(profile_ids)
             cur.execute(
-                """
-                UPDATE profiles
-                SET jv_tier = %s,
-                    jv_readiness_score = %s,
-                    updated_at = NOW()
-                WHERE id = %s::uuid
-                """,
-                (u["tier"], u["score"], u["id"]),
+                f"SELECT id FROM profiles WHERE {' AND '.join(id_conditions)} "
+                "ORDER BY jv_readiness_score DESC NULLS LAST LIMIT %s",
+                id_params + [int(limit)],
             )
-            updated += 1
-
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        logger.error("Batch update failed: %s", e)
-        raise
+            profile_ids = [str(r["id"]) for r in cur.fetchall()]
+
+        where = " AND ".join(conditions)
+
+        if profile_ids is not None:
+            for i in range(0, len(profile_ids), chunk_size):
+                cur.execute(
+                    f"SELECT {RESCORE_COLUMNS} FROM profiles "
+                    f"WHERE {where} AND id = ANY(%s::uuid[])",
+                    params + [profile_ids[i:i + chunk_size]],
+                )
+                rows = cur.fetchall()
+                if rows:
+                    yield [dict(r) for r in rows]
+            return
+
+        last_id = None
+        while True:
+            keyset = " AND id > %s::uuid" if last_id else ""
+            cur.execute(
+                f"SELECT {RESCORE_COLUMNS} FROM profiles "
+                f"WHERE {where}{keyset} ORDER BY id LIMIT %s",
+                params + ([last_id] if last_id else []) + [chunk_size],
+            )
+            rows = cur.fetchall()
+            if not rows:
+                return
+            last_id = str(rows[-1]["id"])
+            yield [dict(r) for r in rows]
     finally:
         cur.close()
-        conn.close()
 
-    return updated
+
+def _batch_update_scores(conn, updates: list[dict], page_size: int = 1000) -> int:
+    """Set-based update of jv_tier and jv_readiness_score via a VALUES join.
+
+    Does not commit; the caller commits once per chunk.
+    """
+    if not updates:
+        return 0
+
+    with conn.cursor() as cur:
+        psycopg2.extras.execute_values(
+            cur,
+            """
+            UPDATE profiles
+            SET jv_tier = data.tier,
+                jv_readiness_score = data.score,
+                updated_at = NOW()
+            FROM (VALUES %s) AS data(id, tier, score)
+            WHERE profiles.id = data.id
+            """,
+            [(u["id"], u["tier"], u["score"]) for u in updates],
+            template="(%s::uuid, %s, %s::float)",
+            page_size=page_size,
+        )
+    return len(updates)
 
 
 # ---------- Scoring functions (from jv_triage.py) ----------
@@ -159,11 +189,13 @@ class Layer2RescoreFilter:
         tier_filter: set[str] | None = None,
         limit: int | None = None,
         dry_run: bool = False,
+        chunk_size: int = 5000,
     ):
         self.threshold = threshold
         self.tier_filter = tier_filter
         self.limit = limit
         self.dry_run = dry_run
+        self.chunk_size = chunk_size
 
     def run(
         self,
@@ -182,78 +214,93 @@ class Layer2RescoreFilter:
 
         classify_tier, score_jv_readiness = _import_triage()
 
-        profiles = _fetch_profiles_for_rescore(
-            profile_ids=affected_ids,
-            tier_filter=self.tier_filter,
-            limit=self.limit,
-        )
-
-        if not profiles:
+        promotions = Counter()
+        score_bands = Counter()
+        qualified: list[tuple[float, str]] = []
+        sum_before = 0.0
+        sum_after = 0.0
+        updated = 0
+
+        logger.info("Layer 2: rescoring (threshold=%.1f, chunk=%d)", self.threshold, self.chunk_size)
+
+        conn = _get_conn()
+        try:
+            for profiles in _iter_profiles_for_rescore(
+                conn,
+                profile_ids=affected_ids or None,
+                tier_filter=self.tier_filter,
+                limit=self.limit,
+                chunk_size=self.chunk_size,
+            ):
+                updates = []
+
+                for profile in profiles:
+                    old_tier = profile.get("jv_tier", "E")
+                    old_score = profile.get("jv_readiness_score") or 0
+                    sum_before += old_score
+
+                    new_tier = classify_tier(profile)
+                    new_score = score_jv_readiness(profile, new_tier)
+
+                    # Track tier changes
+                    if new_tier != old_tier:
+                        key = f"{old_tier}→{new_tier}"
+                        promotions[key] += 1
+
+                    # Track score distribution
+                    band = f"{int(new_score // 10) * 10}-{int(new_score // 10) * 10 + 10}"
+                    score_bands[band] += 1
+
+                    # Only update if something changed
+                    if new_tier != old_tier or abs(new_score - old_score) >= 0.5:
+                        rounded = round(new_score, 2)
+                        updates.append({
+                            "id": str(profile["id"]),
+                            "tier": new_tier,
+                            "score": rounded,
+                        })
+                        sum_after += rounded
+                    else:
+                        sum_after += old_score
+
+                    # Qualified for Layer 3?
+                    if new_score >= self.threshold and new_tier != "X":
+                        qualified.append((new_score, str(profile["id"])))
+
+                result.profiles_rescored += len(profiles)
+
+                # Write this chunk's updates in one set-based statement
+                if updates and not self.dry_run:
+                    try:
+                        updated += _batch_update_scores(conn, updates)
+                        conn.commit()
+                    except Exception as e:
+                        conn.rollback()
+                        logger.error("Batch update failed: %s", e)
+                        raise
+                else:
+                    updated += len(updates)
+        finally:
+            conn.close()
+
+        if not result.profiles_rescored:
             logger.info("Layer 2: no profiles to rescore")
             result.runtime_seconds = time.time() - start
             return result
 
-        logger.info("Layer 2: rescoring %d profiles (threshold=%.1f)", len(profiles), self.threshold)
-
-        # Track before scores
-        before_scores = [p.get("jv_readiness_score") or 0 for p in profiles]
-        result.avg_score_before = sum(before_scores) / len(before_scores) if before_scores else 0
-
-        updates = []
-        promotions = Counter()
-        score_bands = Counter()
-
-        for profile in profiles:
-            old_tier = profile.get("jv_tier", "E")
-            old_score = profile.get("jv_readiness_score") or 0
-
-            new_tier = classify_tier(profile)
-            new_score = score_jv_readiness(profile, new_tier)
-
-            # Track tier changes
-            if new_tier != old_tier:
-                key = f"{old_tier}→{new_tier}"
-                promotions[key] += 1
-
-            # Track score distribution
-            band = f"{int(new_score // 10) * 10}-{int(new_score // 10) * 10 + 10}"
-            score_bands[band] += 1
-
-            # Only update if something changed
-            if new_tier != old_tier or abs(new_score - old_score) >= 0.5:
-                updates.append({
-                    "id": str(profile["id"]),
-                    "tier": new_tier,
-                    "score": round(new_score, 2),
-                })
-
-            # Qualified for Layer 3?
-            if new_score >= self.threshold and new_tier != "X":
-                result.qualified_ids.append(str(profile["id"]))
-
-        result.profiles_rescored = len(profiles)
+        # Highest new score first for Layer 3
+        qualified.sort(key=lambda x: x[0], reverse=True)
+        result.qualified_ids = [pid for _, pid in qualified]
         result.tier_promotions = dict(promotions)
         result.score_distribution = dict(score_bands)
         result.qualified_count = len(result.qualified_ids)
+        result.avg_score_before = sum_before / result.profiles_rescored
+        result.avg_score_after = sum_after / result.profiles_rescored
 
-        # Calculate after scores
-        after_scores = []
-        for profile in profiles:
-            pid = str(profile["id"])
-            for u in updates:
-                if u["id"] == pid:
-                    after_scores.append(u["score"])
-                    break
-            else:
-                after_scores.append(profile.get("jv_readiness_score") or 0)
-        result.avg_score_after = sum(after_scores) / len(after_scores) if after_scores else 0
-
-        # Write updates
-        if updates and not self.dry_run:
-            written = _batch_update_scores(updates)
-            logger.info("Layer 2: updated %d profiles in DB", written)
-        elif updates:
-            logger.info("Layer 2: DRY RUN — would update %d profiles", len(updates))
+        if self.dry_run and updated:
+            logger.info("Layer 2: DRY RUN — would update %d profiles", updated)
+        elif updated:
+            logger.info("Layer 2: updated %d profiles in DB", updated)
 
         result.runtime_seconds = time.time() - start
 
@@ -261,7 +308,7 @@ class Layer2RescoreFilter:
             "Layer 2 complete: %d rescored, %d updated, %d qualified (>=%.0f), "
             "avg score %.1f→%.1f, promotions=%s, %.1fs",
             result.profiles_rescored,
-            len(updates),
+            updated,
             result.qualified_count,
             self.threshold,
             result.avg_score_before,
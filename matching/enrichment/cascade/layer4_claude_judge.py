@@ -7,21 +7,33 @@ to judge which value is correct.
 
 Budget: ~$15-20/mo via cost_guard.
 Expected: 5-10% of Layer 3 profiles have conflicts.
+
+Batched mode (Layer4ClaudeJudge(batched=True)) packs several conflicts —
+across profiles — into one prompt with a JSON verdict array, reuses
+verdicts for repeated (field, value_a, value_b) triples via an append-only
+JSONL cache, runs judge calls with bounded concurrency and applies all
+verdicts in a single transaction.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 import psycopg2
 import psycopg2.extras
 
+from matching.enrichment.result_cache import JsonlResultCache
+
 logger = logging.getLogger(__name__)
 
 # Fields worth judging (high-signal fields only)
@@ -50,6 +62,39 @@ Rules:
 Respond with ONLY one of: "A", "B", or "NEITHER" followed by a brief reason.
 Format: VERDICT: [A/B/NEITHER] | REASON: [one sentence]"""
 
+BATCH_JUDGE_PROMPT_TEMPLATE = """You are a data quality judge for a JV (Joint Venture) partner matching platform.
+
+For each numbered conflict below, two sources disagree about a profile field. Decide which value is more accurate for matching purposes.
+
+Rules:
+- Choose the value that is more specific and actionable for JV partner matching.
+- If both are roughly equivalent, prefer the existing data (Value A).
+- If one is clearly more detailed or accurate, choose it regardless of source.
+- If both are wrong or nonsensical, answer "NEITHER".
+
+{conflicts}
+
+Respond with ONLY a JSON array, one object per conflict, in any order:
+[{{"id": <conflict number>, "verdict": "A" | "B" | "NEITHER", "reason": "<one sentence>"}}]"""
+
+BATCH_CONFLICT_TEMPLATE = """Conflict {idx}
+Profile: {name}
+Website: {website}
+Field: {field_name}
+Value A (existing data): {value_a}
+Value B (new AI extraction): {value_b}
+"""
+
+VERDICT_CACHE_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "scripts"
+    / "enrichment_batches"
+    / "cascade_checkpoints"
+    / "judge_verdict_cache.jsonl"
+)
+
+JUDGE_CALL_COST = 0.005  # ~$0.005 per judge call
+
 
 # ---------- Result dataclass ----------
 
@@ -147,6 +192,95 @@ def _apply_verdict(
         conn.close()
 
 
+def _apply_verdicts_batch(changes: list[dict]) -> int:
+    """Apply many verdicts in one transaction.
+
+    changes = [{"profile_id", "field", "chosen", "verdict", "reason"}, ...].
+    Field values are written with one UPDATE ... FROM (VALUES ...) per field
+    and the judge log is appended with one statement for all profiles.
+    Returns the number of field updates applied (0 on rollback).
+    """
+    if not changes:
+        return 0
+
+    by_field: dict[str, list[tuple]] = defaultdict(list)
+    log_by_profile: dict[str, list[dict]] = defaultdict(list)
+    judged_at = datetime.now().isoformat()
+    for c in changes:
+        by_field[c["field"]].append((c["profile_id"], c["chosen"]))
+        log_by_profile[c["profile_id"]].append({
+            "field": c["field"],
+            "verdict": c["verdict"],
+            "reason": c["reason"],
+            "judged_at": judged_at,
+        })
+
+    conn = _get_conn()
+    cur = conn.cursor()
+    try:
+        for fld, rows in by_field.items():
+            if fld not in JUDGEABLE_FIELDS:
+                raise ValueError(f"Refusing to write non-judgeable field {fld!r}")
+            psycopg2.extras.execute_values(
+                cur,
+                f"""
+                UPDATE profiles SET {fld} = data.val, updated_at = NOW()
+                FROM (VALUES %s) AS data(id, val)
+                WHERE profiles.id = data.id
+                """,
+                rows,
+                template="(%s::uuid, %s)",
+            )
+
+        psycopg2.extras.execute_values(
+            cur,
+            """
+            UPDATE profiles
+            SET enrichment_metadata = COALESCE(enrichment_metadata, '{}'::jsonb)
+                || jsonb_build_object(
+                    'judge_verdicts',
+                    COALESCE(enrichment_metadata->'judge_verdicts', '[]'::jsonb)
+                    || data.log
+                )
+            FROM (VALUES %s) AS data(id, log)
+            WHERE profiles.id = data.id
+            """,
+            [(pid, json.dumps(log)) for pid, log in log_by_profile.items()],
+            template="(%s::uuid, %s::jsonb)",
+        )
+
+        conn.commit()
+        return len(changes)
+    except Exception as e:
+        conn.rollback()
+        logger.error("Failed to apply %d verdicts: %s", len(changes), e)
+        return 0
+    finally:
+        cur.close()
+        conn.close()
+
+
+# ---------- Verdict cache ----------
+
+def _conflict_key(field_name: str, value_a: str, value_b: str) -> str:
+    raw = json.dumps([field_name, value_a, value_b], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class JudgeVerdictCache(JsonlResultCache):
+    """Verdicts keyed by _conflict_key(field, value_a, value_b)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        super().__init__(path or VERDICT_CACHE_PATH, name="Verdict")
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        cached = super().get(key)
+        return (cached["verdict"], cached.get("reason", "")) if cached else None
+
+    def put(self, key: str, verdict: str, reason: str) -> None:
+        super().put(key, {"verdict": verdict, "reason": reason})
+
+
 # ---------- Conflict detection ----------
 
 def _detect_conflicts(profile: dict) -> list[dict]:
@@ -203,8 +337,16 @@ class Layer4ClaudeJudge:
     def __init__(
         self,
         dry_run: bool = False,
+        batched: bool = False,
+        batch_size: int = 10,
+        max_workers: int = 4,
+        cache: Optional[JudgeVerdictCache] = None,
     ):
         self.dry_run = dry_run
+        self.batched = batched
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.cache = cache
 
     def run(
         self,
@@ -247,6 +389,12 @@ class Layer4ClaudeJudge:
             result.runtime_seconds = time.time() - start
             return result
 
+        if self.batched:
+            self._run_batched(client, profiles, result)
+            result.runtime_seconds = time.time() - start
+            self._log_summary(result)
+            return result
+
         for profile in profiles:
             pid = str(profile["id"])
             name = profile.get("name", "")
@@ -301,7 +449,11 @@ class Layer4ClaudeJudge:
                     logger.error("Layer 4 judge error for %s.%s: %s", name, fld, e)
 
         result.runtime_seconds = time.time() - start
+        self._log_summary(result)
+        return result
 
+    @staticmethod
+    def _log_summary(result: Layer4Result) -> None:
         logger.info(
             "Layer 4 complete: %d checked, %d conflicts found, %d resolved, "
             "verdicts=%s, %d fields updated, $%.3f cost, %.1fs",
@@ -314,7 +466,156 @@ class Layer4ClaudeJudge:
             result.runtime_seconds,
         )
 
-        return result
+    # ---------- Batched mode ----------
+
+    def _run_batched(self, client, profiles: list[dict], result: Layer4Result) -> None:
+        """Judge all conflicts with cached, deduplicated, packed, concurrent calls."""
+        cache = self.cache if self.cache is not None else JudgeVerdictCache()
+
+        items = []
+        for profile in profiles:
+            for conflict in _detect_conflicts(profile):
+                conflict.update({
+                    "profile_id": str(profile["id"]),
+                    "name": profile.get("name", "") or "",
+                    "website": profile.get("website", "") or "",
+                    "key": _conflict_key(conflict["field"], conflict["value_a"], conflict["value_b"]),
+                })
+                items.append(conflict)
+        result.conflicts_found = len(items)
+        if not items:
+            return
+
+        # One judge call per distinct (field, value_a, value_b) not already cached
+        verdicts: dict[str, tuple[str, str]] = {}
+        pending: dict[str, dict] = {}
+        for item in items:
+            cached = cache.get(item["key"])
+            if cached:
+                verdicts[item["key"]] = cached
+            elif item["key"] not in pending:
+                pending[item["key"]] = item
+
+        unique = list(pending.values())
+        batches = [unique[i:i + self.batch_size] for i in range(0, len(unique), self.batch_size)]
+        logger.info(
+            "Layer 4: %d conflicts, %d cached, %d distinct to judge in %d prompts",
+            len(items), sum(1 for i in items if i["key"] in verdicts),
+            len(unique), len(batches),
+        )
+
+        calls = 0
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            for batch_verdicts, batch_calls in pool.map(lambda b: self._judge_batch(client, b), batches):
+                calls += batch_calls
+                for key, (verdict, reason) in batch_verdicts.items():
+                    verdicts[key] = (verdict, reason)
+                    cache.put(key, verdict, reason)
+        result.cost += calls * JUDGE_CALL_COST
+
+        changes = []
+        for item in items:
+            if item["key"] not in verdicts:
+                continue
+            verdict, reason = verdicts[item["key"]]
+            result.verdicts[verdict] = result.verdicts.get(verdict, 0) + 1
+            result.conflicts_resolved += 1
+            if verdict == "B":
+                continue  # Keep AI value (already in DB)
+            chosen = item["value_a"] if verdict == "A" else ""
+            if self.dry_run:
+                logger.info(
+                    "DRY RUN: would update %s.%s to %s (%s)",
+                    item["name"], item["field"], verdict, reason,
+                )
+                continue
+            changes.append({
+                "profile_id": item["profile_id"],
+                "field": item["field"],
+                "chosen": chosen,
+                "verdict": verdict,
+                "reason": reason,
+            })
+
+        result.fields_updated += _apply_verdicts_batch(changes)
+
+    def _judge_batch(self, client, batch: list[dict]) -> tuple[dict[str, tuple[str, str]], int]:
+        """Judge a packed batch; fall back to single prompts for anything unparsed.
+
+        Returns ({key: (verdict, reason)}, number_of_calls).
+        """
+        verdicts: dict[str, tuple[str, str]] = {}
+        calls = 0
+
+        if len(batch) > 1:
+            prompt = BATCH_JUDGE_PROMPT_TEMPLATE.format(conflicts="\n".join(
+                BATCH_CONFLICT_TEMPLATE.format(
+                    idx=idx,
+                    name=item["name"],
+                    website=item["website"],
+                    field_name=item["field"],
+                    value_a=item["value_a"],
+                    value_b=item["value_b"],
+                )
+                for idx, item in enumerate(batch)
+            ))
+            try:
+                response = client.call(prompt)
+                calls += 1
+                verdicts.update(_parse_batch_verdicts(response, batch))
+            except Exception as e:
+                logger.error("Layer 4 batch judge error (%d conflicts): %s", len(batch), e)
+
+        for item in batch:
+            if item["key"] in verdicts:
+                continue
+            prompt = JUDGE_PROMPT_TEMPLATE.format(
+                name=item["name"],
+                website=item["website"],
+                field_name=item["field"],
+                value_a=item["value_a"],
+                value_b=item["value_b"],
+            )
+            try:
+                response = client.call(prompt)
+                calls += 1
+                if response:
+                    verdicts[item["key"]] = _parse_verdict(response)
+            except Exception as e:
+                logger.error("Layer 4 judge error for %s.%s: %s", item["name"], item["field"], e)
+
+        return verdicts, calls
+
+
+def _parse_batch_verdicts(response: Optional[str], batch: list[dict]) -> dict[str, tuple[str, str]]:
+    """Parse a JSON verdict array into {conflict key: (verdict, reason)}.
+
+    Entries with an unknown id or verdict are dropped so the caller can
+    re-judge them individually.
+    """
+    if not response:
+        return {}
+    from matching.enrichment.claude_client import ClaudeClient
+
+    parsed = ClaudeClient.parse_json(response)
+    if isinstance(parsed, dict):
+        parsed = parsed.get("verdicts")
+    if not isinstance(parsed, list):
+        return {}
+
+    verdicts = {}
+    for entry in parsed:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            idx = int(entry.get("id"))
+        except (TypeError, ValueError):
+            continue
+        verdict = str(entry.get("verdict", "")).strip().upper()
+        if not 0 <= idx < len(batch) or verdict not in ("A", "B", "NEITHER"):
+            continue
+        verdicts[batch[idx]["key"]] = (verdict, str(entry.get("reason", "")).strip())
+    return verdicts
 
 
 def _parse_verdict(response: str) -> tuple[str, str]:
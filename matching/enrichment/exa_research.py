@@ -16,15 +16,28 @@ Cost per profile:
 - Has website (Exa-indexed): ~$0.020 (3 API calls)
 - Has website (not indexed): Falls back to crawl4ai + Claude pipeline
 - Name-only: ~$0.025 (4 API calls)
+
+Responses are cached locally (ExaResponseCache, SQLite) keyed by the
+normalized request, so re-research runs, retries and the several flows that
+call exa_enrich_profile() pay for a URL or query once per TTL window.
+research_profiles_batch() researches many profiles concurrently under a
+shared request rate and CostGuard budget.
 """
 
+import hashlib
 import json
 import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
+
+from matching.enrichment.result_cache import SqliteTTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +140,85 @@ PROFILE_SCHEMA = {
     "required": ["what_you_do", "who_you_serve", "niche"]
 }
 
+# --- Response cache ---
+# Bump EXA_CACHE_VERSION when the parsing of Exa responses changes shape;
+# edits to PROFILE_SCHEMA invalidate cached extractions automatically
+# because the schema itself is part of every extraction key.
+EXA_CACHE_VERSION = 1
+EXA_CACHE_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "scripts" / "enrichment_batches" / "exa_cache" / "exa_responses.sqlite3"
+)
+EXA_CACHE_TTL_DAYS = float(os.environ.get('EXA_CACHE_TTL_DAYS', '30'))
+
+# Estimated spend per profile, used for CostGuard checks in batch research
+EXA_COST_PER_PROFILE = 0.025
+
+
+def _normalize_cache_url(url: str) -> str:
+    """Canonical form of a URL for cache keys (scheme/host case, www., trailing /)."""
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parsed.path.rstrip('/')
+    return urlunparse(('https', host, path, '', parsed.query, ''))
+
+
+def _normalize_cache_text(text: str) -> str:
+    """Case- and whitespace-insensitive form of a query string."""
+    return ' '.join((text or '').lower().split())
+
+
+class ExaResponseCache(SqliteTTLCache):
+    """Persistent cache of parsed Exa responses with a TTL.
+
+    Values are JSON-serialisable results of the service's parse step (not
+    raw SDK objects). A TTL of 0 disables the cache.
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl_days: float = EXA_CACHE_TTL_DAYS):
+        super().__init__(path or EXA_CACHE_PATH, 'exa_responses', ttl_days, name='Exa')
+
+    @staticmethod
+    def make_key(operation: str, **request) -> str:
+        """Hash of the operation, its normalized request and EXA_CACHE_VERSION."""
+        raw = json.dumps(
+            {'op': operation, 'v': EXA_CACHE_VERSION, 'request': request},
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class _RequestRateLimiter:
+    """Thread-safe minimum spacing between outgoing API requests."""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+
+_default_cache: Optional[ExaResponseCache] = None
+
+
+def get_exa_cache() -> ExaResponseCache:
+    """Process-wide response cache shared by all ExaResearchService instances."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ExaResponseCache()
+    return _default_cache
+
 
 class ExaResearchService:
     """
@@ -143,7 +235,22 @@ class ExaResearchService:
       Call 3 (conditional): social + JV discovery if still missing
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[ExaResponseCache] = None,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[_RequestRateLimiter] = None,
+    ):
+        """
+        Args:
+            cache: Response cache (defaults to the shared get_exa_cache()).
+            base_url: Override the Exa API endpoint (EXA_BASE_URL env var),
+                e.g. to point the client at a stub server in tests.
+            rate_limiter: Shared limiter applied before every uncached call.
+        """
+        self.cache = cache if cache is not None else get_exa_cache()
+        self.base_url = base_url or os.environ.get('EXA_BASE_URL', '')
+        self.rate_limiter = rate_limiter
         self.api_key = os.environ.get('EXA_API_KEY', '')
         if not self.api_key:
             # Fallback: try loading from .env if Django hasn't loaded it yet
@@ -165,9 +272,17 @@ class ExaResearchService:
             if not self.api_key:
                 raise ValueError("EXA_API_KEY not set")
             from exa_py import Exa
-            self._client = Exa(api_key=self.api_key)
+            if self.base_url:
+                self._client = Exa(api_key=self.api_key, base_url=self.base_url)
+            else:
+                self._client = Exa(api_key=self.api_key)
         return self._client
 
+    def _throttle(self) -> None:
+        """Wait for the shared rate limiter (if any) before an API call."""
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+
     @property
     def available(self) -> bool:
         """Check if Exa is configured."""
@@ -303,6 +418,87 @@ class ExaResearchService:
 
         return result
 
+    def research_profiles_batch(
+        self,
+        profiles: List[Dict],
+        max_workers: int = 8,
+        requests_per_second: float = 5.0,
+        cost_guard=None,
+        on_result: Optional[Callable[[int, Dict], None]] = None,
+    ) -> List[Optional[Dict]]:
+        """
+        Research many profiles concurrently.
+
+        All workers share one request rate limit and the service's response
+        cache. The CostGuard headroom (daily and monthly) is read once up
+        front; each dispatch then reserves an estimate against this batch's
+        running in-memory spend, and once the headroom is used up the
+        remaining profiles are not researched.
+
+        Args:
+            profiles: Dicts of research_profile() keyword arguments
+                (name, website, linkedin, company, existing_data).
+            max_workers: Profiles researched at once.
+            requests_per_second: Shared cap on uncached Exa calls.
+            cost_guard: Budget guard (defaults to get_cost_guard()).
+            on_result: Optional callback(index, result) as each profile finishes.
+
+        Returns:
+            research_profile() results in input order; None for profiles
+            skipped because the budget was exhausted.
+        """
+        from matching.enrichment.cost_guard import get_cost_guard
+
+        guard = cost_guard or get_cost_guard()
+        budget = guard.get_summary()
+        headroom = min(budget['daily_remaining'], budget['monthly_remaining'])
+        previous_limiter = self.rate_limiter
+        self.rate_limiter = _RequestRateLimiter(requests_per_second)
+
+        results: List[Optional[Dict]] = [None] * len(profiles)
+        lock = threading.Lock()
+        state = {'spent': 0.0, 'in_flight': 0, 'budget_exhausted': False}
+
+        def research(index: int) -> None:
+            with lock:
+                if state['budget_exhausted']:
+                    return
+                # Reserve an estimate for every profile still running
+                reserved = state['spent'] + (state['in_flight'] + 1) * EXA_COST_PER_PROFILE
+                if reserved > headroom:
+                    logger.warning(
+                        f"Exa batch stopped: ${reserved:.2f} would exceed "
+                        f"${headroom:.2f} remaining budget"
+                    )
+                    state['budget_exhausted'] = True
+                    return
+                state['in_flight'] += 1
+
+            try:
+                result = self.research_profile(**profiles[index])
+            finally:
+                with lock:
+                    state['in_flight'] -= 1
+            with lock:
+                state['spent'] += result.get('_exa_cost', 0.0)
+            results[index] = result
+            if on_result:
+                on_result(index, result)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                list(executor.map(research, range(len(profiles))))
+        finally:
+            self.rate_limiter = previous_limiter
+
+        done = sum(1 for r in results if r is not None)
+        logger.info(
+            f"Exa batch research: {done}/{len(profiles)} profiles, "
+            f"${state['spent']:.4f} spent, cache {self.cache.hits} hits / "
+            f"{self.cache.misses} misses"
+        )
+        return results
+
     def _extract_from_website(
         self, name: str, url: str
     ) -> Tuple[Dict, List[str], float]:
@@ -310,17 +506,27 @@ class ExaResearchService:
         Call 1: Extract structured profile data from a website URL.
         Uses Exa get_contents with summary+schema for direct JSON extraction.
 
-        Returns: (profile_dict, page_links, cost)
+        Returns: (profile_dict, page_links, cost) -- cost is 0.0 on a cache hit
         """
+        summary_query = (
+            f"Extract complete business profile for {name}: "
+            "what they do, who they serve, their programs, "
+            "pricing tier, credentials, partnerships, services"
+        )
+        cache_key = self.cache.make_key(
+            'website_contents', url=_normalize_cache_url(url),
+            query=_normalize_cache_text(summary_query), schema=PROFILE_SCHEMA,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached['profile'], cached['links'], 0.0
+
         try:
+            self._throttle()
             result = self.client.get_contents(
                 urls=[url],
                 summary={
-                    "query": (
-                        f"Extract complete business profile for {name}: "
-                        "what they do, who they serve, their programs, "
-                        "pricing tier, credentials, partnerships, services"
-                    ),
+                    "query": summary_query,
                     "schema": PROFILE_SCHEMA,
                 },
                 subpages=3,
@@ -337,6 +543,7 @@ class ExaResearchService:
         links = []
 
         if not result.results:
+            self.cache.put(cache_key, {'profile': {}, 'links': []})
             return {}, [], cost
 
         r = result.results[0]
@@ -370,20 +577,31 @@ class ExaResearchService:
                     except (json.JSONDecodeError, TypeError):
                         pass
 
+        self.cache.put(cache_key, {'profile': profile, 'links': links})
         return profile, links, cost
 
     def _extract_from_linkedin(
         self, name: str, linkedin_url: str
     ) -> Tuple[Dict, float]:
         """Extract profile data from a LinkedIn URL."""
+        summary_query = (
+            f"Extract professional profile for {name}: "
+            "what they do, who they serve, credentials, experience, company"
+        )
+        cache_key = self.cache.make_key(
+            'linkedin_contents', url=_normalize_cache_url(linkedin_url),
+            query=_normalize_cache_text(summary_query), schema=PROFILE_SCHEMA,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached, 0.0
+
         try:
+            self._throttle()
             result = self.client.get_contents(
                 urls=[linkedin_url],
                 summary={
-                    "query": (
-                        f"Extract professional profile for {name}: "
-                        "what they do, who they serve, credentials, experience, company"
-                    ),
+                    "query": summary_query,
                     "schema": PROFILE_SCHEMA,
                 },
                 livecrawl="fallback",
@@ -404,6 +622,7 @@ class ExaResearchService:
             except (json.JSONDecodeError, TypeError):
                 pass
 
+        self.cache.put(cache_key, profile)
         return profile, cost
 
     def _discover_profile(
@@ -449,7 +668,13 @@ class ExaResearchService:
 
         query = " ".join(query_parts)
 
+        cache_key = self.cache.make_key('discover_profile', query=_normalize_cache_text(query))
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached, 0.0
+
         try:
+            self._throttle()
             result = self.client.search(
                 query=query,
                 type="auto",
@@ -480,6 +705,7 @@ class ExaResearchService:
                 f"linkedin={discovered.get('linkedin', 'N/A')}"
             )
 
+        self.cache.put(cache_key, discovered)
         return discovered, cost
 
     def _discover_social_and_jv(
@@ -494,7 +720,13 @@ class ExaResearchService:
         """
         query = f"{name} {company}".strip()
 
+        cache_key = self.cache.make_key('social_and_jv', query=_normalize_cache_text(query))
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached['profiles'], cached['mentions'], 0.0
+
         try:
+            self._throttle()
             result = self.client.search(
                 query=query,
                 type="auto",
@@ -555,6 +787,7 @@ class ExaResearchService:
                             "quote": h[:300],
                         })
 
+        self.cache.put(cache_key, {'profiles': profiles, 'mentions': mentions[:10]})
         return profiles, mentions[:10], cost
 
     def _extract_social_from_links(self, links: List[str]) -> Dict[str, str]:
@@ -150,12 +150,15 @@ def gpu_enrichment_task(
 def claude_judge_task(
     enriched_ids: list[str],
     dry_run: bool,
+    batched: bool = False,
 ) -> dict:
     """Layer 4: Claude-only conflict resolution."""
     logger = get_run_logger()
-    logger.info("Starting Layer 4: Claude Judge (%d profiles)", len(enriched_ids))
+    logger.info(
+        "Starting Layer 4: Claude Judge (%d profiles, batched=%s)", len(enriched_ids), batched,
+    )
 
-    layer = Layer4ClaudeJudge(dry_run=dry_run)
+    layer = Layer4ClaudeJudge(dry_run=dry_run, batched=batched)
     result = layer.run(enriched_ids=enriched_ids)
 
     logger.info(
@@ -334,6 +337,7 @@ def enrichment_cascade_flow(
     limit: int | None = None,
     dry_run: bool = False,
     checkpoint_id: str | None = None,
+    batched_judge: bool = False,
 ) -> CascadeResult:
     """6-layer self-healing enrichment pipeline.
 
@@ -347,6 +351,9 @@ def enrichment_cascade_flow(
 
     Composable: layers=[1,2] for free-only, layers=[3,4] for AI-only,
     or full [1,2,3,4,5,6] for complete pipeline.
+
+    batched_judge=True runs Layer 4 in batched mode: several deduplicated
+    conflicts per Claude call instead of one call per conflict.
     """
     logger = get_run_logger()
     start = time.time()
@@ -411,6 +418,7 @@ def enrichment_cascade_flow(
         l4_result = claude_judge_task(
             enriched_ids=enriched_ids,
             dry_run=dry_run,
+            batched=batched_judge,
         )
         result.l4 = l4_result
         result.total_cost += l4_result.get("cost", 0)
@@ -29,6 +29,7 @@ import psycopg2
 import psycopg2.extras
 from prefect import task, get_run_logger
 
+from matching.match_cache import invalidate_matches
 from matching.services import SupabaseMatchScoringService
 from matching.models import SupabaseProfile, MemberReport
 
@@ -308,6 +309,7 @@ def score_against_all_clients(
 
         for client in clients:
             client_saved = 0
+            saved_pairs = []
             for prospect in prospects:
                 if str(client.id) == str(prospect.id):
                     continue
@@ -328,6 +330,7 @@ def score_against_all_clients(
                     continue
 
                 _save_match_record(cur, client, prospect, scores)
+                saved_pairs.append((client.id, prospect.id))
                 total_saved += 1
                 client_saved += 1
 
@@ -347,6 +350,7 @@ def score_against_all_clients(
                     logger.info("Progress: %d pairs saved, %d high-quality", total_saved, len(high_quality))
 
             conn.commit()
+            invalidate_matches(saved_pairs)
             logger.info("Client %s done: %d pairs saved", client.name, client_saved)
 
     except Exception:
@@ -5,7 +5,9 @@ Searches the existing 1.1M+ profiles before paying for external APIs.
 
 Strategy:
   1. Vector search (~3K profiles with embeddings) — pgvector cosine similarity
-  2. Text search (remaining profiles) — ILIKE keyword matching
+  2. Text search (remaining profiles) — full-text match on the weighted
+     niche / what_you_do / offering document (GIN expression index from
+     migration 0024), ranked by ts_rank
   3. Combine, deduplicate, return with _db_profile_id marker
 
 Cost: $0.00 per search — all local DB queries.
@@ -61,7 +63,44 @@ _VECTOR_SEARCH_SQL = """
 
 
 # ---------------------------------------------------------------------------
-# SQL: Text keyword search (profiles WITHOUT embeddings)
+# SQL: Full-text search (profiles WITHOUT embeddings)
+# ---------------------------------------------------------------------------
+
+# Weighted search document. Must stay the same expression as the
+# idx_profiles_search_tsv GIN index (migration 0024) or the planner cannot
+# use the index.
+_SEARCH_DOCUMENT = """(
+                        setweight(to_tsvector('english', coalesce(niche, '')), 'A')
+                        || setweight(to_tsvector('english', coalesce(what_you_do, '')), 'B')
+                        || setweight(to_tsvector('english', coalesce(offering, '')), 'B')
+                    )"""
+
+_FULLTEXT_SEARCH_SQL = """
+    SELECT p.id, p.name, p.website, p.linkedin, p.email, p.niche,
+           p.what_you_do, p.offering, p.seeking, p.who_you_serve,
+           p.jv_tier, p.jv_readiness_score, p.revenue_tier,
+           p.content_platforms, p.network_role,
+           0.0 AS similarity,
+           ts_rank({document}, q.query) AS text_rank
+    FROM profiles p, (SELECT {tsquery} AS query) q
+    WHERE {document} @@ q.query
+      AND p.embedding_offering IS NULL
+      AND p.jv_tier IN ('A', 'B', 'C')
+      AND p.jv_readiness_score >= %s
+      AND p.id != %s
+      AND p.id != ALL(%s::uuid[])
+      AND p.id NOT IN (
+          SELECT suggested_profile_id FROM match_suggestions
+          WHERE profile_id = %s
+      )
+      AND COALESCE(p.last_enriched_at, p.created_at) >= NOW() - INTERVAL '%s days'
+    ORDER BY text_rank DESC, p.jv_readiness_score DESC
+    LIMIT %s
+"""
+
+
+# ---------------------------------------------------------------------------
+# SQL: Text keyword search — ILIKE fallback for keywords with no tsquery terms
 # ---------------------------------------------------------------------------
 
 _TEXT_SEARCH_SQL = """
@@ -175,6 +214,20 @@ def _build_keyword_clauses(keywords: list[str], max_keywords: int = 8) -> tuple[
     return " OR ".join(clauses), params
 
 
+def _build_tsquery(keywords: list[str], max_keywords: int = 8) -> tuple[str, list]:
+    """Build an OR-ed tsquery expression for keyword full-text search.
+
+    Each keyword goes through plainto_tsquery (so multi-word keywords must
+    all match and user text never needs escaping); the keywords are then
+    combined with ``||``. Returns (sql_fragment, params).
+    """
+    keywords = [kw for kw in keywords[:max_keywords] if kw and kw.strip()]
+    if not keywords:
+        return "NULL::tsquery", []
+    sql = " || ".join("plainto_tsquery('english', %s)" for _ in keywords)
+    return f"({sql})", [kw.strip() for kw in keywords]
+
+
 def _text_search(
     cur,
     client_id: str,
@@ -184,10 +237,44 @@ def _text_search(
     max_staleness_days: int,
     limit: int,
 ) -> list[dict]:
-    """Search profiles using ILIKE keyword matching on text fields."""
+    """Search profiles by keyword: indexed full-text, ILIKE if no usable terms."""
     if not keywords:
         return []
 
+    tsquery_sql, tsquery_params = _build_tsquery(keywords)
+    if tsquery_params:
+        sql = _FULLTEXT_SEARCH_SQL.format(tsquery=tsquery_sql, document=_SEARCH_DOCUMENT)
+        params = [
+            *tsquery_params,          # plainto_tsquery keyword params
+            min_readiness_score,      # jv_readiness_score filter
+            client_id,                # exclude self
+            exclude_ids or [],        # exclude already-seen IDs
+            client_id,                # exclude existing match_suggestions
+            max_staleness_days,       # staleness window
+            limit,                    # LIMIT
+        ]
+        cur.execute(sql, params)
+        return [dict(row) for row in cur.fetchall()]
+
+    return _ilike_search(
+        cur, client_id, keywords,
+        exclude_ids=exclude_ids,
+        min_readiness_score=min_readiness_score,
+        max_staleness_days=max_staleness_days,
+        limit=limit,
+    )
+
+
+def _ilike_search(
+    cur,
+    client_id: str,
+    keywords: list[str],
+    exclude_ids: list[str],
+    min_readiness_score: float,
+    max_staleness_days: int,
+    limit: int,
+) -> list[dict]:
+    """Search profiles using ILIKE keyword matching on text fields."""
     keyword_sql, keyword_params = _build_keyword_clauses(keywords)
     sql = _TEXT_SEARCH_SQL.format(keyword_clauses=keyword_sql)
 
@@ -221,7 +308,7 @@ def search_database_prospects(
 
     Two-phase search:
       1. pgvector cosine similarity on embedded profiles (~3K with vectors)
-      2. ILIKE text search on remaining profiles (1M+ without vectors)
+      2. Full-text search on remaining profiles (1M+ without vectors)
 
     All results are marked with ``_db_profile_id`` so the ingestion step
     knows these are existing profiles (no need to create new rows).
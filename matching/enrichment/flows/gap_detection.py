@@ -68,6 +68,57 @@ _ACTIVE_CLIENTS_SQL = """
 """
 
 
+# ---------------------------------------------------------------------------
+# SQL: set-based variants for batch gap detection (one query for all clients)
+# ---------------------------------------------------------------------------
+
+_BATCH_CLIENT_PROFILES_SQL = """
+    SELECT id, name, niche, tags
+    FROM profiles
+    WHERE id = ANY(%(client_ids)s::uuid[])
+"""
+
+# Per-client score distribution. Scores are ranked per client so the
+# top-N aggregates (lowest / average of the best target_count) come out
+# of the same GROUP BY as the qualifying count.
+_BATCH_SCORE_STATS_SQL = """
+    WITH ranked AS (
+        SELECT
+            ms.profile_id,
+            ms.suggested_profile_id,
+            COALESCE(ms.harmonic_mean, 0)::float8 AS score,
+            row_number() OVER (
+                PARTITION BY ms.profile_id
+                ORDER BY COALESCE(ms.harmonic_mean, 0) DESC
+            ) AS rn
+        FROM match_suggestions ms
+        JOIN profiles p ON p.id = ms.suggested_profile_id
+        WHERE ms.profile_id = ANY(%(client_ids)s::uuid[])
+          AND ms.status NOT IN ('dismissed')
+    )
+    SELECT
+        profile_id,
+        count(*) FILTER (WHERE score >= %(target_score)s) AS current_count,
+        min(score) FILTER (WHERE rn <= %(target_count)s) AS lowest_score,
+        avg(score) FILTER (WHERE rn <= %(target_count)s) AS avg_score,
+        (array_agg(suggested_profile_id::text ORDER BY rn)
+            FILTER (WHERE score >= %(target_score)s))[1:20] AS top_match_ids
+    FROM ranked
+    GROUP BY profile_id
+"""
+
+_BATCH_NICHE_COUNTS_SQL = """
+    SELECT ms.profile_id, p.niche, count(*) AS match_count
+    FROM match_suggestions ms
+    JOIN profiles p ON p.id = ms.suggested_profile_id
+    WHERE ms.profile_id = ANY(%(client_ids)s::uuid[])
+      AND ms.status NOT IN ('dismissed')
+      AND COALESCE(p.niche, '') <> ''
+    GROUP BY ms.profile_id, p.niche
+    ORDER BY ms.profile_id, match_count DESC, p.niche
+"""
+
+
 # ---------------------------------------------------------------------------
 # Main gap detection task
 # ---------------------------------------------------------------------------
@@ -118,22 +169,9 @@ def detect_match_gaps(
             logger.warning(
                 "Client profile %s not found in database", client_profile_id
             )
-            return {
-                "client_id": client_profile_id,
-                "client_name": "",
-                "current_count": 0,
-                "target_count": target_count,
-                "gap": target_count,
-                "has_gap": True,
-                "lowest_score": 0.0,
-                "avg_score": 0.0,
-                "niche_gaps": [],
-                "top_niches": [],
-            }
+            return _missing_client_result(client_profile_id, target_count)
 
         client_name = client_row.get("name", "")
-        client_niche = client_row.get("niche", "")
-        client_tags = client_row.get("tags") or []
 
         # Fetch all match scores for this client
         cursor.execute(_MATCH_SCORES_SQL, (client_profile_id,))
@@ -172,36 +210,16 @@ def detect_match_gaps(
         lowest_score = top_scores[-1] if top_scores else 0.0
         avg_score = sum(top_scores) / len(top_scores) if top_scores else 0.0
 
-        # Calculate gap
-        gap = max(0, target_count - qualifying_count)
-
-        # Identify niche gaps -- niches from client tags/niche that are
-        # underrepresented in the match pool
-        niche_gaps = _identify_niche_gaps(
-            client_niche, client_tags, niche_counts
+        result = _gap_result(
+            client_profile_id, client_row, target_count,
+            qualifying_count, lowest_score, avg_score,
+            niche_counts, top_match_ids,
         )
 
-        # Top niches currently represented
-        top_niches = sorted(niche_counts, key=niche_counts.get, reverse=True)[:5]
-
-        result = {
-            "client_id": client_profile_id,
-            "client_name": client_name,
-            "current_count": qualifying_count,
-            "target_count": target_count,
-            "gap": gap,
-            "has_gap": gap > 0,
-            "lowest_score": round(lowest_score, 2),
-            "avg_score": round(avg_score, 2),
-            "niche_gaps": niche_gaps,
-            "top_niches": top_niches,
-            "top_match_ids": top_match_ids[:20],
-        }
-
         logger.info(
             "Gap analysis for %s: %d/%d qualifying (gap=%d), avg=%.1f, lowest=%.1f",
             client_name, qualifying_count, target_count,
-            gap, avg_score, lowest_score,
+            result["gap"], avg_score, lowest_score,
         )
 
         return result
@@ -218,11 +236,15 @@ def detect_match_gaps(
 def detect_gaps_batch(
     target_score: int = 64,
     target_count: int = 30,
+    client_ids: list[str] | None = None,
 ) -> list[dict]:
     """Run gap detection for all active clients.
 
     Queries the match_suggestions table to find all distinct profile_ids
-    (clients), then runs gap detection for each.
+    (clients), then computes every client's gap analysis from grouped
+    queries: client profiles, per-client score distributions and per-client
+    niche counts each come back in a single round trip, independent of the
+    number of clients. Results match ``detect_match_gaps`` per client.
 
     Parameters
     ----------
@@ -230,6 +252,8 @@ def detect_gaps_batch(
         Minimum harmonic_mean score to count as a "good" match.
     target_count:
         How many good matches each client should have.
+    client_ids:
+        Restrict detection to these clients instead of all active ones.
 
     Returns
     -------
@@ -241,26 +265,52 @@ def detect_gaps_batch(
     conn = _get_db_connection()
     try:
         cursor = conn.cursor(cursor_factory=RealDictCursor)
-        cursor.execute(_ACTIVE_CLIENTS_SQL)
-        rows = cursor.fetchall()
-        client_ids = [str(row["profile_id"]) for row in rows]
+        if client_ids is None:
+            cursor.execute(_ACTIVE_CLIENTS_SQL)
+            client_ids = [str(row["profile_id"]) for row in cursor.fetchall()]
+        client_ids = [str(cid) for cid in client_ids]
         logger.info("Found %d active clients for batch gap detection", len(client_ids))
+        if not client_ids:
+            return []
+
+        params = {
+            "client_ids": client_ids,
+            "target_score": target_score,
+            "target_count": target_count,
+        }
+        cursor.execute(_BATCH_CLIENT_PROFILES_SQL, params)
+        clients = {str(row["id"]): row for row in cursor.fetchall()}
+
+        cursor.execute(_BATCH_SCORE_STATS_SQL, params)
+        stats = {str(row["profile_id"]): row for row in cursor.fetchall()}
+
+        cursor.execute(_BATCH_NICHE_COUNTS_SQL, params)
+        niche_counts: dict[str, dict[str, int]] = {}
+        for row in cursor.fetchall():
+            niche = (row["niche"] or "").strip().lower()
+            if niche:
+                counts = niche_counts.setdefault(str(row["profile_id"]), {})
+                counts[niche] = counts.get(niche, 0) + int(row["match_count"])
     finally:
         conn.close()
 
     results: list[dict] = []
     for client_id in client_ids:
-        try:
-            gap_result = detect_match_gaps.fn(
-                client_profile_id=client_id,
-                target_score=target_score,
-                target_count=target_count,
-            )
-            results.append(gap_result)
-        except Exception as exc:
-            logger.error(
-                "Gap detection failed for client %s: %s", client_id, exc
-            )
+        client_row = clients.get(client_id)
+        if not client_row:
+            logger.warning("Client profile %s not found in database", client_id)
+            results.append(_missing_client_result(client_id, target_count))
+            continue
+
+        row = stats.get(client_id) or {}
+        results.append(_gap_result(
+            client_id, client_row, target_count,
+            int(row.get("current_count") or 0),
+            float(row.get("lowest_score") or 0.0),
+            float(row.get("avg_score") or 0.0),
+            niche_counts.get(client_id, {}),
+            row.get("top_match_ids") or [],
+        ))
 
     # Sort by gap size descending
     results.sort(key=lambda r: r.get("gap", 0), reverse=True)
@@ -278,6 +328,59 @@ def detect_gaps_batch(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _missing_client_result(client_id: str, target_count: int) -> dict:
+    """Gap result for a client whose profile row no longer exists."""
+    return {
+        "client_id": client_id,
+        "client_name": "",
+        "current_count": 0,
+        "target_count": target_count,
+        "gap": target_count,
+        "has_gap": True,
+        "lowest_score": 0.0,
+        "avg_score": 0.0,
+        "niche_gaps": [],
+        "top_niches": [],
+    }
+
+
+def _gap_result(
+    client_id: str,
+    client_row: dict,
+    target_count: int,
+    qualifying_count: int,
+    lowest_score: float,
+    avg_score: float,
+    niche_counts: dict[str, int],
+    top_match_ids: list[str],
+) -> dict:
+    """Assemble the gap analysis dict from a client's score statistics."""
+    gap = max(0, target_count - qualifying_count)
+
+    # Identify niche gaps -- niches from client tags/niche that are
+    # underrepresented in the match pool
+    niche_gaps = _identify_niche_gaps(
+        client_row.get("niche", ""), client_row.get("tags") or [], niche_counts
+    )
+
+    # Top niches currently represented
+    top_niches = sorted(niche_counts, key=niche_counts.get, reverse=True)[:5]
+
+    return {
+        "client_id": client_id,
+        "client_name": client_row.get("name", ""),
+        "current_count": qualifying_count,
+        "target_count": target_count,
+        "gap": gap,
+        "has_gap": gap > 0,
+        "lowest_score": round(lowest_score, 2),
+        "avg_score": round(avg_score, 2),
+        "niche_gaps": niche_gaps,
+        "top_niches": top_niches,
+        "top_match_ids": list(top_match_ids)[:20],
+    }
+
+
 def _identify_niche_gaps(
     client_niche: str,
     client_tags: list[str],
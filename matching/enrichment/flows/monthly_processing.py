@@ -332,7 +332,6 @@ def run_gap_detection(
     if client_limit > 0:
         # Run on a subset of clients for faster testing / incremental runs
         from matching.enrichment.flows.gap_detection import (
-            detect_match_gaps,
             _get_db_connection,
             _ACTIVE_CLIENTS_SQL,
         )
@@ -348,17 +347,11 @@ def run_gap_detection(
             conn.close()
 
         logger.info("Gap detection on %d clients (limited from %d)", len(client_ids), len(rows))
-        gaps = []
-        for cid in client_ids:
-            try:
-                result = detect_match_gaps.fn(
-                    client_profile_id=cid,
-                    target_score=target_score,
-                    target_count=target_count,
-                )
-                gaps.append(result if isinstance(result, dict) else {"client_id": cid})
-            except Exception as exc:
-                logger.warning("Gap detection failed for %s: %s", cid, exc)
+        gaps = detect_gaps_batch.fn(
+            target_score=target_score,
+            target_count=target_count,
+            client_ids=client_ids,
+        )
     else:
         # Full batch — all clients
         gaps = detect_gaps_batch.fn(
@@ -12,11 +12,23 @@ Usage (CLI):
 Usage (Prefect):
     from matching.enrichment.flows.report_delivery import report_delivery_flow
     report_delivery_flow()
+
+Delivery is batched: all access codes rotate in one transaction, intros
+are generated concurrently (and cached by client, month + change summary), and
+every email goes out over a single reused SMTP connection.
 """
 
 from __future__ import annotations
 
+import contextvars
+import hashlib
+import json
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from prefect.cache_policies import NO_CACHE
 
 # Django bootstrap — required when run by Prefect worker outside Django web process
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
@@ -26,12 +38,22 @@ django.setup()
 import secrets
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Optional
 
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from prefect import flow, task, get_run_logger
 
+from matching.enrichment.result_cache import JsonlResultCache  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Personalised intros keyed by client, month + change summary (see IntroCache)
+INTRO_CACHE_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "scripts" / "enrichment_batches" / "report_intro_cache" / "intros.jsonl"
+)
+
 
 # ---------------------------------------------------------------------------
 # Result dataclass
@@ -174,6 +196,72 @@ def rotate_access_code(report_id: int, new_code: str) -> dict[str, Any]:
         conn.close()
 
 
+@task(name="rotate-access-codes", retries=2, retry_delay_seconds=5)
+def rotate_access_codes(new_codes: dict[int, str]) -> list[dict[str, Any]]:
+    """Rotate access codes for many MemberReports in one transaction.
+
+    Same effect as :func:`rotate_access_code` per report -- new code,
+    current month, 35-day expiry, ``access_count`` reset -- but with one
+    connection, one SELECT and one UPDATE for the whole batch.
+
+    Parameters
+    ----------
+    new_codes:
+        Mapping of MemberReport PK -> new 8-char hex access code.
+
+    Returns
+    -------
+    list[dict] with: report_id, old_code, new_code, expires_at.
+    """
+    logger = get_run_logger()
+    if not new_codes:
+        return []
+
+    new_month = datetime.utcnow().replace(day=1).date()
+    new_expires = datetime.utcnow() + timedelta(days=35)
+    report_ids = list(new_codes)
+
+    conn = _get_db_connection()
+    try:
+        with conn:
+            cur = conn.cursor(cursor_factory=RealDictCursor)
+            cur.execute(
+                "SELECT id, access_code FROM matching_memberreport WHERE id = ANY(%s) FOR UPDATE",
+                (report_ids,),
+            )
+            old_codes = {row["id"]: row["access_code"] for row in cur.fetchall()}
+
+            cur.execute(
+                """
+                UPDATE matching_memberreport AS mr
+                SET access_code  = data.code,
+                    month        = %s,
+                    expires_at   = %s,
+                    access_count = 0
+                FROM unnest(%s::int[], %s::text[]) AS data(id, code)
+                WHERE mr.id = data.id
+                """,
+                (new_month, new_expires, report_ids, [new_codes[rid] for rid in report_ids]),
+            )
+    finally:
+        conn.close()
+
+    logger.info(
+        "Rotated access codes for %d reports (expires %s)",
+        len(old_codes), new_expires.isoformat(),
+    )
+    return [
+        {
+            "report_id": rid,
+            "old_code": old_codes[rid],
+            "new_code": new_codes[rid],
+            "expires_at": new_expires.isoformat(),
+        }
+        for rid in report_ids
+        if rid in old_codes
+    ]
+
+
 @task(name="generate-report-intro", retries=1, retry_delay_seconds=10)
 def generate_report_intro(
     client: dict[str, Any],
@@ -264,7 +352,11 @@ def generate_report_intro(
     except Exception as exc:
         logger.warning("AI intro generation failed for %s: %s -- using template", name, exc)
 
-    # Template fallback
+    return _template_intro(name, partner_count, new_count)
+
+
+def _template_intro(name: str, partner_count: int, new_count: int) -> str:
+    """Non-AI intro used when generation is unavailable or fails."""
     if new_count > 0:
         return (
             f"Hi {name},\n\n"
@@ -278,6 +370,88 @@ def generate_report_intro(
     )
 
 
+def _intro_cache_key(report: dict[str, Any], changes: dict[str, Any], month: str) -> str:
+    """Cache key: the client, the delivery month and everything the intro
+    prompt depends on. The month keeps each monthly run from reusing last
+    month's intro."""
+    raw = json.dumps({
+        "client": report.get("client_profile_id") or report.get("report_id"),
+        "month": month,
+        "name": report.get("member_name", ""),
+        "partner_count": report.get("partner_count", 0),
+        "changes": changes,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class IntroCache(JsonlResultCache):
+    """Generated intros keyed by _intro_cache_key(). Template fallbacks are
+    never cached."""
+
+    def __init__(self, path: Optional[Path] = None):
+        super().__init__(path or INTRO_CACHE_PATH, name="Intro")
+
+
+@task(name="generate-report-intros")
+def generate_report_intros(
+    reports: list[dict[str, Any]],
+    changes_by_report: dict[int, dict[str, Any]],
+    max_workers: int = 4,
+    cache: Optional[IntroCache] = None,
+    month: Optional[str] = None,
+) -> dict[int, str]:
+    """Generate intros for many reports with bounded concurrency.
+
+    Cached intros are reused within a delivery month (``YYYY-MM``, default
+    the current UTC month); the rest run :func:`generate_report_intro`
+    on up to ``max_workers`` threads, so total time tracks the slowest
+    LLM calls rather than their sum.
+
+    Returns
+    -------
+    dict mapping report_id -> intro text.
+    """
+    logger = get_run_logger()
+    cache = cache if cache is not None else IntroCache()
+    month = month or datetime.utcnow().strftime("%Y-%m")
+
+    intros: dict[int, str] = {}
+    pending: list[tuple[dict[str, Any], dict[str, Any], str]] = []
+    for report in reports:
+        changes = changes_by_report.get(report["report_id"], {})
+        key = _intro_cache_key(report, changes, month)
+        cached = cache.get(key)
+        if cached:
+            intros[report["report_id"]] = cached
+        else:
+            pending.append((report, changes, key))
+
+    def _generate(report, changes):
+        return generate_report_intro.fn(client=report, report=report, changes=changes)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            (report, changes, key,
+             executor.submit(contextvars.copy_context().run, _generate, report, changes))
+            for report, changes, key in pending
+        ]
+        for report, changes, key, future in futures:
+            intro = future.result()
+            intros[report["report_id"]] = intro
+            fallback = _template_intro(
+                report.get("member_name", "there"),
+                report.get("partner_count", 0),
+                changes.get("new_partners", 0),
+            )
+            if intro != fallback:
+                cache.put(key, intro)
+
+    logger.info(
+        "Intros: %d from cache, %d generated", len(reports) - len(pending), len(pending),
+    )
+    return intros
+
+
 @task(name="send-delivery-email", retries=2, retry_delay_seconds=10)
 def send_delivery_email(
     client: dict[str, Any],
@@ -307,18 +481,7 @@ def send_delivery_email(
     """
     logger = get_run_logger()
 
-    base_url = os.environ.get("REPORT_BASE_URL", "https://app.jvmatchmaker.com")
-    report_url = f"{base_url}/report/{access_code}/"
-
-    subject = f"Your Updated JV Partner Report is Ready -- {datetime.utcnow().strftime('%B %Y')}"
-    body = (
-        f"{intro}\n\n"
-        f"View your report here:\n{report_url}\n\n"
-        f"This link is unique to you and expires in 35 days. "
-        f"Bookmark it for easy access.\n\n"
-        f"Questions or feedback? Just reply to this email.\n\n"
-        f"Best,\nJV Matchmaker Team"
-    )
+    subject, body = _delivery_email_content(intro, access_code)
 
     if dry_run:
         logger.info(
@@ -348,6 +511,103 @@ def send_delivery_email(
         return False
 
 
+def _delivery_email_content(intro: str, access_code: str) -> tuple[str, str]:
+    """Subject and body of the delivery email."""
+    base_url = os.environ.get("REPORT_BASE_URL", "https://app.jvmatchmaker.com")
+    report_url = f"{base_url}/report/{access_code}/"
+
+    subject = f"Your Updated JV Partner Report is Ready -- {datetime.utcnow().strftime('%B %Y')}"
+    body = (
+        f"{intro}\n\n"
+        f"View your report here:\n{report_url}\n\n"
+        f"This link is unique to you and expires in 35 days. "
+        f"Bookmark it for easy access.\n\n"
+        f"Questions or feedback? Just reply to this email.\n\n"
+        f"Best,\nJV Matchmaker Team"
+    )
+    return subject, body
+
+
+@task(name="send-delivery-emails", cache_policy=NO_CACHE)
+def send_delivery_emails(
+    deliveries: list[tuple[dict[str, Any], str, str]],
+    dry_run: bool = False,
+    connection: Any = None,
+) -> dict[int, bool]:
+    """Send many delivery emails over one reused mail connection.
+
+    Each message is sent on its own so one bad address or rejected message
+    doesn't abort the batch; if the server drops the connection it is
+    reopened for the remaining messages.
+
+    Parameters
+    ----------
+    deliveries:
+        (client/report dict, intro, access_code) per email.
+    dry_run:
+        If True, log instead of sending.
+    connection:
+        An already-open mail connection, left open for the caller to close.
+        If omitted one is opened and closed here.
+
+    Returns
+    -------
+    dict mapping report_id -> True if sent (or would be sent).
+    """
+    logger = get_run_logger()
+    outcome: dict[int, bool] = {}
+
+    if dry_run:
+        for client, _intro, access_code in deliveries:
+            logger.info(
+                "[DRY RUN] Would send delivery email to %s (code=%s)",
+                client["member_email"],
+                access_code,
+            )
+            outcome[client["report_id"]] = True
+        return outcome
+
+    from django.core.mail import EmailMessage, get_connection
+
+    owns_connection = connection is None
+    if owns_connection:
+        connection = get_connection(fail_silently=False)
+    try:
+        if owns_connection:
+            connection.open()
+        for client, intro, access_code in deliveries:
+            subject, body = _delivery_email_content(intro, access_code)
+            message = EmailMessage(
+                subject=subject,
+                body=body,
+                from_email=None,  # Uses DEFAULT_FROM_EMAIL from settings
+                to=[client["member_email"]],
+                connection=connection,
+            )
+            try:
+                connection.send_messages([message])
+                logger.info("Delivered report to %s", client["member_email"])
+                outcome[client["report_id"]] = True
+            except Exception as exc:
+                logger.error(
+                    "Failed to deliver report to %s: %s",
+                    client["member_email"],
+                    exc,
+                )
+                outcome[client["report_id"]] = False
+                # Start the next message on a fresh session
+                try:
+                    connection.close()
+                    connection.open()
+                except Exception as reopen_exc:
+                    logger.error("Could not reopen mail connection: %s", reopen_exc)
+    finally:
+        if owns_connection:
+            connection.close()
+
+    return outcome
+
+
 # ---------------------------------------------------------------------------
 # Main flow
 # ---------------------------------------------------------------------------
@@ -360,20 +620,27 @@ def send_delivery_email(
 )
 def report_delivery_flow(
     dry_run: bool = False,
+    max_workers: int = 4,
 ) -> DeliveryResult:
     """Deliver updated reports to all active clients.
 
     Steps:
       1. Get all active clients with MemberReports
-      2. Generate new access codes (8-char hex)
-      3. Generate personalized intro (AI-generated summary of what changed)
-      4. Send delivery email with report link + intro
-      5. Track delivery status
+      2. Generate personalized intro (AI-generated summary of what changed)
+      3. Open the mail connection
+      4. Generate and rotate new access codes (8-char hex)
+      5. Send delivery email with report link + intro
+      6. Track delivery status
+
+    Intros and the mail connection are ready before any code rotates, so a
+    failure in either leaves every member's current link working.
 
     Parameters
     ----------
     dry_run:
         If True, log actions without sending emails or rotating codes.
+    max_workers:
+        Concurrent intro generations.
 
     Returns
     -------
@@ -390,49 +657,63 @@ def report_delivery_flow(
         logger.info("No active reports found -- nothing to deliver")
         return result
 
-    for report in reports:
-        # Step 2: Generate new access code
-        new_code = generate_access_code()
-
-        # Step 3: Rotate access code in DB (unless dry run)
-        if not dry_run:
-            rotate_access_code(
-                report_id=report["report_id"],
-                new_code=new_code,
-            )
-            result.new_access_codes += 1
-        else:
-            logger.info(
-                "[DRY RUN] Would rotate code for report %d",
-                report["report_id"],
-            )
-
-        # Step 4: Compute what changed (simplified -- compare partner counts)
-        changes = {
+    # Step 2: Compute what changed (simplified -- compare partner counts)
+    changes_by_report = {
+        report["report_id"]: {
             "new_partners": 0,
             "score_improvements": 0,
         }
+        for report in reports
+    }
 
-        # Step 5: Generate personalized intro
-        intro = generate_report_intro(
-            client=report,
-            report=report,
-            changes=changes,
-        )
+    # Step 3: Generate personalized intros (concurrent, cached)
+    intros = generate_report_intros(reports, changes_by_report, max_workers=max_workers)
+
+    # Step 4: Open the mail connection before any code rotates
+    connection = None
+    if not dry_run:
+        from django.core.mail import get_connection
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as exc:
+            logger.error("Mail connection failed -- no access codes rotated: %s", exc)
+            raise
 
-        # Step 6: Send delivery email
-        success = send_delivery_email(
-            client=report,
-            report=report,
-            intro=intro,
-            access_code=new_code,
+    try:
+        # Step 5: Generate new access codes
+        new_codes = {report["report_id"]: generate_access_code.fn() for report in reports}
+
+        # Step 6: Rotate all access codes in one transaction (unless dry run).
+        # Only reports whose code was actually written get an email.
+        if not dry_run:
+            rotated = rotate_access_codes(new_codes)
+            result.new_access_codes = len(rotated)
+            new_codes = {row["report_id"]: row["new_code"] for row in rotated}
+            skipped = [report for report in reports if report["report_id"] not in new_codes]
+            if skipped:
+                result.clients_skipped = len(skipped)
+                logger.warning(
+                    "Skipping %d reports whose access code was not rotated: %s",
+                    len(skipped), [report["report_id"] for report in skipped],
+                )
+                reports = [report for report in reports if report["report_id"] in new_codes]
+        else:
+            logger.info("[DRY RUN] Would rotate codes for %d reports", len(new_codes))
+
+        # Step 7: Send all delivery emails over the open connection
+        outcome = send_delivery_emails(
+            [(report, intros[report["report_id"]], new_codes[report["report_id"]]) for report in reports],
             dry_run=dry_run,
+            connection=connection,
         )
+    finally:
+        if connection is not None:
+            connection.close()
 
-        if success:
-            result.reports_delivered += 1
-        else:
-            result.delivery_failures += 1
+    result.reports_delivered = sum(1 for ok in outcome.values() if ok)
+    result.delivery_failures = sum(1 for ok in outcome.values() if not ok)
 
     logger.info(
         "Report delivery complete: %d delivered, %d codes rotated, %d failures",
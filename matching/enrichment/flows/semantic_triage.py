@@ -19,22 +19,26 @@ COSMETIC changes (log and skip):
 
 from __future__ import annotations
 
+import contextvars
+import hashlib
 import json
 import logging
 import os
-import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Optional
 
 import httpx
-from prefect import task, get_run_logger
+from prefect import get_run_logger, task
 
 from matching.enrichment.flows.content_hash_check import (
     HashCheckResult,
-    _fetch_page,
     _clean_html,
+    _fetch_page,
     _normalise_base_url,
 )
+from matching.enrichment.result_cache import JsonlResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +48,14 @@ logger = logging.getLogger(__name__)
 
 _MAX_SNIPPET_CHARS = 2000  # max chars per old/new snippet sent to Claude
 
+# Triage results keyed by the changed pages' new content hashes, so a
+# page revision is only ever classified once (re-runs, failed metadata
+# writes, etc.).
+TRIAGE_CACHE_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "scripts" / "enrichment_batches" / "triage_cache" / "triage_cache.jsonl"
+)
+
 _TRIAGE_PROMPT_TEMPLATE = """\
 You are a business profile change analyst.  Compare the OLD and NEW website \
 text for a JV partner profile and classify the change.
@@ -75,6 +87,43 @@ revenue_tier, jv_history, content_platforms, company, bio.
 """
 
 
+_BATCH_TRIAGE_PROMPT_TEMPLATE = """\
+You are a business profile change analyst.  For each JV partner profile \
+below, compare the OLD and NEW website text and classify the change.
+
+Classify each change as one of:
+- "material": New offering, pricing change, niche shift, new program, new \
+partnership, changed target audience, new credentials/certifications, \
+significant service change.
+- "cosmetic": Rewording, layout change, minor edits, copyright year update, \
+testimonial additions, blog posts, formatting tweaks.
+
+{profiles}
+
+Respond with ONLY a JSON object (no markdown fences) mapping each profile \
+KEY to its classification:
+{{"<KEY>": {{"classification": "material" or "cosmetic", "confidence": 0.0-1.0, \
+"summary": "one-sentence description of what changed", \
+"affected_fields": ["seeking", "offering", "who_you_serve", ...]}}, ...}}
+
+The affected_fields lists should contain only fields from this set:
+seeking, offering, who_you_serve, what_you_do, niche, signature_programs, \
+revenue_tier, jv_history, content_platforms, company, bio.
+"""
+
+_BATCH_TRIAGE_PROFILE_TEMPLATE = """\
+=== KEY: {key} ===
+**Profile:** {name} ({website})
+**Pages changed:** {pages_changed}
+
+--- OLD TEXT (before) ---
+{old_text}
+
+--- NEW TEXT (after) ---
+{new_text}
+"""
+
+
 # ---------------------------------------------------------------------------
 # Result dataclass
 # ---------------------------------------------------------------------------
@@ -179,41 +228,17 @@ def _parse_triage_json(text: str) -> Optional[dict]:
         return None
 
 
-# ---------------------------------------------------------------------------
-# Prefect tasks
-# ---------------------------------------------------------------------------
-
-@task(name="semantic-triage", retries=1, retry_delay_seconds=10)
-def semantic_triage(
+def _build_snippets(
     profile: dict,
     hash_result: HashCheckResult,
     old_content: str = "",
     new_content: str = "",
-) -> TriageResult:
-    """Classify a detected content change as MATERIAL or COSMETIC using Claude.
-
-    If *old_content* / *new_content* are not provided, the task attempts to
-    reconstruct snippets by re-fetching the changed pages (new) and using
-    the profile's cached data as a proxy for the old content.
-
-    Parameters
-    ----------
-    profile:
-        Profile dict (id, name, website, enrichment_metadata).
-    hash_result:
-        HashCheckResult from Layer 1 showing which pages changed.
-    old_content:
-        Optional pre-fetched old text (e.g. from cache).
-    new_content:
-        Optional pre-fetched new text.
+) -> tuple[str, str]:
+    """Return truncated (old_text, new_text) for a changed profile.
 
-    Returns
-    -------
-    TriageResult
+    New text is re-fetched from the changed pages when not provided; the
+    profile's current enrichment fields stand in for the old text.
     """
-    log = get_run_logger()
-    pid = str(profile.get("id", ""))
-    name = profile.get("name", "")
     website = (profile.get("website") or "").strip()
 
     # --- Build text snippets if not provided ---
@@ -246,8 +271,147 @@ def semantic_triage(
         old_content = "\n".join(parts)
 
     # Truncate to budget
-    old_text = old_content[:_MAX_SNIPPET_CHARS]
-    new_text = new_content[:_MAX_SNIPPET_CHARS]
+    return old_content[:_MAX_SNIPPET_CHARS], new_content[:_MAX_SNIPPET_CHARS]
+
+
+def _triage_result_from_parsed(pid: str, name: str, parsed: dict) -> TriageResult:
+    """Build a TriageResult from one parsed classification object."""
+    classification = str(parsed.get("classification", "cosmetic")).lower()
+    if classification not in ("material", "cosmetic"):
+        classification = "cosmetic"
+
+    return TriageResult(
+        profile_id=pid,
+        name=name,
+        classification=classification,
+        confidence=min(1.0, max(0.0, float(parsed.get("confidence", 0.5)))),
+        change_summary=parsed.get("summary", ""),
+        affected_fields=parsed.get("affected_fields", []),
+    )
+
+
+def _triage_cache_key(hash_result: HashCheckResult) -> Optional[str]:
+    """Hash of the profile id plus the new content hashes of its changed pages.
+
+    Returns None when the changed pages have no recorded hashes (nothing
+    stable to key on).
+    """
+    page_hashes = sorted(
+        (page, hash_result.new_hashes[page])
+        for page in hash_result.pages_changed
+        if hash_result.new_hashes.get(page)
+    )
+    if not page_hashes:
+        return None
+    raw = json.dumps([hash_result.profile_id, page_hashes])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TriageCache(JsonlResultCache):
+    """Triage results keyed by _triage_cache_key()."""
+
+    def __init__(self, path: Optional[Path] = None):
+        super().__init__(path or TRIAGE_CACHE_PATH, name="Triage")
+
+    def get(self, key: str) -> Optional[TriageResult]:
+        cached = super().get(key)
+        return TriageResult(**cached) if cached else None
+
+    def put(self, key: str, result: TriageResult) -> None:
+        super().put(key, asdict(result))
+
+
+def _triage_chunk(chunk: list[tuple[dict, HashCheckResult]]) -> list[TriageResult]:
+    """Classify several changed profiles with one prompt.
+
+    Profiles missing from (or malformed in) the response map -- or the whole
+    chunk, if the response is unparseable -- are retried with the
+    single-profile prompt.
+    """
+    if len(chunk) == 1:
+        profile, hr = chunk[0]
+        return [semantic_triage.fn(profile=profile, hash_result=hr)]
+
+    blocks: list[str] = []
+    snippets: list[tuple[str, str]] = []
+    for profile, hr in chunk:
+        old_text, new_text = _build_snippets(profile, hr)
+        snippets.append((old_text, new_text))
+        blocks.append(_BATCH_TRIAGE_PROFILE_TEMPLATE.format(
+            key=hr.profile_id,
+            name=profile.get("name", ""),
+            website=(profile.get("website") or "").strip(),
+            pages_changed=", ".join(hr.pages_changed),
+            old_text=old_text or "(no prior content available)",
+            new_text=new_text or "(could not fetch new content)",
+        ))
+
+    parsed = None
+    try:
+        raw_response = _call_claude(
+            _BATCH_TRIAGE_PROMPT_TEMPLATE.format(profiles="\n".join(blocks))
+        )
+        parsed = _parse_triage_json(raw_response)
+    except Exception as exc:
+        logger.warning("Batch triage call failed for %d profiles: %s", len(chunk), exc)
+
+    results: list[TriageResult] = []
+    for (profile, hr), (old_text, new_text) in zip(chunk, snippets):
+        entry = parsed.get(hr.profile_id) if isinstance(parsed, dict) else None
+        if isinstance(entry, dict):
+            try:
+                results.append(
+                    _triage_result_from_parsed(hr.profile_id, profile.get("name", ""), entry)
+                )
+                continue
+            except (TypeError, ValueError):
+                pass
+        # Fall back to the single-profile prompt, reusing fetched snippets
+        results.append(semantic_triage.fn(
+            profile=profile, hash_result=hr,
+            old_content=old_text, new_content=new_text,
+        ))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Prefect tasks
+# ---------------------------------------------------------------------------
+
+@task(name="semantic-triage", retries=1, retry_delay_seconds=10)
+def semantic_triage(
+    profile: dict,
+    hash_result: HashCheckResult,
+    old_content: str = "",
+    new_content: str = "",
+) -> TriageResult:
+    """Classify a detected content change as MATERIAL or COSMETIC using Claude.
+
+    If *old_content* / *new_content* are not provided, the task attempts to
+    reconstruct snippets by re-fetching the changed pages (new) and using
+    the profile's cached data as a proxy for the old content.
+
+    Parameters
+    ----------
+    profile:
+        Profile dict (id, name, website, enrichment_metadata).
+    hash_result:
+        HashCheckResult from Layer 1 showing which pages changed.
+    old_content:
+        Optional pre-fetched old text (e.g. from cache).
+    new_content:
+        Optional pre-fetched new text.
+
+    Returns
+    -------
+    TriageResult
+    """
+    log = get_run_logger()
+    pid = str(profile.get("id", ""))
+    name = profile.get("name", "")
+    website = (profile.get("website") or "").strip()
+
+    old_text, new_text = _build_snippets(profile, hash_result, old_content, new_content)
 
     prompt = _TRIAGE_PROMPT_TEMPLATE.format(
         name=name,
@@ -281,18 +445,7 @@ def semantic_triage(
             change_summary="Unparseable API response",
         )
 
-    classification = parsed.get("classification", "cosmetic").lower()
-    if classification not in ("material", "cosmetic"):
-        classification = "cosmetic"
-
-    result = TriageResult(
-        profile_id=pid,
-        name=name,
-        classification=classification,
-        confidence=min(1.0, max(0.0, float(parsed.get("confidence", 0.5)))),
-        change_summary=parsed.get("summary", ""),
-        affected_fields=parsed.get("affected_fields", []),
-    )
+    result = _triage_result_from_parsed(pid, name, parsed)
 
     log.info(
         "Triage for %s: %s (conf=%.2f) — %s",
@@ -305,12 +458,16 @@ def semantic_triage(
 def triage_batch(
     profiles: list[dict],
     hash_results: list[HashCheckResult],
+    batch_size: int = 5,
+    max_workers: int = 4,
+    cache: Optional[TriageCache] = None,
 ) -> list[TriageResult]:
     """Batch semantic triage for all profiles with detected changes.
 
     Pairs each profile with its corresponding hash result by profile_id,
-    then runs ``semantic_triage`` sequentially (to stay within API rate
-    limits and keep costs predictable).
+    skips profiles whose changed pages were already triaged at the same
+    content hashes, and classifies the rest *batch_size* profiles per
+    prompt with at most *max_workers* prompts in flight.
 
     Parameters
     ----------
@@ -318,18 +475,29 @@ def triage_batch(
         List of profile dicts (only those with detected changes).
     hash_results:
         Corresponding HashCheckResults (same order/length as *profiles*).
+    batch_size:
+        Profiles per Claude prompt (1 = one prompt per profile).
+    max_workers:
+        Maximum concurrent Claude calls.
+    cache:
+        Triage cache; defaults to the JSONL cache at TRIAGE_CACHE_PATH.
 
     Returns
     -------
     list[TriageResult]
+        One result per triaged profile, in input order.
     """
     log = get_run_logger()
     log.info("Starting semantic triage for %d changed profiles", len(profiles))
+    cache = cache if cache is not None else TriageCache()
 
     # Build lookup by profile_id for safety
     hr_by_id = {hr.profile_id: hr for hr in hash_results}
 
-    results: list[TriageResult] = []
+    results_by_pid: dict[str, TriageResult] = {}
+    order: list[str] = []
+    pending: list[tuple[dict, HashCheckResult]] = []
+    cache_hits = 0
     for profile in profiles:
         pid = str(profile.get("id", ""))
         hr = hr_by_id.get(pid)
@@ -337,20 +505,52 @@ def triage_batch(
             log.warning("No hash result for profile %s, skipping triage", pid)
             continue
 
-        try:
-            tr = semantic_triage.fn(profile=profile, hash_result=hr)
-            results.append(tr)
-        except Exception as exc:
-            log.error("Triage failed for %s: %s", pid, exc)
+        order.append(pid)
+        key = _triage_cache_key(hr)
+        cached = cache.get(key) if key else None
+        if cached:
+            results_by_pid[pid] = cached
+            cache_hits += 1
+        else:
+            pending.append((profile, hr))
+
+    chunks = [
+        pending[i:i + max(1, batch_size)]
+        for i in range(0, len(pending), max(1, batch_size))
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        # Each worker runs in a copy of this task's context so the
+        # single-profile fallback can still reach the Prefect run logger.
+        futures = {
+            executor.submit(contextvars.copy_context().run, _triage_chunk, chunk): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                chunk_results = future.result()
+            except Exception as exc:
+                log.error(
+                    "Triage failed for %s: %s",
+                    ", ".join(hr.profile_id for _, hr in chunk), exc,
+                )
+                continue
+            for (_, hr), tr in zip(chunk, chunk_results):
+                results_by_pid[hr.profile_id] = tr
+                # Zero-confidence results are API/parse failures; retry those next run
+                key = _triage_cache_key(hr)
+                if key and tr.confidence > 0:
+                    cache.put(key, tr)
 
-        # Rate-limit: ~1 call/sec to stay well under API limits
-        time.sleep(1.0)
+    results = [results_by_pid[pid] for pid in order if pid in results_by_pid]
 
     material = sum(1 for r in results if r.classification == "material")
     cosmetic = sum(1 for r in results if r.classification == "cosmetic")
     log.info(
-        "Triage complete: %d material, %d cosmetic out of %d",
+        "Triage complete: %d material, %d cosmetic out of %d "
+        "(%d cached, %d prompts for %d profiles)",
         material, cosmetic, len(results),
+        cache_hits, len(chunks), len(pending),
     )
 
     return results
@@ -0,0 +1,140 @@
+"""
+Persistent result caches shared by the enrichment flows.
+
+JsonlResultCache: append-only JSONL file loaded into memory, for small
+caches of LLM outputs (Layer 4 verdicts, semantic triage, report intros).
+
+SqliteTTLCache: one SQLite table with a TTL, for API responses that many
+processes read and write concurrently (Exa, Apollo).
+
+Both are thread-safe and never raise on I/O errors: a failed read is a
+miss and a failed write is logged.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlResultCache:
+    """Append-only JSONL cache of JSON-serialisable values by key.
+
+    Each put() appends {"key", "value", "cached_at"}; on load the last line
+    for a key wins and unreadable lines are skipped.
+    """
+
+    def __init__(self, path: Path, name: str = "Result"):
+        self.path = Path(path)
+        self.name = name
+        self._lock = threading.Lock()
+        self._values: dict[str, Any] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._values[entry["key"]] = entry["value"]
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._values.get(key)
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._values[key] = value
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({
+                        "key": key,
+                        "value": value,
+                        "cached_at": datetime.now().isoformat(),
+                    }) + "\n")
+            except Exception as exc:
+                logger.error("%s cache write failed: %s", self.name, exc)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class SqliteTTLCache:
+    """JSON values by key in a SQLite table, expiring after a TTL.
+
+    One file can be shared by every flow and worker process (WAL mode).
+    A TTL of 0 disables the cache.
+    """
+
+    def __init__(self, path: Path, table: str, ttl_days: float, name: str = "Result"):
+        self.path = Path(path)
+        self.table = table
+        self.ttl_seconds = ttl_days * 86400
+        self.name = name
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def lookup(self, key: str) -> Optional[tuple[Any, float]]:
+        """(value, age in seconds) for a stored key regardless of TTL, or None."""
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("%s cache read failed: %s", self.name, e)
+            return None
+        if row is None:
+            return None
+        return json.loads(row[0]), time.time() - row[1]
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        entry = self.lookup(key)
+        if entry is None or entry[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, default=str), time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("%s cache write failed: %s", self.name, e)
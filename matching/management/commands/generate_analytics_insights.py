@@ -4,15 +4,19 @@ Generate proactive analytics insights from engagement data.
 Scans EngagementSummary records for patterns that indicate opportunities
 or problems, and creates AnalyticsInsight records for operator review.
 
+Summaries, report partners and existing insight keys for all active reports
+are loaded up front; every rule then runs against in-memory indexes and new
+insights are written with a single bulk_create.
+
 Usage:
     python manage.py generate_analytics_insights
     python manage.py generate_analytics_insights --report-id 42
 """
 
+from collections import defaultdict
 from datetime import timedelta
 
 from django.core.management.base import BaseCommand
-from django.db.models import Avg, Q, Sum
 from django.utils import timezone
 
 from matching.models import (
@@ -24,16 +28,6 @@ from matching.models import (
 )
 
 
-def _insight_exists(category: str, report=None) -> bool:
-    """Check if an active, non-dismissed insight already exists for this category + report."""
-    return AnalyticsInsight.objects.filter(
-        category=category,
-        report=report,
-        is_active=True,
-        is_dismissed=False,
-    ).exists()
-
-
 class Command(BaseCommand):
     help = 'Generate proactive analytics insights from engagement data'
 
@@ -50,22 +44,47 @@ class Command(BaseCommand):
         else:
             reports = MemberReport.objects.filter(is_active=True)
 
-        if not reports.exists():
+        reports = list(reports)
+        if not reports:
             self.stdout.write(self.style.WARNING('No active reports found.'))
             return
 
+        report_ids = [report.id for report in reports]
+
+        # Page-level summary and partner summaries per report
+        page_summaries = {}
+        partner_summaries_by_report = defaultdict(list)
+        for es in EngagementSummary.objects.filter(report_id__in=report_ids).order_by('pk'):
+            if es.partner_id == '':
+                page_summaries.setdefault(es.report_id, es)
+            else:
+                partner_summaries_by_report[es.report_id].append(es)
+
+        partners_by_report = defaultdict(list)
+        for rp in ReportPartner.objects.filter(report_id__in=report_ids):
+            partners_by_report[rp.report_id].append(rp)
+
+        # (category, report_id) of active, non-dismissed insights; insights
+        # queued during this run are added so later rules see them too
+        self._existing = set(
+            AnalyticsInsight.objects.filter(
+                is_active=True, is_dismissed=False,
+            ).values_list('category', 'report_id')
+        )
+        self._new_insights = []
+
         created_count = 0
         skipped_count = 0
 
         for report in reports:
             self.stdout.write(f'\n--- Report #{report.id}: {report.member_name} ---')
 
-            page_summary = EngagementSummary.objects.filter(
-                report=report, partner_id=''
-            ).first()
-            partner_summaries = EngagementSummary.objects.filter(
-                report=report,
-            ).exclude(partner_id='')
+            page_summary = page_summaries.get(report.id)
+            partner_summaries = partner_summaries_by_report[report.id]
+            summaries_by_partner = {}
+            for es in partner_summaries:
+                summaries_by_partner.setdefault(es.partner_id, es)
+            partners = partners_by_report[report.id]
 
             # Rule 1 & 2: Idle report
             c, s = self._check_idle_report(report, page_summary)
@@ -73,7 +92,7 @@ class Command(BaseCommand):
             skipped_count += s
 
             # Rule 3: Score calibration
-            c, s = self._check_score_calibration(report, partner_summaries)
+            c, s = self._check_score_calibration(report, partners, summaries_by_partner)
             created_count += c
             skipped_count += s
 
@@ -83,17 +102,17 @@ class Command(BaseCommand):
             skipped_count += s
 
             # Rule 5: Enrichment quality
-            c, s = self._check_enrichment_quality(report, partner_summaries)
+            c, s = self._check_enrichment_quality(report, partners, summaries_by_partner)
             created_count += c
             skipped_count += s
 
             # Rule 6: Partner friction
-            c, s = self._check_partner_friction(report, partner_summaries)
+            c, s = self._check_partner_friction(report, partners, partner_summaries)
             created_count += c
             skipped_count += s
 
             # Rule 7 & 8: Engagement patterns
-            c, s = self._check_engagement_patterns(report, partner_summaries)
+            c, s = self._check_engagement_patterns(report, partners, partner_summaries, summaries_by_partner)
             created_count += c
             skipped_count += s
 
@@ -107,11 +126,26 @@ class Command(BaseCommand):
         created_count += c
         skipped_count += s
 
+        if self._new_insights:
+            AnalyticsInsight.objects.bulk_create(self._new_insights)
+
         self.stdout.write(f'\n{"=" * 60}')
         self.stdout.write(self.style.SUCCESS(
             f'Done. Created {created_count} insights, skipped {skipped_count} duplicates.'
         ))
 
+    def _insight_exists(self, category: str, report=None) -> bool:
+        """Check if an active, non-dismissed insight already exists for this category + report."""
+        return (category, report.id if report else None) in self._existing
+
+    def _create_insight(self, **fields) -> AnalyticsInsight:
+        """Queue an insight for the final bulk_create and mark its key as taken."""
+        insight = AnalyticsInsight(**fields)
+        report = fields.get('report')
+        self._existing.add((insight.category, report.id if report else None))
+        self._new_insights.append(insight)
+        return insight
+
     # =========================================================================
     # RULE 1 & 2: Idle Report
     # =========================================================================
@@ -127,10 +161,10 @@ class Command(BaseCommand):
 
         # Rule 2: CRITICAL — 14+ days idle (check first so we don't also create WARNING)
         if days > 14:
-            if _insight_exists('idle_report', report):
+            if self._insight_exists('idle_report', report):
                 skipped += 1
             else:
-                insight = AnalyticsInsight.objects.create(
+                insight = self._create_insight(
                     report=report,
                     severity='critical',
                     category='idle_report',
@@ -145,10 +179,10 @@ class Command(BaseCommand):
                 created += 1
         # Rule 1: WARNING — 7-14 days idle
         elif days > 7:
-            if _insight_exists('idle_report', report):
+            if self._insight_exists('idle_report', report):
                 skipped += 1
             else:
-                insight = AnalyticsInsight.objects.create(
+                insight = self._create_insight(
                     report=report,
                     severity='warning',
                     category='idle_report',
@@ -168,12 +202,11 @@ class Command(BaseCommand):
     # RULE 3: Score Calibration
     # =========================================================================
 
-    def _check_score_calibration(self, report, partner_summaries):
+    def _check_score_calibration(self, report, partners, summaries_by_partner):
         created = 0
         skipped = 0
 
         # Build score buckets from ReportPartner match_score joined with engagement
-        partners = ReportPartner.objects.filter(report=report)
 
         bucket_high = []   # score 80+
         bucket_mid = []    # score 60-80
@@ -182,7 +215,7 @@ class Command(BaseCommand):
             if rp.match_score is None:
                 continue
             # Find engagement for this partner
-            es = partner_summaries.filter(partner_id=str(rp.source_profile_id)).first() if rp.source_profile_id else None
+            es = summaries_by_partner.get(str(rp.source_profile_id)) if rp.source_profile_id else None
             if es is None:
                 continue
             contacted = es.any_contact_action
@@ -197,10 +230,10 @@ class Command(BaseCommand):
             rate_mid = sum(bucket_mid) / len(bucket_mid)
 
             if rate_mid > rate_high:
-                if _insight_exists('score_calibration', report):
+                if self._insight_exists('score_calibration', report):
                     skipped += 1
                 else:
-                    insight = AnalyticsInsight.objects.create(
+                    insight = self._create_insight(
                         report=report,
                         severity='warning',
                         category='score_calibration',
@@ -234,15 +267,13 @@ class Command(BaseCommand):
             return created, skipped
 
         copies = page_summary.template_copy_count
-        total_email_clicks = partner_summaries.aggregate(
-            total=Sum('email_click_count')
-        )['total'] or 0
+        total_email_clicks = sum(es.email_click_count for es in partner_summaries)
 
         if copies > 3 and total_email_clicks == 0:
-            if _insight_exists('template_friction', report):
+            if self._insight_exists('template_friction', report):
                 skipped += 1
             else:
-                insight = AnalyticsInsight.objects.create(
+                insight = self._create_insight(
                     report=report,
                     severity='warning',
                     category='template_friction',
@@ -267,21 +298,19 @@ class Command(BaseCommand):
     # RULE 5: Enrichment Quality
     # =========================================================================
 
-    def _check_enrichment_quality(self, report, partner_summaries):
+    def _check_enrichment_quality(self, report, partners, summaries_by_partner):
         created = 0
         skipped = 0
 
-        partners = ReportPartner.objects.filter(report=report)
-
         rich_contacted = 0
         rich_total = 0
         basic_contacted = 0
         basic_total = 0
 
         for rp in partners:
-            es = partner_summaries.filter(
-                partner_id=str(rp.source_profile_id)
-            ).first() if rp.source_profile_id else None
+            es = summaries_by_partner.get(
+                str(rp.source_profile_id)
+            ) if rp.source_profile_id else None
             if es is None:
                 continue
 
@@ -301,10 +330,10 @@ class Command(BaseCommand):
 
             # Rich why_fit cards get 2x+ contact rate vs basic
             if rate_basic > 0 and rate_rich >= 2 * rate_basic:
-                if _insight_exists('enrichment_quality', report):
+                if self._insight_exists('enrichment_quality', report):
                     skipped += 1
                 else:
-                    insight = AnalyticsInsight.objects.create(
+                    insight = self._create_insight(
                         report=report,
                         severity='info',
                         category='enrichment_quality',
@@ -332,30 +361,29 @@ class Command(BaseCommand):
     # RULE 6: Partner Friction
     # =========================================================================
 
-    def _check_partner_friction(self, report, partner_summaries):
+    def _check_partner_friction(self, report, partners, partner_summaries):
         created = 0
         skipped = 0
 
         # Partners with high interest (expand >= 5) but no contact action
-        friction_partners = partner_summaries.filter(
-            card_expand_count__gte=5,
-            any_contact_action=False,
-        ).exclude(partner_id='')
+        friction_partners = [
+            es for es in partner_summaries
+            if es.card_expand_count >= 5 and not es.any_contact_action
+        ]
 
         for es in friction_partners:
             # Use partner_id in the dedup check via data field
-            if _insight_exists('partner_friction', report):
+            if self._insight_exists('partner_friction', report):
                 skipped += 1
                 continue
 
             # Look up partner name for a better title
-            rp = ReportPartner.objects.filter(
-                report=report,
-                source_profile_id=es.partner_id,
-            ).first()
+            rp = next(
+                (p for p in partners if str(p.source_profile_id) == es.partner_id), None
+            )
             partner_name = rp.name if rp else f'partner {es.partner_id[:8]}'
 
-            insight = AnalyticsInsight.objects.create(
+            insight = self._create_insight(
                 report=report,
                 severity='warning',
                 category='partner_friction',
@@ -380,50 +408,45 @@ class Command(BaseCommand):
     # RULE 7 & 8: Engagement Patterns
     # =========================================================================
 
-    def _check_engagement_patterns(self, report, partner_summaries):
+    def _check_engagement_patterns(self, report, partners, partner_summaries, summaries_by_partner):
         created = 0
         skipped = 0
 
-        # Get partner-level summaries only (exclude page-level)
-        partner_level = partner_summaries.exclude(partner_id='')
-        total_partners = partner_level.count()
+        # Partner-level summaries only (page-level summary is kept separately)
+        total_partners = len(partner_summaries)
 
         if total_partners == 0:
             return created, skipped
 
-        contacted = partner_level.filter(any_contact_action=True).count()
+        contacted = sum(1 for es in partner_summaries if es.any_contact_action)
 
         # Rule 7: WARNING — Priority section partners all have no contact action
-        priority_partners = ReportPartner.objects.filter(
-            report=report, section='priority'
-        )
-        if priority_partners.exists():
+        priority_partners = [rp for rp in partners if rp.section == 'priority']
+        if priority_partners:
             all_priority_idle = True
             for rp in priority_partners:
                 if rp.source_profile_id:
-                    es = partner_level.filter(
-                        partner_id=str(rp.source_profile_id)
-                    ).first()
+                    es = summaries_by_partner.get(str(rp.source_profile_id))
                     if es and es.any_contact_action:
                         all_priority_idle = False
                         break
 
             if all_priority_idle:
-                if _insight_exists('engagement_pattern', report):
+                if self._insight_exists('engagement_pattern', report):
                     skipped += 1
                 else:
-                    insight = AnalyticsInsight.objects.create(
+                    insight = self._create_insight(
                         report=report,
                         severity='warning',
                         category='engagement_pattern',
                         title=f'No priority partners contacted',
                         description=(
                             f'{report.member_name} has not taken any contact action on '
-                            f'any of the {priority_partners.count()} priority section partners. '
+                            f'any of the {len(priority_partners)} priority section partners. '
                             f'Consider reordering, improving why-fit text, or sending a nudge.'
                         ),
                         data={
-                            'priority_partner_count': priority_partners.count(),
+                            'priority_partner_count': len(priority_partners),
                             'total_contacted': contacted,
                             'total_partners': total_partners,
                         },
@@ -435,10 +458,10 @@ class Command(BaseCommand):
         if total_partners > 0:
             contact_rate = contacted / total_partners
             if contact_rate > 0.80:
-                if _insight_exists('engagement_pattern', report):
+                if self._insight_exists('engagement_pattern', report):
                     skipped += 1
                 else:
-                    insight = AnalyticsInsight.objects.create(
+                    insight = self._create_insight(
                         report=report,
                         severity='info',
                         category='engagement_pattern',
@@ -473,10 +496,10 @@ class Command(BaseCommand):
         scroll_depth = page_summary.avg_scroll_depth_pct
 
         if scroll_depth < 50:
-            if _insight_exists('section_attention', report):
+            if self._insight_exists('section_attention', report):
                 skipped += 1
             else:
-                insight = AnalyticsInsight.objects.create(
+                insight = self._create_insight(
                     report=report,
                     severity='warning',
                     category='section_attention',
@@ -506,7 +529,7 @@ class Command(BaseCommand):
 
         pending = AnalyticsIntervention.objects.filter(
             verified_at__isnull=True,
-        )
+        ).select_related('report')
 
         for intervention in pending:
             window_end = intervention.created_at + timedelta(
@@ -517,12 +540,12 @@ class Command(BaseCommand):
                 continue
 
             report = intervention.report
-            if _insight_exists('intervention_pending', report):
+            if self._insight_exists('intervention_pending', report):
                 skipped += 1
                 continue
 
             days_overdue = (now - window_end).days
-            insight = AnalyticsInsight.objects.create(
+            insight = self._create_insight(
                 report=report,
                 severity='info',
                 category='intervention_pending',
@@ -1,15 +1,46 @@
 """
 Import scraped JV Directory data into Supabase.
 Handles 10,000+ records with upsert logic.
+
+The CSV is streamed into a temp staging table with COPY, rows sharing a
+name are merged in SQL, and existing profiles are matched with an
+indexed join on lower(btrim(name)) (idx_profiles_name_key). Matches get
+their empty fields filled by one UPDATE and the rest are added by one
+INSERT, so memory use does not grow with the profiles table.
 """
 
 import csv
 import re
-from datetime import datetime
 from pathlib import Path
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from matching.models import SupabaseProfile
+from django.db import connection, transaction
+
+from matching.pg_copy import copy_rows
+
+STAGE_TABLE = '_directory_import_stage'
+MERGED_TABLE = '_directory_import_merged'
+MATCHED_TABLE = '_directory_import_matched'
+
+STAGE_COLUMNS = (
+    'row_num', 'name', 'name_key', 'email', 'phone', 'company', 'website',
+    'business_focus', 'status', 'list_size', 'social_reach', 'notes',
+)
+
+# Text fields filled on existing profiles only when they are empty
+FILL_TEXT_FIELDS = ('email', 'phone', 'website', 'business_focus', 'notes')
+# Numeric fields filled on existing profiles only when they are 0/NULL
+FILL_NUMBER_FIELDS = ('list_size', 'social_reach')
+
+# Range of the staging (and profiles) integer columns; one out-of-range
+# value would otherwise fail the whole COPY
+PG_INTEGER_MIN, PG_INTEGER_MAX = -2**31, 2**31 - 1
+
+
+def _first_value(column: str, condition: str) -> str:
+    """SQL for the earliest (by CSV row) value of column meeting condition."""
+    return (
+        f"(array_agg({column} ORDER BY row_num) FILTER (WHERE {condition}))[1] AS {column}"
+    )
 
 
 class Command(BaseCommand):
@@ -50,79 +81,164 @@ class Command(BaseCommand):
         if dry_run:
             self.stdout.write(self.style.WARNING('DRY RUN MODE - No changes will be saved\n'))
 
-        # Load existing profiles for matching
-        self.stdout.write('Loading existing profiles...')
-        existing_profiles = {
-            p.name.lower().strip(): p
-            for p in SupabaseProfile.objects.all()
-        }
-        self.stdout.write(f'Found {len(existing_profiles)} existing profiles\n')
+        self.errors = 0
+        self.skipped = 0
 
-        # Read CSV
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        total_rows = len(rows)
-        if limit > 0:
-            rows = rows[:limit]
-            self.stdout.write(f'Processing {len(rows)} of {total_rows} records (limited)\n')
-        else:
-            self.stdout.write(f'Processing {total_rows} records\n')
-
-        # Stats
-        created = 0
-        updated = 0
-        skipped = 0
-        errors = 0
-
-        # Process records individually (no batch transaction to avoid error cascades)
-        for i, row in enumerate(rows):
-            try:
-                result = self._process_row(row, existing_profiles, dry_run)
-                if result == 'created':
-                    created += 1
-                elif result == 'updated':
-                    updated += 1
-                elif result == 'skipped':
-                    skipped += 1
-            except Exception as e:
-                errors += 1
-                if errors <= 10:  # Only show first 10 errors
-                    self.stdout.write(self.style.ERROR(f'Error: {row.get("name", "?")} - {str(e)[:100]}'))
-
-            # Progress update every 500 records
-            if (i + 1) % 500 == 0:
-                self.stdout.write(f'  Processed {i+1}/{len(rows)} ({100*(i+1)//len(rows)}%)')
+        # Dry runs execute the same statements and roll back, so the
+        # summary reflects exactly what a real run would do.
+        with transaction.atomic():
+            with connection.cursor() as cur:
+                staged = self._stage_csv(cur, csv_file, limit)
+                self.stdout.write(f'Staged {staged} records\n')
+                stats = self._merge(cur)
+            if dry_run:
+                transaction.set_rollback(True)
 
         # Summary
         self.stdout.write('\n' + '='*60)
         self.stdout.write('IMPORT SUMMARY')
         self.stdout.write('='*60)
-        self.stdout.write(f'  Created: {created}')
-        self.stdout.write(f'  Updated: {updated}')
-        self.stdout.write(f'  Skipped: {skipped}')
-        self.stdout.write(f'  Errors:  {errors}')
-        self.stdout.write(f'  Total:   {len(rows)}')
+        self.stdout.write(f'  Created: {stats["created"]}')
+        self.stdout.write(f'  Updated: {stats["updated"]}')
+        self.stdout.write(f'  Skipped: {self.skipped + stats["unchanged"] + stats["merged_rows"]}')
+        self.stdout.write(f'  Errors:  {self.errors}')
+        self.stdout.write(f'  Total:   {staged + self.skipped + self.errors}')
 
         if dry_run:
             self.stdout.write(self.style.WARNING('\nDRY RUN - No changes were saved'))
         else:
             self.stdout.write(self.style.SUCCESS('\nImport complete!'))
 
+    def _stage_csv(self, cur, csv_file: Path, limit: int) -> int:
+        """COPY normalized CSV rows into the staging table; returns rows staged."""
+        cur.execute(f"""
+            CREATE TEMP TABLE {STAGE_TABLE} (
+                row_num integer, name text, name_key text, email text, phone text,
+                company text, website text, business_focus text, status text,
+                list_size integer, social_reach integer, notes text
+            ) ON COMMIT DROP
+        """)
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            staged = copy_rows(cur, STAGE_TABLE, STAGE_COLUMNS, self._staged_rows(reader, limit))
+        cur.execute(f"CREATE INDEX ON {STAGE_TABLE} (name_key)")
+        cur.execute(f"ANALYZE {STAGE_TABLE}")
+        return staged
+
+    def _staged_rows(self, reader, limit: int):
+        """Yield one staging tuple per importable CSV row."""
+        for i, row in enumerate(reader):
+            if limit > 0 and i >= limit:
+                break
+            try:
+                values = self._normalize_row(row)
+            except Exception as e:
+                self.errors += 1
+                if self.errors <= 10:  # Only show first 10 errors
+                    self.stdout.write(self.style.ERROR(f'Error: {row.get("name", "?")} - {str(e)[:100]}'))
+                continue
+            if values is None:
+                self.skipped += 1
+                continue
+            yield (i, *values)
+
+            # Progress update every 5000 records
+            if (i + 1) % 5000 == 0:
+                self.stdout.write(f'  Staged {i+1} records')
+
+    def _merge(self, cur) -> dict:
+        """Merge staged rows into profiles with set-based UPDATE and INSERT."""
+        # One candidate per name: first row's name/status, and for every
+        # other field the first non-empty value across the file.
+        text_columns = ', '.join(
+            _first_value(col, f"{col} IS NOT NULL") for col in ('company', *FILL_TEXT_FIELDS)
+        )
+        number_columns = ', '.join(
+            _first_value(col, f"{col} > 0") for col in FILL_NUMBER_FIELDS
+        )
+        cur.execute(f"""
+            CREATE TEMP TABLE {MERGED_TABLE} ON COMMIT DROP AS
+            SELECT name_key,
+                   (array_agg(name ORDER BY row_num))[1] AS name,
+                   (array_agg(status ORDER BY row_num))[1] AS status,
+                   {text_columns},
+                   {number_columns},
+                   count(*) AS row_count
+            FROM {STAGE_TABLE}
+            GROUP BY name_key
+        """)
+        cur.execute(f"SELECT count(*), COALESCE(sum(row_count), 0) FROM {MERGED_TABLE}")
+        candidates, rows = cur.fetchone()
+
+        cur.execute(f"""
+            CREATE TEMP TABLE {MATCHED_TABLE} ON COMMIT DROP AS
+            SELECT DISTINCT ON (m.name_key) m.name_key, p.id AS profile_id
+            FROM {MERGED_TABLE} m
+            JOIN profiles p ON lower(btrim(p.name)) = m.name_key
+            ORDER BY m.name_key, p.id
+        """)
+        cur.execute(f"SELECT count(*) FROM {MATCHED_TABLE}")
+        matched = cur.fetchone()[0]
+
+        assignments = [
+            f"{col} = COALESCE(NULLIF(p.{col}, ''), m.{col})" for col in FILL_TEXT_FIELDS
+        ] + [
+            f"{col} = CASE WHEN COALESCE(p.{col}, 0) = 0 AND m.{col} > 0 "
+            f"THEN m.{col} ELSE p.{col} END"
+            for col in FILL_NUMBER_FIELDS
+        ]
+        needs_fill = [
+            f"(NULLIF(p.{col}, '') IS NULL AND m.{col} IS NOT NULL)" for col in FILL_TEXT_FIELDS
+        ] + [
+            f"(COALESCE(p.{col}, 0) = 0 AND m.{col} > 0)" for col in FILL_NUMBER_FIELDS
+        ]
+        cur.execute(f"""
+            UPDATE profiles AS p
+            SET {', '.join(assignments)}, updated_at = NOW()
+            FROM {MATCHED_TABLE} x
+            JOIN {MERGED_TABLE} m ON m.name_key = x.name_key
+            WHERE p.id = x.profile_id
+              AND ({' OR '.join(needs_fill)})
+        """)
+        updated = cur.rowcount
+
+        cur.execute(f"""
+            INSERT INTO profiles (
+                id, name, email, phone, company, website, business_focus,
+                status, list_size, social_reach, notes, created_at, updated_at
+            )
+            SELECT gen_random_uuid(), m.name, m.email, m.phone, m.company, m.website,
+                   m.business_focus, m.status, COALESCE(m.list_size, 0),
+                   COALESCE(m.social_reach, 0), m.notes, NOW(), NOW()
+            FROM {MERGED_TABLE} m
+            WHERE NOT EXISTS (SELECT 1 FROM {MATCHED_TABLE} x WHERE x.name_key = m.name_key)
+        """)
+        created = cur.rowcount
+
+        return {
+            'created': created,
+            'updated': updated,
+            'unchanged': matched - updated,
+            'merged_rows': rows - candidates,
+        }
+
     # Valid status values (from Supabase check constraint)
     VALID_STATUSES = {
         'Member', 'Non Member Resource', 'Pending', 'Active', 'Inactive',
         'Premium', 'Basic', 'Trial', 'Suspended'
     }
 
-    def _process_row(self, row: dict, existing: dict, dry_run: bool) -> str:
-        """Process a single row. Returns 'created', 'updated', or 'skipped'."""
+    def _normalize_row(self, row: dict):
+        """
+        Clean a CSV row into staging values (without row_num).
+
+        Returns None for rows that cannot be imported (no name). Raises
+        ValueError for values that do not fit the staging columns, which
+        _staged_rows() counts as an error.
+        """
         name = row.get('name', '').strip()
         if not name:
-            return 'skipped'
-
-        name_lower = name.lower()
+            return None
 
         # Parse list_size (handle various formats, skip URLs/invalid values)
         list_size_raw = row.get('list_size', '')
@@ -137,6 +253,10 @@ class Command(BaseCommand):
         else:
             social_reach = 0
 
+        for field, number in (('list_size', list_size), ('social_reach', social_reach)):
+            if not PG_INTEGER_MIN <= number <= PG_INTEGER_MAX:
+                raise ValueError(f'{field} out of range: {number}')
+
         # Extract clean email
         email = self._extract_email(row.get('email', ''))
 
@@ -167,65 +287,19 @@ class Command(BaseCommand):
             notes_parts.append(f"JV Directory: {row['url']}")
         notes = '\n'.join(notes_parts) if notes_parts else None
 
-        # Check if profile exists
-        existing_profile = existing.get(name_lower)
-
-        if existing_profile:
-            # Update existing - only update fields that are empty or have new data
-            changed = False
-
-            if email and not existing_profile.email:
-                existing_profile.email = email
-                changed = True
-
-            if row.get('phone') and not existing_profile.phone:
-                existing_profile.phone = row['phone'].strip()
-                changed = True
-
-            if website and not existing_profile.website:
-                existing_profile.website = website
-                changed = True
-
-            if business_focus and not existing_profile.business_focus:
-                existing_profile.business_focus = business_focus
-                changed = True
-
-            if list_size > 0 and (not existing_profile.list_size or existing_profile.list_size == 0):
-                existing_profile.list_size = list_size
-                changed = True
-
-            if social_reach > 0 and (not existing_profile.social_reach or existing_profile.social_reach == 0):
-                existing_profile.social_reach = social_reach
-                changed = True
-
-            if notes and not existing_profile.notes:
-                existing_profile.notes = notes
-                changed = True
-
-            if changed:
-                if not dry_run:
-                    existing_profile.save()
-                return 'updated'
-            return 'skipped'
-        else:
-            # Create new profile
-            if not dry_run:
-                new_profile = SupabaseProfile.objects.create(
-                    name=name,
-                    email=email or None,
-                    phone=row.get('phone', '').strip() or None,
-                    company=row.get('company', '').strip() or None,
-                    website=website or None,
-                    business_focus=business_focus or None,
-                    status=status,
-                    list_size=list_size,
-                    social_reach=social_reach,
-                    notes=notes,
-                )
-                # Add to existing dict for dedup within batch
-                existing[name_lower] = new_profile
-
-            return 'created'
+        return (
+            name,
+            name.lower(),
+            email or None,
+            (row.get('phone') or '').strip() or None,
+            (row.get('company') or '').strip() or None,
+            website or None,
+            business_focus or None,
+            status,
+            list_size,
+            social_reach,
+            notes,
+        )
 
     def _parse_number(self, value: str) -> int:
         """Parse numbers like '10,000', '10K', '1M', etc."""
@@ -5,6 +5,7 @@ and generate personalized outreach emails.
 import csv
 import re
 from django.core.management.base import BaseCommand
+from matching.contact_matching import PartnerIndex, match_contacts
 from matching.models import SupabaseProfile
 
 
@@ -20,6 +21,8 @@ COACHING_KEYWORDS = [
     'self-help', 'self-improvement', 'mindfulness', 'meditation', 'yoga',
 ]
 
+COACHING_KEYWORD_SET = frozenset(COACHING_KEYWORDS)
+
 # Category to niche mapping for better matching
 CATEGORY_NICHE_MAP = {
     'coach': ['coaching', 'coach', 'mentor', 'consultant'],
@@ -111,6 +114,12 @@ class Command(BaseCommand):
             default=0,
             help='Minimum follower count to process'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Match coaches across this many processes (default: 1)'
+        )
 
     def handle(self, *args, **options):
         csv_file = options['csv_file']
@@ -130,12 +139,13 @@ class Command(BaseCommand):
         processed = 0
         matched = 0
         results = []
+        coaches = []
 
         with open(csv_file, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
 
             for row in reader:
-                if limit and processed >= limit:
+                if limit and len(coaches) >= limit:
                     break
 
                 # Get follower count
@@ -152,33 +162,36 @@ class Command(BaseCommand):
                 if not coach['email']:
                     continue
 
-                # Find best match
-                best_match = self._find_best_match(coach)
-
-                if best_match:
-                    # Generate personalized email
-                    email_text = self._generate_email(coach, best_match)
-                    partner = best_match['partner']
-
-                    results.append({
-                        'coach_name': coach['name'],
-                        'coach_email': coach['email'],
-                        'coach_category': coach['category'],
-                        'coach_follower_count': coach['follower_count'],
-                        'matched_partner_name': partner.name,
-                        'matched_partner_email': partner.email or '',
-                        'matched_partner_offering': partner.offering or partner.what_you_do or '',
-                        'matched_partner_serves': partner.who_you_serve or '',
-                        'matched_partner_niche': partner.niche or '',
-                        'match_score': best_match['score'],
-                        'match_reason': best_match['reason'],
-                        'personalized_email': email_text,
-                    })
-                    matched += 1
-
-                processed += 1
-                if processed % 1000 == 0:
-                    self.stdout.write(f'  Processed {processed} coaches, {matched} matched...')
+                coaches.append(coach)
+
+        # Find best match for each coach
+        for coach, best_match in zip(
+            coaches, match_contacts(self._find_best_match, coaches, options['workers'])
+        ):
+            if best_match:
+                # Generate personalized email
+                email_text = self._generate_email(coach, best_match)
+                partner = best_match['partner']
+
+                results.append({
+                    'coach_name': coach['name'],
+                    'coach_email': coach['email'],
+                    'coach_category': coach['category'],
+                    'coach_follower_count': coach['follower_count'],
+                    'matched_partner_name': partner.name,
+                    'matched_partner_email': partner.email or '',
+                    'matched_partner_offering': partner.offering or partner.what_you_do or '',
+                    'matched_partner_serves': partner.who_you_serve or '',
+                    'matched_partner_niche': partner.niche or '',
+                    'match_score': best_match['score'],
+                    'match_reason': best_match['reason'],
+                    'personalized_email': email_text,
+                })
+                matched += 1
+
+            processed += 1
+            if processed % 1000 == 0:
+                self.stdout.write(f'  Processed {processed} coaches, {matched} matched...')
 
         # Write output CSV
         self._write_output(results, output_file)
@@ -191,76 +204,14 @@ class Command(BaseCommand):
         ))
 
     def _preprocess_partners(self, partners):
-        """Pre-process partners for faster matching."""
-        partner_data = []
-
-        # First pass: collect all keywords to calculate frequency (for IDF)
-        all_partner_keywords = []
-
-        for p in partners:
-            # Combine all text fields for keyword matching
-            all_text = ' '.join(filter(None, [
-                p.niche or '',
-                p.what_you_do or '',
-                p.who_you_serve or '',
-                p.offering or '',
-                p.seeking or '',
-                p.business_focus or '',
-            ])).lower()
-
-            # Extract keywords
-            keywords = set(re.findall(r'\b\w+\b', all_text))
-            all_partner_keywords.append(keywords)
-
-            # Count niches (comma-separated in niche field)
-            niche_text = p.niche or ''
-            niche_count = len([n.strip() for n in niche_text.split(',') if n.strip()])
-
-            # Calculate breadth penalty: partners with 8+ niches get penalized
-            # 1-3 niches = 1.0 (specialist bonus), 4-7 = 0.9, 8-12 = 0.7, 13+ = 0.5
-            if niche_count <= 3:
-                breadth_multiplier = 1.1  # Specialist bonus
-            elif niche_count <= 7:
-                breadth_multiplier = 1.0  # Normal
-            elif niche_count <= 12:
-                breadth_multiplier = 0.75  # Generalist penalty
-            else:
-                breadth_multiplier = 0.6  # Heavy generalist penalty
-
-            partner_data.append({
-                'partner': p,
-                'niche': (p.niche or '').lower(),
-                'niche_count': niche_count,
-                'breadth_multiplier': breadth_multiplier,
-                'offering': p.offering or p.what_you_do or '',
-                'serves': p.who_you_serve or '',
-                'all_text': all_text,
-                'keywords': keywords,
-                'list_size': p.list_size or 0,
-            })
-
-        # Second pass: calculate keyword frequency across all partners (for IDF-like scoring)
-        from collections import Counter
-        keyword_doc_freq = Counter()
-        for kw_set in all_partner_keywords:
-            for kw in kw_set:
-                keyword_doc_freq[kw] += 1
-
-        # Store for use in matching - keywords appearing in 50%+ of partners are "common"
-        self.keyword_rarity = {}
-        total_partners = len(partners)
-        for kw, freq in keyword_doc_freq.items():
-            doc_freq_ratio = freq / total_partners
-            if doc_freq_ratio > 0.5:
-                self.keyword_rarity[kw] = 0.3  # Very common, low value
-            elif doc_freq_ratio > 0.25:
-                self.keyword_rarity[kw] = 0.6  # Common
-            elif doc_freq_ratio > 0.1:
-                self.keyword_rarity[kw] = 1.0  # Normal
-            else:
-                self.keyword_rarity[kw] = 1.5  # Rare, high value
+        """Pre-process partners for faster matching.
 
-        return partner_data
+        Builds the shared PartnerIndex (keyword sets, keyword rarity and the
+        keyword → partner inverted index used to prune scoring).
+        """
+        self.partner_index = PartnerIndex(partners)
+        self.keyword_rarity = self.partner_index.keyword_rarity
+        return self.partner_index.partner_data
 
     def _extract_coach_data(self, row):
         """Extract and normalize coach data from CSV row."""
@@ -386,101 +337,137 @@ class Command(BaseCommand):
         return seeking
 
     def _find_best_match(self, coach):
-        """Find the best matching partner for a coach using harmonic mean scoring."""
-        best_score = 0
-        best_match = None
-        best_reason = ''
+        """Find the best matching partner for a coach using harmonic mean scoring.
 
+        Partners sharing a seeking/offering/coaching keyword or an audience
+        term with the coach are scored up front; the rest are visited
+        best-bound-first until none can win.
+        """
+        index = self.partner_index
         coach_category = coach['category']
+
+        niche_scores = index.per_partner(
+            ('category', coach_category),
+            lambda pd: self._score_category_match(coach_category, pd['niche']) / 5,  # Convert 0-50 to 0-10
+        )
+
+        def score(pos):
+            return self._score_partner(coach, self.partner_data[pos], niche_scores[pos])[0]
+
+        def bound(pos):
+            # Partners outside the candidate set score at most 3 on
+            # seeking/offering, exactly 3 on keywords and at most 10 on scale.
+            pd = self.partner_data[pos]
+            return self._calculate_harmonic_mean({
+                'niche_alignment': max(niche_scores[pos], 2.0),
+                'seeking_offering': 3,
+                'scale_match': 10,
+                'keyword_overlap': 3.0,
+            }) * pd['breadth_multiplier']
+
+        candidates = index.partners_with_keywords(
+            coach['parsed_seeking']
+            | coach['parsed_offering']
+            | (coach['bio_keywords'] & COACHING_KEYWORD_SET)
+        )
+        for audience in coach['parsed_audience']:
+            candidates |= index.partners_with_substring('serves', audience)
+
+        best_pos, _ = index.find_best(
+            candidates, score,
+            bound_key=coach_category,
+            bound_fn=bound,
+        )
+        if best_pos is None:
+            return None
+
+        pd = self.partner_data[best_pos]
+        final_score, scores, reasons = self._score_partner(coach, pd, niche_scores[best_pos])
+        return {
+            'partner': pd['partner'],
+            'score': round(final_score, 1),
+            'reason': '; '.join(reasons) if reasons else 'general coaching fit',
+            'offering_text': self._clean_text(pd['offering']),
+            'serves_text': self._clean_text(pd['serves']),
+            'component_scores': scores,
+        }
+
+    def _score_partner(self, coach, pd, niche_score):
+        """Score one coach/partner pair. Returns (final_score, scores, reasons)."""
+        scores = {}
+        reasons = []
+
         coach_bio_keywords = coach['bio_keywords']
         coach_followers = coach['follower_count']
         coach_seeking = coach['parsed_seeking']
         coach_audience = coach['parsed_audience']
         coach_offering = coach['parsed_offering']
 
-        for pd in self.partner_data:
-            scores = {}
-            reasons = []
-
-            # 1. Category/Niche alignment (0-10 scale)
-            niche_score = self._score_category_match(coach_category, pd['niche']) / 5  # Convert 0-50 to 0-10
-            scores['niche_alignment'] = max(niche_score, 2.0)  # Floor of 2 - assume some baseline relevance
-            if niche_score >= 6:
-                reasons.append(f"niche: {pd['partner'].niche or 'general'}")
-
-            # 2. Seeking→Offering match (0-10 scale)
-            partner_offering_keywords = pd['keywords']
-            seeking_match = len(coach_seeking & partner_offering_keywords)
-            # Also check if partner serves similar audience
-            partner_serves = (pd['serves'] or '').lower()
-            audience_match = sum(1 for a in coach_audience if a in partner_serves)
-            # Check if coach's offering overlaps with partner's niche (complementary)
-            offering_niche_match = len(coach_offering & pd['keywords'])
-
-            seeking_offering_score = min((seeking_match * 2) + (audience_match * 2) + (offering_niche_match), 10)
-            # Base score of 3 if they're both in coaching space
-            if len(coach_bio_keywords & pd['keywords']) > 0:
-                seeking_offering_score = max(seeking_offering_score, 3)
-            scores['seeking_offering'] = max(seeking_offering_score, 2.0)
-            if seeking_match > 0:
-                matched_terms = list(coach_seeking & partner_offering_keywords)[:2]
-                if matched_terms:
-                    reasons.append(f"offers: {', '.join(matched_terms)}")
-
-            # 3. Scale compatibility (0-10 scale)
-            # Default to neutral score (5) when data is missing - don't penalize unknown
-            scale_score = 5.0  # Neutral default
-            if pd['list_size'] > 0 and coach_followers > 0:
-                ratio = max(pd['list_size'], coach_followers) / max(min(pd['list_size'], coach_followers), 1)
-                if ratio <= 2:
-                    scale_score = 10  # Very similar
-                    reasons.append("similar scale")
-                elif ratio <= 5:
-                    scale_score = 8  # Compatible
-                    reasons.append("compatible scale")
-                elif ratio <= 10:
-                    scale_score = 6  # Moderate difference
-                else:
-                    scale_score = 4  # Large gap but still possible
-            scores['scale_match'] = scale_score
-
-            # 4. Keyword overlap (0-10 scale) - weighted by keyword rarity
-            keyword_overlap = coach_bio_keywords & pd['keywords']
-            relevant_overlap = keyword_overlap & set(COACHING_KEYWORDS)
-
-            # Weight keywords by rarity (rare keywords = higher value)
-            weighted_keyword_score = 0
-            for kw in relevant_overlap:
-                rarity = self.keyword_rarity.get(kw, 1.0)
-                weighted_keyword_score += 1.5 * rarity
-
-            keyword_score = min(weighted_keyword_score, 10)
-            # Base score for being in same general space
-            keyword_score = max(keyword_score, 3.0)
-            scores['keyword_overlap'] = keyword_score
-            if len(relevant_overlap) >= 2:
-                reasons.append(f"keywords: {', '.join(list(relevant_overlap)[:2])}")
-
-            # Calculate weighted harmonic mean
-            raw_score = self._calculate_harmonic_mean(scores)
-
-            # Apply breadth penalty/bonus - specialists get boosted, generalists penalized
-            final_score = raw_score * pd['breadth_multiplier']
-
-            # Update best match
-            if final_score > best_score:
-                best_score = final_score
-                best_reason = '; '.join(reasons) if reasons else 'general coaching fit'
-                best_match = {
-                    'partner': pd['partner'],
-                    'score': round(final_score, 1),
-                    'reason': best_reason,
-                    'offering_text': self._clean_text(pd['offering']),
-                    'serves_text': self._clean_text(pd['serves']),
-                    'component_scores': scores,
-                }
-
-        return best_match
+        # 1. Category/Niche alignment (0-10 scale)
+        scores['niche_alignment'] = max(niche_score, 2.0)  # Floor of 2 - assume some baseline relevance
+        if niche_score >= 6:
+            reasons.append(f"niche: {pd['partner'].niche or 'general'}")
+
+        # 2. Seeking→Offering match (0-10 scale)
+        partner_offering_keywords = pd['keywords']
+        seeking_match = len(coach_seeking & partner_offering_keywords)
+        # Also check if partner serves similar audience
+        partner_serves = (pd['serves'] or '').lower()
+        audience_match = sum(1 for a in coach_audience if a in partner_serves)
+        # Check if coach's offering overlaps with partner's niche (complementary)
+        offering_niche_match = len(coach_offering & pd['keywords'])
+
+        seeking_offering_score = min((seeking_match * 2) + (audience_match * 2) + (offering_niche_match), 10)
+        # Base score of 3 if they're both in coaching space
+        if not coach_bio_keywords.isdisjoint(pd['keywords']):
+            seeking_offering_score = max(seeking_offering_score, 3)
+        scores['seeking_offering'] = max(seeking_offering_score, 2.0)
+        if seeking_match > 0:
+            matched_terms = list(coach_seeking & partner_offering_keywords)[:2]
+            if matched_terms:
+                reasons.append(f"offers: {', '.join(matched_terms)}")
+
+        # 3. Scale compatibility (0-10 scale)
+        # Default to neutral score (5) when data is missing - don't penalize unknown
+        scale_score = 5.0  # Neutral default
+        if pd['list_size'] > 0 and coach_followers > 0:
+            ratio = max(pd['list_size'], coach_followers) / max(min(pd['list_size'], coach_followers), 1)
+            if ratio <= 2:
+                scale_score = 10  # Very similar
+                reasons.append("similar scale")
+            elif ratio <= 5:
+                scale_score = 8  # Compatible
+                reasons.append("compatible scale")
+            elif ratio <= 10:
+                scale_score = 6  # Moderate difference
+            else:
+                scale_score = 4  # Large gap but still possible
+        scores['scale_match'] = scale_score
+
+        # 4. Keyword overlap (0-10 scale) - weighted by keyword rarity
+        keyword_overlap = coach_bio_keywords & pd['keywords']
+        relevant_overlap = keyword_overlap & COACHING_KEYWORD_SET
+
+        # Weight keywords by rarity (rare keywords = higher value)
+        weighted_keyword_score = 0
+        for kw in relevant_overlap:
+            rarity = self.keyword_rarity.get(kw, 1.0)
+            weighted_keyword_score += 1.5 * rarity
+
+        keyword_score = min(weighted_keyword_score, 10)
+        # Base score for being in same general space
+        keyword_score = max(keyword_score, 3.0)
+        scores['keyword_overlap'] = keyword_score
+        if len(relevant_overlap) >= 2:
+            reasons.append(f"keywords: {', '.join(list(relevant_overlap)[:2])}")
+
+        # Calculate weighted harmonic mean
+        raw_score = self._calculate_harmonic_mean(scores)
+
+        # Apply breadth penalty/bonus - specialists get boosted, generalists penalized
+        final_score = raw_score * pd['breadth_multiplier']
+
+        return final_score, scores, reasons
 
     def _calculate_harmonic_mean(self, scores):
         """
@@ -5,6 +5,7 @@ Matching only - no email generation.
 import csv
 import re
 from django.core.management.base import BaseCommand
+from matching.contact_matching import PartnerIndex, match_contacts
 from matching.models import SupabaseProfile
 
 
@@ -22,6 +23,8 @@ COACHING_KEYWORDS = [
     'strategist', 'advisor', 'expert', 'specialist', 'professional',
 ]
 
+COACHING_KEYWORD_SET = frozenset(COACHING_KEYWORDS)
+
 # Industry to niche mapping
 INDUSTRY_NICHE_MAP = {
     'health, wellness & fitness': ['health', 'wellness', 'fitness', 'nutrition', 'weight'],
@@ -85,6 +88,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Only process contacts with email addresses'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Match contacts across this many processes (default: 1)'
+        )
 
     def handle(self, *args, **options):
         csv_file = options['csv_file']
@@ -105,12 +114,13 @@ class Command(BaseCommand):
         matched = 0
         skipped_no_email = 0
         results = []
+        contacts = []
 
         with open(csv_file, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
 
             for row in reader:
-                if limit and processed >= limit:
+                if limit and len(contacts) >= limit:
                     break
 
                 # Get contact data
@@ -121,37 +131,40 @@ class Command(BaseCommand):
                     skipped_no_email += 1
                     continue
 
-                # Find best match
-                best_match = self._find_best_match(contact)
-
-                if best_match:
-                    partner = best_match['partner']
-
-                    results.append({
-                        'contact_first_name': contact['first_name'],
-                        'contact_last_name': contact['last_name'],
-                        'contact_full_name': contact['full_name'],
-                        'contact_email': contact['email'],
-                        'contact_title': contact['title'],
-                        'contact_position': contact['position'],
-                        'contact_company': contact['company'],
-                        'contact_industry': contact['industry'],
-                        'contact_employees': contact['employees'],
-                        'contact_linkedin_url': contact['linkedin_url'],
-                        'matched_partner_name': partner.name,
-                        'matched_partner_email': partner.email or '',
-                        'matched_partner_niche': partner.niche or '',
-                        'matched_partner_offering': partner.offering or partner.what_you_do or '',
-                        'matched_partner_serves': partner.who_you_serve or '',
-                        'matched_partner_list_size': partner.list_size or 0,
-                        'match_score': best_match['score'],
-                        'match_reason': best_match['reason'],
-                    })
-                    matched += 1
-
-                processed += 1
-                if processed % 1000 == 0:
-                    self.stdout.write(f'  Processed {processed} contacts, {matched} matched...')
+                contacts.append(contact)
+
+        # Find best match for each contact
+        for contact, best_match in zip(
+            contacts, match_contacts(self._find_best_match, contacts, options['workers'])
+        ):
+            if best_match:
+                partner = best_match['partner']
+
+                results.append({
+                    'contact_first_name': contact['first_name'],
+                    'contact_last_name': contact['last_name'],
+                    'contact_full_name': contact['full_name'],
+                    'contact_email': contact['email'],
+                    'contact_title': contact['title'],
+                    'contact_position': contact['position'],
+                    'contact_company': contact['company'],
+                    'contact_industry': contact['industry'],
+                    'contact_employees': contact['employees'],
+                    'contact_linkedin_url': contact['linkedin_url'],
+                    'matched_partner_name': partner.name,
+                    'matched_partner_email': partner.email or '',
+                    'matched_partner_niche': partner.niche or '',
+                    'matched_partner_offering': partner.offering or partner.what_you_do or '',
+                    'matched_partner_serves': partner.who_you_serve or '',
+                    'matched_partner_list_size': partner.list_size or 0,
+                    'match_score': best_match['score'],
+                    'match_reason': best_match['reason'],
+                })
+                matched += 1
+
+            processed += 1
+            if processed % 1000 == 0:
+                self.stdout.write(f'  Processed {processed} contacts, {matched} matched...')
 
         # Write output CSV
         self._write_output(results, output_file)
@@ -173,76 +186,14 @@ class Command(BaseCommand):
             self.stdout.write(f'  Average: {sum(scores)/len(scores):.2f}')
 
     def _preprocess_partners(self, partners):
-        """Pre-process partners for faster matching."""
-        partner_data = []
-
-        # First pass: collect all keywords to calculate frequency (for IDF)
-        all_partner_keywords = []
-
-        for p in partners:
-            # Combine all text fields for keyword matching
-            all_text = ' '.join(filter(None, [
-                p.niche or '',
-                p.what_you_do or '',
-                p.who_you_serve or '',
-                p.offering or '',
-                p.seeking or '',
-                p.business_focus or '',
-            ])).lower()
-
-            # Extract keywords
-            keywords = set(re.findall(r'\b\w+\b', all_text))
-            all_partner_keywords.append(keywords)
-
-            # Count niches (comma-separated in niche field)
-            niche_text = p.niche or ''
-            niche_count = len([n.strip() for n in niche_text.split(',') if n.strip()])
-
-            # Calculate breadth penalty: partners with 8+ niches get penalized
-            # 1-3 niches = 1.1 (specialist bonus), 4-7 = 1.0, 8-12 = 0.75, 13+ = 0.6
-            if niche_count <= 3:
-                breadth_multiplier = 1.1  # Specialist bonus
-            elif niche_count <= 7:
-                breadth_multiplier = 1.0  # Normal
-            elif niche_count <= 12:
-                breadth_multiplier = 0.75  # Generalist penalty
-            else:
-                breadth_multiplier = 0.6  # Heavy generalist penalty
-
-            partner_data.append({
-                'partner': p,
-                'niche': (p.niche or '').lower(),
-                'niche_count': niche_count,
-                'breadth_multiplier': breadth_multiplier,
-                'offering': p.offering or p.what_you_do or '',
-                'serves': p.who_you_serve or '',
-                'all_text': all_text,
-                'keywords': keywords,
-                'list_size': p.list_size or 0,
-            })
-
-        # Second pass: calculate keyword frequency across all partners (for IDF-like scoring)
-        from collections import Counter
-        keyword_doc_freq = Counter()
-        for kw_set in all_partner_keywords:
-            for kw in kw_set:
-                keyword_doc_freq[kw] += 1
-
-        # Store for use in matching - keywords appearing in 50%+ of partners are "common"
-        self.keyword_rarity = {}
-        total_partners = len(partners)
-        for kw, freq in keyword_doc_freq.items():
-            doc_freq_ratio = freq / total_partners
-            if doc_freq_ratio > 0.5:
-                self.keyword_rarity[kw] = 0.3  # Very common, low value
-            elif doc_freq_ratio > 0.25:
-                self.keyword_rarity[kw] = 0.6  # Common
-            elif doc_freq_ratio > 0.1:
-                self.keyword_rarity[kw] = 1.0  # Normal
-            else:
-                self.keyword_rarity[kw] = 1.5  # Rare, high value
+        """Pre-process partners for faster matching.
 
-        return partner_data
+        Builds the shared PartnerIndex (keyword sets, keyword rarity and the
+        keyword → partner inverted index used to prune scoring).
+        """
+        self.partner_index = PartnerIndex(partners)
+        self.keyword_rarity = self.partner_index.keyword_rarity
+        return self.partner_index.partner_data
 
     def _extract_contact_data(self, row):
         """Extract and normalize contact data from CSV row."""
@@ -309,85 +260,119 @@ class Command(BaseCommand):
         return 'professional'
 
     def _find_best_match(self, contact):
-        """Find the best matching partner for a contact using harmonic mean scoring."""
-        best_score = 0
-        best_match = None
-        best_reason = ''
+        """Find the best matching partner for a contact using harmonic mean scoring.
+
+        Only partners sharing a coaching keyword with the title are scored up
+        front; the rest are visited best-bound-first until none can win.
+        """
+        index = self.partner_index
+        contact_industry = contact['industry']
+        contact_category = contact['inferred_category']
+
+        niche_scores = index.per_partner(
+            ('industry', contact_industry),
+            lambda pd: self._score_industry_match(contact_industry, pd['niche']),
+        )
+        category_scores = index.per_partner(
+            ('category', contact_category),
+            lambda pd: self._score_title_match(frozenset(), contact_category, pd),
+        )
+
+        def score(pos):
+            return self._score_partner(contact, self.partner_data[pos], niche_scores[pos])[0]
+
+        def bound(pos):
+            # Partners sharing no coaching keyword: title and keyword scores
+            # are fixed; scale can be at most 10.
+            pd = self.partner_data[pos]
+            return self._calculate_harmonic_mean({
+                'niche_alignment': max(niche_scores[pos], 2.0),
+                'title_match': max(category_scores[pos], 2.0),
+                'scale_match': 10,
+                'keyword_overlap': 3.0,
+            }) * pd['breadth_multiplier']
+
+        candidates = index.partners_with_keywords(contact['title_keywords'] & COACHING_KEYWORD_SET)
+        best_pos, _ = index.find_best(
+            candidates, score,
+            bound_key=(contact_industry, contact_category),
+            bound_fn=bound,
+        )
+        if best_pos is None:
+            return None
+
+        pd = self.partner_data[best_pos]
+        final_score, scores, reasons = self._score_partner(contact, pd, niche_scores[best_pos])
+        return {
+            'partner': pd['partner'],
+            'score': round(final_score, 1),
+            'reason': '; '.join(reasons) if reasons else 'general professional fit',
+            'component_scores': scores,
+        }
+
+    def _score_partner(self, contact, pd, niche_score):
+        """Score one contact/partner pair. Returns (final_score, scores, reasons)."""
+        scores = {}
+        reasons = []
 
         contact_industry = contact['industry']
         contact_title_keywords = contact['title_keywords']
         contact_employees = contact['employees']
         contact_category = contact['inferred_category']
 
-        for pd in self.partner_data:
-            scores = {}
-            reasons = []
-
-            # 1. Industry/Niche alignment (0-10 scale)
-            niche_score = self._score_industry_match(contact_industry, pd['niche'])
-            scores['niche_alignment'] = max(niche_score, 2.0)  # Floor of 2
-            if niche_score >= 6:
-                reasons.append(f"industry: {contact_industry or 'general'}")
-
-            # 2. Title/Position match (0-10 scale)
-            title_score = self._score_title_match(contact_title_keywords, contact_category, pd)
-            scores['title_match'] = max(title_score, 2.0)
-            if title_score >= 6:
-                reasons.append(f"role: {contact_category}")
-
-            # 3. Scale compatibility (0-10 scale)
-            # Use employee count as proxy for contact's "scale"
-            # Compare to partner's list_size (rough approximation)
-            scale_score = 5.0  # Neutral default
-            if pd['list_size'] > 0 and contact_employees > 0:
-                # Approximate: 1 employee ≈ 100 list members (rough heuristic)
-                contact_scale_proxy = contact_employees * 100
-                ratio = max(pd['list_size'], contact_scale_proxy) / max(min(pd['list_size'], contact_scale_proxy), 1)
-                if ratio <= 3:
-                    scale_score = 10
-                    reasons.append("similar scale")
-                elif ratio <= 10:
-                    scale_score = 7
-                elif ratio <= 50:
-                    scale_score = 5
-                else:
-                    scale_score = 3
-            scores['scale_match'] = scale_score
-
-            # 4. Keyword overlap (0-10 scale) - weighted by keyword rarity
-            keyword_overlap = contact_title_keywords & pd['keywords']
-            relevant_overlap = keyword_overlap & set(COACHING_KEYWORDS)
-
-            # Weight keywords by rarity (rare keywords = higher value)
-            weighted_keyword_score = 0
-            for kw in relevant_overlap:
-                rarity = self.keyword_rarity.get(kw, 1.0)
-                weighted_keyword_score += 2 * rarity
-
-            keyword_score = min(weighted_keyword_score, 10)
-            keyword_score = max(keyword_score, 3.0)  # Base score
-            scores['keyword_overlap'] = keyword_score
-            if len(relevant_overlap) >= 2:
-                reasons.append(f"keywords: {', '.join(list(relevant_overlap)[:2])}")
-
-            # Calculate weighted harmonic mean
-            raw_score = self._calculate_harmonic_mean(scores)
-
-            # Apply breadth penalty/bonus - specialists get boosted, generalists penalized
-            final_score = raw_score * pd['breadth_multiplier']
-
-            # Update best match
-            if final_score > best_score:
-                best_score = final_score
-                best_reason = '; '.join(reasons) if reasons else 'general professional fit'
-                best_match = {
-                    'partner': pd['partner'],
-                    'score': round(final_score, 1),
-                    'reason': best_reason,
-                    'component_scores': scores,
-                }
-
-        return best_match
+        # 1. Industry/Niche alignment (0-10 scale)
+        scores['niche_alignment'] = max(niche_score, 2.0)  # Floor of 2
+        if niche_score >= 6:
+            reasons.append(f"industry: {contact_industry or 'general'}")
+
+        # 2. Title/Position match (0-10 scale)
+        title_score = self._score_title_match(contact_title_keywords, contact_category, pd)
+        scores['title_match'] = max(title_score, 2.0)
+        if title_score >= 6:
+            reasons.append(f"role: {contact_category}")
+
+        # 3. Scale compatibility (0-10 scale)
+        # Use employee count as proxy for contact's "scale"
+        # Compare to partner's list_size (rough approximation)
+        scale_score = 5.0  # Neutral default
+        if pd['list_size'] > 0 and contact_employees > 0:
+            # Approximate: 1 employee ≈ 100 list members (rough heuristic)
+            contact_scale_proxy = contact_employees * 100
+            ratio = max(pd['list_size'], contact_scale_proxy) / max(min(pd['list_size'], contact_scale_proxy), 1)
+            if ratio <= 3:
+                scale_score = 10
+                reasons.append("similar scale")
+            elif ratio <= 10:
+                scale_score = 7
+            elif ratio <= 50:
+                scale_score = 5
+            else:
+                scale_score = 3
+        scores['scale_match'] = scale_score
+
+        # 4. Keyword overlap (0-10 scale) - weighted by keyword rarity
+        keyword_overlap = contact_title_keywords & pd['keywords']
+        relevant_overlap = keyword_overlap & COACHING_KEYWORD_SET
+
+        # Weight keywords by rarity (rare keywords = higher value)
+        weighted_keyword_score = 0
+        for kw in relevant_overlap:
+            rarity = self.keyword_rarity.get(kw, 1.0)
+            weighted_keyword_score += 2 * rarity
+
+        keyword_score = min(weighted_keyword_score, 10)
+        keyword_score = max(keyword_score, 3.0)  # Base score
+        scores['keyword_overlap'] = keyword_score
+        if len(relevant_overlap) >= 2:
+            reasons.append(f"keywords: {', '.join(list(relevant_overlap)[:2])}")
+
+        # Calculate weighted harmonic mean
+        raw_score = self._calculate_harmonic_mean(scores)
+
+        # Apply breadth penalty/bonus - specialists get boosted, generalists penalized
+        final_score = raw_score * pd['breadth_multiplier']
+
+        return final_score, scores, reasons
 
     def _calculate_harmonic_mean(self, scores):
         """
@@ -448,7 +433,7 @@ class Command(BaseCommand):
 
         # Direct keyword overlap
         overlap = title_keywords & partner_keywords
-        coaching_overlap = overlap & set(COACHING_KEYWORDS)
+        coaching_overlap = overlap & COACHING_KEYWORD_SET
         score += len(coaching_overlap) * 1.5
 
         return min(score, 10)
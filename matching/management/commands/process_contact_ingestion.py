@@ -0,0 +1,51 @@
+"""
+Drain queued contact ingestion jobs submitted to /api/contacts/ingest/.
+
+Each pass claims up to --max-contacts worth of queued jobs, coalesces jobs
+that share a source into one new_contact_flow run, and records per-job
+status for the /api/contacts/ingest/<job_id>/ status endpoint.
+
+Usage:
+    python manage.py process_contact_ingestion              # one pass
+    python manage.py process_contact_ingestion --loop       # run as a worker
+    python manage.py process_contact_ingestion --loop --interval 10
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from matching.tasks import INGESTION_BATCH_CONTACTS, process_contact_ingestion_jobs
+
+
+class Command(BaseCommand):
+    help = 'Process queued contact ingestion jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep polling the queue instead of exiting after one pass',
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5.0,
+            help='Seconds to wait when the queue is empty (default: 5)',
+        )
+        parser.add_argument(
+            '--max-contacts', type=int, default=INGESTION_BATCH_CONTACTS,
+            help=f'Contacts per coalesced batch (default: {INGESTION_BATCH_CONTACTS})',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            results = process_contact_ingestion_jobs(options['max_contacts'])
+            if results['jobs']:
+                self.stdout.write(
+                    f"Processed {results['jobs']} jobs ({results['contacts']} contacts, "
+                    f"{results['flow_runs']} flow runs, {results['failed']} failed)"
+                )
+            if not options['loop']:
+                if not results['jobs']:
+                    self.stdout.write(self.style.SUCCESS('Ingestion queue is empty.'))
+                return
+            if not results['jobs']:
+                time.sleep(options['interval'])
@@ -0,0 +1,51 @@
+"""
+Drain queued match recalculation jobs from the match and profile lists.
+
+Each job scores a user's Profiles against their ICP in chunks, skipping
+profiles whose input fingerprint is unchanged, and records progress for
+the match-recalc-status endpoint.
+
+Usage:
+    python manage.py process_match_recalculation              # one pass
+    python manage.py process_match_recalculation --loop       # run as a worker
+    python manage.py process_match_recalculation --loop --interval 10
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from matching.tasks import MATCH_RECALC_CHUNK_PROFILES, process_match_recalculation_jobs
+
+
+class Command(BaseCommand):
+    help = 'Process queued match recalculation jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep polling the queue instead of exiting after one pass',
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5.0,
+            help='Seconds to wait when the queue is empty (default: 5)',
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=MATCH_RECALC_CHUNK_PROFILES,
+            help=f'Profiles scored per chunk (default: {MATCH_RECALC_CHUNK_PROFILES})',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            results = process_match_recalculation_jobs(options['chunk_size'])
+            if results['jobs']:
+                self.stdout.write(
+                    f"Processed {results['jobs']} jobs ({results['scored']} scored, "
+                    f"{results['skipped']} unchanged, {results['failed']} failed)"
+                )
+            if not options['loop']:
+                if not results['jobs']:
+                    self.stdout.write(self.style.SUCCESS('Recalculation queue is empty.'))
+                return
+            if not results['jobs']:
+                time.sleep(options['interval'])
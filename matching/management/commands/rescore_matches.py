@@ -27,6 +27,7 @@ from django.core.management.base import BaseCommand
 from django.db import connection
 from django.utils import timezone
 
+from matching.match_cache import invalidate_matches
 from matching.models import SupabaseProfile, SupabaseMatch
 from matching.services import SupabaseMatchScoringService, ShadowScoringService
 
@@ -231,6 +232,7 @@ class Command(BaseCommand):
                     ['score_ab', 'score_ba', 'harmonic_mean', 'match_reason', 'match_context'],
                     batch_size=batch_size,
                 )
+                invalidate_matches((m.profile_id, m.suggested_profile_id) for m in to_update)
 
             # Cycle DB connection between batches (PgBouncer safety)
             connection.close()
@@ -23,6 +23,9 @@ Usage:
 
     # Resume from checkpoint
     python3 manage.py run_enrichment_cascade --layers 1 --limit 1000 --resume
+
+    # Layer 4 with several conflicts per Claude call
+    python3 manage.py run_enrichment_cascade --layers 3,4 --batched-judge
 """
 
 from django.core.management.base import BaseCommand
@@ -89,6 +92,11 @@ class Command(BaseCommand):
             action='store_true',
             help='Only process profiles imported since last cascade run',
         )
+        parser.add_argument(
+            '--batched-judge',
+            action='store_true',
+            help='Layer 4: judge several deduplicated conflicts per Claude call',
+        )
 
     def handle(self, *args, **options):
         from matching.enrichment.flows.cascade_flow import enrichment_cascade_flow
@@ -121,6 +129,7 @@ class Command(BaseCommand):
         self.stdout.write(f'  Limit:           {options["limit"] or "none"}')
         self.stdout.write(f'  Dry run:         {options["dry_run"]}')
         self.stdout.write(f'  Resume:          {options["resume"]}')
+        self.stdout.write(f'  Batched judge:   {options["batched_judge"]}')
         self.stdout.write('')
 
         result = enrichment_cascade_flow(
@@ -133,6 +142,7 @@ class Command(BaseCommand):
             limit=options['limit'],
             dry_run=options['dry_run'],
             checkpoint_id=checkpoint_id,
+            batched_judge=options['batched_judge'],
         )
 
         # Print summary
@@ -0,0 +1,85 @@
+"""
+Cached match lookups for the Supabase profile detail page.
+
+A profile's top matches (in both directions) and the viewing user's
+pair match against it only change when match_suggestions rows are
+rewritten, while popular profiles are viewed many times in between.
+Both are served from Django's cache and dropped by invalidate_matches(),
+which the match writers call after committing.
+"""
+
+from django.core.cache import cache
+
+from .models import SupabaseMatch
+
+# Matches shown per direction on the profile detail page
+MATCH_SECTION_LIMIT = 10
+
+# Upper bound on staleness for writers that do not call invalidate_matches()
+MATCH_CACHE_TTL = 60 * 60
+
+# Stored for pairs with no match row, since cache.get() returns None on a miss
+_NO_MATCH = 'no-match'
+
+
+def _sections_key(profile_id) -> str:
+    return f'match-sections:{profile_id}'
+
+
+def _pair_key(profile_id, suggested_profile_id) -> str:
+    return f'match-pair:{profile_id}:{suggested_profile_id}'
+
+
+def match_sections(profile_id) -> dict:
+    """
+    Top matches where the profile is the source and where it is the target.
+
+    Returns {'as_source': [...], 'as_target': [...]} of SupabaseMatch rows,
+    each ordered by harmonic_mean and capped at MATCH_SECTION_LIMIT.
+    """
+    key = _sections_key(profile_id)
+    sections = cache.get(key)
+    if sections is None:
+        sections = {
+            'as_source': list(
+                SupabaseMatch.objects.filter(profile_id=profile_id)
+                .order_by('-harmonic_mean')[:MATCH_SECTION_LIMIT]
+            ),
+            'as_target': list(
+                SupabaseMatch.objects.filter(suggested_profile_id=profile_id)
+                .order_by('-harmonic_mean')[:MATCH_SECTION_LIMIT]
+            ),
+        }
+        cache.set(key, sections, MATCH_CACHE_TTL)
+    return sections
+
+
+def pair_match(profile_id, suggested_profile_id):
+    """The SupabaseMatch for one (profile, suggested profile) pair, or None."""
+    key = _pair_key(profile_id, suggested_profile_id)
+    cached = cache.get(key)
+    if cached is None:
+        match = SupabaseMatch.objects.filter(
+            profile_id=profile_id,
+            suggested_profile_id=suggested_profile_id,
+        ).first()
+        cache.set(key, _NO_MATCH if match is None else match, MATCH_CACHE_TTL)
+        return match
+    return None if cached == _NO_MATCH else cached
+
+
+def invalidate_matches(pairs):
+    """
+    Drop cached data for rewritten match rows.
+
+    Args:
+        pairs: Iterable of (profile_id, suggested_profile_id) for every
+            match_suggestions row inserted, updated or deleted
+    """
+    keys = set()
+    for profile_id, suggested_profile_id in pairs:
+        keys.add(_sections_key(profile_id))
+        keys.add(_sections_key(suggested_profile_id))
+        keys.add(_pair_key(profile_id, suggested_profile_id))
+    if keys:
+        cache.delete_many(list(keys))
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    atomic = False
+
+    dependencies = [
+        ('matching', '0023_evaluationbatch_completion_notes_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                -- Weighted full-text document for prospect search, indexed as
+                -- an expression so no column is added: a stored generated
+                -- column would rewrite profiles under ACCESS EXCLUSIVE.
+                -- Must stay identical to _SEARCH_DOCUMENT in
+                -- matching/enrichment/flows/db_prospect_search.py.
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profiles_search_tsv
+                    ON profiles USING GIN ((
+                        setweight(to_tsvector('english', coalesce(niche, '')), 'A')
+                        || setweight(to_tsvector('english', coalesce(what_you_do, '')), 'B')
+                        || setweight(to_tsvector('english', coalesce(offering, '')), 'B')
+                    ));
+            """,
+            reverse_sql="""
+                DROP INDEX CONCURRENTLY IF EXISTS idx_profiles_search_tsv;
+            """,
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    atomic = False
+
+    dependencies = [
+        ('matching', '0024_add_profiles_search_tsv'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                -- Apollo person id lookup for ApolloWebhookView. Expression
+                -- index, so every writer of enrichment_metadata.apollo_data
+                -- keeps it current without extra bookkeeping.
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profiles_apollo_id
+                    ON profiles ((enrichment_metadata->'apollo_data'->>'apollo_id'));
+            """,
+            reverse_sql="""
+                DROP INDEX CONCURRENTLY IF EXISTS idx_profiles_apollo_id;
+            """,
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:47
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0025_add_profiles_apollo_id_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContactIngestionJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('source', models.CharField(default='api_webhook', max_length=50)),
+                ('ingested_by', models.CharField(blank=True, default='', max_length=200)),
+                ('contacts', models.JSONField(default=list)),
+                ('contact_count', models.IntegerField(default=0)),
+                ('processed_count', models.IntegerField(default=0)),
+                ('result', models.JSONField(blank=True, default=dict, help_text='ContactIngestionResult of the (possibly coalesced) flow run')),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='matching_co_status_3d10f0_idx')],
+            },
+        ),
+    ]
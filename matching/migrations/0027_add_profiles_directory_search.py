@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    atomic = False
+
+    dependencies = [
+        ('matching', '0026_contactingestionjob'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                -- Weighted document for the partner directory search
+                -- (SupabaseProfileListView): who they are ranks above what
+                -- they do. Expression index rather than a stored column, so
+                -- profiles is not rewritten under ACCESS EXCLUSIVE. Must stay
+                -- identical to DIRECTORY_SEARCH_DOCUMENT in matching/views.py.
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profiles_directory_tsv
+                    ON profiles USING GIN ((
+                        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+                        || setweight(to_tsvector('english', coalesce(company, '')), 'A')
+                        || setweight(to_tsvector('english', coalesce(niche, '')), 'B')
+                        || setweight(to_tsvector('english', coalesce(business_focus, '')), 'B')
+                        || setweight(to_tsvector('english', coalesce(what_you_do, '')), 'C')
+                        || setweight(to_tsvector('english', coalesce(who_you_serve, '')), 'C')
+                    ));
+            """,
+            reverse_sql="""
+                DROP INDEX CONCURRENTLY IF EXISTS idx_profiles_directory_tsv;
+            """,
+        ),
+        migrations.RunSQL(
+            sql="""
+                -- Keyset pagination order for the directory
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profiles_last_active_keyset
+                    ON profiles (last_active_at DESC NULLS LAST, id DESC);
+            """,
+            reverse_sql="""
+                DROP INDEX CONCURRENTLY IF EXISTS idx_profiles_last_active_keyset;
+            """,
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    atomic = False
+
+    dependencies = [
+        ('matching', '0027_add_profiles_directory_search'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                -- "Matched by" section of the profile detail page; the
+                -- source direction is already covered by idx_match_profile_score.
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_match_suggested_score
+                    ON match_suggestions (suggested_profile_id, harmonic_mean DESC);
+            """,
+            reverse_sql="""
+                DROP INDEX CONCURRENTLY IF EXISTS idx_match_suggested_score;
+            """,
+        ),
+        migrations.RunSQL(
+            sql="""
+                -- Viewer profile lookup (email__iexact compiles to UPPER(email)).
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profiles_email_upper
+                    ON profiles (UPPER(email));
+            """,
+            reverse_sql="""
+                DROP INDEX CONCURRENTLY IF EXISTS idx_profiles_email_upper;
+            """,
+        ),
+    ]
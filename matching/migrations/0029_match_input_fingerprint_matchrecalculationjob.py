@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:02
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0028_add_profile_detail_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='match',
+            name='input_fingerprint',
+            field=models.CharField(blank=True, default='', help_text='Hash of the profile fields and ICP the scores were computed from', max_length=64),
+        ),
+        migrations.CreateModel(
+            name='MatchRecalculationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('mode', models.CharField(choices=[('missing', 'Profiles without matches'), ('all', 'All profiles')], default='all', max_length=20)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('total_count', models.IntegerField(default=0)),
+                ('processed_count', models.IntegerField(default=0)),
+                ('scored_count', models.IntegerField(default=0)),
+                ('skipped_count', models.IntegerField(default=0, help_text='Profiles whose input fingerprint was unchanged')),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_recalculation_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='matching_ma_status_83eda2_idx')],
+            },
+        ),
+    ]
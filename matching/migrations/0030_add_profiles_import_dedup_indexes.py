@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    atomic = False
+
+    dependencies = [
+        ('matching', '0029_match_input_fingerprint_matchrecalculationjob'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                -- Normalized name key for the directory/CSV importers' dedup
+                -- joins (name, name+company, name+domain).
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profiles_name_key
+                    ON profiles (lower(btrim(name)));
+            """,
+            reverse_sql="""
+                DROP INDEX CONCURRENTLY IF EXISTS idx_profiles_name_key;
+            """,
+        ),
+        migrations.RunSQL(
+            sql="""
+                -- Email dedup for the importers and contact ingestion
+                -- (LOWER(email) = ANY(...)).
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profiles_email_lower
+                    ON profiles (lower(email));
+            """,
+            reverse_sql="""
+                DROP INDEX CONCURRENTLY IF EXISTS idx_profiles_email_lower;
+            """,
+        ),
+    ]
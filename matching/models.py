@@ -311,6 +311,12 @@ class Match(models.Model):
         default=Status.NEW
     )
     notes = models.TextField(null=True, blank=True)
+    input_fingerprint = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        help_text='Hash of the profile fields and ICP the scores were computed from'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -1435,3 +1441,105 @@ class WeightExperiment(models.Model):
 
     def __str__(self):
         return f"{self.name} ({self.status})"
+
+
+# =============================================================================
+# CONTACT INGESTION QUEUE (API submissions drained by a background worker)
+# =============================================================================
+
+class ContactIngestionJob(models.Model):
+    """
+    A contact batch submitted to /api/contacts/ingest/.
+
+    The endpoint only validates and stores the payload; the
+    process_contact_ingestion worker drains queued jobs through
+    new_contact_flow, coalescing submissions that share a source.
+    """
+    class Status(models.TextChoices):
+        QUEUED = 'queued', 'Queued'
+        RUNNING = 'running', 'Running'
+        COMPLETED = 'completed', 'Completed'
+        FAILED = 'failed', 'Failed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.QUEUED)
+    source = models.CharField(max_length=50, default='api_webhook')
+    ingested_by = models.CharField(max_length=200, blank=True, default='')
+    contacts = models.JSONField(default=list)
+    contact_count = models.IntegerField(default=0)
+    processed_count = models.IntegerField(default=0)
+    result = models.JSONField(
+        default=dict, blank=True,
+        help_text='ContactIngestionResult of the (possibly coalesced) flow run'
+    )
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Ingestion {self.id} ({self.contact_count} contacts, {self.status})"
+
+
+class MatchRecalculationJob(models.Model):
+    """
+    A request to (re)score a user's Profiles against their ICP.
+
+    Queued by CalculateBulkMatchView / RecalculateAllMatchesView and drained
+    in chunks by the process_match_recalculation worker; the match list
+    polls the job for progress.
+    """
+    class Mode(models.TextChoices):
+        MISSING = 'missing', 'Profiles without matches'
+        ALL = 'all', 'All profiles'
+
+    class Status(models.TextChoices):
+        QUEUED = 'queued', 'Queued'
+        RUNNING = 'running', 'Running'
+        COMPLETED = 'completed', 'Completed'
+        FAILED = 'failed', 'Failed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    user = models.ForeignKey(
+        'core.User',
+        on_delete=models.CASCADE,
+        related_name='match_recalculation_jobs'
+    )
+    mode = models.CharField(max_length=20, choices=Mode.choices, default=Mode.ALL)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.QUEUED)
+    total_count = models.IntegerField(default=0)
+    processed_count = models.IntegerField(default=0)
+    scored_count = models.IntegerField(default=0)
+    skipped_count = models.IntegerField(
+        default=0,
+        help_text='Profiles whose input fingerprint was unchanged'
+    )
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Match recalculation {self.id} ({self.mode}, {self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.Status.COMPLETED, self.Status.FAILED)
+
+    @property
+    def progress_pct(self):
+        if not self.total_count:
+            return 100 if self.is_finished else 0
+        return round(self.processed_count * 100 / self.total_count)
@@ -2,7 +2,7 @@
 JV Matcher Services - PDF Generation
 """
 
-from .pdf_generator import PDFGenerator, PDFGenerationError
+from .pdf_generator import PDFGenerator, PDFGenerationError, PDFRenderCache
 from .data_validator import DataValidator, ValidationError
 
-__all__ = ['PDFGenerator', 'PDFGenerationError', 'DataValidator', 'ValidationError']
+__all__ = ['PDFGenerator', 'PDFGenerationError', 'PDFRenderCache', 'DataValidator', 'ValidationError']
@@ -4,15 +4,20 @@ PDF Generator for JV Matcher Reports
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
 from reportlab.platypus import SimpleDocTemplate, PageBreak
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import hashlib
+import io
+import json
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import os
 
 from .data_validator import DataValidator, ValidationError
-from .pdf_styles import create_pdf_styles
+from .pdf_styles import get_pdf_styles
 from .pdf_components import (
     create_cover_page,
     create_dashboard,
@@ -23,12 +28,98 @@ from .pdf_components import (
 
 logger = logging.getLogger(__name__)
 
+# Bump when styles or components change so cached renders are not reused
+PDF_RENDER_VERSION = 1
+
+# Standard fonts referenced by pdf_styles and FooterCanvas
+PDF_FONTS = ('Helvetica', 'Helvetica-Bold')
+
 
 class PDFGenerationError(Exception):
     """Custom exception for PDF failures"""
     pass
 
 
+def content_key(member_data: Dict) -> str:
+    """Hash of the member data (and render version) a PDF is built from."""
+    payload = json.dumps(
+        {'version': PDF_RENDER_VERSION, 'data': member_data},
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class PDFRenderCache:
+    """
+    Content-addressed store of rendered PDFs, one file per content_key.
+
+    Writes go through a temp file and os.replace so concurrent exports
+    never read a partially written PDF.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pdf"
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, pdf_bytes: bytes):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(pdf_bytes)
+        os.replace(tmp_path, path)
+
+
+def build_pdf(data: Dict, target):
+    """Render validated member data into a path or binary file object."""
+    doc = SimpleDocTemplate(
+        target,
+        pagesize=letter,
+        rightMargin=0.75 * inch,
+        leftMargin=0.75 * inch,
+        topMargin=0.75 * inch,
+        bottomMargin=0.75 * inch
+    )
+
+    styles = get_pdf_styles()
+    matches = data.get('matches', [])
+
+    # Cover page, executive dashboard, detailed match pages, action tracker
+    story = []
+    story.extend(create_cover_page(data, styles))
+    story.extend(create_dashboard(matches, styles))
+    story.extend(create_match_pages(matches, styles))
+    story.extend(create_action_tracker(matches, styles))
+
+    # Build the PDF with custom footer canvas
+    doc.build(story, canvasmaker=FooterCanvas)
+
+
+def _init_render_worker():
+    """Load the stylesheet and font metrics once per render process."""
+    get_pdf_styles()
+    for font_name in PDF_FONTS:
+        pdfmetrics.getFont(font_name)
+
+
+def _render_worker(data: Dict):
+    """Render one member in a pool process; returns (pdf_bytes, error)."""
+    try:
+        buffer = io.BytesIO()
+        build_pdf(data, buffer)
+        return buffer.getvalue(), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
 class PDFGenerator:
     """
     Generate professional PDF reports for JV matches
@@ -72,11 +163,7 @@ class PDFGenerator:
             # Validate
             participant = member_data.get('participant', 'Unknown')
             logger.info(f"Validating data for {participant}")
-            self.validator.validate_member_data(member_data)
-
-            # Add date if missing
-            if 'date' not in member_data:
-                member_data['date'] = datetime.now().strftime("%B %d, %Y")
+            self._prepare(member_data)
 
             # Create filename
             safe_participant = participant.replace(' ', '_').replace('/', '_')
@@ -102,39 +189,15 @@ class PDFGenerator:
             logger.exception("PDF generation failed")
             raise PDFGenerationError(f"Failed to generate PDF: {str(e)}")
 
+    def _prepare(self, member_data: Dict):
+        """Validate member data and add the report date if missing"""
+        self.validator.validate_member_data(member_data)
+        if 'date' not in member_data:
+            member_data['date'] = datetime.now().strftime("%B %d, %Y")
+
     def _create_pdf(self, data: Dict, output_path: str):
         """Internal PDF creation"""
-
-        # Create document
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=letter,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch
-        )
-
-        # Get styles
-        styles = create_pdf_styles()
-
-        # Build document story
-        story = []
-
-        # Cover page with profile
-        story.extend(create_cover_page(data, styles))
-
-        # Executive dashboard
-        story.extend(create_dashboard(data.get('matches', []), styles))
-
-        # Detailed match pages
-        story.extend(create_match_pages(data.get('matches', []), styles))
-
-        # Action tracker
-        story.extend(create_action_tracker(data.get('matches', []), styles))
-
-        # Build the PDF with custom footer canvas
-        doc.build(story, canvasmaker=FooterCanvas)
+        build_pdf(data, output_path)
 
     def generate_to_bytes(self, member_data: Dict, member_id: Optional[str] = None) -> bytes:
         """
@@ -146,27 +209,88 @@ class PDFGenerator:
 
         Returns:
             PDF content as bytes
-        """
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-            tmp_path = tmp.name
 
+        Raises:
+            PDFGenerationError: If generation fails
+        """
         try:
-            # Generate to temp file
-            self._temp_output_dir = self.output_dir
-            self.output_dir = Path(tempfile.gettempdir())
+            self._prepare(member_data)
+            buffer = io.BytesIO()
+            build_pdf(member_data, buffer)
+            return buffer.getvalue()
 
-            pdf_path = self.generate(member_data, member_id)
+        except ValidationError as e:
+            logger.error(f"Validation failed: {e}")
+            raise PDFGenerationError(f"Invalid data: {str(e)}")
+        except Exception as e:
+            logger.exception("PDF generation failed")
+            raise PDFGenerationError(f"Failed to generate PDF: {str(e)}")
 
-            # Read bytes
-            with open(pdf_path, 'rb') as f:
-                pdf_bytes = f.read()
+    def generate_batch(
+        self,
+        members: List[Dict],
+        max_workers: Optional[int] = None,
+        cache: Optional[PDFRenderCache] = None
+    ) -> List[Optional[bytes]]:
+        """
+        Render many members' PDFs across a process pool
 
-            # Cleanup
-            os.remove(pdf_path)
+        Members whose data hashes to a cached render are served from cache,
+        identical members are rendered once, and the rest are spread over
+        worker processes that each load styles and fonts a single time.
 
-            return pdf_bytes
+        Args:
+            members: Member data dicts (same shape as generate())
+            max_workers: Render processes (defaults to the CPU count)
+            cache: Optional PDFRenderCache keyed by content_key()
 
-        finally:
-            self.output_dir = self._temp_output_dir
+        Returns:
+            PDF bytes per member, in input order; None where validation or
+            rendering failed (failures are logged)
+        """
+        results: List[Optional[bytes]] = [None] * len(members)
+        pending: Dict[str, List[int]] = {}
+        cached = 0
+
+        for i, member_data in enumerate(members):
+            try:
+                self._prepare(member_data)
+            except ValidationError as e:
+                logger.error(f"Validation failed for {member_data.get('participant', 'Unknown')}: {e}")
+                continue
+
+            key = content_key(member_data)
+            hit = cache.get(key) if cache is not None else None
+            if hit is not None:
+                results[i] = hit
+                cached += 1
+            else:
+                pending.setdefault(key, []).append(i)
+
+        keys = list(pending)
+        payloads = [members[pending[key][0]] for key in keys]
+        workers = min(max_workers or os.cpu_count() or 1, len(payloads))
+
+        if workers <= 1:
+            rendered = [_render_worker(data) for data in payloads]
+        else:
+            chunksize = max(1, len(payloads) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+                rendered = list(pool.map(_render_worker, payloads, chunksize=chunksize))
+
+        failed = 0
+        for key, data, (pdf_bytes, error) in zip(keys, payloads, rendered):
+            if error:
+                failed += 1
+                logger.error(f"PDF render failed for {data.get('participant', 'Unknown')}: {error}")
+                continue
+            if cache is not None:
+                cache.put(key, pdf_bytes)
+            for i in pending[key]:
+                results[i] = pdf_bytes
+
+        logger.info(
+            f"Batch PDF render: {len(members)} members, {cached} cached, "
+            f"{len(payloads)} rendered on {max(workers, 1)} process(es), {failed} failed"
+        )
+        return results
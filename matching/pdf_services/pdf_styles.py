@@ -2,6 +2,8 @@
 PDF styling and layout configuration
 """
 
+from functools import lru_cache
+
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.lib.colors import HexColor, white
@@ -140,6 +142,17 @@ def create_pdf_styles():
     return styles
 
 
+@lru_cache(maxsize=None)
+def get_pdf_styles():
+    """
+    Shared stylesheet for the current process.
+
+    Components only read from the stylesheet, so one instance can back
+    every render instead of rebuilding it per document.
+    """
+    return create_pdf_styles()
+
+
 # Color scheme - Apple Design System
 COLORS = {
     'primary': HexColor('#0071e3'),      # Apple Blue
@@ -0,0 +1,62 @@
+"""
+Streaming COPY FROM STDIN helpers for bulk loads into Postgres.
+
+Rows are encoded into PostgreSQL's COPY text format and flushed in
+fixed-size chunks, so loading a file of any length holds at most one
+chunk in memory. Works with a psycopg2 cursor or Django's cursor wrapper
+(which forwards copy_expert to psycopg2).
+"""
+
+import io
+import json
+
+# Rows buffered per COPY statement
+COPY_CHUNK_ROWS = 5000
+
+_COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+
+def copy_text_value(value) -> str:
+    """Encode one value as a COPY text-format field (None becomes NULL)."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif isinstance(value, bool):
+        value = 't' if value else 'f'
+    return str(value).replace('\x00', '').translate(_COPY_ESCAPES)
+
+
+def copy_rows(cursor, table: str, columns, rows, chunk_rows: int = COPY_CHUNK_ROWS) -> int:
+    """
+    COPY an iterable of row tuples into table, chunk_rows at a time.
+
+    Returns:
+        Number of rows copied
+    """
+    statement = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    buf = io.StringIO()
+    pending = 0
+    total = 0
+
+    for row in rows:
+        buf.write('\t'.join(copy_text_value(v) for v in row))
+        buf.write('\n')
+        pending += 1
+        if pending >= chunk_rows:
+            buf.seek(0)
+            cursor.copy_expert(statement, buf)
+            total += pending
+            buf = io.StringIO()
+            pending = 0
+
+    if pending:
+        buf.seek(0)
+        cursor.copy_expert(statement, buf)
+        total += pending
+    return total
@@ -11,6 +11,7 @@ integrates ICP and Transformation data with pre-computed SupabaseMatch data.
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
+import hashlib
 import json
 import logging
 import math
@@ -66,6 +67,19 @@ class MatchScoringService:
         'context': 0.10,
     })
 
+    # Bump when scoring logic changes so stored fingerprints stop matching
+    SCORING_VERSION = 1
+
+    # Days since update after which profile freshness scores 0
+    FRESHNESS_MAX_DAYS = 30
+
+    # Profile fields read by the calculate_*_score methods
+    SCORED_PROFILE_FIELDS = (
+        'name', 'company', 'email', 'linkedin_url', 'website_url', 'industry',
+        'audience_size', 'audience_description', 'content_style',
+        'collaboration_history', 'enrichment_data', 'source', 'updated_at',
+    )
+
     def __init__(self, profile: Profile, user):
         """
         Initialize the scoring service.
@@ -595,12 +609,35 @@ class MatchScoringService:
         else:
             return "Low match score. Consider other prospects or significantly different approach."
 
-    def create_or_update_match(self) -> Match:
+    def input_fingerprint(self) -> str:
         """
-        Create or update a Match record with calculated scores.
+        Hash of everything the score depends on: scored profile fields,
+        the user's ICP, the weights, SCORING_VERSION and the days since
+        the profile was updated, capped where the momentum freshness factor
+        reaches 0 (the score changes with time even when the profile does
+        not).
+
+        A Match whose input_fingerprint equals this value is up to date.
+        """
+        from django.utils import timezone
+        updated_at = self.profile.updated_at
+        payload = json.dumps({
+            'version': self.SCORING_VERSION,
+            'weights': self.WEIGHTS,
+            'icp': self.icp,
+            'profile': {name: getattr(self.profile, name) for name in self.SCORED_PROFILE_FIELDS},
+            'freshness_days': (
+                min((timezone.now() - updated_at).days, self.FRESHNESS_MAX_DAYS) if updated_at else None
+            ),
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def match_fields(self) -> dict:
+        """
+        Calculate scores and return the Match field values to store.
 
         Returns:
-            Match instance with all scores populated
+            dict of score fields, score_breakdown and input_fingerprint
         """
         breakdown = self.calculate_score()
 
@@ -633,18 +670,27 @@ class MatchScoringService:
             'recommendation': breakdown.recommendation,
         }
 
-        # Create or update match
+        return {
+            'intent_score': breakdown.intent.score / 10,  # Convert to 0-1 scale
+            'synergy_score': breakdown.synergy.score / 10,
+            'momentum_score': breakdown.momentum.score / 10,
+            'context_score': breakdown.context.score / 10,
+            'final_score': breakdown.final_score / 10,
+            'score_breakdown': score_breakdown_json,
+            'input_fingerprint': self.input_fingerprint(),
+        }
+
+    def create_or_update_match(self) -> Match:
+        """
+        Create or update a Match record with calculated scores.
+
+        Returns:
+            Match instance with all scores populated
+        """
         match, created = Match.objects.update_or_create(
             user=self.user,
             profile=self.profile,
-            defaults={
-                'intent_score': breakdown.intent.score / 10,  # Convert to 0-1 scale
-                'synergy_score': breakdown.synergy.score / 10,
-                'momentum_score': breakdown.momentum.score / 10,
-                'context_score': breakdown.context.score / 10,
-                'final_score': breakdown.final_score / 10,
-                'score_breakdown': score_breakdown_json,
-            }
+            defaults=self.match_fields(),
         )
 
         return match
@@ -5,6 +5,7 @@ These tasks can be run with Celery for async processing,
 or called directly (synchronously) if Celery is not configured.
 """
 
+import json
 import logging
 from django.db.models import Q
 
@@ -41,7 +42,8 @@ def recalculate_matches_for_profile(profile_id: str):
     Returns:
         dict with recalculation results
     """
-    from matching.models import SupabaseProfile, SupabaseMatch
+    from matching.match_cache import invalidate_matches
+    from matching.models import SupabaseMatch, SupabaseProfile
 
     results = {
         'profile_id': str(profile_id),
@@ -62,6 +64,7 @@ def recalculate_matches_for_profile(profile_id: str):
 
         results['matches_found'] = matches.count()
 
+        saved = []
         for match in matches:
             try:
                 # Get both profiles for the match
@@ -84,6 +87,7 @@ def recalculate_matches_for_profile(profile_id: str):
                 match.harmonic_mean = new_scores['harmonic_mean']
                 match.match_reason = new_scores.get('match_reason', '')
                 match.save(update_fields=['score_ab', 'score_ba', 'harmonic_mean', 'match_reason'])
+                saved.append(match)
 
                 logger.info(
                     f"Match {match.id} recalculated: "
@@ -95,6 +99,8 @@ def recalculate_matches_for_profile(profile_id: str):
             except Exception as e:
                 results['errors'].append(f"Error processing match {match.id}: {str(e)}")
 
+        invalidate_matches((m.profile_id, m.suggested_profile_id) for m in saved)
+
         logger.info(
             f"Match recalculation complete for {profile.name}: "
             f"{results['matches_found']} found, {results['matches_updated']} flagged"
@@ -112,12 +118,20 @@ def recalculate_matches_for_profile(profile_id: str):
     return results
 
 
+MATCH_SCORE_FIELDS = ['score_ab', 'score_ba', 'harmonic_mean', 'match_reason']
+
+
 @shared_task
 def bulk_recalculate_matches(profile_ids: list):
     """
     Recalculate matches for multiple profiles.
 
     Useful when batch enrichment updates multiple profiles at once.
+    Matches shared between the given profiles are scored once: all
+    affected matches and every profile they involve are loaded up front,
+    each distinct pair is scored a single time, and scores are written
+    with bulk_update. Per-profile details keep the shape returned by
+    recalculate_matches_for_profile().
 
     Args:
         profile_ids: List of UUID strings
@@ -125,24 +139,111 @@ def bulk_recalculate_matches(profile_ids: list):
     Returns:
         dict with bulk recalculation results
     """
+    from matching.match_cache import invalidate_matches
+    from matching.models import SupabaseMatch, SupabaseProfile
+    from matching.services import SupabaseMatchScoringService
+
     results = {
         'total_profiles': len(profile_ids),
         'processed': 0,
         'failed': 0,
         'details': []
     }
+    if not profile_ids:
+        return results
+
+    requested = [str(pid) for pid in profile_ids]
+
+    try:
+        matches = list(SupabaseMatch.objects.filter(
+            Q(profile_id__in=requested) | Q(suggested_profile_id__in=requested)
+        ))
+        involved_ids = set(requested)
+        for match in matches:
+            involved_ids.add(str(match.profile_id))
+            involved_ids.add(str(match.suggested_profile_id))
+        profiles = {
+            str(p.id): p for p in SupabaseProfile.objects.filter(id__in=involved_ids)
+        }
+    except Exception as e:
+        for profile_id in profile_ids:
+            results['failed'] += 1
+            results['details'].append({'profile_id': profile_id, 'error': str(e)})
+        return results
+
+    # match id -> error message; matches absent from this dict were updated
+    match_errors = {}
+    pair_scores = {}  # (source_id, target_id) -> score_pair() result
+    to_save = []
+    scorer = SupabaseMatchScoringService()
+
+    for match in matches:
+        source_id, target_id = str(match.profile_id), str(match.suggested_profile_id)
+        source_profile = profiles.get(source_id)
+        target_profile = profiles.get(target_id)
+        if not source_profile or not target_profile:
+            match_errors[match.id] = f"Missing profile for match {match.id}"
+            continue
 
-    for profile_id in profile_ids:
         try:
-            result = recalculate_matches_for_profile(profile_id)
-            results['processed'] += 1
-            results['details'].append(result)
+            key = (source_id, target_id)
+            if key not in pair_scores:
+                pair_scores[key] = scorer.score_pair(source_profile, target_profile)
+            new_scores = pair_scores[key]
+
+            match.score_ab = new_scores['score_ab']
+            match.score_ba = new_scores['score_ba']
+            match.harmonic_mean = new_scores['harmonic_mean']
+            match.match_reason = new_scores.get('match_reason', '')
+            to_save.append(match)
         except Exception as e:
-            results['failed'] += 1
-            results['details'].append({
-                'profile_id': profile_id,
-                'error': str(e)
-            })
+            match_errors[match.id] = f"Error processing match {match.id}: {str(e)}"
+
+    try:
+        SupabaseMatch.objects.bulk_update(to_save, MATCH_SCORE_FIELDS, batch_size=500)
+        saved = to_save
+    except Exception as e:
+        logger.warning(f"Bulk match update failed ({len(to_save)} matches), saving individually: {e}")
+        saved = []
+        for match in to_save:
+            try:
+                match.save(update_fields=MATCH_SCORE_FIELDS)
+                saved.append(match)
+            except Exception as e2:
+                match_errors[match.id] = f"Error processing match {match.id}: {str(e2)}"
+    invalidate_matches((m.profile_id, m.suggested_profile_id) for m in saved)
+
+    logger.info(
+        f"Bulk recalculation: {len(profile_ids)} profiles, {len(matches)} matches, "
+        f"{len(pair_scores)} pairs scored, {len(match_errors)} errors"
+    )
+
+    matches_by_profile = {}
+    for match in matches:
+        for pid in {str(match.profile_id), str(match.suggested_profile_id)}:
+            matches_by_profile.setdefault(pid, []).append(match)
+
+    for profile_id in requested:
+        detail = {
+            'profile_id': profile_id,
+            'matches_found': 0,
+            'matches_updated': 0,
+            'errors': []
+        }
+        if profile_id not in profiles:
+            error_msg = f"SupabaseProfile not found: {profile_id}"
+            logger.error(error_msg)
+            detail['errors'].append(error_msg)
+        else:
+            profile_matches = matches_by_profile.get(profile_id, [])
+            detail['matches_found'] = len(profile_matches)
+            for match in profile_matches:
+                if match.id in match_errors:
+                    detail['errors'].append(match_errors[match.id])
+                else:
+                    detail['matches_updated'] += 1
+        results['processed'] += 1
+        results['details'].append(detail)
 
     return results
 
@@ -293,3 +394,292 @@ def refresh_reports_for_profile(profile_id: str):
         f"Profile {profile_id} changed: refreshed {results['triggered']}/{results['reports_affected']} reports"
     )
     return results
+
+
+# Contacts per new_contact_flow run when coalescing queued ingestion jobs
+INGESTION_BATCH_CONTACTS = 500
+
+# A RUNNING ingestion job whose started_at is older than this is assumed
+# abandoned (worker killed or redeployed) and is claimed again. Longer than
+# new_contact_flow's 1h timeout so live runs are never reclaimed.
+INGESTION_LEASE_SECONDS = 75 * 60
+
+
+def claim_contact_ingestion_jobs(max_contacts: int = INGESTION_BATCH_CONTACTS) -> list:
+    """
+    Atomically move the oldest claimable ContactIngestionJobs to RUNNING.
+
+    Claimable means queued, or running with an expired lease. Claims jobs in
+    submission order until max_contacts is reached (always at least one
+    job). SKIP LOCKED lets several workers drain the queue without claiming
+    the same job twice.
+    """
+    from datetime import timedelta
+
+    from django.db import transaction
+    from django.utils import timezone
+
+    from matching.models import ContactIngestionJob
+
+    lease_expired = timezone.now() - timedelta(seconds=INGESTION_LEASE_SECONDS)
+    with transaction.atomic():
+        queued = (
+            ContactIngestionJob.objects
+            .filter(
+                Q(status=ContactIngestionJob.Status.QUEUED)
+                | Q(status=ContactIngestionJob.Status.RUNNING, started_at__lt=lease_expired)
+            )
+            .order_by('created_at')
+            .select_for_update(skip_locked=True)
+            .only('id', 'status', 'contact_count')
+        )
+        claimed_ids = []
+        total = 0
+        for job in queued[:100]:
+            if claimed_ids and total + job.contact_count > max_contacts:
+                break
+            if job.status == ContactIngestionJob.Status.RUNNING:
+                logger.warning(f"Reclaiming abandoned contact ingestion job {job.id}")
+            claimed_ids.append(job.id)
+            total += job.contact_count
+
+        ContactIngestionJob.objects.filter(id__in=claimed_ids).update(
+            status=ContactIngestionJob.Status.RUNNING, started_at=timezone.now(),
+        )
+
+    return list(ContactIngestionJob.objects.filter(id__in=claimed_ids).order_by('created_at'))
+
+
+@shared_task
+def process_contact_ingestion_jobs(max_contacts: int = INGESTION_BATCH_CONTACTS):
+    """
+    Drain one batch of queued contact ingestion jobs.
+
+    Claimed jobs that share (source, ingested_by) are coalesced into a single
+    new_contact_flow run, so concurrent submissions are deduplicated and
+    enriched together. Each job records the run's result and its own
+    completion state.
+
+    Returns:
+        dict with jobs/contacts/flow-run counts
+    """
+    from dataclasses import asdict
+
+    from django.utils import timezone
+
+    from matching.enrichment.flows.new_contact_flow import new_contact_flow
+    from matching.models import ContactIngestionJob
+
+    jobs = claim_contact_ingestion_jobs(max_contacts)
+    results = {'jobs': len(jobs), 'contacts': 0, 'flow_runs': 0, 'failed': 0}
+
+    groups = {}
+    for job in jobs:
+        groups.setdefault((job.source, job.ingested_by), []).append(job)
+
+    for (source, ingested_by), group in groups.items():
+        # Identical contacts submitted by several jobs are ingested once
+        contacts = []
+        seen = set()
+        for job in group:
+            for contact in job.contacts:
+                email = (contact.get('email') or '').strip().lower()
+                key = email or json.dumps(contact, sort_keys=True)
+                if key not in seen:
+                    seen.add(key)
+                    contacts.append(contact)
+        results['contacts'] += len(contacts)
+        results['flow_runs'] += 1
+
+        # Renew the lease: earlier groups in this pass may have used some of it
+        ContactIngestionJob.objects.filter(id__in=[job.id for job in group]).update(
+            started_at=timezone.now(),
+        )
+        try:
+            flow_result = new_contact_flow(
+                contacts=contacts,
+                source=source,
+                ingested_by=ingested_by,
+                source_file="",
+                skip_enrichment=False,
+                dry_run=False,
+            )
+            update = {
+                'status': ContactIngestionJob.Status.COMPLETED,
+                'result': {**asdict(flow_result), 'coalesced_jobs': len(group)},
+            }
+        except Exception as e:
+            logger.error(f"Contact ingestion failed for {len(group)} jobs: {e}")
+            results['failed'] += len(group)
+            update = {'status': ContactIngestionJob.Status.FAILED, 'error': str(e)}
+
+        now = timezone.now()
+        for job in group:
+            job.status = update['status']
+            job.result = update.get('result', {})
+            job.error = update.get('error', '')
+            job.processed_count = job.contact_count if job.status == ContactIngestionJob.Status.COMPLETED else 0
+            job.completed_at = now
+        ContactIngestionJob.objects.bulk_update(
+            group, ['status', 'result', 'error', 'processed_count', 'completed_at'],
+        )
+
+    if jobs:
+        logger.info(
+            f"Contact ingestion: {results['jobs']} jobs, {results['contacts']} contacts "
+            f"in {results['flow_runs']} flow runs ({results['failed']} jobs failed)"
+        )
+    return results
+
+
+MATCH_RECALC_CHUNK_PROFILES = 500
+
+# A RUNNING recalculation job renews started_at after every chunk; one whose
+# started_at is older than this is assumed abandoned (worker killed or
+# redeployed) and is claimed again.
+MATCH_RECALC_LEASE_SECONDS = 15 * 60
+
+MATCH_RECALC_UPDATE_FIELDS = [
+    'intent_score', 'synergy_score', 'momentum_score', 'context_score',
+    'final_score', 'score_breakdown', 'input_fingerprint',
+]
+
+
+def claim_match_recalculation_job():
+    """
+    Atomically move the oldest claimable MatchRecalculationJob to RUNNING.
+
+    Claimable means queued, or running with an expired lease; a reclaimed
+    job restarts its progress counts (profiles scored before it was
+    abandoned are skipped by their fingerprints). SKIP LOCKED lets several
+    workers drain the queue without claiming the same job twice. Returns
+    None when the queue is empty.
+    """
+    from datetime import timedelta
+
+    from django.db import transaction
+    from django.utils import timezone
+
+    from matching.models import MatchRecalculationJob
+
+    lease_expired = timezone.now() - timedelta(seconds=MATCH_RECALC_LEASE_SECONDS)
+    with transaction.atomic():
+        job = (
+            MatchRecalculationJob.objects
+            .filter(
+                Q(status=MatchRecalculationJob.Status.QUEUED)
+                | Q(status=MatchRecalculationJob.Status.RUNNING, started_at__lt=lease_expired)
+            )
+            .order_by('created_at')
+            .select_for_update(skip_locked=True)
+            .first()
+        )
+        if job is None:
+            return None
+        if job.status == MatchRecalculationJob.Status.RUNNING:
+            logger.warning(f"Reclaiming abandoned match recalculation job {job.id}")
+        job.status = MatchRecalculationJob.Status.RUNNING
+        job.started_at = timezone.now()
+        job.processed_count = job.scored_count = job.skipped_count = 0
+        job.save(update_fields=[
+            'status', 'started_at', 'processed_count', 'scored_count', 'skipped_count',
+        ])
+    return job
+
+
+def run_match_recalculation(job, chunk_size: int = MATCH_RECALC_CHUNK_PROFILES):
+    """
+    Score the job's profiles in chunks, recording progress on the job.
+
+    Each chunk loads the stored input fingerprints for its profiles, skips
+    profiles whose MatchScoringService.input_fingerprint() is unchanged,
+    and upserts the rest with one bulk_create(update_conflicts=True).
+    The progress save after each chunk also renews the job's lease.
+    """
+    from django.utils import timezone
+
+    from matching.models import Match, MatchRecalculationJob, Profile
+    from matching.services import MatchScoringService
+
+    profiles = Profile.objects.filter(user_id=job.user_id)
+    if job.mode == MatchRecalculationJob.Mode.MISSING:
+        profiles = profiles.exclude(
+            pk__in=Match.objects.filter(user_id=job.user_id).values('profile_id')
+        )
+    profiles = profiles.order_by('pk')
+
+    job.total_count = profiles.count()
+    job.save(update_fields=['total_count'])
+
+    last_pk = None
+    while True:
+        chunk_qs = profiles if last_pk is None else profiles.filter(pk__gt=last_pk)
+        chunk = list(chunk_qs[:chunk_size])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+
+        stored = dict(
+            Match.objects
+            .filter(user_id=job.user_id, profile__in=chunk)
+            .values_list('profile_id', 'input_fingerprint')
+        )
+        to_upsert = []
+        for profile in chunk:
+            service = MatchScoringService(profile, job.user)
+            if stored.get(profile.pk) == service.input_fingerprint():
+                job.skipped_count += 1
+                continue
+            to_upsert.append(Match(user_id=job.user_id, profile=profile, **service.match_fields()))
+
+        if to_upsert:
+            Match.objects.bulk_create(
+                to_upsert,
+                update_conflicts=True,
+                unique_fields=['user', 'profile'],
+                update_fields=MATCH_RECALC_UPDATE_FIELDS,
+            )
+        job.scored_count += len(to_upsert)
+        job.processed_count += len(chunk)
+        job.started_at = timezone.now()
+        job.save(update_fields=['processed_count', 'scored_count', 'skipped_count', 'started_at'])
+
+
+@shared_task
+def process_match_recalculation_jobs(chunk_size: int = MATCH_RECALC_CHUNK_PROFILES):
+    """
+    Drain queued match recalculation jobs.
+
+    Returns:
+        dict with job/scored/skipped counts
+    """
+    from django.utils import timezone
+
+    from matching.models import MatchRecalculationJob
+
+    results = {'jobs': 0, 'scored': 0, 'skipped': 0, 'failed': 0}
+    while True:
+        job = claim_match_recalculation_job()
+        if job is None:
+            break
+        results['jobs'] += 1
+
+        try:
+            run_match_recalculation(job, chunk_size)
+            job.status = MatchRecalculationJob.Status.COMPLETED
+        except Exception as e:
+            logger.error(f"Match recalculation {job.id} failed: {e}")
+            results['failed'] += 1
+            job.status = MatchRecalculationJob.Status.FAILED
+            job.error = str(e)
+        job.completed_at = timezone.now()
+        job.save(update_fields=['status', 'error', 'completed_at'])
+
+        results['scored'] += job.scored_count
+        results['skipped'] += job.skipped_count
+        logger.info(
+            f"Match recalculation {job.id}: {job.processed_count}/{job.total_count} profiles, "
+            f"{job.scored_count} scored, {job.skipped_count} unchanged"
+        )
+
+    return results
@@ -0,0 +1,104 @@
+"""
+Tests for email_monitor.services.activity_scorer batch aggregation.
+
+The InboundEmail query is mocked so compute_activity_batch() can be
+exercised as pure Python; no database access required.
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from email_monitor.services.activity_scorer import (
+    _PromotionNetworkAccumulator,
+    compute_activity_batch,
+)
+
+
+def _dt(y, m, d):
+    return datetime(y, m, d, 12, 0, tzinfo=timezone.utc)
+
+
+PROMO = {
+    'email_type': 'partner_promotion',
+    'promotion_style': 'dedicated',
+    'promoted_partners': [{'name': 'Acme Launch', 'website_or_url': 'https://www.acme.com/x', 'product_type': 'course'}],
+    'own_products_mentioned': [{'name': 'My Course', 'type': 'course'}],
+}
+CONTENT = {
+    'email_type': 'content',
+    'promotion_style': 'none',
+    'own_products_mentioned': [{'name': 'my course', 'type': 'course'}, {'name': 'Coaching', 'type': 'service'}],
+}
+
+
+class TestPromotionNetworkAccumulator:
+    def test_partners_counted_and_dated(self):
+        acc = _PromotionNetworkAccumulator()
+        acc.add(PROMO, _dt(2026, 8, 1))
+        acc.add(PROMO, _dt(2026, 9, 1))
+        network = acc.to_network()
+
+        partner = network['promoted_partners'][0]
+        assert partner['count'] == 2
+        assert partner['domain'] == 'acme.com'
+        assert partner['first_seen'] == '2026-08-01'
+        assert partner['last_seen'] == '2026-09-01'
+        assert network['unique_partners'] == 1
+        assert network['total_partner_promotions'] == 2
+        assert network['promotion_cadence']['style'] == 'dedicated'
+
+    def test_own_offers_deduplicated_case_insensitively(self):
+        acc = _PromotionNetworkAccumulator()
+        acc.add(PROMO, _dt(2026, 8, 1))
+        acc.add(CONTENT, _dt(2026, 8, 2))
+        names = [o['name'] for o in acc.to_network()['own_offers']]
+        assert names == ['My Course', 'Coaching']
+
+    def test_empty(self):
+        network = _PromotionNetworkAccumulator().to_network()
+        assert network['promoted_partners'] == []
+        assert network['promotion_cadence'] == {'avg_per_week': 0.0, 'style': ''}
+
+
+def _mock_rows(rows):
+    qs = MagicMock()
+    qs.filter.return_value = qs
+    qs.order_by.return_value = qs
+    qs.values_list.return_value = qs
+    qs.iterator.return_value = iter(rows)
+    model = MagicMock()
+    model.objects.filter.return_value = qs
+    return model
+
+
+class TestComputeActivityBatch:
+    def test_single_scan_groups_by_profile(self):
+        rows = [
+            ('p1', PROMO, _dt(2026, 10, 2), _dt(2026, 10, 1)),
+            ('p1', CONTENT, _dt(2026, 10, 6), _dt(2026, 10, 5)),
+            ('p1', None, None, _dt(2026, 10, 9)),            # not analysed yet
+            ('p2', CONTENT, _dt(2026, 8, 16), _dt(2026, 8, 15)),  # prior month only
+        ]
+        with patch('email_monitor.models.InboundEmail', _mock_rows(rows)):
+            result = compute_activity_batch(
+                date(2026, 10, 1), profile_ids=['p1', 'p2', 'p3'], today=date(2026, 10, 18),
+            )
+
+        p1 = result['p1']
+        assert p1['total_30d'] == 3
+        assert p1['promotional'] == 1
+        assert p1['content_only'] == 1
+        assert p1['partner_promos_30d'] == 1
+        assert p1['has_own_products'] is True
+        assert p1['partners_promoted'][0]['name'] == 'Acme Launch'
+        assert p1['promotion_types'] == {'course': 1}
+        assert p1['network']['unique_partners'] == 1
+        assert p1['was_active_prior'] is False
+
+        p2 = result['p2']
+        assert p2['total_30d'] == 0
+        assert p2['was_active_prior'] is True
+        assert len(p2['network']['own_offers']) == 2
+
+        assert result['p3']['total_30d'] == 0
+        assert result['p3']['network']['unique_partners'] == 0
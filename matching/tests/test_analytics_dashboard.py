@@ -0,0 +1,105 @@
+"""
+Tests for AnalyticsDashboardView — grouped engagement aggregates.
+
+Covers:
+- Per-report partner / contacted counts and page-level session stats
+- ReportPartner fallback when no partner-level summaries exist
+- Global funnel totals
+- Query count stays constant as the number of active reports grows
+"""
+
+import os
+from datetime import timedelta
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from matching.models import EngagementSummary, MemberReport, ReportPartner
+
+User = get_user_model()
+
+
+def _create_report(code, **kwargs):
+    """Create an active MemberReport with a unique access code."""
+    return MemberReport.objects.create(
+        member_name=f'Member {code}',
+        member_email=f'{code.lower()}@example.com',
+        company_name=f'Company {code}',
+        access_code=code,
+        month=timezone.now().date().replace(day=1),
+        expires_at=timezone.now() + timedelta(days=30),
+        is_active=True,
+        client_profile={},
+        **kwargs,
+    )
+
+
+def _add_engagement(report, partners=3, contacted=1, expanded=2, sessions=4):
+    """Attach a page-level summary and partner-level summaries to a report."""
+    EngagementSummary.objects.create(
+        report=report, partner_id='', total_sessions=sessions, template_open_count=1,
+    )
+    for i in range(partners):
+        EngagementSummary.objects.create(
+            report=report,
+            partner_id=f'p{i}',
+            card_expand_count=1 if i < expanded else 0,
+            any_contact_action=i < contacted,
+        )
+
+
+@pytest.fixture
+def client(db):
+    user = User.objects.create_user(username='analyst', password='pw', email='a@example.com')
+    c = Client()
+    c.force_login(user)
+    return c
+
+
+def _get_dashboard(client):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse('matching:analytics-dashboard'))
+    assert response.status_code == 200
+    return response, len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+class TestAnalyticsDashboard:
+    def test_report_stats_and_funnel(self, client):
+        engaged = _create_report('ENG00001')
+        _add_engagement(engaged, partners=4, contacted=2, expanded=3, sessions=5)
+        snapshot_only = _create_report('SNAP0001')
+        for rank in range(2):
+            ReportPartner.objects.create(report=snapshot_only, rank=rank, section='priority',
+                                         name=f'Partner {rank}')
+
+        response, _ = _get_dashboard(client)
+
+        stats = {s['report'].id: s for s in response.context['report_stats']}
+        assert stats[engaged.id]['total_partners'] == 4
+        assert stats[engaged.id]['contacted'] == 2
+        assert stats[engaged.id]['total_sessions'] == 5
+        assert stats[snapshot_only.id]['total_partners'] == 2
+        assert stats[snapshot_only.id]['contacted'] == 0
+        assert stats[snapshot_only.id]['total_sessions'] == 0
+
+        funnel = response.context['funnel']
+        assert (funnel['shown'], funnel['expanded'], funnel['contacted']) == (4, 3, 2)
+        assert funnel['expanded_pct'] == 75
+
+    def test_query_count_independent_of_report_count(self, client):
+        _add_engagement(_create_report('ONE00001'))
+        _, one_report = _get_dashboard(client)
+
+        for i in range(5):
+            _add_engagement(_create_report(f'MANY{i:04d}'))
+        _, six_reports = _get_dashboard(client)
+
+        assert six_reports == one_report
@@ -0,0 +1,168 @@
+"""
+Tests for coalesced, cached Apollo bulk enrichment in
+matching/enrichment/apollo_enrichment.py:
+    - repeat lookups are answered from the result cache without credits
+    - identical lookups across profiles are sent once
+    - batches are pipelined concurrently, limited by rate-limit headroom
+
+The HTTP session is replaced by a fake bulk_match endpoint; the cache
+lives in tmp_path. No API key or network required.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from matching.enrichment import apollo_enrichment
+from matching.enrichment.apollo_enrichment import (
+    ApolloEnrichmentService,
+    ApolloResultCache,
+    lookup_key,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeBulkMatch:
+    """Answers bulk_match with a person per detail (None for 'Nobody')."""
+
+    def __init__(self, delay=0.0, remaining=None, rate_limit_first=False):
+        self.calls = []
+        self.delay = delay
+        self.remaining = remaining
+        self.rate_limit_first = rate_limit_first
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, json=None, params=None, timeout=None):
+        with self._lock:
+            self.calls.append(json['details'])
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        headers = {} if self.remaining is None else {'X-RateLimit-Remaining': str(self.remaining)}
+        if self.rate_limit_first:
+            self.rate_limit_first = False
+            return FakeResponse(429, headers={'Retry-After': '0'})
+        matches = [
+            None if d['first_name'] == 'Nobody' else {
+                'first_name': d['first_name'], 'last_name': d['last_name'],
+                'email': f"{d['first_name'].lower()}@{d.get('domain', 'example.com')}",
+            }
+            for d in json['details']
+        ]
+        return FakeResponse(payload={'matches': matches}, headers=headers)
+
+
+def _profile(pid, name, website='https://example.com'):
+    return {'id': pid, 'name': name, 'company': '', 'website': website,
+            'linkedin': '', 'email': ''}
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = ApolloEnrichmentService(
+        api_key='test', cache=ApolloResultCache(tmp_path / 'apollo.sqlite3'),
+    )
+    svc._http = lambda: svc.fake
+    svc.fake = FakeBulkMatch()
+    return svc
+
+
+class TestEnrichMany:
+    def test_duplicate_lookups_are_coalesced(self, service):
+        profiles = [
+            _profile('p1', 'Jane Doe'),
+            _profile('p2', 'jane  DOE', website='https://www.example.com/'),
+            _profile('p3', 'John Roe'),
+        ]
+
+        results = service.enrich_many(profiles)
+
+        assert len(service.fake.calls) == 1
+        assert len(service.fake.calls[0]) == 2
+        assert [r['_profile_id'] for r in results] == ['p1', 'p2', 'p3']
+        assert [r['_credits_consumed'] for r in results] == [1, 0, 1]
+        assert service.last_run_stats['coalesced'] == 1
+
+    def test_repeat_run_is_served_from_cache(self, service):
+        profiles = [_profile('p1', 'Jane Doe'), _profile('p2', 'Nobody Here')]
+        service.enrich_many(profiles)
+
+        results = service.enrich_many(profiles)
+
+        assert len(service.fake.calls) == 1
+        assert results[0]['_cached'] and results[0]['_credits_consumed'] == 0
+        assert results[1]['error'] == 'no_match'
+        assert service.last_run_stats['cache_hits'] == 2
+
+    def test_batches_run_concurrently(self, service):
+        service.fake = FakeBulkMatch(delay=0.05)
+        profiles = [_profile(f'p{i}', f'Person{i} Test') for i in range(40)]
+
+        results = service.enrich_many(profiles, max_concurrency=4)
+
+        assert len(service.fake.calls) == 4
+        assert all(len(details) <= service.MAX_BATCH_SIZE for details in service.fake.calls)
+        assert service.fake.max_active > 1
+        assert [r['_profile_id'] for r in results] == [p['id'] for p in profiles]
+
+    def test_low_rate_limit_headroom_serializes(self, service):
+        service.fake = FakeBulkMatch(delay=0.02, remaining=5)
+        service.last_rate_limit_remaining = 5
+        profiles = [_profile(f'p{i}', f'Person{i} Test') for i in range(30)]
+
+        service.enrich_many(profiles, max_concurrency=4)
+
+        assert service.fake.max_active == 1
+
+    def test_rate_limited_batch_is_retried(self, service):
+        service.fake = FakeBulkMatch(rate_limit_first=True)
+
+        results = service.enrich_many([_profile('p1', 'Jane Doe')])
+
+        assert len(service.fake.calls) == 2
+        assert results[0]['email'] == 'jane@example.com'
+
+    def test_errors_are_not_cached(self, service):
+        service.daily_limit = 0
+
+        results = service.enrich_many([_profile('p1', 'Jane Doe')])
+
+        assert results[0]['error'] == 'daily_limit_reached'
+        assert service.fake.calls == []
+        assert service.cache.get(lookup_key(service.build_request(_profile('p1', 'Jane Doe')))) == (False, None)
+
+
+class TestResultCache:
+    def test_no_match_expires_sooner(self, tmp_path):
+        cache = ApolloResultCache(tmp_path / 'apollo.sqlite3', ttl_days=90, no_match_ttl_days=1)
+        cache.put('hit', {'email': 'a@b.com'})
+        cache.put('miss', None)
+
+        later = time.time() + 2 * 86400
+        with patch.object(apollo_enrichment.time, 'time', return_value=later):
+            assert cache.get('hit') == (True, {'email': 'a@b.com'})
+            assert cache.get('miss') == (False, None)
+
+    def test_zero_ttl_disables_cache(self, tmp_path):
+        cache = ApolloResultCache(tmp_path / 'apollo.sqlite3', ttl_days=0)
+        cache.put('k', {'email': 'a@b.com'})
+        assert cache.get('k') == (False, None)
+        assert not (tmp_path / 'apollo.sqlite3').exists()
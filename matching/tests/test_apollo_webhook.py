@@ -0,0 +1,80 @@
+"""
+Tests for ApolloWebhookView: every person in a callback is resolved with a
+single indexed apollo_id query and written with a single batched UPDATE.
+
+The Django connection is replaced by a MagicMock; no database required.
+"""
+
+import json
+import os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+from unittest.mock import MagicMock, patch
+
+from django.test import RequestFactory
+
+from matching.views import ApolloWebhookView
+
+
+def _post(payload, rows):
+    cursor = MagicMock()
+    cursor.fetchall.return_value = rows
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+
+    request = RequestFactory().post(
+        '/matching/api/apollo/webhook/', data=json.dumps(payload),
+        content_type='application/json',
+    )
+    with patch('django.db.connection', conn):
+        response = ApolloWebhookView.as_view()(request)
+    return json.loads(response.content), cursor
+
+
+def _person(apollo_id, phone='+1 555 123 4567', email=None):
+    return {'person': {'id': apollo_id, 'email': email,
+                       'phone_numbers': [{'raw_number': phone}] if phone else []}}
+
+
+class TestApolloWebhook:
+    def test_one_lookup_and_one_update_for_many_persons(self):
+        rows = [
+            ('11111111-1111-1111-1111-111111111111', None, None, {'apollo_data': {'apollo_id': 'a1'}}, 'a1'),
+            ('22222222-2222-2222-2222-222222222222', '555', 'x@y.com', '{}', 'a2'),
+            ('33333333-3333-3333-3333-333333333333', None, 'z@y.com', None, 'a3'),
+        ]
+        payload = {'matches': [
+            _person('a1', email='new@y.com'), _person('a2'), _person('a3'), _person('missing'),
+        ]}
+
+        body, cursor = _post(payload, rows)
+
+        assert body == {'status': 'ok', 'updated': 2}
+        assert cursor.execute.call_count == 2
+        select_sql, select_params = cursor.execute.call_args_list[0].args
+        assert "->>'apollo_id' = ANY(%s)" in select_sql
+        assert sorted(select_params[0]) == ['a1', 'a2', 'a3', 'missing']
+
+        update_sql, params = cursor.execute.call_args_list[1].args
+        assert update_sql.startswith('UPDATE profiles AS p SET')
+        assert update_sql.count('(%s, %s, %s, %s, %s)') == 2
+        assert params[:3] == ['11111111-1111-1111-1111-111111111111', '+1 555 123 4567', 'new@y.com']
+        meta = json.loads(params[3])
+        assert meta['apollo_data']['apollo_id'] == 'a1'
+        assert 'webhook_received_at' in meta['apollo_data']
+        assert params[5:8] == ['33333333-3333-3333-3333-333333333333', '+1 555 123 4567', None]
+
+    def test_nothing_new_skips_update(self):
+        rows = [('11111111-1111-1111-1111-111111111111', '555', 'x@y.com', {}, 'a1')]
+
+        body, cursor = _post(_person('a1', email='new@y.com'), rows)
+
+        assert body == {'status': 'ok', 'updated': 0}
+        assert cursor.execute.call_count == 1
+
+    def test_invalid_json(self):
+        request = RequestFactory().post('/matching/api/apollo/webhook/', data='nope',
+                                        content_type='application/json')
+        response = ApolloWebhookView.as_view()(request)
+        assert response.status_code == 400
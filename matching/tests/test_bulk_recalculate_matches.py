@@ -0,0 +1,126 @@
+"""
+Tests for matching.tasks.bulk_recalculate_matches: shared matches are scored
+once, written with a single bulk_update, and per-profile details keep the
+recalculate_matches_for_profile() shape. Both tasks drop the cached match
+sections of every match they rewrite.
+
+Model managers and the scoring service are mocked; no database required.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from matching.models import SupabaseMatch, SupabaseProfile
+from matching.tasks import bulk_recalculate_matches, recalculate_matches_for_profile
+
+
+def _match(match_id, source, target):
+    return SimpleNamespace(
+        id=match_id, profile_id=source, suggested_profile_id=target,
+        score_ab=0, score_ba=0, harmonic_mean=0, match_reason='',
+    )
+
+
+def _run(profile_ids, matches, profile_ids_in_db, bulk_update=None, invalidate=None):
+    match_manager = MagicMock()
+    match_manager.filter.return_value = matches
+    if bulk_update:
+        match_manager.bulk_update.side_effect = bulk_update
+    profile_manager = MagicMock()
+    profile_manager.filter.return_value = [SimpleNamespace(id=pid) for pid in profile_ids_in_db]
+
+    with patch.object(SupabaseMatch, 'objects', match_manager), \
+         patch.object(SupabaseProfile, 'objects', profile_manager), \
+         patch('matching.match_cache.invalidate_matches', invalidate or MagicMock()), \
+         patch('matching.services.SupabaseMatchScoringService') as scorer_cls:
+        scorer_cls.return_value.score_pair.return_value = {
+            'score_ab': 60, 'score_ba': 70, 'harmonic_mean': 64.6, 'match_reason': 'overlap',
+        }
+        results = bulk_recalculate_matches(profile_ids)
+
+    return results, match_manager, profile_manager, scorer_cls.return_value
+
+
+class TestBulkRecalculateMatches:
+    def test_shared_matches_scored_once(self):
+        matches = [_match(1, 'a', 'b'), _match(2, 'a', 'c'), _match(3, 'b', 'c')]
+
+        results, match_manager, profile_manager, scorer = _run(
+            ['a', 'b'], matches, ['a', 'b', 'c'],
+        )
+
+        assert scorer.score_pair.call_count == 3
+        assert profile_manager.filter.call_count == 1
+        match_manager.bulk_update.assert_called_once()
+        assert match_manager.bulk_update.call_args.args[0] == matches
+        assert matches[0].harmonic_mean == 64.6
+
+        assert results['processed'] == 2 and results['failed'] == 0
+        assert results['details'] == [
+            {'profile_id': 'a', 'matches_found': 2, 'matches_updated': 2, 'errors': []},
+            {'profile_id': 'b', 'matches_found': 2, 'matches_updated': 2, 'errors': []},
+        ]
+
+    def test_missing_profiles_reported(self):
+        matches = [_match(1, 'a', 'gone')]
+
+        results, *_ = _run(['a', 'x'], matches, ['a'])
+
+        assert results['details'] == [
+            {'profile_id': 'a', 'matches_found': 1, 'matches_updated': 0,
+             'errors': ['Missing profile for match 1']},
+            {'profile_id': 'x', 'matches_found': 0, 'matches_updated': 0,
+             'errors': ['SupabaseProfile not found: x']},
+        ]
+
+    def test_bulk_update_failure_saves_individually(self):
+        matches = [_match(1, 'a', 'b'), _match(2, 'a', 'c')]
+        matches[0].save = MagicMock()
+        matches[1].save = MagicMock(side_effect=RuntimeError('boom'))
+
+        def fail(*args, **kwargs):
+            raise RuntimeError('batch failed')
+
+        results, *_ = _run(['a'], matches, ['a', 'b', 'c'], bulk_update=fail)
+
+        matches[0].save.assert_called_once()
+        assert results['details'][0]['matches_updated'] == 1
+        assert results['details'][0]['errors'] == ['Error processing match 2: boom']
+
+    def test_rewritten_matches_invalidate_cache(self):
+        matches = [_match(1, 'a', 'b'), _match(2, 'a', 'gone')]
+        invalidated = []
+        invalidate = MagicMock(side_effect=lambda pairs: invalidated.extend(pairs))
+
+        _run(['a'], matches, ['a', 'b'], invalidate=invalidate)
+
+        invalidate.assert_called_once()
+        assert invalidated == [('a', 'b')]  # the match with a missing profile was not rewritten
+
+
+class TestRecalculateMatchesForProfile:
+    def test_saved_matches_invalidate_cache(self):
+        matches = [_match(1, 'a', 'b'), _match(2, 'c', 'a')]
+        for match in matches:
+            match.save = MagicMock()
+        matches[1].save.side_effect = RuntimeError('boom')
+        queryset = MagicMock()
+        queryset.count.return_value = 2
+        queryset.__iter__.return_value = iter(matches)
+        match_manager = MagicMock()
+        match_manager.filter.return_value = queryset
+        profile_manager = MagicMock()
+        invalidated = []
+
+        with patch.object(SupabaseMatch, 'objects', match_manager), \
+             patch.object(SupabaseProfile, 'objects', profile_manager), \
+             patch('matching.match_cache.invalidate_matches',
+                   side_effect=lambda pairs: invalidated.extend(pairs)), \
+             patch('matching.services.SupabaseMatchScoringService') as scorer_cls:
+            scorer_cls.return_value.score_pair.return_value = {
+                'score_ab': 60, 'score_ba': 70, 'harmonic_mean': 64.6,
+            }
+            results = recalculate_matches_for_profile('a')
+
+        assert results['matches_updated'] == 1
+        assert invalidated == [('a', 'b')]
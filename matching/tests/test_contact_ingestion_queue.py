@@ -0,0 +1,124 @@
+"""
+Tests for the queued contact ingestion API:
+    - POST /api/contacts/ingest/ validates, stores a job and returns 202
+    - the status endpoint reports queue position and results
+    - process_contact_ingestion_jobs coalesces jobs into one flow run
+    - jobs left RUNNING by a dead worker are reclaimed after the lease
+
+new_contact_flow is mocked; the job table lives in the test database.
+"""
+
+import json
+import os
+from datetime import timedelta
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+from unittest.mock import patch
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from matching.enrichment.flows.new_contact_flow import ContactIngestionResult
+from matching.models import ContactIngestionJob
+from matching.tasks import INGESTION_LEASE_SECONDS, process_contact_ingestion_jobs
+
+FLOW = 'matching.enrichment.flows.new_contact_flow.new_contact_flow'
+
+
+def _submit(client, contacts, **extra):
+    return client.post(
+        reverse('matching:contact-ingest-webhook'),
+        data=json.dumps({'contacts': contacts, **extra}),
+        content_type='application/json',
+    )
+
+
+class TestIngestValidation:
+    @pytest.mark.parametrize('body, error', [
+        ('not json', 'Invalid JSON'),
+        (json.dumps({'contacts': []}), 'No contacts provided'),
+        (json.dumps({'contacts': ['x']}), 'contacts must be a list of objects'),
+        (json.dumps({'contacts': [{'company': 'Acme'}]}), 'Each contact needs a name or email'),
+    ])
+    def test_rejected_without_queueing(self, body, error):
+        with patch.object(ContactIngestionJob.objects, 'create') as create:
+            response = Client().post(reverse('matching:contact-ingest-webhook'),
+                                     data=body, content_type='application/json')
+
+        assert response.status_code == 400
+        assert response.json()['error'] == error
+        create.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestIngestQueue:
+    def test_post_returns_202_without_running_flow(self):
+        client = Client()
+        with patch(FLOW) as flow:
+            response = _submit(client, [{'name': 'Jane Doe', 'email': 'jane@x.com'}],
+                               source='partner_api')
+
+        assert response.status_code == 202
+        flow.assert_not_called()
+        job = ContactIngestionJob.objects.get(id=response.json()['job_id'])
+        assert job.status == ContactIngestionJob.Status.QUEUED
+        assert job.source == 'partner_api' and job.contact_count == 1
+
+        status = client.get(response.json()['status_url']).json()
+        assert status['status'] == 'queued' and status['jobs_ahead'] == 0
+
+    def test_worker_coalesces_jobs_sharing_a_source(self):
+        client = Client()
+        ids = [
+            _submit(client, [{'name': 'A', 'email': 'a@x.com'}]).json()['job_id'],
+            _submit(client, [{'name': 'A', 'email': 'A@x.com'}, {'name': 'B'}]).json()['job_id'],
+            _submit(client, [{'name': 'C'}], source='other').json()['job_id'],
+        ]
+
+        with patch(FLOW, return_value=ContactIngestionResult(total_received=2, new_contacts=2)) as flow:
+            results = process_contact_ingestion_jobs()
+
+        assert results == {'jobs': 3, 'contacts': 3, 'flow_runs': 2, 'failed': 0}
+        first_run = flow.call_args_list[0].kwargs
+        assert first_run['source'] == 'api_webhook'
+        assert [c['name'] for c in first_run['contacts']] == ['A', 'B']
+
+        status = client.get(reverse('matching:contact-ingest-status', args=[ids[1]])).json()
+        assert status['status'] == 'completed'
+        assert status['contacts_processed'] == 2
+        assert status['result']['coalesced_jobs'] == 2
+
+    def test_flow_failure_marks_jobs_failed(self):
+        job_id = _submit(Client(), [{'name': 'A'}]).json()['job_id']
+
+        with patch(FLOW, side_effect=RuntimeError('db down')):
+            results = process_contact_ingestion_jobs()
+
+        job = ContactIngestionJob.objects.get(id=job_id)
+        assert results['failed'] == 1
+        assert job.status == ContactIngestionJob.Status.FAILED and job.error == 'db down'
+        assert process_contact_ingestion_jobs()['jobs'] == 0
+
+    def test_abandoned_running_job_is_reclaimed(self):
+        client = Client()
+        abandoned = _submit(client, [{'name': 'A'}]).json()['job_id']
+        live = _submit(client, [{'name': 'B'}], source='other').json()['job_id']
+        now = timezone.now()
+        ContactIngestionJob.objects.filter(id=abandoned).update(
+            status=ContactIngestionJob.Status.RUNNING,
+            started_at=now - timedelta(seconds=INGESTION_LEASE_SECONDS + 60),
+        )
+        ContactIngestionJob.objects.filter(id=live).update(
+            status=ContactIngestionJob.Status.RUNNING, started_at=now,
+        )
+
+        with patch(FLOW, return_value=ContactIngestionResult(total_received=1)) as flow:
+            results = process_contact_ingestion_jobs()
+
+        assert results['jobs'] == 1
+        assert [c['name'] for c in flow.call_args.kwargs['contacts']] == ['A']
+        assert ContactIngestionJob.objects.get(id=abandoned).status == ContactIngestionJob.Status.COMPLETED
+        assert ContactIngestionJob.objects.get(id=live).status == ContactIngestionJob.Status.RUNNING
@@ -0,0 +1,116 @@
+"""
+Tests for the shared contact → partner matching engine
+(matching/contact_matching.py) and its use by match_linkedin_contacts_v2
+and match_instagram_coaches_v2.
+
+The pruned search must pick exactly the partner a full linear scan picks.
+Partners are plain namespaces; no database required.
+"""
+
+import random
+from types import SimpleNamespace
+
+from matching.contact_matching import PartnerIndex, breadth_multiplier
+from matching.management.commands import match_instagram_coaches_v2 as instagram
+from matching.management.commands import match_linkedin_contacts_v2 as linkedin
+
+WORDS = [
+    'coach', 'coaching', 'health', 'wellness', 'business', 'marketing', 'women',
+    'entrepreneurs', 'growth', 'podcast', 'author', 'leadership', 'mindset',
+    'fitness', 'money', 'audience', 'partnerships', 'the', 'and', 'sales', 'clients',
+]
+INDUSTRIES = ['health, wellness & fitness', 'marketing & advertising', 'e-learning', 'retail', '']
+TITLES = ['Health Coach', 'Founder & CEO', 'Marketing Consultant', 'Author and Speaker', 'Engineer']
+CATEGORIES = ['coach', 'health/beauty', 'entrepreneur', 'artist', '']
+
+
+def _text(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+
+def _partners(rng, n):
+    return [
+        SimpleNamespace(
+            name=f'P{i}', email='', company='',
+            niche=', '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 9))),
+            what_you_do=_text(rng, 4), who_you_serve=_text(rng, 3),
+            offering=_text(rng, 4), seeking=_text(rng, 2), business_focus='',
+            list_size=rng.choice([0, 500, 5000, 50000]),
+        )
+        for i in range(n)
+    ]
+
+
+def _linear_best(cmd, contact, niche_fn):
+    best_pos, best_score = None, 0
+    for pos, pd in enumerate(cmd.partner_data):
+        score = cmd._score_partner(contact, pd, niche_fn(pd))[0]
+        if score > best_score:
+            best_pos, best_score = pos, score
+    return best_pos
+
+
+class TestPartnerIndex:
+    def test_inverted_index_and_rarity(self):
+        partners = [
+            SimpleNamespace(niche='health', what_you_do='coach', who_you_serve='women',
+                            offering='', seeking='', business_focus='', list_size=0),
+            SimpleNamespace(niche='money', what_you_do='coach', who_you_serve='Entrepreneurs',
+                            offering='', seeking='', business_focus='', list_size=10),
+        ]
+        index = PartnerIndex(partners)
+
+        assert index.partners_with_keywords({'coach'}) == {0, 1}
+        assert index.partners_with_keywords({'health', 'nothing'}) == {0}
+        assert index.partners_with_substring('serves', 'entrep') == {1}
+        assert index.keyword_rarity['coach'] == 0.3
+        assert index.keyword_rarity['health'] == 0.6
+
+    def test_breadth_multiplier(self):
+        assert [breadth_multiplier(n) for n in (0, 5, 10, 20)] == [1.1, 1.0, 0.75, 0.6]
+
+
+class TestLinkedInMatcher:
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        cmd = linkedin.Command()
+        cmd.partner_data = cmd._preprocess_partners(_partners(rng, 120))
+
+        for _ in range(150):
+            contact = cmd._extract_contact_data({
+                'First Name': 'A', 'Last Name': 'B',
+                'Title': rng.choice(TITLES),
+                'Industry': rng.choice(INDUSTRIES),
+                '# Employees': str(rng.choice([0, 3, 40, 500])),
+            })
+            match = cmd._find_best_match(contact)
+            expected = _linear_best(
+                cmd, contact, lambda pd: cmd._score_industry_match(contact['industry'], pd['niche']),
+            )
+            assert match['partner'] is cmd.partner_data[expected]['partner']
+
+
+class TestInstagramMatcher:
+    def test_matches_linear_scan(self):
+        rng = random.Random(11)
+        cmd = instagram.Command()
+        cmd.partner_data = cmd._preprocess_partners(_partners(rng, 120))
+
+        for _ in range(150):
+            coach = cmd._extract_coach_data({
+                'FULL NAME': 'Coach Person', 'EMAIL': 'c@example.com',
+                'CATEGORY': rng.choice(CATEGORIES),
+                'BIO': f'I help {_text(rng, 3)} for {_text(rng, 2)} {_text(rng, 4)}',
+                'FOLLOWER COUNT': str(rng.choice([0, 800, 6000, 90000])),
+            })
+            match = cmd._find_best_match(coach)
+            expected = _linear_best(
+                cmd, coach, lambda pd: cmd._score_category_match(coach['category'], pd['niche']) / 5,
+            )
+            assert match['partner'] is cmd.partner_data[expected]['partner']
+
+    def test_no_partners(self):
+        cmd = instagram.Command()
+        cmd.partner_data = cmd._preprocess_partners([])
+        coach = cmd._extract_coach_data({'FULL NAME': 'X', 'EMAIL': 'x@example.com', 'BIO': 'coach'})
+        assert cmd._find_best_match(coach) is None
@@ -0,0 +1,67 @@
+"""
+Tests for the keyword half of matching/enrichment/flows/db_prospect_search.py:
+full-text tsquery construction and the search document matching the
+idx_profiles_search_tsv expression index.
+
+Uses a fake cursor; no database required.
+"""
+
+import importlib
+import re
+from unittest.mock import MagicMock
+
+from matching.enrichment.flows import db_prospect_search as dps
+
+
+def _search(cur, keywords):
+    return dps._text_search(
+        cur, 'client-1', keywords,
+        exclude_ids=['x'], min_readiness_score=20, max_staleness_days=180, limit=50,
+    )
+
+
+class TestBuildTsquery:
+    def test_ors_one_plainto_tsquery_per_keyword(self):
+        sql, params = dps._build_tsquery(['  podcast ', 'health coach', ''])
+        assert sql == "(plainto_tsquery('english', %s) || plainto_tsquery('english', %s))"
+        assert params == ['podcast', 'health coach']
+
+    def test_caps_keywords(self):
+        _, params = dps._build_tsquery([f'kw{i}' for i in range(20)], max_keywords=8)
+        assert len(params) == 8
+
+
+class TestTextSearch:
+    def test_uses_ranked_fulltext_query(self):
+        cur = MagicMock()
+        cur.fetchall.return_value = [{'id': 'p1', 'text_rank': 0.4}]
+
+        rows = _search(cur, ['podcast', 'wellness'])
+
+        assert rows == [{'id': 'p1', 'text_rank': 0.4}]
+        sql, params = next(
+            c.args for c in cur.execute.call_args_list if len(c.args) == 2
+        )
+        assert f'{dps._SEARCH_DOCUMENT} @@ q.query' in sql
+        assert 'ORDER BY text_rank DESC' in sql
+        assert 'ILIKE' not in sql
+        assert params[:2] == ['podcast', 'wellness']
+        assert params[-1] == 50
+
+    def test_document_matches_index_expression(self):
+        migration = importlib.import_module('matching.migrations.0024_add_profiles_search_tsv')
+        index_sql = migration.Migration.operations[0].sql
+
+        def normalize(sql):
+            return re.sub(r'\s+', ' ', sql).strip()
+
+        assert f'USING GIN ({normalize(dps._SEARCH_DOCUMENT)})' in normalize(index_sql)
+
+    def test_blank_keywords_use_ilike(self):
+        cur = MagicMock()
+        cur.fetchall.return_value = [{'id': 'p2'}]
+
+        rows = _search(cur, ['  '])
+
+        assert rows == [{'id': 'p2'}]
+        assert 'ILIKE' in cur.execute.call_args[0][0]
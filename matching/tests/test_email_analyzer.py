@@ -0,0 +1,125 @@
+"""
+Tests for near-duplicate grouping in email_monitor.services.email_analyzer.
+
+analyze_email (the LLM call) and the InboundEmail queryset are mocked, so
+these run without network or database access.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from email_monitor.services.email_analyzer import (
+    batch_analyze_emails,
+    email_fingerprint,
+    group_near_duplicates,
+)
+
+PROMO_BODY = (
+    'Hi friend, my colleague Sarah is opening the doors to her Launch Accelerator '
+    'program this week. It covers list building, webinar funnels and affiliate '
+    'recruitment for coaches who want to grow their audience. Enrollment closes '
+    'Friday at midnight so grab your seat today before the bonuses disappear.'
+)
+OTHER_BODY = (
+    'This week on the podcast we talk about morning routines, journaling and how '
+    'to protect deep work time when your calendar keeps filling up with meetings. '
+    'Plus three book recommendations from listeners and a short mailbag segment.'
+)
+LINKS = [{'url': 'https://www.sarah.com/accelerator?utm_source=list_a&uid=123'}]
+LINKS_B = [{'url': 'https://sarah.com/accelerator/?utm_source=list_b&uid=987'}]
+
+
+class TestFingerprint:
+    def test_resend_with_tracking_noise_is_near_duplicate(self):
+        a = email_fingerprint(PROMO_BODY, '', LINKS)
+        b = email_fingerprint('Hey there, ' + PROMO_BODY + ' 2026', '', LINKS_B)
+        reps = group_near_duplicates({1: a, 2: b}, max_distance=3)
+        assert reps[2] == 1
+
+    def test_different_emails_not_grouped(self):
+        a = email_fingerprint(PROMO_BODY, '', LINKS)
+        b = email_fingerprint(OTHER_BODY, '', [])
+        reps = group_near_duplicates({1: a, 2: b})
+        assert reps == {1: 1, 2: 2}
+
+    def test_html_body_used_when_present(self):
+        html = f'<html><body><p>{PROMO_BODY}</p></body></html>'
+        assert email_fingerprint('', html, []) == email_fingerprint(PROMO_BODY, '', [])
+
+    def test_empty_email_has_no_fingerprint(self):
+        assert email_fingerprint('', '', []) is None
+        assert group_near_duplicates({7: None}) == {7: 7}
+
+
+def _email(pk, body, links=None, sender='Sender', subscription_id=1):
+    e = MagicMock()
+    e.pk = pk
+    e.subscription_id = subscription_id
+    e.subject = f'Subject {pk}'
+    e.from_address = f'{sender.lower()}@example.com'
+    e.from_name = sender
+    e.body_text = body
+    e.body_html = ''
+    e.links_extracted = links or []
+    return e
+
+
+class TestBatchAnalyzeEmails:
+    def test_duplicates_share_one_call_and_single_bulk_update(self):
+        emails = [_email(1, PROMO_BODY, LINKS), _email(2, PROMO_BODY, LINKS_B), _email(3, OTHER_BODY)]
+        model = MagicMock()
+        model.objects.filter.return_value.only.return_value = emails
+
+        def fake_analyze(subject, **kwargs):
+            return {'email_type': 'partner_promotion' if 'Sarah' in kwargs['body_text'] else 'content'}
+
+        with patch('email_monitor.models.InboundEmail', model), \
+                patch('email_monitor.services.email_analyzer.analyze_email', side_effect=fake_analyze) as analyze:
+            results = batch_analyze_emails([1, 2, 3], max_workers=2)
+
+        assert analyze.call_count == 2
+        assert results[1] == results[2] == {'email_type': 'partner_promotion'}
+        assert results[3] == {'email_type': 'content'}
+        model.objects.bulk_update.assert_called_once()
+        updated = model.objects.bulk_update.call_args[0][0]
+        assert {e.pk for e in updated} == {1, 2, 3}
+        assert all(e.analyzed_at is not None for e in updated)
+
+    def test_failed_analysis_leaves_analyzed_at_empty(self):
+        model = MagicMock()
+        model.objects.filter.return_value.only.return_value = [_email(1, PROMO_BODY)]
+        with patch('email_monitor.models.InboundEmail', model), \
+                patch('email_monitor.services.email_analyzer.analyze_email', return_value=None):
+            results = batch_analyze_emails([1])
+        assert results == {1: None}
+        assert model.objects.bulk_update.call_args[0][0][0].analyzed_at is None
+
+    def test_identical_bodies_from_different_senders_analyzed_separately(self):
+        owner = _email(1, PROMO_BODY, LINKS, sender='Sarah', subscription_id=1)
+        affiliate = _email(2, PROMO_BODY, LINKS, sender='Affiliate', subscription_id=2)
+        model = MagicMock()
+        model.objects.filter.return_value.only.return_value = [owner, affiliate]
+
+        def fake_analyze(subject, from_name, **kwargs):
+            return {'email_type': 'own_promotion' if from_name == 'Sarah' else 'partner_promotion'}
+
+        with patch('email_monitor.models.InboundEmail', model), \
+                patch('email_monitor.services.email_analyzer.analyze_email', side_effect=fake_analyze) as analyze:
+            results = batch_analyze_emails([1, 2])
+
+        assert analyze.call_count == 2
+        assert results[1] == {'email_type': 'own_promotion'}
+        assert results[2] == {'email_type': 'partner_promotion'}
+
+    def test_same_sender_across_monitor_addresses_shares_one_call(self):
+        first = _email(1, PROMO_BODY, LINKS, sender='Sarah', subscription_id=1)
+        second = _email(2, PROMO_BODY, LINKS_B, sender='Sarah', subscription_id=2)
+        model = MagicMock()
+        model.objects.filter.return_value.only.return_value = [first, second]
+
+        with patch('email_monitor.models.InboundEmail', model), \
+                patch('email_monitor.services.email_analyzer.analyze_email',
+                      return_value={'email_type': 'own_promotion'}) as analyze:
+            results = batch_analyze_emails([1, 2])
+
+        assert analyze.call_count == 1
+        assert results[1] == results[2] == {'email_type': 'own_promotion'}
@@ -0,0 +1,144 @@
+"""
+Tests for the Exa response cache and concurrent batch research in
+matching/enrichment/exa_research.py.
+
+The Exa SDK client is replaced by a fake that records calls; the cache
+lives in tmp_path. No API key or network required.
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from matching.enrichment import exa_research
+from matching.enrichment.exa_research import ExaResearchService, ExaResponseCache
+
+
+class FakeExaClient:
+    """Minimal stand-in for exa_py.Exa returning canned responses."""
+
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _record(self, kind, kwargs):
+        with self._lock:
+            self.calls.append((kind, kwargs))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+    def get_contents(self, urls, **kwargs):
+        self._record('get_contents', {'urls': urls, **kwargs})
+        summary = json.dumps({'what_you_do': f'Coaching at {urls[0]}', 'niche': 'wellness'})
+        return SimpleNamespace(
+            cost_dollars=SimpleNamespace(total=0.005),
+            results=[SimpleNamespace(summary=summary, extras={'links': []}, subpages=[])],
+        )
+
+    def search(self, query, **kwargs):
+        self._record('search', {'query': query, **kwargs})
+        return SimpleNamespace(cost_dollars=SimpleNamespace(total=0.01), results=[])
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv('EXA_API_KEY', 'test-key')
+    svc = ExaResearchService(cache=ExaResponseCache(tmp_path / 'exa.sqlite3'))
+    svc._client = FakeExaClient()
+    return svc
+
+
+class TestResponseCache:
+    def test_repeat_research_is_served_from_cache(self, service):
+        first = service.research_profile('Jane Doe', website='https://www.janedoe.com/')
+        calls = len(service.client.calls)
+
+        again = service.research_profile('Jane Doe', website='janedoe.com')
+
+        assert len(service.client.calls) == calls  # normalized URL hits the cache
+        assert again['what_you_do'] == first['what_you_do']
+        assert again['_exa_cost'] == 0.0
+        assert first['_exa_cost'] > 0
+
+    def test_cache_is_shared_through_the_file(self, service, tmp_path):
+        service.research_profile('Jane Doe', website='https://janedoe.com')
+
+        other = ExaResearchService(cache=ExaResponseCache(tmp_path / 'exa.sqlite3'))
+        other._client = FakeExaClient()
+        other.research_profile('Jane Doe', website='https://janedoe.com')
+
+        assert other.client.calls == []
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = ExaResponseCache(tmp_path / 'exa.sqlite3', ttl_days=1)
+        cache.put('k', {'v': 1})
+        assert cache.get('k') == {'v': 1}
+
+        with patch.object(exa_research.time, 'time', return_value=time.time() + 2 * 86400):
+            assert cache.get('k') is None
+
+    def test_schema_and_version_are_part_of_the_key(self, monkeypatch):
+        key = ExaResponseCache.make_key('website_contents', url='u', schema={'a': 1})
+        assert key != ExaResponseCache.make_key('website_contents', url='u', schema={'a': 2})
+
+        monkeypatch.setattr(exa_research, 'EXA_CACHE_VERSION', exa_research.EXA_CACHE_VERSION + 1)
+        assert key != ExaResponseCache.make_key('website_contents', url='u', schema={'a': 1})
+
+    def test_zero_ttl_disables_cache(self, tmp_path):
+        cache = ExaResponseCache(tmp_path / 'exa.sqlite3', ttl_days=0)
+        cache.put('k', {'v': 1})
+        assert cache.get('k') is None
+        assert not (tmp_path / 'exa.sqlite3').exists()
+
+
+class FakeGuard:
+    def __init__(self, budget):
+        self.budget = budget
+        self.reads = 0
+
+    def get_summary(self):
+        self.reads += 1
+        return {'daily_remaining': self.budget, 'monthly_remaining': self.budget * 10}
+
+
+class TestBatchResearch:
+    def test_profiles_run_concurrently_in_order(self, service):
+        service._client = FakeExaClient(delay=0.05)
+        profiles = [{'name': f'Person {i}', 'website': f'https://p{i}.com'} for i in range(6)]
+
+        results = service.research_profiles_batch(
+            profiles, max_workers=3, requests_per_second=0, cost_guard=FakeGuard(10.0),
+        )
+
+        assert [r['what_you_do'] for r in results] == [
+            f'Coaching at https://p{i}.com' for i in range(6)
+        ]
+        assert service.client.max_active > 1
+
+    def test_stops_when_budget_exhausted(self, service):
+        profiles = [{'name': f'Person {i}', 'website': f'https://p{i}.com'} for i in range(5)]
+
+        results = service.research_profiles_batch(
+            profiles, max_workers=1, requests_per_second=0,
+            cost_guard=FakeGuard(exa_research.EXA_COST_PER_PROFILE * 2),
+        )
+
+        assert [r is not None for r in results] == [True, True, False, False, False]
+
+    def test_budget_is_read_once_per_batch(self, service):
+        guard = FakeGuard(10.0)
+        profiles = [{'name': f'Person {i}', 'website': f'https://p{i}.com'} for i in range(4)]
+
+        service.research_profiles_batch(profiles, max_workers=2, requests_per_second=0, cost_guard=guard)
+
+        assert guard.reads == 1
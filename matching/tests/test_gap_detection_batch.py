@@ -0,0 +1,106 @@
+"""
+Tests for set-based batch gap detection in
+matching/enrichment/flows/gap_detection.py.
+
+The grouped queries are answered by a fake cursor keyed on the SQL text;
+no database required.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from matching.enrichment.flows import gap_detection as gd
+
+
+def _fake_connection(responses):
+    """Connection whose cursor returns responses[sql] for each executed query."""
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    executed = []
+
+    def execute(sql, params=None):
+        executed.append(sql)
+        cursor.fetchall.return_value = responses[sql]
+        cursor.fetchone.return_value = (responses[sql] or [None])[0]
+
+    cursor.execute.side_effect = execute
+    return conn, executed
+
+
+def _run_batch(responses, **kwargs):
+    conn, executed = _fake_connection(responses)
+    with patch.object(gd, '_get_db_connection', return_value=conn), \
+         patch.object(gd, 'get_run_logger'):
+        return gd.detect_gaps_batch.fn(**kwargs), executed
+
+
+CLIENTS = [
+    {'id': 'c1', 'name': 'Alice', 'niche': 'Wellness', 'tags': ['podcast', 'fitness']},
+    {'id': 'c2', 'name': 'Bob', 'niche': 'Finance', 'tags': []},
+]
+STATS = [
+    {'profile_id': 'c1', 'current_count': 2, 'lowest_score': 55.123,
+     'avg_score': 66.666, 'top_match_ids': ['m1', 'm2']},
+]
+NICHES = [
+    {'profile_id': 'c1', 'niche': 'Wellness', 'match_count': 3},
+    {'profile_id': 'c1', 'niche': 'wellness ', 'match_count': 1},
+    {'profile_id': 'c1', 'niche': 'Podcast', 'match_count': 1},
+]
+
+
+class TestDetectGapsBatch:
+    def test_grouped_queries_build_per_client_results(self):
+        responses = {
+            gd._ACTIVE_CLIENTS_SQL: [{'profile_id': 'c1'}, {'profile_id': 'c2'}, {'profile_id': 'c3'}],
+            gd._BATCH_CLIENT_PROFILES_SQL: CLIENTS,
+            gd._BATCH_SCORE_STATS_SQL: STATS,
+            gd._BATCH_NICHE_COUNTS_SQL: NICHES,
+        }
+
+        results, executed = _run_batch(responses, target_score=60, target_count=5)
+
+        assert len(executed) == 4  # independent of the number of clients
+        by_id = {r['client_id']: r for r in results}
+        assert sorted(by_id['c1'].pop('niche_gaps')) == ['fitness', 'podcast']
+        assert by_id['c1'] == {
+            'client_id': 'c1', 'client_name': 'Alice',
+            'current_count': 2, 'target_count': 5, 'gap': 3, 'has_gap': True,
+            'lowest_score': 55.12, 'avg_score': 66.67,
+            'top_niches': ['wellness', 'podcast'],
+            'top_match_ids': ['m1', 'm2'],
+        }
+        assert by_id['c2']['current_count'] == 0 and by_id['c2']['gap'] == 5
+        assert by_id['c3']['client_name'] == '' and by_id['c3']['has_gap']
+
+    def test_matches_per_client_detection(self):
+        matches = [
+            {'suggested_profile_id': 'm1', 'harmonic_mean': 80, 'niche': 'Wellness'},
+            {'suggested_profile_id': 'm2', 'harmonic_mean': 61.5, 'niche': 'Podcast'},
+            {'suggested_profile_id': 'm3', 'harmonic_mean': None, 'niche': 'wellness'},
+        ]
+        conn, _ = _fake_connection({
+            gd._CLIENT_PROFILE_SQL: [CLIENTS[0]],
+            gd._MATCH_SCORES_SQL: matches,
+        })
+        with patch.object(gd, '_get_db_connection', return_value=conn), \
+             patch.object(gd, 'get_run_logger'):
+            single = gd.detect_match_gaps.fn('c1', target_score=60, target_count=2)
+
+        batch, _ = _run_batch({
+            gd._BATCH_CLIENT_PROFILES_SQL: [CLIENTS[0]],
+            gd._BATCH_SCORE_STATS_SQL: [{
+                'profile_id': 'c1', 'current_count': 2, 'lowest_score': 61.5,
+                'avg_score': 70.75, 'top_match_ids': ['m1', 'm2'],
+            }],
+            gd._BATCH_NICHE_COUNTS_SQL: [
+                {'profile_id': 'c1', 'niche': 'Wellness', 'match_count': 1},
+                {'profile_id': 'c1', 'niche': 'wellness', 'match_count': 1},
+                {'profile_id': 'c1', 'niche': 'Podcast', 'match_count': 1},
+            ],
+        }, target_score=60, target_count=2, client_ids=['c1'])
+
+        assert batch == [single]
+
+    def test_no_clients(self):
+        results, executed = _run_batch({gd._ACTIVE_CLIENTS_SQL: []})
+        assert results == [] and len(executed) == 1
@@ -0,0 +1,97 @@
+"""
+Tests for the single-pass generate_analytics_insights command: all rules
+run against prefetched summaries/partners, duplicates are detected from the
+preloaded insight keys, and new insights go out in one bulk_create.
+
+Model managers are mocked; no database required.
+"""
+
+import os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+
+from matching.models import (
+    AnalyticsInsight,
+    AnalyticsIntervention,
+    EngagementSummary,
+    MemberReport,
+    ReportPartner,
+)
+
+PID = ['11111111-1111-1111-1111-11111111111%d' % i for i in range(4)]
+
+
+def _run(reports, summaries, partners, existing=()):
+    report_mgr = MagicMock()
+    report_mgr.filter.return_value = reports
+    summary_mgr = MagicMock()
+    summary_mgr.filter.return_value.order_by.return_value = summaries
+    partner_mgr = MagicMock()
+    partner_mgr.filter.return_value = partners
+    insight_mgr = MagicMock()
+    insight_mgr.filter.return_value.values_list.return_value = list(existing)
+    intervention_mgr = MagicMock()
+    intervention_mgr.filter.return_value.select_related.return_value = []
+
+    with patch.object(MemberReport, 'objects', report_mgr), \
+         patch.object(EngagementSummary, 'objects', summary_mgr), \
+         patch.object(ReportPartner, 'objects', partner_mgr), \
+         patch.object(AnalyticsInsight, 'objects', insight_mgr), \
+         patch.object(AnalyticsIntervention, 'objects', intervention_mgr):
+        call_command('generate_analytics_insights', stdout=StringIO())
+
+    return summary_mgr, partner_mgr, insight_mgr
+
+
+def _fixtures():
+    reports = [MemberReport(id=1, member_name='Jane'), MemberReport(id=2, member_name='Bob')]
+    summaries = [
+        EngagementSummary(report_id=1, partner_id='', days_since_last_visit=20,
+                          avg_scroll_depth_pct=30, template_copy_count=5),
+        EngagementSummary(report_id=1, partner_id=PID[0], card_expand_count=6),
+        EngagementSummary(report_id=1, partner_id=PID[1], card_expand_count=9),
+        EngagementSummary(report_id=2, partner_id='', days_since_last_visit=1,
+                          avg_scroll_depth_pct=90),
+        EngagementSummary(report_id=2, partner_id=PID[2], any_contact_action=True),
+    ]
+    partners = [
+        ReportPartner(report_id=1, name='Acme', section='priority', source_profile_id=PID[0]),
+        ReportPartner(report_id=1, name='Beta', section='priority', source_profile_id=PID[1]),
+        ReportPartner(report_id=2, name='Gamma', section='priority', source_profile_id=PID[2]),
+    ]
+    return reports, summaries, partners
+
+
+class TestGenerateAnalyticsInsights:
+    def test_queries_do_not_scale_with_reports(self):
+        summary_mgr, partner_mgr, insight_mgr = _run(*_fixtures())
+
+        assert summary_mgr.filter.call_count == 1
+        assert partner_mgr.filter.call_count == 1
+        insight_mgr.bulk_create.assert_called_once()
+
+        created = insight_mgr.bulk_create.call_args.args[0]
+        by_key = {(i.category, i.report_id): i for i in created}
+        assert set(by_key) == {
+            ('idle_report', 1), ('template_friction', 1), ('partner_friction', 1),
+            ('engagement_pattern', 1), ('section_attention', 1), ('engagement_pattern', 2),
+        }
+        assert by_key[('idle_report', 1)].severity == 'critical'
+        # One friction insight per report, named after the first partner
+        assert by_key[('partner_friction', 1)].data['partner_name'] == 'Acme'
+        assert by_key[('engagement_pattern', 2)].severity == 'info'
+
+    def test_existing_insights_are_skipped(self):
+        existing = [('idle_report', 1), ('partner_friction', 1), ('engagement_pattern', 2)]
+
+        _, _, insight_mgr = _run(*_fixtures(), existing=existing)
+
+        created = insight_mgr.bulk_create.call_args.args[0]
+        keys = {(i.category, i.report_id) for i in created}
+        assert keys.isdisjoint(existing)
+        assert ('template_friction', 1) in keys
@@ -0,0 +1,166 @@
+"""
+Tests for the batched Gmail poller HTTP layer (email_monitor.services.gmail_poller).
+
+Runs against a local stub of the Gmail REST + batch endpoints served by
+http.server, so no Google credentials or database are required.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from email_monitor.services import gmail_poller
+
+MESSAGES = {
+    f'm{i}': {
+        'id': f'm{i}',
+        'payload': {
+            'mimeType': 'text/plain',
+            'headers': [
+                {'name': 'To', 'value': 'jvmonitor+abcdef12@gmail.com'},
+                {'name': 'From', 'value': '"Jane" <jane@example.com>'},
+                {'name': 'Subject', 'value': f'Issue {i}'},
+                {'name': 'Date', 'value': 'Mon, 05 Oct 2026 10:00:00 +0000'},
+            ],
+            'body': {'data': ''},
+        },
+    }
+    for i in range(5)
+}
+BROKEN_IN_BATCH = {'m3'}   # sub-response 500 in the batch, served by plain GET
+
+
+class _GmailStub(BaseHTTPRequestHandler):
+    calls: list = []
+
+    def log_message(self, *args):
+        pass
+
+    def _json(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.calls.append(('GET', self.path))
+        if self.path.startswith('/gmail/v1/users/me/messages?'):
+            ids = sorted(MESSAGES)
+            if 'pageToken=p2' in self.path:
+                return self._json({'messages': [{'id': i} for i in ids[3:]]})
+            return self._json({'messages': [{'id': i} for i in ids[:3]], 'nextPageToken': 'p2'})
+        match = re.match(r'/gmail/v1/users/me/messages/(\w+)', self.path)
+        if match and match.group(1) in MESSAGES:
+            return self._json(MESSAGES[match.group(1)])
+        self._json({}, status=404)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        raw = self.rfile.read(length).decode()
+        self.calls.append(('POST', self.path, raw))
+        if self.path == '/batch/gmail/v1':
+            ids = re.findall(r'GET /gmail/v1/users/me/messages/(\w+)\?format=full', raw)
+            boundary = 'batch_resp'
+            parts = []
+            for msg_id in ids:
+                status = '500 Internal Server Error' if msg_id in BROKEN_IN_BATCH else '200 OK'
+                payload = {} if msg_id in BROKEN_IN_BATCH else MESSAGES[msg_id]
+                parts.append(
+                    f'--{boundary}\r\nContent-Type: application/http\r\n'
+                    f'Content-ID: <response-msg-{msg_id}>\r\n\r\n'
+                    f'HTTP/1.1 {status}\r\nContent-Type: application/json\r\n\r\n'
+                    f'{json.dumps(payload)}\r\n'
+                )
+            body = (''.join(parts) + f'--{boundary}--\r\n').encode()
+            self.send_response(200)
+            self.send_header('Content-Type', f'multipart/mixed; boundary={boundary}')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path == '/gmail/v1/users/me/messages/batchModify':
+            return self._json({})
+        self._json({}, status=404)
+
+
+@pytest.fixture
+def gmail_stub(monkeypatch):
+    _GmailStub.calls = []
+    server = HTTPServer(('127.0.0.1', 0), _GmailStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f'http://127.0.0.1:{server.server_port}'
+    monkeypatch.setattr(gmail_poller, 'GMAIL_API', f'{base}/gmail/v1')
+    monkeypatch.setattr(gmail_poller, 'GMAIL_BATCH_URL', f'{base}/batch/gmail/v1')
+    monkeypatch.setattr(gmail_poller, '_get_access_token', lambda: 'test-token')
+    yield _GmailStub
+    server.shutdown()
+
+
+class TestListUnreadIds:
+    def test_follows_next_page_token(self, gmail_stub):
+        pages = list(gmail_poller._list_unread_ids(page_size=3))
+        assert pages == [['m0', 'm1', 'm2'], ['m3', 'm4']]
+
+    def test_max_messages_caps_total(self, gmail_stub):
+        pages = list(gmail_poller._list_unread_ids(page_size=3, max_messages=2))
+        assert pages == [['m0', 'm1']]
+        assert len([c for c in gmail_stub.calls if c[0] == 'GET']) == 1
+
+
+class TestBatchGet:
+    def test_fetches_in_one_batch_and_retries_failed_parts(self, gmail_stub):
+        messages = gmail_poller._gmail_batch_get(sorted(MESSAGES))
+
+        assert set(messages) == set(MESSAGES)
+        assert messages['m1']['payload']['headers'][2]['value'] == 'Issue 1'
+        batch_posts = [c for c in gmail_stub.calls if c[0] == 'POST' and c[1] == '/batch/gmail/v1']
+        single_gets = [c for c in gmail_stub.calls if c[0] == 'GET']
+        assert len(batch_posts) == 1
+        assert single_gets == [('GET', '/gmail/v1/users/me/messages/m3?format=full')]
+
+    def test_parsed_message_fields(self, gmail_stub):
+        msg = gmail_poller._gmail_batch_get(['m0'])['m0']
+        parsed = gmail_poller._parse_message(msg)
+        assert gmail_poller._extract_uuid_prefix(parsed['to_addr']) == 'abcdef12'
+        assert gmail_poller._split_from(parsed['from_addr']) == ('Jane', 'jane@example.com')
+        assert parsed['received_at'].year == 2026
+
+
+class TestBatchMarkRead:
+    def test_single_batch_modify_call(self, gmail_stub):
+        gmail_poller._batch_mark_read(['m0', 'm1', 'm2'])
+        posts = [c for c in gmail_stub.calls if c[0] == 'POST']
+        assert len(posts) == 1
+        assert posts[0][1] == '/gmail/v1/users/me/messages/batchModify'
+        assert json.loads(posts[0][2]) == {'ids': ['m0', 'm1', 'm2'], 'removeLabelIds': ['UNREAD']}
+
+
+class TestPollInboxBatched:
+    def test_lists_every_page_before_marking_read(self, gmail_stub, settings):
+        settings.GMAIL_MONITOR_REFRESH_TOKEN = 'r'
+        settings.GMAIL_MONITOR_CLIENT_ID = 'c'
+        settings.GMAIL_MONITOR_CLIENT_SECRET = 's'
+        inbound = MagicMock()
+        # Every id is already stored, so each page is only marked read
+        inbound.objects.filter.side_effect = (
+            lambda gmail_message_id__in: MagicMock(values_list=lambda *a, **k: list(gmail_message_id__in))
+        )
+
+        with patch('email_monitor.models.InboundEmail', inbound), \
+                patch('django.db.transaction.atomic'), \
+                patch.object(gmail_poller, '_load_subscription_map', return_value={}), \
+                patch.object(gmail_poller, '_fail_stale_pending'):
+            stats = gmail_poller.poll_inbox_batched(page_size=3)
+
+        assert stats['skipped'] == len(MESSAGES)
+        kinds = [c[1].split('?')[0] for c in gmail_stub.calls]
+        first_modify = kinds.index('/gmail/v1/users/me/messages/batchModify')
+        assert kinds[:first_modify] == ['/gmail/v1/users/me/messages'] * 2
+        assert kinds.count('/gmail/v1/users/me/messages/batchModify') == 2
@@ -0,0 +1,138 @@
+"""
+Unit tests for the pipelined mode of scripts/sourcing/jv_triage.py.
+
+Covers the pure pieces that run in worker processes and the writer:
+triage_chunk(), TriageTotals checkpoint round-trips, the COPY buffer
+handed to copy_update_tiers() and write_chunk()'s archive-before-delete
+ordering. No database access required.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.sourcing import jv_triage
+from scripts.sourcing.jv_triage import (
+    TriageTotals,
+    classify_tier,
+    copy_update_tiers,
+    score_jv_readiness,
+    triage_chunk,
+)
+
+
+def _row(uid, source='unknown', **extra):
+    row = {'id': uid, 'name': f'Person {uid}', 'enrichment_metadata': {'original_source': source}}
+    row.update(extra)
+    return row
+
+
+class TestTriageChunk:
+    def test_matches_single_process_scoring(self):
+        rows = [_row('00000000-0000-0000-0000-00000000000%d' % i, website='https://ex%d.com' % i) for i in range(5)]
+        result = triage_chunk(rows)
+
+        expected = []
+        for row in rows:
+            tier = classify_tier(row)
+            if tier != 'X':
+                expected.append((row['id'], tier, score_jv_readiness(row, tier)))
+        assert result['updates'] == expected
+        assert result['scanned'] == 5
+        assert result['last_id'] == rows[-1]['id']
+
+    def test_tier_filter_skips_other_tiers(self):
+        rows = [_row('a'), _row('b')]
+        result = triage_chunk(rows, tier_filter={'A'})
+        assert result['updates'] == []
+        assert result['scanned'] == 2
+        assert sum(result['tier_counts'].values()) == 0
+
+    def test_top_is_bounded(self):
+        rows = [_row(str(i)) for i in range(20)]
+        result = triage_chunk(rows, top_n=3)
+        assert len(result['top']) == 3
+
+
+class TestTriageTotals:
+    def test_merge_and_state_round_trip(self):
+        totals = TriageTotals(top_n=2)
+        totals.merge(triage_chunk([_row('a', source='s1'), _row('b', source='s2')]))
+        totals.merge(triage_chunk([_row('c', source='s1')]))
+        totals.updated = 3
+
+        restored = TriageTotals.from_state(totals.to_state(), top_n=2)
+        assert restored.scanned == 3
+        assert restored.updated == 3
+        assert restored.tier_counts == totals.tier_counts
+        assert restored.source_tier_counts['s1'] == totals.source_tier_counts['s1']
+        assert len(restored.top_profiles) == 2
+
+    def test_from_empty_state(self):
+        totals = TriageTotals.from_state(None)
+        assert totals.scanned == 0
+        assert totals.top_profiles == []
+
+
+class TestCopyUpdateTiers:
+    def test_copies_tab_separated_rows_then_updates(self):
+        conn = MagicMock()
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.rowcount = 2
+
+        written = copy_update_tiers(conn, [('id-1', 'A', 91.5), ('id-2', 'E', 12.0)])
+
+        assert written == 2
+        buf = cur.copy_expert.call_args[0][1]
+        assert buf.getvalue() == 'id-1\tA\t91.5\nid-2\tE\t12.0\n'
+        assert 'UPDATE profiles' in cur.execute.call_args_list[-1][0][0]
+        conn.commit.assert_not_called()
+
+    def test_no_updates_is_noop(self):
+        conn = MagicMock()
+        assert copy_update_tiers(conn, []) == 0
+        conn.cursor.assert_not_called()
+
+
+class TestWriteChunk:
+    def _result(self):
+        return {'updates': [], 'tier_x_rows': [_row('x1'), _row('x2')]}
+
+    def test_archives_before_delete(self):
+        conn = MagicMock()
+        calls = []
+        conn.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            lambda sql, params: calls.append('delete')
+        )
+        conn.commit.side_effect = lambda: calls.append('commit')
+        conn.cursor.return_value.__enter__.return_value.rowcount = 2
+
+        with patch.object(jv_triage, 'append_tier_x_archive', side_effect=lambda rows: calls.append('archive')):
+            assert jv_triage.write_chunk(conn, self._result(), True, True) == (0, 2)
+
+        assert calls == ['archive', 'delete', 'commit']
+
+    def test_failed_archive_deletes_nothing(self):
+        conn = MagicMock()
+        cur = conn.cursor.return_value.__enter__.return_value
+
+        with patch.object(jv_triage, 'append_tier_x_archive', side_effect=OSError('disk full')):
+            with pytest.raises(OSError):
+                jv_triage.write_chunk(conn, self._result(), True, True)
+
+        cur.execute.assert_not_called()
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called_once()
+
+
+class TestCheckpoint:
+    def test_round_trip_outside_scraper_state_dir(self, tmp_path):
+        path = tmp_path / 'jv_triage_checkpoint.json'
+        with patch.object(jv_triage, 'CHECKPOINT_PATH', path):
+            assert jv_triage.load_checkpoint() == {}
+            jv_triage.save_checkpoint({'last_id': 'abc', 'totals': {'scanned': 10}})
+            state = jv_triage.load_checkpoint()
+
+        assert state['last_id'] == 'abc'
+        assert state['totals'] == {'scanned': 10}
+        assert 'config/state' not in str(jv_triage.CHECKPOINT_PATH)
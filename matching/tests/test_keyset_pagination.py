@@ -0,0 +1,134 @@
+"""
+Tests for matching/pagination.py (keyset pages and estimated counts) and
+the directory search query used by SupabaseProfileListView.
+
+Querysets and the DB cursor are faked; no database required.
+"""
+
+import importlib
+import json
+import os
+import re
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from matching import pagination
+from matching.pagination import KeysetPaginator, decode_cursor, encode_cursor
+from matching.views import DIRECTORY_SEARCH_DOCUMENT, _directory_tsquery
+
+
+class FakeQuerySet:
+    """Records filter/order_by calls and returns preset rows when sliced."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = []
+        self.ordering = None
+
+    def filter(self, *args, **kwargs):
+        self.filters.append(args or kwargs)
+        return self
+
+    def order_by(self, *fields):
+        self.ordering = fields
+        return self
+
+    def __getitem__(self, item):
+        return self.rows[item]
+
+
+def _rows(n):
+    ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [SimpleNamespace(pk=f'id{i}', last_active_at=ts) for i in range(n)]
+
+
+class TestCursor:
+    def test_round_trip(self):
+        ts = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+        assert decode_cursor(encode_cursor(ts, 'abc')) == (ts.isoformat(), 'abc')
+        assert decode_cursor(encode_cursor(None, 'abc')) == (None, 'abc')
+
+    def test_malformed_cursor_is_ignored(self):
+        assert decode_cursor('not-a-cursor') is None
+
+
+class TestKeysetPaginator:
+    def test_first_page_has_no_seek_predicate(self):
+        qs = FakeQuerySet(_rows(26))
+
+        page = KeysetPaginator(qs, 25, field='last_active_at').page()
+
+        assert qs.filters == []
+        assert len(page) == 25
+        assert page.has_next() and not page.has_previous()
+        assert decode_cursor(page.next_cursor)[1] == 'id24'
+
+    def test_after_cursor_seeks_past_last_row(self):
+        qs = FakeQuerySet(_rows(3))
+        cursor = encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), 'id9')
+
+        page = KeysetPaginator(qs, 25, field='last_active_at').page(after=cursor)
+
+        assert len(qs.filters) == 1
+        predicate = str(qs.filters[0][0])
+        assert 'last_active_at__lt' in predicate and "'pk__lt', 'id9'" in predicate
+        assert not page.has_next() and page.has_previous()
+
+    def test_before_cursor_reverses_order(self):
+        rows = _rows(26)
+        qs = FakeQuerySet(rows)
+        cursor = encode_cursor(None, 'id0')
+
+        page = KeysetPaginator(qs, 25, field='last_active_at').page(before=cursor)
+
+        assert list(page) == rows[:25][::-1]
+        assert page.has_next() and page.has_previous()
+
+
+class TestEstimatedCount:
+    def _cursor(self, plan_rows):
+        cur = MagicMock()
+        cur.fetchone.return_value = [json.dumps([{'Plan': {'Plan Rows': plan_rows}}])]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cur
+        return conn, cur
+
+    def _queryset(self):
+        qs = MagicMock()
+        qs.order_by.return_value.query.sql_with_params.return_value = ('SELECT 1', ())
+        qs.count.return_value = 42
+        return qs
+
+    def test_large_results_use_planner_estimate(self):
+        conn, cur = self._cursor(250000)
+        qs = self._queryset()
+        with patch.object(pagination, 'connection', conn):
+            assert pagination.estimated_count(qs) == 250000
+        assert cur.execute.call_args.args[0].startswith('EXPLAIN (FORMAT JSON)')
+        qs.count.assert_not_called()
+
+    def test_small_results_are_counted_exactly(self):
+        conn, _ = self._cursor(40)
+        with patch.object(pagination, 'connection', conn):
+            assert pagination.estimated_count(self._queryset()) == 42
+
+
+class TestDirectoryTsquery:
+    def test_prefix_terms(self):
+        assert _directory_tsquery("Jane's  coaching!") == 'jane:* & s:* & coaching:*'
+
+    def test_no_terms(self):
+        assert _directory_tsquery(" -- ") == ''
+
+    def test_document_matches_index_expression(self):
+        migration = importlib.import_module('matching.migrations.0027_add_profiles_directory_search')
+        index_sql = migration.Migration.operations[0].sql
+
+        def normalize(sql):
+            return re.sub(r'\s+', ' ', sql).strip()
+
+        assert f'USING GIN ({normalize(DIRECTORY_SEARCH_DOCUMENT)})' in normalize(index_sql)
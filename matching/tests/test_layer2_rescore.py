@@ -0,0 +1,101 @@
+"""
+Tests for the streaming Layer 2 rescore filter
+(matching/enrichment/cascade/layer2_rescore_filter.py).
+
+Database access is replaced by fake connections/cursors, and jv_triage
+scoring by simple deterministic functions.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from matching.enrichment.cascade import layer2_rescore_filter as l2
+
+
+def _fake_triage():
+    def classify_tier(profile):
+        return profile['new_tier']
+
+    def score_jv_readiness(profile, tier):
+        return profile['new_score']
+
+    return classify_tier, score_jv_readiness
+
+
+def _profile(pid, old_tier, old_score, new_tier, new_score):
+    return {'id': pid, 'jv_tier': old_tier, 'jv_readiness_score': old_score,
+            'new_tier': new_tier, 'new_score': new_score}
+
+
+class TestLayer2Run:
+    def _run(self, chunks, dry_run=False, affected_ids=None):
+        conn = MagicMock()
+        written = []
+
+        def fake_update(conn_arg, updates, page_size=1000):
+            written.append(list(updates))
+            return len(updates)
+
+        with patch.object(l2, '_get_conn', return_value=conn), \
+                patch.object(l2, '_import_triage', _fake_triage), \
+                patch.object(l2, '_iter_profiles_for_rescore', return_value=iter(chunks)) as iter_mock, \
+                patch.object(l2, '_batch_update_scores', side_effect=fake_update):
+            result = l2.Layer2RescoreFilter(threshold=50, dry_run=dry_run, chunk_size=2).run(affected_ids)
+        return result, written, conn, iter_mock
+
+    def test_streams_chunks_and_writes_per_chunk(self):
+        chunks = [
+            [_profile('a', 'C', 40, 'B', 60), _profile('b', 'B', 70, 'B', 70.2)],
+            [_profile('c', 'D', 20, 'D', 30), _profile('d', 'A', 90, 'A', 95)],
+        ]
+        result, written, conn, _ = self._run(chunks)
+
+        assert result.profiles_rescored == 4
+        assert [[u['id'] for u in w] for w in written] == [['a'], ['c', 'd']]
+        assert conn.commit.call_count == 2
+        assert result.tier_promotions == {'C→B': 1}
+        # Highest new score first
+        assert result.qualified_ids == ['d', 'b', 'a']
+        assert result.avg_score_before == (40 + 70 + 20 + 90) / 4
+        # b unchanged (<0.5 delta) keeps its old score in the "after" average
+        assert result.avg_score_after == (60 + 70 + 30 + 95) / 4
+
+    def test_dry_run_does_not_write(self):
+        result, written, conn, _ = self._run([[_profile('a', 'C', 40, 'B', 60)]], dry_run=True)
+        assert written == []
+        conn.commit.assert_not_called()
+        assert result.qualified_ids == ['a']
+
+    def test_no_profiles(self):
+        result, written, _, _ = self._run([])
+        assert result.profiles_rescored == 0
+        assert result.avg_score_after == 0.0
+
+    def test_empty_affected_ids_means_all_profiles(self):
+        _, _, _, iter_mock = self._run([], affected_ids=[])
+        assert iter_mock.call_args.kwargs['profile_ids'] is None
+
+
+class TestIterProfiles:
+    def test_keyset_pagination(self):
+        conn = MagicMock()
+        cur = conn.cursor.return_value
+        cur.fetchall.side_effect = [
+            [{'id': '1'}, {'id': '2'}],
+            [{'id': '3'}],
+            [],
+        ]
+        chunks = list(l2._iter_profiles_for_rescore(conn, chunk_size=2))
+
+        assert chunks == [[{'id': '1'}, {'id': '2'}], [{'id': '3'}]]
+        sqls = [c.args[0] for c in cur.execute.call_args_list]
+        assert 'ORDER BY id LIMIT' in sqls[0] and 'id >' not in sqls[0]
+        assert 'id > %s::uuid' in sqls[1]
+        assert cur.execute.call_args_list[1].args[1] == ['2', 2]
+
+    def test_id_list_fetched_in_chunks(self):
+        conn = MagicMock()
+        cur = conn.cursor.return_value
+        cur.fetchall.side_effect = [[{'id': 'a'}, {'id': 'b'}], [{'id': 'c'}]]
+        chunks = list(l2._iter_profiles_for_rescore(conn, profile_ids=['a', 'b', 'c'], chunk_size=2))
+        assert len(chunks) == 2
+        assert cur.execute.call_args_list[1].args[1] == [['c']]
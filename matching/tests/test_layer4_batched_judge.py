@@ -0,0 +1,147 @@
+"""
+Tests for batched Layer 4 conflict judging
+(matching/enrichment/cascade/layer4_claude_judge.py).
+
+The Claude client and database writes are replaced by fakes; the verdict
+cache lives in a pytest tmp_path.
+"""
+
+import json
+from unittest.mock import patch
+
+from matching.enrichment.cascade import layer4_claude_judge as l4
+from matching.enrichment.claude_client import ClaudeClient
+
+
+def _profile(pid, **fields):
+    meta = {
+        'field_meta': {f: {'source': 'ai_research'} for f in fields},
+        'pre_enrichment': {f: old for f, (old, _) in fields.items()},
+    }
+    row = {'id': pid, 'name': f'Name {pid}', 'website': '', 'enrichment_metadata': meta}
+    row.update({f: new for f, (_, new) in fields.items()})
+    return row
+
+
+class FakeClient:
+    def __init__(self, responder):
+        self.responder = responder
+        self.prompts = []
+
+    def is_available(self):
+        return True
+
+    def call(self, prompt):
+        self.prompts.append(prompt)
+        return self.responder(prompt)
+
+
+def _batch_responder(verdict='A'):
+    def respond(prompt):
+        if 'JSON array' not in prompt:
+            return f'VERDICT: {verdict} | REASON: single'
+        n = prompt.count('\nConflict ') + prompt.startswith('Conflict ')
+        return json.dumps([{'id': i, 'verdict': verdict, 'reason': 'batch'} for i in range(n)])
+    return respond
+
+
+class TestBatchedRun:
+    def _run(self, profiles, client, cache, batch_size=10, dry_run=False):
+        applied = []
+
+        def fake_apply(changes):
+            applied.append(list(changes))
+            return len(changes)
+
+        with patch.object(l4, '_fetch_enriched_profiles', return_value=profiles), \
+                patch.object(l4, '_apply_verdicts_batch', side_effect=fake_apply), \
+                patch('matching.enrichment.claude_client.ClaudeClient') as client_cls:
+            client_cls.return_value = client
+            client_cls.parse_json = ClaudeClient.parse_json
+            judge = l4.Layer4ClaudeJudge(
+                dry_run=dry_run, batched=True, batch_size=batch_size, max_workers=2, cache=cache,
+            )
+            result = judge.run([p['id'] for p in profiles])
+        return result, applied
+
+    def test_duplicate_conflicts_judged_once(self, tmp_path):
+        # Same boilerplate-vs-legacy conflict on three profiles, plus one distinct conflict
+        profiles = [_profile(str(i), niche=('coaching', 'AI boilerplate')) for i in range(3)]
+        profiles.append(_profile('9', seeking=('affiliates', 'podcasts')))
+        client = FakeClient(_batch_responder('A'))
+        cache = l4.JudgeVerdictCache(tmp_path / 'cache.jsonl')
+
+        result, applied = self._run(profiles, client, cache)
+
+        assert len(client.prompts) == 1
+        assert result.conflicts_found == 4
+        assert result.conflicts_resolved == 4
+        assert result.verdicts['A'] == 4
+        assert result.cost == l4.JUDGE_CALL_COST
+        # All writes go through a single batch apply
+        assert len(applied) == 1
+        assert sorted((c['profile_id'], c['chosen']) for c in applied[0]) == [
+            ('0', 'coaching'), ('1', 'coaching'), ('2', 'coaching'), ('9', 'affiliates'),
+        ]
+        assert result.fields_updated == 4
+
+    def test_cached_verdicts_skip_claude(self, tmp_path):
+        path = tmp_path / 'cache.jsonl'
+        profiles = [_profile('1', niche=('coaching', 'AI boilerplate'))]
+        self._run(profiles, FakeClient(_batch_responder('NEITHER')), l4.JudgeVerdictCache(path))
+
+        client = FakeClient(_batch_responder('A'))
+        result, applied = self._run(profiles, client, l4.JudgeVerdictCache(path))
+
+        assert client.prompts == []
+        assert result.verdicts['NEITHER'] == 1
+        assert applied[0][0]['chosen'] == ''
+
+    def test_unparseable_batch_falls_back_to_single_prompts(self, tmp_path):
+        def respond(prompt):
+            if 'JSON array' in prompt:
+                return 'not json'
+            return 'VERDICT: B | REASON: fine'
+
+        profiles = [_profile('1', niche=('x', 'y'), seeking=('p', 'q'))]
+        client = FakeClient(respond)
+        result, applied = self._run(profiles, client, l4.JudgeVerdictCache(tmp_path / 'c.jsonl'))
+
+        assert len(client.prompts) == 3  # 1 batch + 2 singles
+        assert result.verdicts['B'] == 2
+        assert applied == [[]]  # B keeps the AI value, nothing to write
+
+    def test_dry_run_writes_nothing(self, tmp_path):
+        profiles = [_profile('1', niche=('x', 'y'))]
+        _, applied = self._run(
+            profiles, FakeClient(_batch_responder('A')),
+            l4.JudgeVerdictCache(tmp_path / 'c.jsonl'), dry_run=True,
+        )
+        assert applied == [[]]
+
+
+class TestParseBatchVerdicts:
+    def test_ignores_bad_entries(self):
+        batch = [{'key': 'k0'}, {'key': 'k1'}]
+        response = json.dumps([
+            {'id': 0, 'verdict': 'a', 'reason': 'ok'},
+            {'id': 5, 'verdict': 'A'},
+            {'id': 1, 'verdict': 'MAYBE'},
+        ])
+        assert l4._parse_batch_verdicts(response, batch) == {'k0': ('A', 'ok')}
+
+    def test_conflict_key_is_order_sensitive(self):
+        assert l4._conflict_key('niche', 'a', 'b') != l4._conflict_key('niche', 'b', 'a')
+
+
+class TestCascadeWiring:
+    def test_flow_flag_reaches_layer4(self):
+        from matching.enrichment.flows import cascade_flow
+
+        with patch.object(cascade_flow, 'Layer4ClaudeJudge') as judge, \
+                patch.object(cascade_flow, 'get_run_logger'), \
+                patch.object(cascade_flow, 'asdict', return_value={}):
+            cascade_flow.claude_judge_task.fn(enriched_ids=['a'], dry_run=True, batched=True)
+
+        judge.assert_called_once_with(dry_run=True, batched=True)
+        judge.return_value.run.assert_called_once_with(enriched_ids=['a'])
@@ -0,0 +1,114 @@
+"""
+Tests for matching/match_cache.py — cached match sections and pair lookups
+used by SupabaseProfileDetailView.
+
+SupabaseMatch.objects is replaced by a mock so the tests count ORM
+lookups without a database; the cache is Django's local-memory backend.
+"""
+
+import os
+import uuid
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from matching import match_cache
+from matching.match_cache import invalidate_matches, match_sections, pair_match
+from matching.models import SupabaseMatch
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@pytest.fixture(autouse=True)
+def local_cache():
+    with override_settings(CACHES=LOCMEM):
+        cache.clear()
+        yield
+        cache.clear()
+
+
+@pytest.fixture
+def objects():
+    """Mock manager whose filter() returns a fresh queryset per call."""
+    manager = MagicMock()
+
+    def _filter(**kwargs):
+        qs = MagicMock()
+        row = SupabaseMatch(id=uuid.uuid4(), harmonic_mean=60, **kwargs)
+        qs.order_by.return_value.__getitem__.return_value = [row]
+        qs.first.return_value = manager.pair_result
+        return qs
+
+    manager.filter.side_effect = _filter
+    manager.pair_result = None
+    with patch.object(match_cache.SupabaseMatch, 'objects', manager):
+        yield manager
+
+
+class TestMatchSections:
+    def test_sections_are_served_from_cache(self, objects):
+        profile_id = uuid.uuid4()
+        first = match_sections(profile_id)
+        again = match_sections(profile_id)
+
+        assert objects.filter.call_count == 2  # one query per direction, once
+        assert [m.profile_id for m in first['as_source']] == [profile_id]
+        assert [m.suggested_profile_id for m in again['as_target']] == [profile_id]
+
+    def test_invalidation_drops_both_sides(self, objects):
+        source, target = uuid.uuid4(), uuid.uuid4()
+        match_sections(source)
+        match_sections(target)
+
+        invalidate_matches([(source, target)])
+        match_sections(source)
+        match_sections(target)
+
+        assert objects.filter.call_count == 8
+
+    def test_unrelated_profiles_stay_cached(self, objects):
+        viewed = uuid.uuid4()
+        match_sections(viewed)
+
+        invalidate_matches([(uuid.uuid4(), uuid.uuid4())])
+        match_sections(viewed)
+
+        assert objects.filter.call_count == 2
+
+
+class TestPairMatch:
+    def test_match_is_cached(self, objects):
+        user_profile, partner = uuid.uuid4(), uuid.uuid4()
+        objects.pair_result = SupabaseMatch(
+            id=uuid.uuid4(), profile_id=user_profile, suggested_profile_id=partner,
+            harmonic_mean=71,
+        )
+
+        assert pair_match(user_profile, partner).harmonic_mean == 71
+        assert pair_match(user_profile, partner).harmonic_mean == 71
+        assert objects.filter.call_count == 1
+
+    def test_missing_match_is_cached(self, objects):
+        user_profile, partner = uuid.uuid4(), uuid.uuid4()
+
+        assert pair_match(user_profile, partner) is None
+        assert pair_match(user_profile, partner) is None
+        assert objects.filter.call_count == 1
+
+    def test_rewrite_invalidates_pair(self, objects):
+        user_profile, partner = uuid.uuid4(), uuid.uuid4()
+        assert pair_match(user_profile, partner) is None
+
+        objects.pair_result = SupabaseMatch(
+            id=uuid.uuid4(), profile_id=user_profile, suggested_profile_id=partner,
+            harmonic_mean=58,
+        )
+        invalidate_matches([(user_profile, partner)])
+
+        assert pair_match(user_profile, partner).harmonic_mean == 58
+        assert objects.filter.call_count == 2
@@ -0,0 +1,205 @@
+"""
+Tests for background Match recalculation — MatchScoringService input
+fingerprints and the chunked process_match_recalculation_jobs worker.
+
+Covers:
+- input_fingerprint() stability and sensitivity to profile / ICP changes
+- Chunked scoring with progress counts on MatchRecalculationJob
+- Unchanged profiles skipped on recalculation
+- Upserts keep user-managed Match fields (status, notes)
+- Abandoned RUNNING jobs reclaimed once their lease expires
+- Status endpoint JSON
+"""
+
+import os
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from matching.models import Match, MatchRecalculationJob, Profile
+from matching.services import MatchScoringService
+from matching.tasks import process_match_recalculation_jobs
+
+User = get_user_model()
+
+
+def _unsaved_profile(**kwargs):
+    fields = {
+        'name': 'Jane Partner',
+        'company': 'Partner Co',
+        'industry': 'Coaching',
+        'source': Profile.Source.MANUAL,
+        'updated_at': timezone.now(),
+    }
+    fields.update(kwargs)
+    return Profile(**fields)
+
+
+# ===========================================================================
+# Fingerprint (no database)
+# ===========================================================================
+
+class TestInputFingerprint:
+    def test_same_inputs_same_fingerprint(self):
+        user = SimpleNamespace()
+        profile = _unsaved_profile()
+        assert (
+            MatchScoringService(profile, user).input_fingerprint()
+            == MatchScoringService(profile, user).input_fingerprint()
+        )
+
+    def test_profile_change_changes_fingerprint(self):
+        user = SimpleNamespace()
+        profile = _unsaved_profile()
+        before = MatchScoringService(profile, user).input_fingerprint()
+        profile.industry = 'Finance'
+        assert MatchScoringService(profile, user).input_fingerprint() != before
+
+    def test_icp_change_changes_fingerprint(self):
+        profile = _unsaved_profile()
+        before = MatchScoringService(profile, SimpleNamespace()).input_fingerprint()
+        icp_user = SimpleNamespace(target_industries=['Coaching'])
+        assert MatchScoringService(profile, icp_user).input_fingerprint() != before
+
+    def test_ageing_profile_changes_fingerprint(self):
+        user = SimpleNamespace()
+        profile = _unsaved_profile()
+        before = MatchScoringService(profile, user).input_fingerprint()
+        later = timezone.now() + timedelta(days=1)
+        with patch('django.utils.timezone.now', return_value=later):
+            assert MatchScoringService(profile, user).input_fingerprint() != before
+
+    def test_stale_profile_fingerprint_stops_changing(self):
+        user = SimpleNamespace()
+        profile = _unsaved_profile(updated_at=timezone.now() - timedelta(days=40))
+        before = MatchScoringService(profile, user).input_fingerprint()
+        later = timezone.now() + timedelta(days=5)
+        with patch('django.utils.timezone.now', return_value=later):
+            assert MatchScoringService(profile, user).input_fingerprint() == before
+
+    def test_fingerprint_stored_with_scores(self):
+        service = MatchScoringService(_unsaved_profile(), SimpleNamespace())
+        fields = service.match_fields()
+        assert fields['input_fingerprint'] == service.input_fingerprint()
+        assert 0 <= fields['final_score'] <= 1
+
+
+# ===========================================================================
+# Worker (database)
+# ===========================================================================
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username='recalc', password='pw', email='recalc@test.com')
+
+
+def _profiles(user, count):
+    return [Profile.objects.create(user=user, name=f'Partner {i}') for i in range(count)]
+
+
+@pytest.mark.django_db
+class TestRecalculationWorker:
+    def test_scores_all_profiles_in_chunks(self, user):
+        _profiles(user, 5)
+        job = MatchRecalculationJob.objects.create(user=user)
+
+        results = process_match_recalculation_jobs(chunk_size=2)
+
+        job.refresh_from_db()
+        assert results['jobs'] == 1
+        assert job.status == MatchRecalculationJob.Status.COMPLETED
+        assert (job.total_count, job.processed_count, job.scored_count) == (5, 5, 5)
+        assert Match.objects.filter(user=user).exclude(input_fingerprint='').count() == 5
+
+    def test_unchanged_profiles_are_skipped(self, user):
+        first, second = _profiles(user, 2)
+        MatchRecalculationJob.objects.create(user=user)
+        process_match_recalculation_jobs()
+
+        second.industry = 'Publishing'
+        second.save()
+        job = MatchRecalculationJob.objects.create(user=user)
+        process_match_recalculation_jobs()
+
+        job.refresh_from_db()
+        assert (job.scored_count, job.skipped_count) == (1, 1)
+
+    def test_missing_mode_only_scores_new_profiles(self, user):
+        scored, new = _profiles(user, 2)
+        Match.objects.create(
+            user=user, profile=scored, intent_score=0.5, synergy_score=0.5,
+            momentum_score=0.5, context_score=0.5, final_score=0.5,
+        )
+        job = MatchRecalculationJob.objects.create(user=user, mode=MatchRecalculationJob.Mode.MISSING)
+
+        process_match_recalculation_jobs()
+
+        job.refresh_from_db()
+        assert job.total_count == 1
+        assert Match.objects.get(user=user, profile=new).input_fingerprint
+
+    def test_upsert_keeps_status_and_notes(self, user):
+        (profile,) = _profiles(user, 1)
+        Match.objects.create(
+            user=user, profile=profile, intent_score=0.1, synergy_score=0.1,
+            momentum_score=0.1, context_score=0.1, final_score=0.1,
+            status=Match.Status.CONTACTED, notes='Called on Monday',
+        )
+        MatchRecalculationJob.objects.create(user=user)
+
+        process_match_recalculation_jobs()
+
+        match = Match.objects.get(user=user, profile=profile)
+        assert match.status == Match.Status.CONTACTED
+        assert match.notes == 'Called on Monday'
+        assert match.input_fingerprint
+
+    def test_queueing_reuses_pending_job_and_reports_status(self, user):
+        client = Client()
+        client.force_login(user)
+        client.post(reverse('matching:recalculate-all'))
+        client.post(reverse('matching:recalculate-all'))
+        assert MatchRecalculationJob.objects.filter(user=user).count() == 1
+
+        job = MatchRecalculationJob.objects.get(user=user)
+        response = client.get(reverse('matching:match-recalc-status', args=[job.id]))
+        assert response.status_code == 200
+        assert response.json()['status'] == 'queued'
+
+    def test_abandoned_running_job_is_reclaimed(self, user):
+        _profiles(user, 2)
+        stale = MatchRecalculationJob.objects.create(
+            user=user, status=MatchRecalculationJob.Status.RUNNING,
+            started_at=timezone.now() - timedelta(hours=1), processed_count=1,
+        )
+        live = MatchRecalculationJob.objects.create(
+            user=user, status=MatchRecalculationJob.Status.RUNNING, started_at=timezone.now(),
+        )
+
+        client = Client()
+        client.force_login(user)
+        client.post(reverse('matching:recalculate-all'))
+        assert MatchRecalculationJob.objects.filter(
+            user=user, status=MatchRecalculationJob.Status.QUEUED,
+        ).count() == 0  # the live job is reused
+
+        live.delete()
+        client.post(reverse('matching:recalculate-all'))
+        assert MatchRecalculationJob.objects.filter(
+            user=user, status=MatchRecalculationJob.Status.QUEUED,
+        ).count() == 1  # the stale job is not
+
+        results = process_match_recalculation_jobs()
+
+        stale.refresh_from_db()
+        assert results['jobs'] == 2
+        assert stale.status == MatchRecalculationJob.Status.COMPLETED
+        assert (stale.processed_count, stale.total_count) == (2, 2)
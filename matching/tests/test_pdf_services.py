@@ -5,7 +5,8 @@ Covers:
 - DataValidator: validate_member_data(), safe_get()
 - pdf_components: detect_urgency(), detect_collaboration_type(), get_score_color(),
   parse_score(), safe_get()
-- PDFGenerator: generate(), generate_to_bytes()
+- PDFGenerator: generate(), generate_to_bytes(), generate_batch()
+- PDFRenderCache / content_key()
 - pdf_styles: create_pdf_styles(), COLORS
 
 All tests are pure Python — no database access required.
@@ -24,7 +25,9 @@ from matching.pdf_services.pdf_components import (
     parse_score,
     safe_get,
 )
-from matching.pdf_services.pdf_generator import PDFGenerator, PDFGenerationError
+from matching.pdf_services.pdf_generator import (
+    PDFGenerator, PDFGenerationError, PDFRenderCache, content_key,
+)
 from matching.pdf_services.pdf_styles import create_pdf_styles, COLORS
 
 
@@ -456,6 +459,85 @@ class TestPDFGenerator:
         assert os.path.getsize(result) > 0
 
 
+# =============================================================================
+# PDFGenerator.generate_batch / PDFRenderCache
+# =============================================================================
+
+class TestGenerateBatch:
+    """Tests for batch rendering and the content-hash cache"""
+
+    def _members(self, count):
+        members = []
+        for i in range(count):
+            data = _make_valid_member_data()
+            data['participant'] = f'Member {i}'
+            members.append(data)
+        return members
+
+    def test_batch_renders_in_input_order_across_processes(self, tmp_path):
+        """Pool rendering returns one PDF per member, aligned with input."""
+        generator = PDFGenerator(output_dir=str(tmp_path))
+        members = self._members(3)
+        results = generator.generate_batch(members, max_workers=2)
+        assert len(results) == 3
+        for pdf in results:
+            assert pdf.startswith(b'%PDF')
+
+    def test_invalid_member_yields_none(self, tmp_path):
+        """A member failing validation does not abort the rest of the batch."""
+        generator = PDFGenerator(output_dir=str(tmp_path))
+        members = self._members(2)
+        members[0]['matches'] = []
+        results = generator.generate_batch(members, max_workers=1)
+        assert results[0] is None
+        assert results[1].startswith(b'%PDF')
+
+    def test_cache_skips_unchanged_members(self, tmp_path, monkeypatch):
+        """Unchanged member data is served from cache without rendering."""
+        from matching.pdf_services import pdf_generator
+
+        generator = PDFGenerator(output_dir=str(tmp_path))
+        cache = PDFRenderCache(tmp_path / 'cache')
+        members = self._members(2)
+        first = generator.generate_batch(members, max_workers=1, cache=cache)
+
+        rendered = []
+        real_worker = pdf_generator._render_worker
+        monkeypatch.setattr(
+            pdf_generator, '_render_worker',
+            lambda data: rendered.append(data['participant']) or real_worker(data),
+        )
+        members[1]['profile']['what_you_do'] = 'Podcast production'
+        second = generator.generate_batch(members, max_workers=1, cache=cache)
+
+        assert rendered == ['Member 1']
+        assert second[0] == first[0]
+        assert second[1] != first[1]
+
+    def test_duplicate_members_render_once(self, tmp_path, monkeypatch):
+        """Identical member data in one batch is rendered a single time."""
+        from matching.pdf_services import pdf_generator
+
+        rendered = []
+        real_worker = pdf_generator._render_worker
+        monkeypatch.setattr(
+            pdf_generator, '_render_worker',
+            lambda data: rendered.append(data['participant']) or real_worker(data),
+        )
+        generator = PDFGenerator(output_dir=str(tmp_path))
+        results = generator.generate_batch(
+            [_make_valid_member_data(), _make_valid_member_data()], max_workers=1,
+        )
+        assert len(rendered) == 1
+        assert results[0] is results[1]
+
+    def test_content_key_ignores_dict_order(self):
+        """content_key() is stable under key reordering."""
+        data = _make_valid_member_data()
+        reordered = dict(reversed(list(data.items())))
+        assert content_key(data) == content_key(reordered)
+
+
 # =============================================================================
 # pdf_styles
 # =============================================================================
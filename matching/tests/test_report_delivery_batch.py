@@ -0,0 +1,208 @@
+"""
+Tests for batched report delivery (matching/enrichment/flows/report_delivery.py):
+one mail connection for all emails with per-message failure isolation,
+concurrent cached intro generation, and the flow wiring (nothing rotates
+until intros and the mail connection are ready).
+
+Uses Django's locmem email backend or a fake connection; the DB and LLM
+calls are mocked.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core import mail
+from django.test import override_settings
+
+from matching.enrichment.flows import report_delivery as rd
+
+
+def _report(rid, email=None, name=None):
+    return {
+        'report_id': rid, 'member_name': name or f'Member {rid}',
+        'member_email': email or f'm{rid}@example.com', 'partner_count': 10,
+        'client_profile_id': f'client-{rid}',
+    }
+
+
+class FakeConnection:
+    """Mail connection that rejects one recipient and counts opens."""
+
+    def __init__(self, reject):
+        self.reject = reject
+        self.opened = 0
+        self.sent = []
+
+    def open(self):
+        self.opened += 1
+
+    def close(self):
+        pass
+
+    def send_messages(self, messages):
+        for message in messages:
+            if self.reject in message.to:
+                raise RuntimeError('550 mailbox unavailable')
+            self.sent.append(message)
+        return len(messages)
+
+
+class TestSendDeliveryEmails:
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+    def test_all_messages_share_one_connection(self):
+        deliveries = [(_report(i), f'Hi {i}', f'code{i}') for i in range(3)]
+
+        with patch.object(rd, 'get_run_logger'), \
+             patch('django.core.mail.get_connection', wraps=mail.get_connection) as get_conn:
+            outcome = rd.send_delivery_emails.fn(deliveries)
+
+        assert outcome == {0: True, 1: True, 2: True}
+        assert get_conn.call_count == 1
+        assert len(mail.outbox) == 3
+        assert '/report/code1/' in mail.outbox[1].body
+        assert mail.outbox[1].to == ['m1@example.com']
+
+    def test_one_failure_does_not_stop_the_batch(self):
+        conn = FakeConnection(reject='m1@example.com')
+        deliveries = [(_report(i), 'Hi', f'code{i}') for i in range(3)]
+
+        with patch.object(rd, 'get_run_logger'), \
+             patch('django.core.mail.get_connection', return_value=conn):
+            outcome = rd.send_delivery_emails.fn(deliveries)
+
+        assert outcome == {0: True, 1: False, 2: True}
+        assert [m.to for m in conn.sent] == [['m0@example.com'], ['m2@example.com']]
+        assert conn.opened == 2  # reopened after the failure
+
+    def test_caller_connection_is_used_and_left_open(self):
+        conn = MagicMock()
+        with patch.object(rd, 'get_run_logger'), \
+             patch('django.core.mail.get_connection') as get_conn:
+            outcome = rd.send_delivery_emails.fn([(_report(1), 'Hi', 'code1')], connection=conn)
+
+        assert outcome == {1: True}
+        get_conn.assert_not_called()
+        conn.open.assert_not_called()
+        conn.close.assert_not_called()
+
+
+class TestGenerateReportIntros:
+    def test_cached_intros_skip_generation(self, tmp_path):
+        reports = [_report(1), _report(2)]
+        changes = {1: {'new_partners': 2}, 2: {'new_partners': 0}}
+        calls = []
+
+        def fake_generate(client, report, changes):
+            calls.append(report['report_id'])
+            return f"Hi {client['member_name']}, AI intro"
+
+        cache_path = tmp_path / 'intros.jsonl'
+        with patch.object(rd, 'get_run_logger'), \
+             patch.object(rd.generate_report_intro, 'fn', side_effect=fake_generate):
+            first = rd.generate_report_intros.fn(reports, changes, cache=rd.IntroCache(cache_path))
+            again = rd.generate_report_intros.fn(reports, changes, cache=rd.IntroCache(cache_path))
+            changes[2] = {'new_partners': 5}
+            rd.generate_report_intros.fn(reports, changes, cache=rd.IntroCache(cache_path))
+
+        assert first == again == {1: 'Hi Member 1, AI intro', 2: 'Hi Member 2, AI intro'}
+        assert sorted(calls) == [1, 2, 2]  # only the changed summary is regenerated
+
+    def test_new_month_regenerates(self, tmp_path):
+        reports = [_report(1)]
+        calls = []
+
+        def fake_generate(client, report, changes):
+            calls.append(report['report_id'])
+            return 'AI intro'
+
+        cache = rd.IntroCache(tmp_path / 'intros.jsonl')
+        with patch.object(rd, 'get_run_logger'), \
+             patch.object(rd.generate_report_intro, 'fn', side_effect=fake_generate):
+            rd.generate_report_intros.fn(reports, {}, cache=cache, month='2026-09')
+            rd.generate_report_intros.fn(reports, {}, cache=cache, month='2026-09')
+            rd.generate_report_intros.fn(reports, {}, cache=cache, month='2026-10')
+
+        assert calls == [1, 1]
+
+    def test_template_fallback_is_not_cached(self, tmp_path):
+        cache = rd.IntroCache(tmp_path / 'intros.jsonl')
+        with patch.object(rd, 'get_run_logger'), \
+             patch.dict('os.environ', {'OPENROUTER_API_KEY': '', 'ANTHROPIC_API_KEY': ''}):
+            intros = rd.generate_report_intros.fn([_report(1)], {}, cache=cache)
+
+        assert intros[1].startswith('Hi Member 1,')
+        assert len(cache) == 0
+
+
+def _rotated(codes, missing=()):
+    """Fake rotate_access_codes(): one row per report id found in the DB."""
+    return [
+        {'report_id': rid, 'old_code': 'old', 'new_code': code, 'expires_at': ''}
+        for rid, code in codes.items() if rid not in missing
+    ]
+
+
+class TestReportDeliveryFlow:
+    def test_codes_rotate_once_and_emails_batch(self):
+        reports = [_report(1), _report(2)]
+
+        with patch.object(rd, 'get_run_logger'), \
+             patch.object(rd, 'get_active_reports', return_value=reports), \
+             patch.object(rd, 'rotate_access_codes', side_effect=_rotated) as rotate, \
+             patch.object(rd, 'generate_report_intros', return_value={1: 'Hi 1', 2: 'Hi 2'}), \
+             patch.object(rd, 'send_delivery_emails', return_value={1: True, 2: False}) as send, \
+             patch('django.core.mail.get_connection') as get_conn:
+            result = rd.report_delivery_flow.fn()
+
+        rotate.assert_called_once()
+        codes = rotate.call_args.args[0]
+        assert set(codes) == {1, 2}
+        deliveries = send.call_args.args[0]
+        assert [(d[0]['report_id'], d[1], d[2]) for d in deliveries] == [
+            (1, 'Hi 1', codes[1]), (2, 'Hi 2', codes[2]),
+        ]
+        assert (result.new_access_codes, result.reports_delivered, result.delivery_failures) == (2, 1, 1)
+        assert send.call_args.kwargs['connection'] is get_conn.return_value
+        get_conn.return_value.close.assert_called_once()
+
+    def test_reports_missing_from_rotation_are_not_emailed(self):
+        reports = [_report(1), _report(2)]
+
+        with patch.object(rd, 'get_run_logger'), \
+             patch.object(rd, 'get_active_reports', return_value=reports), \
+             patch.object(rd, 'rotate_access_codes', side_effect=lambda codes: _rotated(codes, missing={2})), \
+             patch.object(rd, 'generate_report_intros', return_value={1: 'Hi 1'}), \
+             patch.object(rd, 'send_delivery_emails', return_value={1: True}) as send, \
+             patch('django.core.mail.get_connection'):
+            result = rd.report_delivery_flow.fn()
+
+        assert [d[0]['report_id'] for d in send.call_args.args[0]] == [1]
+        assert (result.new_access_codes, result.clients_skipped, result.reports_delivered) == (1, 1, 1)
+
+    def test_mail_connection_failure_rotates_nothing(self):
+        conn = MagicMock()
+        conn.open.side_effect = ConnectionRefusedError('smtp down')
+
+        with patch.object(rd, 'get_run_logger'), \
+             patch.object(rd, 'get_active_reports', return_value=[_report(1)]), \
+             patch.object(rd, 'rotate_access_codes') as rotate, \
+             patch.object(rd, 'generate_report_intros', return_value={1: 'Hi 1'}), \
+             patch.object(rd, 'send_delivery_emails') as send, \
+             patch('django.core.mail.get_connection', return_value=conn):
+            with pytest.raises(ConnectionRefusedError):
+                rd.report_delivery_flow.fn()
+
+        rotate.assert_not_called()
+        send.assert_not_called()
+
+    def test_intro_failure_rotates_nothing(self):
+        with patch.object(rd, 'get_run_logger'), \
+             patch.object(rd, 'get_active_reports', return_value=[_report(1)]), \
+             patch.object(rd, 'rotate_access_codes') as rotate, \
+             patch.object(rd, 'generate_report_intros', side_effect=RuntimeError('llm down')), \
+             patch('django.core.mail.get_connection') as get_conn:
+            with pytest.raises(RuntimeError):
+                rd.report_delivery_flow.fn()
+
+        rotate.assert_not_called()
+        get_conn.assert_not_called()
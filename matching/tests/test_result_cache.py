@@ -0,0 +1,48 @@
+"""
+Tests for matching/enrichment/result_cache.py — the append-only JSONL cache
+and the SQLite TTL cache shared by the enrichment flows.
+
+Files live under pytest's tmp_path; no database required.
+"""
+
+from unittest.mock import patch
+
+from matching.enrichment.result_cache import JsonlResultCache, SqliteTTLCache
+
+
+class TestJsonlResultCache:
+    def test_reload_last_line_wins(self, tmp_path):
+        path = tmp_path / 'cache.jsonl'
+        cache = JsonlResultCache(path)
+        cache.put('k', {'n': 1})
+        cache.put('k', {'n': 2})
+        cache.put('other', 'text')
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('not json\n')
+
+        reloaded = JsonlResultCache(path)
+
+        assert reloaded.get('k') == {'n': 2}
+        assert reloaded.get('other') == 'text'
+        assert reloaded.get('missing') is None
+        assert len(reloaded) == 2
+
+
+class TestSqliteTTLCache:
+    def test_values_expire_after_ttl(self, tmp_path):
+        cache = SqliteTTLCache(tmp_path / 'cache.sqlite3', 'results', ttl_days=1)
+        cache.put('k', {'n': 1})
+        assert cache.get('k') == {'n': 1}
+
+        with patch('matching.enrichment.result_cache.time.time', return_value=2e10):
+            assert cache.get('k') is None
+            value, age = cache.lookup('k')
+
+        assert value == {'n': 1} and age > 86400
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_zero_ttl_disables(self, tmp_path):
+        cache = SqliteTTLCache(tmp_path / 'cache.sqlite3', 'results', ttl_days=0)
+        cache.put('k', 1)
+        assert cache.get('k') is None
+        assert not (tmp_path / 'cache.sqlite3').exists()
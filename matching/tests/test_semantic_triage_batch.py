@@ -0,0 +1,108 @@
+"""
+Tests for batched semantic triage
+(matching/enrichment/flows/semantic_triage.py): several profiles per
+prompt, cache hits keyed by changed-page hashes, and the single-profile
+fallback when a batch response cannot be used.
+
+_call_claude is replaced by a fake; no API key or network required.
+"""
+
+import json
+from unittest.mock import patch
+
+from matching.enrichment.flows import semantic_triage as st
+from matching.enrichment.flows.content_hash_check import HashCheckResult
+
+
+def _profile(pid):
+    return {'id': pid, 'name': f'Name {pid}', 'website': '', 'offering': 'coaching'}
+
+
+def _hash_result(pid, page_hash='sha256:aa'):
+    return HashCheckResult(
+        profile_id=pid, name=f'Name {pid}', website='', changed=True,
+        pages_changed=['homepage'], new_hashes={'homepage': page_hash},
+    )
+
+
+def _verdict(classification='material'):
+    return {'classification': classification, 'confidence': 0.9,
+            'summary': 'new program', 'affected_fields': ['offering']}
+
+
+class FakeClaude:
+    """Answers batch prompts with a JSON map, single prompts with one object."""
+
+    def __init__(self, drop=()):
+        self.prompts = []
+        self.drop = set(drop)
+
+    def __call__(self, prompt):
+        self.prompts.append(prompt)
+        if '=== KEY:' not in prompt:
+            return json.dumps(_verdict('cosmetic'))
+        keys = [line.split('KEY: ')[1].split(' ===')[0]
+                for line in prompt.splitlines() if line.startswith('=== KEY:')]
+        return json.dumps({k: _verdict() for k in keys if k not in self.drop})
+
+
+def _run(profiles, hash_results, fake, cache, **kwargs):
+    with patch.object(st, '_call_claude', fake), \
+         patch.object(st, 'get_run_logger'):
+        return st.triage_batch.fn(profiles, hash_results, cache=cache, **kwargs)
+
+
+class TestTriageBatch:
+    def test_profiles_share_prompts(self, tmp_path):
+        pids = [f'p{i}' for i in range(6)]
+        fake = FakeClaude()
+
+        results = _run(
+            [_profile(p) for p in pids], [_hash_result(p) for p in pids],
+            fake, st.TriageCache(tmp_path / 'cache.jsonl'), batch_size=3, max_workers=2,
+        )
+
+        assert len(fake.prompts) == 2
+        assert [r.profile_id for r in results] == pids
+        assert all(r.classification == 'material' for r in results)
+
+    def test_cached_hashes_skip_prompting(self, tmp_path):
+        cache_path = tmp_path / 'cache.jsonl'
+        _run([_profile('p1')], [_hash_result('p1')], FakeClaude(), st.TriageCache(cache_path))
+
+        fake = FakeClaude()
+        results = _run(
+            [_profile('p1'), _profile('p2')],
+            [_hash_result('p1'), _hash_result('p2', 'sha256:bb')],
+            fake, st.TriageCache(cache_path),
+        )
+
+        assert len(fake.prompts) == 1  # only p2 is classified
+        assert [r.profile_id for r in results] == ['p1', 'p2']
+
+        # A new revision of p1's page is triaged again
+        assert st._triage_cache_key(_hash_result('p1')) != st._triage_cache_key(
+            _hash_result('p1', 'sha256:cc'))
+
+    def test_missing_entries_fall_back_to_single_prompt(self, tmp_path):
+        fake = FakeClaude(drop={'p2'})
+
+        results = _run(
+            [_profile('p1'), _profile('p2')], [_hash_result('p1'), _hash_result('p2')],
+            fake, st.TriageCache(tmp_path / 'cache.jsonl'),
+        )
+
+        assert len(fake.prompts) == 2
+        assert [r.classification for r in results] == ['material', 'cosmetic']
+
+    def test_unparseable_batch_response(self, tmp_path):
+        responses = iter(['not json'] + [json.dumps(_verdict())] * 2)
+
+        with patch.object(st, '_call_claude', lambda prompt: next(responses)), \
+             patch.object(st, 'get_run_logger'):
+            results = st.triage_batch.fn(
+                [_profile('p1'), _profile('p2')], [_hash_result('p1'), _hash_result('p2')],
+                cache=st.TriageCache(tmp_path / 'cache.jsonl'),
+            )
+
+        assert [r.classification for r in results] == ['material', 'material']
@@ -0,0 +1,118 @@
+"""
+Tests for scripts/sourcing/rate_limiter.py token buckets and the
+concurrent source runner in scripts/sourcing/runner.py.
+
+Sleeps are patched out; timing is asserted through the delays the
+limiter asks for, so these run instantly and need no network.
+"""
+
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scripts.sourcing.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate_per_sec=1.0, capacity=3)
+        delays = [bucket.reserve() for _ in range(5)]
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert 0.9 < delays[3] <= 1.0
+        assert 1.9 < delays[4] <= 2.0
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(rate_per_sec=10.0, capacity=1)
+        assert bucket.reserve() == 0.0
+        bucket.updated -= 0.2  # pretend 200ms passed
+        assert bucket.reserve() == 0.0
+
+
+class TestRateLimiter:
+    def test_sources_do_not_block_each_other(self):
+        limiter = RateLimiter()
+        with patch('scripts.sourcing.rate_limiter.time.sleep') as sleep:
+            limiter.wait('slow', 1)
+            limiter.wait('slow', 1)     # must wait ~60s
+            limiter.wait('fast', 600)   # unaffected by 'slow'
+        waits = [c.args[0] for c in sleep.call_args_list]
+        assert len(waits) == 1
+        assert 59 < waits[0] <= 60
+
+    def test_first_request_is_immediate(self):
+        limiter = RateLimiter()
+        with patch('scripts.sourcing.rate_limiter.time.sleep') as sleep:
+            limiter.wait('src', 10)
+        sleep.assert_not_called()
+
+    def test_host_limit_shared_across_sources(self):
+        limiter = RateLimiter(host_limits={'api.example.com': 6})
+        with patch('scripts.sourcing.rate_limiter.time.sleep') as sleep:
+            limiter.wait('a', 600, url='https://api.example.com/x')
+            limiter.wait('b', 600, url='https://www.api.example.com/y')
+        assert 9 < sleep.call_args[0][0] <= 10
+
+    def test_does_not_sleep_under_lock(self):
+        limiter = RateLimiter()
+        limiter.wait('slow', 1)
+
+        def slow_caller():
+            limiter.wait('slow', 1)  # would sleep ~60s
+
+        t = threading.Thread(target=slow_caller, daemon=True)
+        t.start()
+        time.sleep(0.05)
+        start = time.monotonic()
+        limiter.wait('other', 60)
+        assert time.monotonic() - start < 1.0
+
+
+class TestRunSourcesConcurrently:
+    def test_runs_each_source_with_shared_limiter(self):
+        from scripts.sourcing import runner
+
+        seen = {}
+
+        def fake_run_source(source, rate_limiter=None, **kwargs):
+            seen[source] = rate_limiter
+            if source == 'broken':
+                raise RuntimeError('boom')
+            return {'pages_scraped': 1}
+
+        with patch.object(runner, 'run_source', side_effect=fake_run_source):
+            results = runner.run_sources_concurrently(['a', 'b', 'broken'], max_workers=3, dry_run=True)
+
+        assert results['a'] == {'pages_scraped': 1}
+        assert results['broken'] == {'exception': 'boom'}
+        assert len({id(v) for v in seen.values()}) == 1
+        assert isinstance(seen['a'], RateLimiter)
+
+    def test_flush_batch_ingests_one_source_at_a_time(self):
+        from scripts.sourcing import runner
+
+        active = []
+        overlap = []
+
+        def fake_ingest(contacts, source, source_file):
+            active.append(source)
+            overlap.append(len(active))
+            time.sleep(0.01)
+            active.remove(source)
+            return [SimpleNamespace(is_new=True) for _ in contacts]
+
+        module = SimpleNamespace(ingest_contacts=fake_ingest)
+        with patch.dict(sys.modules, {'matching.enrichment.flows.contact_ingestion': module}), \
+                patch('django.setup'):
+            threads = [
+                threading.Thread(target=runner._flush_batch, args=([{'name': 'x'}], f's{i}', False))
+                for i in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(overlap) == 4
+        assert max(overlap) == 1
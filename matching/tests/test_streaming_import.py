@@ -0,0 +1,138 @@
+"""
+Unit tests for the COPY-staged directory imports: matching/pg_copy.py,
+scripts/sourcing/import_csv.py staging keys and the import_scraped_directory
+command's row normalization and merge statements.
+
+Cursors are MagicMocks; no database access required.
+"""
+
+import os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+from unittest.mock import MagicMock
+
+from matching.management.commands import import_scraped_directory
+from matching.pg_copy import copy_rows, copy_text_value
+from scripts.sourcing.import_csv import (
+    STAGE_COLUMNS,
+    _dedup_keys,
+    _stage_row,
+    in_file_duplicates,
+    map_to_supabase,
+)
+
+
+class TestCopyRows:
+    def test_escapes_text_format_specials(self):
+        assert copy_text_value(None) == '\\N'
+        assert copy_text_value('a\tb\nc\\d') == 'a\\tb\\nc\\\\d'
+        assert copy_text_value({'k': [1]}) == '{"k": [1]}'
+        assert copy_text_value(True) == 't'
+        assert copy_text_value('nul\x00byte') == 'nulbyte'
+
+    def test_flushes_in_chunks(self):
+        cur = MagicMock()
+        buffers = []
+        cur.copy_expert.side_effect = lambda sql, buf: buffers.append(buf.getvalue())
+
+        copied = copy_rows(cur, 'stage', ('a', 'b'), ((i, None) for i in range(5)), chunk_rows=2)
+
+        assert copied == 5
+        assert cur.copy_expert.call_args[0][0] == 'COPY stage (a, b) FROM STDIN'
+        assert buffers == ['0\t\\N\n1\t\\N\n', '2\t\\N\n3\t\\N\n', '4\t\\N\n']
+
+    def test_empty_input_issues_no_copy(self):
+        cur = MagicMock()
+        assert copy_rows(cur, 'stage', ('a',), iter(())) == 0
+        cur.copy_expert.assert_not_called()
+
+
+class TestCsvImportStaging:
+    def test_dedup_keys_match_in_memory_rules(self):
+        keys = _dedup_keys({
+            'email': ' Jane@Example.com ', 'name': ' Jane Doe ',
+            'company': 'Acme', 'website': 'https://www.acme.com/about',
+        })
+        assert keys == ('jane@example.com', 'jane doe', 'ACME', 'acme.com')
+
+    def test_platform_domains_and_bad_emails_are_not_keys(self):
+        keys = _dedup_keys({'email': 'not-an-email', 'name': 'Jane', 'website': 'youtube.com/@jane'})
+        assert keys == (None, 'jane', None, None)
+
+    def test_stage_row_follows_stage_columns(self):
+        mapped = map_to_supabase({'name': 'Jane Doe', 'source': 'noomii', 'categories': 'Coaching, Health'})
+        row = _stage_row(7, mapped)
+
+        assert len(row) == len(STAGE_COLUMNS)
+        staged = dict(zip(STAGE_COLUMNS, row))
+        assert staged['row_num'] == 7
+        assert staged['tags'] == ['coaching', 'health']
+        assert staged['name_key'] == 'jane doe'
+
+
+class TestInFileDuplicates:
+    def test_only_imported_rows_are_matched(self):
+        rows = [
+            (1, 'x@example.com', 'a', None, None),
+            (2, 'x@example.com', 'n', 'C', None),  # dup of row 1 by email
+            (3, 'y@example.com', 'n', 'C', None),  # matches only row 2, which is dropped
+            (4, 'z@example.com', 'n', 'C', None),  # matches row 3, which is imported
+        ]
+        assert in_file_duplicates(rows) == [2, 4]
+
+    def test_name_needs_company_or_domain(self):
+        rows = [
+            (1, None, 'jane', None, None),
+            (2, None, 'jane', None, None),
+            (3, None, 'jane', None, 'jane.com'),
+            (4, None, 'jane', 'ACME', 'jane.com'),
+        ]
+        assert in_file_duplicates(rows) == [4]
+
+
+class TestScrapedDirectoryImport:
+    def test_normalize_row(self):
+        command = import_scraped_directory.Command()
+        values = command._normalize_row({
+            'name': ' Jane Doe ', 'email': 'Contact: JANE@EXAMPLE.COM', 'website': 'jane.com',
+            'list_size': '10K', 'status': 'non member', 'url': 'https://dir/jane',
+        })
+        staged = dict(zip(import_scraped_directory.STAGE_COLUMNS[1:], values))
+
+        assert staged['name_key'] == 'jane doe'
+        assert staged['email'] == 'jane@example.com'
+        assert staged['website'] == 'https://jane.com'
+        assert staged['list_size'] == 10000
+        assert staged['status'] == 'Non Member Resource'
+        assert staged['notes'] == 'JV Directory: https://dir/jane'
+
+    def test_out_of_range_number_is_an_error_not_a_copy_failure(self):
+        command = import_scraped_directory.Command()
+        command.errors = command.skipped = 0
+        reader = [
+            {'name': 'Huge List', 'list_size': '1e12'},
+            {'name': 'Jane Doe', 'list_size': '10K'},
+        ]
+
+        staged = list(command._staged_rows(reader, limit=0))
+
+        assert [row[1] for row in staged] == ['Jane Doe']
+        assert command.errors == 1
+
+    def test_row_without_name_is_skipped(self):
+        assert import_scraped_directory.Command()._normalize_row({'name': '  '}) is None
+
+    def test_merge_is_set_based(self):
+        command = import_scraped_directory.Command()
+        cur = MagicMock()
+        cur.fetchone.side_effect = [(3, 4), (1,)]
+        cur.rowcount = 1
+
+        stats = command._merge(cur)
+
+        statements = [c[0][0] for c in cur.execute.call_args_list]
+        assert any('lower(btrim(p.name))' in sql for sql in statements)
+        assert sum(sql.lstrip().startswith('UPDATE profiles') for sql in statements) == 1
+        assert sum(sql.lstrip().startswith('INSERT INTO profiles') for sql in statements) == 1
+        assert stats == {'created': 1, 'updated': 1, 'unchanged': 0, 'merged_rows': 1}
@@ -24,6 +24,7 @@ from django.urls import reverse
 from django.contrib.auth import get_user_model
 
 from matching.models import Profile, Match
+from matching.tasks import process_match_recalculation_jobs
 
 User = get_user_model()
 
@@ -601,6 +602,9 @@ class TestCalculateBulkMatchView:
         response = client.post(url)
 
         assert response.status_code == 302
+        # Scoring runs in the background worker
+        assert not Match.objects.filter(user=user, profile=p2).exists()
+        process_match_recalculation_jobs()
         # p2 should now have a match
         assert Match.objects.filter(user=user, profile=p2).exists()
 
@@ -621,6 +625,7 @@ class TestRecalculateAllMatchesView:
         response = client.post(url)
 
         assert response.status_code == 302
+        process_match_recalculation_jobs()
         # Both profiles should now have matches
         assert Match.objects.filter(user=user, profile=p1).exists()
         assert Match.objects.filter(user=user, profile=p2).exists()
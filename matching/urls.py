@@ -38,6 +38,7 @@ urlpatterns = [
     path('calculate/<int:pk>/', views.CalculateMatchView.as_view(), name='calculate-match'),
     path('calculate/bulk/', views.CalculateBulkMatchView.as_view(), name='calculate-bulk'),
     path('calculate/recalculate-all/', views.RecalculateAllMatchesView.as_view(), name='recalculate-all'),
+    path('calculate/jobs/<uuid:job_id>/', views.MatchRecalculationStatusView.as_view(), name='match-recalc-status'),
 
     # Member Reports (code-gated, no login required)
     path('report/', views.ReportAccessView.as_view(), name='report-access'),
@@ -57,6 +58,7 @@ urlpatterns = [
 
     # Contact ingestion webhook
     path('api/contacts/ingest/', views.ContactIngestionWebhookView.as_view(), name='contact-ingest-webhook'),
+    path('api/contacts/ingest/<uuid:job_id>/', views.ContactIngestionJobStatusView.as_view(), name='contact-ingest-status'),
 
     # Analytics dashboard (login required)
     path('analytics/', views.AnalyticsDashboardView.as_view(), name='analytics-dashboard'),
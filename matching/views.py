@@ -16,6 +16,7 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db import models
 from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.expressions import RawSQL
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse_lazy
@@ -30,7 +31,11 @@ from django.views.generic import (
 )
 
 from .forms import ProfileForm, ProfileImportForm, MatchStatusForm
-from .models import Match, MemberReport, Profile, SupabaseProfile, SupabaseMatch
+from .models import (
+    Match, MatchRecalculationJob, MemberReport, Profile, SupabaseProfile, SupabaseMatch,
+)
+from .match_cache import match_sections, pair_match
+from .pagination import KeysetPaginator, table_row_estimate
 from .services import MatchScoringService, PartnershipAnalyzer
 from positioning.models import ICP, TransformationAnalysis
 
@@ -39,6 +44,25 @@ from positioning.models import ICP, TransformationAnalysis
 # SUPABASE PROFILE VIEWS (Browse the 3,143+ partner database)
 # =============================================================================
 
+# Weighted directory search document. Must stay the same expression as the
+# idx_profiles_directory_tsv GIN index (migration 0027) or the planner cannot
+# use the index.
+DIRECTORY_SEARCH_DOCUMENT = """(
+                        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+                        || setweight(to_tsvector('english', coalesce(company, '')), 'A')
+                        || setweight(to_tsvector('english', coalesce(niche, '')), 'B')
+                        || setweight(to_tsvector('english', coalesce(business_focus, '')), 'B')
+                        || setweight(to_tsvector('english', coalesce(what_you_do, '')), 'C')
+                        || setweight(to_tsvector('english', coalesce(who_you_serve, '')), 'C')
+                    )"""
+
+
+def _directory_tsquery(search):
+    """Prefix tsquery ("jane:* & coach:*") from free text, or '' if no terms."""
+    terms = re.findall(r'[^\W_]+', search.lower())[:8]
+    return ' & '.join(f'{term}:*' for term in terms)
+
+
 class SupabaseProfileListView(LoginRequiredMixin, ListView):
     """
     Browse all JV partner profiles from Supabase database.
@@ -52,17 +76,16 @@ class SupabaseProfileListView(LoginRequiredMixin, ListView):
         """Apply search and filters to Supabase profiles."""
         queryset = SupabaseProfile.objects.all()
 
-        # Search filter
+        # Search filter: prefix match against the GIN-indexed directory
+        # document (name, company, niche, business_focus, what_you_do,
+        # who_you_serve -- migration 0027)
         search = self.request.GET.get('search', '').strip()
-        if search:
-            queryset = queryset.filter(
-                Q(name__icontains=search) |
-                Q(company__icontains=search) |
-                Q(niche__icontains=search) |
-                Q(business_focus__icontains=search) |
-                Q(what_you_do__icontains=search) |
-                Q(who_you_serve__icontains=search)
-            )
+        tsquery = _directory_tsquery(search)
+        if tsquery:
+            queryset = queryset.filter(RawSQL(
+                f"{DIRECTORY_SEARCH_DOCUMENT} @@ to_tsquery('english', %s)", [tsquery],
+                output_field=models.BooleanField(),
+            ))
 
         # Niche filter
         niche = self.request.GET.get('niche', '').strip()
@@ -74,11 +97,21 @@ class SupabaseProfileListView(LoginRequiredMixin, ListView):
         if status:
             queryset = queryset.filter(status=status)
 
-        return queryset.order_by('-last_active_at')
+        # Ordering is applied by the keyset paginator
+        return queryset
+
+    def paginate_queryset(self, queryset, page_size):
+        """Keyset pages from ?after= / ?before= cursors instead of OFFSET."""
+        paginator = KeysetPaginator(queryset, page_size, field='last_active_at')
+        page = paginator.page(
+            after=self.request.GET.get('after'),
+            before=self.request.GET.get('before'),
+        )
+        return paginator, page, page.object_list, page.has_other_pages()
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['total_profiles'] = SupabaseProfile.objects.count()
+        context['total_profiles'] = table_row_estimate('profiles')
         context['current_search'] = self.request.GET.get('search', '')
         context['current_niche'] = self.request.GET.get('niche', '')
         context['current_status'] = self.request.GET.get('status', '')
@@ -246,19 +279,14 @@ class SupabaseProfileDetailView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Get any matches involving this profile
-        context['matches_as_source'] = SupabaseMatch.objects.filter(
-            profile_id=self.object.id
-        ).order_by('-harmonic_mean')[:10]
-        context['matches_as_target'] = SupabaseMatch.objects.filter(
-            suggested_profile_id=self.object.id
-        ).order_by('-harmonic_mean')[:10]
-
-        # Get user context for partnership analysis
-        primary_icp = ICP.objects.filter(
-            user=self.request.user,
-            is_primary=True
-        ).first() or ICP.objects.filter(user=self.request.user).first()
+        # Get any matches involving this profile (cached until rewritten)
+        sections = match_sections(self.object.id)
+        context['matches_as_source'] = sections['as_source']
+        context['matches_as_target'] = sections['as_target']
+
+        # Get user context for partnership analysis (ICP ordering puts
+        # the primary ICP first)
+        primary_icp = ICP.objects.filter(user=self.request.user).first()
 
         transformation = TransformationAnalysis.objects.filter(
             user=self.request.user
@@ -271,10 +299,7 @@ class SupabaseProfileDetailView(LoginRequiredMixin, DetailView):
         # Get match data for this specific partner
         supabase_match = None
         if user_supabase_profile:
-            supabase_match = SupabaseMatch.objects.filter(
-                profile_id=user_supabase_profile.id,
-                suggested_profile_id=self.object.id
-            ).first()
+            supabase_match = pair_match(user_supabase_profile.id, self.object.id)
 
         # Analyze this partner
         analyzer = PartnershipAnalyzer(
@@ -721,55 +746,71 @@ class CalculateMatchView(LoginRequiredMixin, View):
         })
 
 
-class CalculateBulkMatchView(LoginRequiredMixin, View):
-    """Calculate matches for all profiles without existing matches."""
+def _queue_match_recalculation(request, mode):
+    """
+    Queue (or reuse) a MatchRecalculationJob for the user and respond with
+    the polling progress partial for HTMX, or a redirect otherwise.
 
-    def post(self, request):
-        # Get profiles without matches
-        profiles_with_matches = Match.objects.filter(
-            user=request.user
-        ).values_list('profile_id', flat=True)
+    Only queued jobs and running jobs holding a live lease are reused; a
+    stale running job is left for the worker to reclaim.
+    """
+    from datetime import timedelta
 
-        profiles_without_matches = Profile.objects.filter(
-            user=request.user
-        ).exclude(pk__in=profiles_with_matches)
+    from django.utils import timezone
 
-        matches_created = 0
-        for profile in profiles_without_matches:
-            service = MatchScoringService(profile, request.user)
-            service.create_or_update_match()
-            matches_created += 1
+    from .tasks import MATCH_RECALC_LEASE_SECONDS
 
-        if request.htmx:
-            return HttpResponse(
-                f'<div class="p-4 bg-green-100 text-green-800 rounded">'
-                f'Successfully calculated {matches_created} new match scores.</div>'
-            )
+    lease_expired = timezone.now() - timedelta(seconds=MATCH_RECALC_LEASE_SECONDS)
+    job = MatchRecalculationJob.objects.filter(
+        Q(status=MatchRecalculationJob.Status.QUEUED)
+        | Q(status=MatchRecalculationJob.Status.RUNNING, started_at__gte=lease_expired),
+        user=request.user,
+        mode=mode,
+    ).first()
+    if job is None:
+        job = MatchRecalculationJob.objects.create(user=request.user, mode=mode)
 
-        messages.success(request, f'Calculated {matches_created} new match scores.')
-        return redirect('matching:match-list')
+    if request.htmx:
+        return render(request, 'matching/partials/match_recalc_progress.html', {'job': job})
+
+    messages.info(request, 'Match scores are being calculated in the background.')
+    return redirect('matching:match-list')
+
+
+class CalculateBulkMatchView(LoginRequiredMixin, View):
+    """Queue score calculation for all profiles without existing matches."""
+
+    def post(self, request):
+        return _queue_match_recalculation(request, MatchRecalculationJob.Mode.MISSING)
 
 
 class RecalculateAllMatchesView(LoginRequiredMixin, View):
-    """Recalculate all existing match scores."""
+    """Queue recalculation of all match scores (unchanged inputs are skipped)."""
 
     def post(self, request):
-        profiles = Profile.objects.filter(user=request.user)
+        return _queue_match_recalculation(request, MatchRecalculationJob.Mode.ALL)
 
-        matches_updated = 0
-        for profile in profiles:
-            service = MatchScoringService(profile, request.user)
-            service.create_or_update_match()
-            matches_updated += 1
 
-        if request.htmx:
-            return HttpResponse(
-                f'<div class="p-4 bg-green-100 text-green-800 rounded">'
-                f'Successfully recalculated {matches_updated} match scores.</div>'
-            )
+class MatchRecalculationStatusView(LoginRequiredMixin, View):
+    """Progress of a queued match recalculation, polled by the progress partial."""
 
-        messages.success(request, f'Recalculated {matches_updated} match scores.')
-        return redirect('matching:match-list')
+    def get(self, request, job_id):
+        job = get_object_or_404(MatchRecalculationJob, id=job_id, user=request.user)
+
+        if request.htmx:
+            return render(request, 'matching/partials/match_recalc_progress.html', {'job': job})
+
+        return JsonResponse({
+            'job_id': str(job.id),
+            'mode': job.mode,
+            'status': job.status,
+            'total': job.total_count,
+            'processed': job.processed_count,
+            'scored': job.scored_count,
+            'skipped': job.skipped_count,
+            'progress_pct': job.progress_pct,
+            'error': job.error or None,
+        })
 
 
 class ProfileDeleteView(LoginRequiredMixin, View):
@@ -1557,13 +1598,17 @@ class ApolloWebhookView(View):
 
     Apollo sends phone numbers and waterfall-enriched emails asynchronously
     via webhook after the initial API response. This view processes that
-    payload and writes the data to the matching Supabase profile.
+    payload and writes the data to the matching Supabase profiles.
+
+    All persons in a callback are resolved with one query against the
+    idx_profiles_apollo_id expression index and written back with one
+    UPDATE ... FROM (VALUES ...) statement.
     """
 
     def post(self, request, *args, **kwargs):
-        import json
         import logging
         from datetime import datetime
+        from django.db import connection as db_conn
 
         logger = logging.getLogger(__name__)
 
@@ -1575,86 +1620,98 @@ class ApolloWebhookView(View):
         # Apollo webhook payload structure varies — extract what we can
         matches = payload.get('matches', [payload]) if not isinstance(payload, list) else payload
 
-        updated = 0
+        persons = []
         for match in matches:
             person = match.get('person', match)
-            apollo_id = person.get('id')
-
-            if not apollo_id:
-                continue
-
-            # Find profile by apollo_id stored in enrichment_metadata
-            from matching.models import SupabaseProfile
-            import psycopg2
-            from psycopg2 import sql as psql
-            import os
+            if person.get('id'):
+                persons.append(person)
 
-            try:
-                conn = psycopg2.connect(os.environ['DATABASE_URL'])
-                cur = conn.cursor()
+        if not persons:
+            return JsonResponse({'status': 'ok', 'updated': 0})
 
-                # Find profile with this apollo_id
+        try:
+            with db_conn.cursor() as cur:
+                # Find profiles by apollo_id stored in enrichment_metadata
                 cur.execute(
-                    "SELECT id, phone, email, enrichment_metadata FROM profiles "
-                    "WHERE enrichment_metadata->'apollo_data'->>'apollo_id' = %s",
-                    (apollo_id,)
+                    "SELECT id, phone, email, enrichment_metadata, "
+                    "enrichment_metadata->'apollo_data'->>'apollo_id' AS apollo_id "
+                    "FROM profiles "
+                    "WHERE enrichment_metadata->'apollo_data'->>'apollo_id' = ANY(%s)",
+                    [list({p['id'] for p in persons})],
                 )
-                row = cur.fetchone()
-
-                if not row:
-                    logger.info("Apollo webhook: no profile for apollo_id %s", apollo_id)
-                    continue
-
-                profile_id, existing_phone, existing_email, existing_meta = row
-
-                set_parts = []
-                params = []
-
-                # Write phone if we don't have one
-                phone_numbers = person.get('phone_numbers') or []
-                if phone_numbers and not existing_phone:
-                    raw_phone = phone_numbers[0].get('raw_number', '')
-                    if raw_phone and len(raw_phone) >= 7:
-                        set_parts.append(psql.SQL("phone = %s"))
-                        params.append(raw_phone.strip())
-
-                # Write waterfall email if we don't have one
-                waterfall_email = person.get('email')
-                if waterfall_email and not existing_email:
-                    set_parts.append(psql.SQL("email = %s"))
-                    params.append(waterfall_email.strip())
-
-                if set_parts:
-                    # Update enrichment_metadata too
-                    meta = existing_meta or {}
-                    if isinstance(meta, str):
-                        meta = json.loads(meta)
-                    apollo_data = meta.get('apollo_data', {})
-                    apollo_data['webhook_received_at'] = datetime.now().isoformat()
-                    apollo_data['phone_numbers'] = phone_numbers
-                    meta['apollo_data'] = apollo_data
-
-                    set_parts.append(psql.SQL("enrichment_metadata = %s::jsonb"))
-                    params.append(json.dumps(meta))
-                    set_parts.append(psql.SQL("updated_at = %s"))
-                    params.append(datetime.now())
-
-                    update_q = psql.SQL("UPDATE profiles SET {} WHERE id = %s").format(
-                        psql.SQL(", ").join(set_parts)
+                profiles_by_apollo_id = {}
+                for profile_id, phone, email, meta, apollo_id in cur.fetchall():
+                    profiles_by_apollo_id.setdefault(apollo_id, {
+                        'id': profile_id, 'phone': phone, 'email': email, 'meta': meta,
+                    })
+
+                now = datetime.now()
+                updates = {}  # profile id -> row; later persons see earlier writes
+                for person in persons:
+                    profile = profiles_by_apollo_id.get(person['id'])
+                    if not profile:
+                        logger.info("Apollo webhook: no profile for apollo_id %s", person['id'])
+                        continue
+                    row = self._build_update(person, profile, now)
+                    if row:
+                        profile.update(phone=row['phone'] or profile['phone'],
+                                       email=row['email'] or profile['email'],
+                                       meta=row['meta'])
+                        updates[profile['id']] = row
+
+                if updates:
+                    rows = list(updates.values())
+                    values_sql = ", ".join(["(%s, %s, %s, %s, %s)"] * len(rows))
+                    params = []
+                    for row in rows:
+                        params.extend([str(row['id']), row['phone'], row['email'],
+                                       json.dumps(row['meta']), now])
+                    cur.execute(
+                        "UPDATE profiles AS p SET "
+                        "phone = COALESCE(data.phone, p.phone), "
+                        "email = COALESCE(data.email, p.email), "
+                        "enrichment_metadata = data.meta::jsonb, "
+                        "updated_at = data.updated_at "
+                        f"FROM (VALUES {values_sql}) AS data(id, phone, email, meta, updated_at) "
+                        "WHERE p.id = data.id::uuid",
+                        params,
                     )
-                    params.append(profile_id)
-                    cur.execute(update_q, params)
-                    conn.commit()
-                    updated += 1
+        except Exception as e:
+            logger.error("Apollo webhook error: %s", e)
+            return JsonResponse({'status': 'ok', 'updated': 0})
 
-                cur.close()
-                conn.close()
+        return JsonResponse({'status': 'ok', 'updated': len(updates)})
 
-            except Exception as e:
-                logger.error("Apollo webhook error: %s", e)
-                continue
+    @staticmethod
+    def _build_update(person, profile, now):
+        """Phone/email/metadata changes for one person, or None if nothing is new."""
+        phone = email = None
+
+        # Write phone if we don't have one
+        phone_numbers = person.get('phone_numbers') or []
+        if phone_numbers and not profile['phone']:
+            raw_phone = phone_numbers[0].get('raw_number', '')
+            if raw_phone and len(raw_phone) >= 7:
+                phone = raw_phone.strip()
+
+        # Write waterfall email if we don't have one
+        waterfall_email = person.get('email')
+        if waterfall_email and not profile['email']:
+            email = waterfall_email.strip()
+
+        if not phone and not email:
+            return None
+
+        # Update enrichment_metadata too
+        meta = profile['meta'] or {}
+        if isinstance(meta, str):
+            meta = json.loads(meta)
+        apollo_data = meta.get('apollo_data', {})
+        apollo_data['webhook_received_at'] = now.isoformat()
+        apollo_data['phone_numbers'] = phone_numbers
+        meta['apollo_data'] = apollo_data
 
-        return JsonResponse({'status': 'ok', 'updated': updated})
+        return {'id': profile['id'], 'phone': phone, 'email': email, 'meta': meta}
 
 
 # =============================================================================
@@ -1676,24 +1733,48 @@ class AnalyticsDashboardView(LoginRequiredMixin, View):
         now = timezone.now()
 
         # ---- Report cards with engagement stats ----
-        active_reports = MemberReport.objects.filter(is_active=True).order_by('-month')
+        # One grouped query per source, independent of the number of reports
+        active_reports = list(MemberReport.objects.filter(is_active=True).order_by('-month'))
+
+        page_summaries = {}
+        for es in (
+            EngagementSummary.objects
+            .filter(report__is_active=True, partner_id='')
+            .order_by('report_id', 'pk')
+        ):
+            page_summaries.setdefault(es.report_id, es)
+
+        partner_counts = {
+            row['report_id']: row
+            for row in (
+                EngagementSummary.objects
+                .filter(report__is_active=True)
+                .exclude(partner_id='')
+                .values('report_id')
+                .annotate(
+                    total=Count('id'),
+                    contacted=Count('id', filter=Q(any_contact_action=True)),
+                )
+            )
+        }
+        report_partner_counts = dict(
+            ReportPartner.objects
+            .filter(report__is_active=True)
+            .values('report_id')
+            .annotate(total=Count('id'))
+            .values_list('report_id', 'total')
+        )
+
         report_stats = []
 
         for report in active_reports:
             # Page-level summary (partner_id='')
-            page_summary = (
-                EngagementSummary.objects
-                .filter(report=report, partner_id='')
-                .first()
-            )
+            page_summary = page_summaries.get(report.id)
 
             # Partner-level summaries
-            partner_summaries = EngagementSummary.objects.filter(
-                report=report
-            ).exclude(partner_id='')
-
-            total_partners = partner_summaries.count() or ReportPartner.objects.filter(report=report).count()
-            contacted = partner_summaries.filter(any_contact_action=True).count()
+            counts = partner_counts.get(report.id, {})
+            total_partners = counts.get('total') or report_partner_counts.get(report.id, 0)
+            contacted = counts.get('contacted', 0)
 
             total_sessions = page_summary.total_sessions if page_summary else 0
             template_opens = page_summary.template_open_count if page_summary else 0
@@ -1730,10 +1811,14 @@ class AnalyticsDashboardView(LoginRequiredMixin, View):
         alerts = alerts[:10]
 
         # ---- Global funnel ----
-        all_partner_summaries = EngagementSummary.objects.exclude(partner_id='')
-        shown = all_partner_summaries.count()
-        expanded = all_partner_summaries.filter(card_expand_count__gt=0).count()
-        contacted_global = all_partner_summaries.filter(any_contact_action=True).count()
+        totals = EngagementSummary.objects.exclude(partner_id='').aggregate(
+            shown=Count('id'),
+            expanded=Count('id', filter=Q(card_expand_count__gt=0)),
+            contacted=Count('id', filter=Q(any_contact_action=True)),
+        )
+        shown = totals['shown']
+        expanded = totals['expanded']
+        contacted_global = totals['contacted']
 
         funnel = {
             'shown': shown,
@@ -2112,44 +2197,50 @@ class ContactIngestionWebhookView(View):
 
     POST /api/contacts/ingest/
     Body: {"contacts": [...], "source": "api_webhook", "ingested_by": "..."}
+
+    The payload is validated and queued as a ContactIngestionJob; the
+    process_contact_ingestion worker runs new_contact_flow. Responds 202
+    with a job id to poll at /api/contacts/ingest/<job_id>/.
     """
 
     def post(self, request, *args, **kwargs):
         import json
         from django.http import JsonResponse
-        from django.views.decorators.csrf import csrf_exempt
+        from django.urls import reverse
+        from matching.models import ContactIngestionJob
 
         try:
             data = json.loads(request.body)
         except json.JSONDecodeError:
             return JsonResponse({"error": "Invalid JSON"}, status=400)
+        if not isinstance(data, dict):
+            return JsonResponse({"error": "Expected a JSON object"}, status=400)
 
         contacts = data.get("contacts", [])
         if not contacts:
             return JsonResponse({"error": "No contacts provided"}, status=400)
-
-        source = data.get("source", "api_webhook")
-        ingested_by = data.get("ingested_by", "")
-
-        try:
-            from matching.enrichment.flows.new_contact_flow import new_contact_flow
-
-            result = new_contact_flow(
-                contacts=contacts,
-                source=source,
-                ingested_by=ingested_by,
-                source_file="",
-                skip_enrichment=False,
-                dry_run=False,
+        if not isinstance(contacts, list) or not all(isinstance(c, dict) for c in contacts):
+            return JsonResponse({"error": "contacts must be a list of objects"}, status=400)
+        missing = [i for i, c in enumerate(contacts) if not (c.get("name") or c.get("email"))]
+        if missing:
+            return JsonResponse(
+                {"error": "Each contact needs a name or email", "invalid_indexes": missing[:20]},
+                status=400,
             )
 
-            return JsonResponse({
-                "status": "ok",
-                "contacts_received": len(contacts),
-                "result": str(result),
-            })
-        except Exception as exc:
-            return JsonResponse({"error": str(exc)}, status=500)
+        job = ContactIngestionJob.objects.create(
+            source=str(data.get("source") or "api_webhook")[:50],
+            ingested_by=str(data.get("ingested_by") or "")[:200],
+            contacts=contacts,
+            contact_count=len(contacts),
+        )
+
+        return JsonResponse({
+            "status": job.status,
+            "job_id": str(job.id),
+            "contacts_received": len(contacts),
+            "status_url": reverse('matching:contact-ingest-status', args=[job.id]),
+        }, status=202)
 
     def dispatch(self, request, *args, **kwargs):
         # Skip CSRF for API endpoint
@@ -2158,6 +2249,35 @@ class ContactIngestionWebhookView(View):
         return super().dispatch(request, *args, **kwargs)
 
 
+class ContactIngestionJobStatusView(View):
+    """GET /api/contacts/ingest/<job_id>/ -- progress of a queued ingestion."""
+
+    def get(self, request, job_id):
+        from matching.models import ContactIngestionJob
+
+        job = get_object_or_404(ContactIngestionJob.objects.defer('contacts'), id=job_id)
+
+        payload = {
+            "job_id": str(job.id),
+            "status": job.status,
+            "source": job.source,
+            "contacts_received": job.contact_count,
+            "contacts_processed": job.processed_count,
+            "created_at": job.created_at.isoformat(),
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        }
+        if job.status == ContactIngestionJob.Status.QUEUED:
+            payload["jobs_ahead"] = ContactIngestionJob.objects.filter(
+                status=ContactIngestionJob.Status.QUEUED, created_at__lt=job.created_at,
+            ).count()
+        if job.result:
+            payload["result"] = job.result
+        if job.error:
+            payload["error"] = job.error
+        return JsonResponse(payload)
+
+
 # =============================================================================
 # SALES / PITCH PAGE (code-gated, no login required)
 # =============================================================================
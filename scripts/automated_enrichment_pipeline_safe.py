@@ -60,6 +60,86 @@ from matching.enrichment.retry_queue import enqueue as retry_enqueue
 
 PIPELINE_VERSION = 1
 
+# --- Batch consolidation (multi-row UPDATE ... FROM (VALUES ...)) ---
+# How each column merges the new value (data.<col>) into the existing row
+# (profiles.<col>). A NULL new value always leaves the column untouched.
+_MERGE_SQL = {
+    'overwrite': "COALESCE(data.{col}, profiles.{col})",
+    'fill_empty': (
+        "CASE WHEN data.{col} IS NOT NULL AND COALESCE(profiles.{col}, '') = '' "
+        "THEN data.{col} ELSE profiles.{col} END"
+    ),
+    'fill_zero': (
+        "CASE WHEN data.{col} IS NOT NULL AND (profiles.{col} IS NULL OR profiles.{col} = 0) "
+        "THEN data.{col} ELSE profiles.{col} END"
+    ),
+    'upgrade': (
+        "CASE WHEN data.{col} > COALESCE(profiles.{col}, 0) "
+        "THEN data.{col} ELSE profiles.{col} END"
+    ),
+    'fill_json_list': (
+        "CASE WHEN data.{col} IS NOT NULL AND (profiles.{col} IS NULL "
+        "OR profiles.{col}::text IN ('[]', 'null', '')) "
+        "THEN data.{col} ELSE profiles.{col} END"
+    ),
+    'fill_json_object': (
+        "CASE WHEN data.{col} IS NOT NULL AND (profiles.{col} IS NULL "
+        "OR profiles.{col}::text IN ('{{}}', 'null', '')) "
+        "THEN data.{col} ELSE profiles.{col} END"
+    ),
+    'merge_json_object': (
+        "CASE WHEN data.{col} IS NULL THEN profiles.{col} "
+        "ELSE COALESCE(profiles.{col}, '{{}}'::jsonb) || data.{col} END"
+    ),
+    'union_array': (
+        "CASE WHEN data.{col} IS NULL THEN profiles.{col} "
+        "ELSE (SELECT array_agg(DISTINCT t) FROM unnest("
+        "COALESCE(profiles.{col}, ARRAY[]::text[]) || data.{col}) AS t) END"
+    ),
+    'append_emails': (
+        "CASE WHEN data.{col} IS NULL THEN profiles.{col} "
+        "ELSE COALESCE(profiles.{col}, '{{}}') || ARRAY("
+        "SELECT e FROM unnest(data.{col}) WITH ORDINALITY AS s(e, n) "
+        "WHERE NOT (e = ANY(COALESCE(profiles.{col}, '{{}}'))) "
+        "AND lower(e) <> lower(COALESCE(profiles.email, '')) "
+        "ORDER BY n) END"
+    ),
+}
+
+# (column, SQL type, merge mode, merge mode in refresh mode)
+_CONSOLIDATION_COLUMNS = [
+    ('what_you_do', 'text', 'overwrite', 'overwrite'),
+    ('who_you_serve', 'text', 'overwrite', 'overwrite'),
+    ('seeking', 'text', 'overwrite', 'overwrite'),
+    ('offering', 'text', 'overwrite', 'overwrite'),
+    ('bio', 'text', 'overwrite', 'overwrite'),
+    ('social_proof', 'text', 'overwrite', 'overwrite'),
+    ('revenue_tier', 'text', 'overwrite', 'overwrite'),
+    ('jv_history', 'jsonb', 'fill_json_list', 'overwrite'),
+    ('content_platforms', 'jsonb', 'fill_json_object', 'merge_json_object'),
+    ('audience_engagement_score', 'float8', 'fill_zero', 'fill_zero'),
+    ('signature_programs', 'text', 'overwrite', 'overwrite'),
+    ('booking_link', 'text', 'overwrite', 'overwrite'),
+    ('niche', 'text', 'overwrite', 'overwrite'),
+    ('phone', 'text', 'overwrite', 'overwrite'),
+    ('current_projects', 'text', 'overwrite', 'overwrite'),
+    ('business_size', 'text', 'overwrite', 'overwrite'),
+    ('tags', 'text[]', 'overwrite', 'union_array'),
+    ('audience_type', 'text', 'overwrite', 'overwrite'),
+    ('business_focus', 'text', 'overwrite', 'overwrite'),
+    ('service_provided', 'text', 'overwrite', 'overwrite'),
+    ('company', 'text', 'fill_empty', 'fill_empty'),
+    ('list_size', 'int', 'upgrade', 'upgrade'),
+    ('social_reach', 'int', 'upgrade', 'upgrade'),
+    ('email', 'text', 'fill_empty', 'fill_empty'),
+    ('secondary_emails', 'text[]', 'append_emails', 'append_emails'),
+    ('website', 'text', 'fill_empty', 'fill_empty'),
+    ('linkedin', 'text', 'fill_empty', 'fill_empty'),
+    ('avatar_url', 'text', 'fill_empty', 'fill_empty'),
+]
+
+PG_INT4_MAX = 2147483647
+
 
 class SafeEnrichmentPipeline:
     """
@@ -905,46 +985,42 @@ class SafeEnrichmentPipeline:
         needs_apollo = needs_apollo[:remaining_credits]
         print(f"  CASCADE: Running Apollo on {len(needs_apollo)} profiles with contact gaps...")
 
-        # Process in batches of 10
-        for batch_start in range(0, len(needs_apollo), 10):
-            batch = needs_apollo[batch_start:batch_start + 10]
-
-            # Convert results to profile-like dicts for Apollo
-            profile_dicts = []
-            for r in batch:
-                profile_dicts.append({
-                    'id': r['profile_id'],
-                    'name': r.get('name', ''),
-                    'company': r.get('company', ''),
-                    'website': r.get('website', r.get('discovered_website', '')),
-                    'linkedin': r.get('linkedin', r.get('discovered_linkedin', '')),
-                    'email': r.get('email', ''),
-                })
-
-            apollo_results = service.enrich_batch(profile_dicts)
-
-            for apollo_result, original_result in zip(apollo_results, batch):
-                if apollo_result.get('error'):
-                    continue
+        # Convert results to profile-like dicts for Apollo
+        profile_dicts = []
+        for r in needs_apollo:
+            profile_dicts.append({
+                'id': r['profile_id'],
+                'name': r.get('name', ''),
+                'company': r.get('company', ''),
+                'website': r.get('website', r.get('discovered_website', '')),
+                'linkedin': r.get('linkedin', r.get('discovered_linkedin', '')),
+                'email': r.get('email', ''),
+            })
 
-                idx = result_map.get(original_result['profile_id'])
-                if idx is None:
-                    continue
+        # Cached/duplicate lookups are answered locally; the rest go out as
+        # concurrent bulk_match batches paced by Apollo's rate-limit headers.
+        apollo_results = service.enrich_many(profile_dicts)
 
-                # Merge Apollo fields into existing result
-                for field in ('email', 'linkedin', 'website', 'phone', 'company',
-                              'business_size', 'revenue_tier', 'service_provided',
-                              'niche', 'avatar_url'):
-                    if apollo_result.get(field) and not results[idx].get(field):
-                        results[idx][field] = apollo_result[field]
+        for apollo_result, original_result in zip(apollo_results, needs_apollo):
+            if apollo_result.get('error'):
+                continue
+
+            idx = result_map.get(original_result['profile_id'])
+            if idx is None:
+                continue
 
-                # Store apollo_data in result for consolidation
-                results[idx]['_apollo_data'] = apollo_result.get('_apollo_data', {})
+            # Merge Apollo fields into existing result
+            for field in ('email', 'linkedin', 'website', 'phone', 'company',
+                          'business_size', 'revenue_tier', 'service_provided',
+                          'niche', 'avatar_url'):
+                if apollo_result.get(field) and not results[idx].get(field):
+                    results[idx][field] = apollo_result[field]
 
-                self.apollo_credits_used += 1
-                self.stats['apollo_api'] += 1
+            # Store apollo_data in result for consolidation
+            results[idx]['_apollo_data'] = apollo_result.get('_apollo_data', {})
 
-            time.sleep(1)  # Rate limit between batches
+            self.apollo_credits_used += apollo_result.get('_credits_consumed', 1)
+            self.stats['apollo_api'] += 1
 
         print(f"  CASCADE: Apollo enriched {self.stats['apollo_api']} profiles")
         return results
@@ -1627,25 +1703,46 @@ class SafeEnrichmentPipeline:
 
         try:
             from matching.models import SupabaseProfile, SupabaseMatch
-            from django.db.models import Q
+            from django.db.models import F, Window
+            from django.db.models.functions import RowNumber
 
             sample_ids = profile_ids[:5]
             stale_count = 0
 
-            for pid in sample_ids:
-                try:
-                    profile = SupabaseProfile.objects.get(id=pid)
-                    matches = SupabaseMatch.objects.filter(
-                        Q(profile_id=pid) | Q(suggested_profile_id=pid)
-                    ).order_by('-harmonic_mean')[:3]
-
-                    for match in matches:
-                        if (hasattr(match, 'updated_at') and match.updated_at
-                                and profile.last_enriched_at
-                                and match.updated_at < profile.last_enriched_at):
-                            stale_count += 1
-                except Exception:
-                    pass
+            # Three queries for the whole sample instead of 2 per profile.
+            # Each side is cut to its top 3 per profile in SQL, so the check
+            # reads at most 6 matches per profile however many exist.
+            enriched_at = dict(
+                SupabaseProfile.objects.filter(id__in=sample_ids)
+                .values_list('id', 'last_enriched_at')
+            )
+            candidates = {}
+            for side in ('profile_id', 'suggested_profile_id'):
+                side_top = SupabaseMatch.objects.filter(**{f'{side}__in': sample_ids}).annotate(
+                    side_rank=Window(
+                        RowNumber(), partition_by=F(side), order_by=F('harmonic_mean').desc(),
+                    ),
+                ).filter(side_rank__lte=3)
+                for match in side_top:
+                    candidates.setdefault(getattr(match, side), {})[match.id] = match
+
+            top_matches = {
+                pid: sorted(
+                    matches.values(),
+                    key=lambda m: m.harmonic_mean if m.harmonic_mean is not None else float('inf'),
+                    reverse=True,
+                )[:3]
+                for pid, matches in candidates.items()
+                if pid in enriched_at
+            }
+
+            for pid, matches in top_matches.items():
+                last_enriched_at = enriched_at.get(pid)
+                for match in matches:
+                    if (hasattr(match, 'updated_at') and match.updated_at
+                            and last_enriched_at
+                            and match.updated_at < last_enriched_at):
+                        stale_count += 1
 
             if stale_count > 0:
                 logger.warning(
@@ -1667,6 +1764,283 @@ class SafeEnrichmentPipeline:
         except Exception as e:
             logger.warning(f"Score freshness check failed: {e}")
 
+    def _prefetch_enrichment_metadata(self, profile_ids: list) -> Dict[str, dict]:
+        """Fetch enrichment_metadata for a whole batch in one query."""
+        if not profile_ids:
+            return {}
+
+        with self._get_conn() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            try:
+                cursor.execute(
+                    "SELECT id, enrichment_metadata FROM profiles WHERE id = ANY(%s::uuid[])",
+                    [[str(pid) for pid in profile_ids]],
+                )
+                rows = cursor.fetchall()
+                conn.rollback()  # read-only; don't leave the pooled conn in a transaction
+            finally:
+                cursor.close()
+
+        metadata = {}
+        for row in rows:
+            meta = row['enrichment_metadata'] or {}
+            if isinstance(meta, str):
+                try:
+                    meta = json.loads(meta)
+                except (json.JSONDecodeError, TypeError):
+                    meta = {}
+            metadata[str(row['id'])] = meta
+        return metadata
+
+    def _build_profile_update(self, result: Dict, existing_meta: dict, scorer,
+                              enriched_at: datetime) -> Optional[Dict]:
+        """Decide field-level writes for one profile, in memory.
+
+        Returns a row for _bulk_update_profiles ({column: new value}, where
+        None leaves the column untouched), or None when nothing is written.
+        Uses source-aware merge (R4/R5) and builds field-level provenance (R1).
+        """
+        profile_id = result['profile_id']
+        values = {}
+        fields_written = []  # Track for field-level provenance (R1)
+
+        # Determine enrichment source
+        enrichment_source = 'exa_research'
+        ext_meta = result.get('_extraction_metadata') or {}
+        if ext_meta.get('source') == 'ai_research':
+            enrichment_source = 'ai_research'
+
+        def write(field, value, source=enrichment_source):
+            if self._should_write_field(field, value, existing_meta, source):
+                values[field] = value
+                fields_written.append(field)
+
+        # --- Core, standard and categorization text fields ---
+        for field in ('what_you_do', 'who_you_serve', 'seeking', 'offering',
+                      'bio', 'social_proof',
+                      'signature_programs', 'booking_link', 'niche', 'phone',
+                      'current_projects', 'business_size',
+                      'audience_type', 'business_focus', 'service_provided'):
+            value = result.get(field)
+            if value and isinstance(value, str) and value.strip():
+                if self._should_write_field(field, value, existing_meta, enrichment_source):
+                    values[field] = value.strip()
+                    fields_written.append(field)
+
+        # --- Extended signal fields (R5: source-aware, no longer always-fill-only) ---
+        revenue_tier = result.get('revenue_tier')
+        if revenue_tier:
+            write('revenue_tier', revenue_tier)
+
+        # jv_history / content_platforms: JSONB — refresh mode replaces /
+        # deep-merges (R7), otherwise fill-only (see _CONSOLIDATION_COLUMNS)
+        for field in ('jv_history', 'content_platforms'):
+            value = result.get(field)
+            if value and self._should_write_field(field, value, existing_meta, enrichment_source):
+                values[field] = json.dumps(value) if not isinstance(value, str) else value
+                fields_written.append(field)
+
+        # audience_engagement_score: handle 0.0 (M4)
+        engagement_score = result.get('audience_engagement_score')
+        if engagement_score is not None:
+            if self._should_write_field('audience_engagement_score', engagement_score, existing_meta, enrichment_source):
+                values['audience_engagement_score'] = float(engagement_score)
+                fields_written.append('audience_engagement_score')
+
+        # --- tags: text[] — union merge in refresh mode (R7) ---
+        tags_value = result.get('tags')
+        if tags_value and isinstance(tags_value, list) and len(tags_value) > 0:
+            write('tags', tags_value)
+
+        # company: source-aware, fill-only (R5)
+        company_value = result.get('company')
+        if company_value and isinstance(company_value, str) and company_value.strip():
+            if self._should_write_field('company', company_value, existing_meta, enrichment_source):
+                values['company'] = company_value.strip()
+                fields_written.append('company')
+
+        # list_size / social_reach: upgrade-only (R5)
+        for field, key in (('list_size', 'enriched_list_size'), ('social_reach', 'social_reach')):
+            raw = result.get(key)
+            if raw is None:
+                continue
+            try:
+                number = min(int(raw), PG_INT4_MAX)
+            except (ValueError, TypeError):
+                logger.warning(f"  Supabase write: invalid {field} '{raw}' for {profile_id}")
+                continue
+            if number > 0:
+                values[field] = number
+                fields_written.append(field)
+
+        # Exa-discovered email: source-aware, fill-only (R5)
+        exa_email = result.get('exa_email', '').strip()
+        if exa_email and '@' in exa_email:
+            write('email', exa_email)
+
+        # Append any secondary emails (deduped — always append-only)
+        secondary = list(dict.fromkeys(
+            e.strip() for e in (result.get('secondary_emails') or [])
+            if e and e.strip() and '@' in e
+        ))
+        if secondary:
+            values['secondary_emails'] = secondary
+
+        # Exa-discovered website/linkedin: source-aware, fill-only (R5)
+        discovered_website = result.get('discovered_website', '').strip()
+        if discovered_website:
+            write('website', discovered_website)
+
+        discovered_linkedin = result.get('discovered_linkedin', '').strip()
+        if discovered_linkedin:
+            write('linkedin', discovered_linkedin)
+
+        if not values:
+            return None
+
+        # --- Field-level provenance tracking (R1) + enrichment metadata (M3) ---
+        field_meta_update = {}
+        now_iso = datetime.now().isoformat()
+        for f in fields_written:
+            field_meta_update[f] = {
+                'source': enrichment_source,
+                'updated_at': now_iso,
+                'pipeline_version': PIPELINE_VERSION,
+            }
+
+        # avatar_url: from Apollo cascade (fill-only)
+        avatar_url = result.get('avatar_url', '').strip()
+        if avatar_url:
+            write('avatar_url', avatar_url, source='apollo')
+
+        meta_payload = {
+            'last_enrichment': 'exa_pipeline',
+            'enriched_at': enriched_at.isoformat(),
+            'tier': result.get('_tier', 0),
+            'field_meta': field_meta_update,
+        }
+
+        # Include apollo_data from cascade enrichment
+        apollo_data = result.get('_apollo_data')
+        if apollo_data:
+            meta_payload['apollo_data'] = apollo_data
+            meta_payload['last_apollo_enrichment'] = datetime.now().isoformat()
+            # Track Apollo-sourced fields in field_meta
+            for f in fields_written:
+                if f in ('email', 'phone', 'linkedin', 'website', 'company',
+                         'business_size', 'revenue_tier', 'service_provided',
+                         'niche', 'avatar_url'):
+                    # Check if this field came from Apollo (not Exa)
+                    if result.get('_apollo_data') and not result.get('_extraction_metadata'):
+                        field_meta_update[f] = {
+                            'source': 'apollo',
+                            'updated_at': now_iso,
+                            'pipeline_version': PIPELINE_VERSION,
+                        }
+
+        # -- Per-field confidence scores --
+        # Write top-level entries with {'confidence', 'source', 'enriched_at'}
+        # so calculate_profile_confidence() can compute a weighted average.
+        for f in fields_written:
+            f_source = field_meta_update.get(f, {}).get('source', enrichment_source)
+            field_conf = scorer.calculate_confidence(f, f_source, enriched_at)
+            meta_payload[f] = {
+                'confidence': round(field_conf, 4),
+                'source': f_source,
+                'enriched_at': enriched_at.isoformat(),
+            }
+
+        # Update profile_confidence from per-field weighted average
+        profile_conf = scorer.calculate_profile_confidence(meta_payload)
+
+        values.update({
+            'id': str(profile_id),
+            'last_enriched_at': enriched_at,
+            'enrichment_metadata': json.dumps(meta_payload),
+            'profile_confidence': round(profile_conf, 4) if profile_conf > 0 else None,
+        })
+        return values
+
+    def _bulk_update_profiles(self, cursor, rows: List[Dict]) -> int:
+        """Apply all profile field updates as one multi-row UPDATE.
+
+        Each column merges per _CONSOLIDATION_COLUMNS; field_meta provenance
+        is merged into enrichment_metadata server-side so other fields'
+        provenance survives. Runs inside the caller's transaction. If the
+        batch statement fails, rows are retried one by one to isolate the bad
+        ones. Returns the number of rows that could not be written.
+        """
+        if not rows:
+            return 0
+
+        columns = [(col, col_type, refresh if self.refresh_mode else normal)
+                   for col, col_type, normal, refresh in _CONSOLIDATION_COLUMNS]
+        value_names = (['id'] + [col for col, _, _ in columns]
+                       + ['last_enriched_at', 'enrichment_metadata', 'profile_confidence'])
+        casts = (['uuid'] + [col_type for _, col_type, _ in columns]
+                 + ['timestamptz', 'jsonb', 'float8'])
+        row_template = sql.SQL("({})").format(sql.SQL(", ").join(
+            sql.SQL("%s::" + cast) for cast in casts
+        ))
+
+        assignments = [
+            sql.SQL("{} = " + _MERGE_SQL[mode]).format(
+                sql.Identifier(col), col=sql.Identifier(col),
+            )
+            for col, _, mode in columns
+        ]
+        assignments += [
+            sql.SQL("last_enriched_at = data.last_enriched_at"),
+            sql.SQL("updated_at = NOW()"),
+            sql.SQL(
+                "enrichment_metadata = COALESCE(profiles.enrichment_metadata, '{{}}'::jsonb) "
+                "|| (data.enrichment_metadata - 'field_meta') "
+                "|| jsonb_build_object('field_meta', "
+                "COALESCE(profiles.enrichment_metadata->'field_meta', '{{}}'::jsonb) "
+                "|| COALESCE(data.enrichment_metadata->'field_meta', '{{}}'::jsonb))"
+            ),
+            sql.SQL("profile_confidence = COALESCE(data.profile_confidence, profiles.profile_confidence)"),
+        ]
+
+        def statement(batch):
+            query = sql.SQL(
+                "UPDATE profiles SET {assignments} "
+                "FROM (VALUES {values}) AS data({names}) "
+                "WHERE profiles.id = data.id"
+            ).format(
+                assignments=sql.SQL(", ").join(assignments),
+                values=sql.SQL(", ").join([row_template] * len(batch)),
+                names=sql.SQL(", ").join(sql.Identifier(n) for n in value_names),
+            )
+            params = [row.get(name) for row in batch for name in value_names]
+            return query, params
+
+        cursor.execute("SAVEPOINT profile_batch")
+        try:
+            cursor.execute(*statement(rows))
+            cursor.execute("RELEASE SAVEPOINT profile_batch")
+            return 0
+        except Exception as e:
+            logger.warning(f"Batch profile update failed ({len(rows)} profiles): {e}")
+            cursor.execute("ROLLBACK TO SAVEPOINT profile_batch")
+
+        # Fallback: per-profile execution to isolate failures
+        failed = 0
+        for j, row in enumerate(rows):
+            try:
+                cursor.execute(f"SAVEPOINT fallback_{j}")
+                cursor.execute(*statement([row]))
+                cursor.execute(f"RELEASE SAVEPOINT fallback_{j}")
+            except Exception as e2:
+                failed += 1
+                logger.warning(f"Profile update fallback failed: {e2}")
+                try:
+                    cursor.execute(f"ROLLBACK TO SAVEPOINT fallback_{j}")
+                except Exception:
+                    pass
+                retry_enqueue(row['id'], "db_write_failed", str(e2))
+        return failed
+
     async def consolidate_to_supabase_batch(self, results: List[Dict]):
         """
         Batch consolidate to Supabase with verification gate.
@@ -1692,6 +2066,11 @@ class SafeEnrichmentPipeline:
         profile_updates = []
         quarantined_records = []
 
+        # Current enrichment_metadata for the whole batch in one query (R4)
+        prefetched_meta = self._prefetch_enrichment_metadata(
+            [r['profile_id'] for r in results if r.get('profile_id')]
+        )
+
         for result in results:
             profile_id = result['profile_id']
             email = result.get('email')
@@ -1699,7 +2078,9 @@ class SafeEnrichmentPipeline:
             enriched_at = datetime.fromisoformat(result['enriched_at'])
 
             # Get existing enrichment_metadata for source priority checks (R4)
-            existing_meta = result.get('enrichment_metadata') or {}
+            existing_meta = prefetched_meta.get(str(profile_id))
+            if existing_meta is None:
+                existing_meta = result.get('enrichment_metadata') or {}
             if isinstance(existing_meta, str):
                 try:
                     existing_meta = json.loads(existing_meta)
@@ -1769,298 +2150,9 @@ class SafeEnrichmentPipeline:
                     ))
 
             # --- AI-researched profile fields + extended signals ---
-            set_parts = []
-            params = []
-            fields_written = []  # Track for field-level provenance (R1)
-
-            # Determine enrichment source
-            enrichment_source = 'exa_research'
-            ext_meta = result.get('_extraction_metadata') or {}
-            if ext_meta.get('source') == 'ai_research':
-                enrichment_source = 'ai_research'
-
-            # --- Core text fields (P1: sql.Identifier for column names) ---
-            for field in ('what_you_do', 'who_you_serve', 'seeking', 'offering',
-                          'bio', 'social_proof'):
-                value = result.get(field)
-                if value and isinstance(value, str) and value.strip():
-                    if self._should_write_field(field, value, existing_meta, enrichment_source):
-                        set_parts.append(
-                            sql.SQL("{} = %s").format(sql.Identifier(field))
-                        )
-                        params.append(value.strip())
-                        fields_written.append(field)
-
-            # --- Extended signal fields (R5: source-aware, no longer always-fill-only) ---
-            revenue_tier = result.get('revenue_tier')
-            if revenue_tier and self._should_write_field('revenue_tier', revenue_tier, existing_meta, enrichment_source):
-                set_parts.append(sql.SQL("{} = %s").format(sql.Identifier('revenue_tier')))
-                params.append(revenue_tier)
-                fields_written.append('revenue_tier')
-
-            # jv_history: JSONB — smart merge in refresh mode (R7)
-            jv_history = result.get('jv_history')
-            if jv_history:
-                jv_json = json.dumps(jv_history) if not isinstance(jv_history, str) else jv_history
-                if self.refresh_mode and self._should_write_field('jv_history', jv_history, existing_meta, enrichment_source):
-                    # R7: Append new JV entries, dedup by partner name (done in Python)
-                    set_parts.append(sql.SQL(
-                        "{} = %s::jsonb"
-                    ).format(sql.Identifier('jv_history')))
-                    params.append(jv_json)
-                    fields_written.append('jv_history')
-                elif self._should_write_field('jv_history', jv_history, existing_meta, enrichment_source):
-                    set_parts.append(sql.SQL(
-                        "{col} = CASE WHEN profiles.{col} IS NULL "
-                        "OR profiles.{col}::text IN ('[]', 'null', '') "
-                        "THEN %s::jsonb ELSE profiles.{col} END"
-                    ).format(col=sql.Identifier('jv_history')))
-                    params.append(jv_json)
-                    fields_written.append('jv_history')
-
-            # content_platforms: JSONB — deep merge in refresh mode (R7)
-            content_platforms = result.get('content_platforms')
-            if content_platforms:
-                cp_json = json.dumps(content_platforms) if not isinstance(content_platforms, str) else content_platforms
-                if self.refresh_mode and self._should_write_field('content_platforms', content_platforms, existing_meta, enrichment_source):
-                    # R7: Deep merge — existing keys kept, new keys added
-                    set_parts.append(sql.SQL(
-                        "{col} = COALESCE(profiles.{col}, '{{}}'::jsonb) || %s::jsonb"
-                    ).format(col=sql.Identifier('content_platforms')))
-                    params.append(cp_json)
-                    fields_written.append('content_platforms')
-                elif self._should_write_field('content_platforms', content_platforms, existing_meta, enrichment_source):
-                    set_parts.append(sql.SQL(
-                        "{col} = CASE WHEN profiles.{col} IS NULL "
-                        "OR profiles.{col}::text IN ('{{}}', 'null', '') "
-                        "THEN %s::jsonb ELSE profiles.{col} END"
-                    ).format(col=sql.Identifier('content_platforms')))
-                    params.append(cp_json)
-                    fields_written.append('content_platforms')
-
-            # audience_engagement_score: handle 0.0 (M4)
-            engagement_score = result.get('audience_engagement_score')
-            if engagement_score is not None:
-                if self._should_write_field('audience_engagement_score', engagement_score, existing_meta, enrichment_source):
-                    set_parts.append(sql.SQL(
-                        "{col} = CASE WHEN profiles.{col} IS NULL OR profiles.{col} = 0 "
-                        "THEN %s ELSE profiles.{col} END"
-                    ).format(col=sql.Identifier('audience_engagement_score')))
-                    params.append(float(engagement_score))
-                    fields_written.append('audience_engagement_score')
-
-            # --- Standard text fields ---
-            for field in ('signature_programs', 'booking_link', 'niche', 'phone',
-                          'current_projects', 'business_size'):
-                value = result.get(field)
-                if value and isinstance(value, str) and value.strip():
-                    if self._should_write_field(field, value, existing_meta, enrichment_source):
-                        set_parts.append(
-                            sql.SQL("{} = %s").format(sql.Identifier(field))
-                        )
-                        params.append(value.strip())
-                        fields_written.append(field)
-
-            # --- tags: text[] — union merge in refresh mode (R7) ---
-            tags_value = result.get('tags')
-            if tags_value and isinstance(tags_value, list) and len(tags_value) > 0:
-                if self._should_write_field('tags', tags_value, existing_meta, enrichment_source):
-                    if self.refresh_mode:
-                        # R7: Union existing + new tags, dedup
-                        set_parts.append(sql.SQL(
-                            "{col} = ("
-                            "SELECT array_agg(DISTINCT t) FROM unnest("
-                            "COALESCE(profiles.{col}, ARRAY[]::text[]) || %s::text[]"
-                            ") AS t"
-                            ")"
-                        ).format(col=sql.Identifier('tags')))
-                    else:
-                        set_parts.append(sql.SQL("{} = %s::text[]").format(sql.Identifier('tags')))
-                    params.append(tags_value)
-                    fields_written.append('tags')
-
-            # --- Categorization fields ---
-            for field in ('audience_type', 'business_focus', 'service_provided'):
-                value = result.get(field)
-                if value and isinstance(value, str) and value.strip():
-                    if self._should_write_field(field, value, existing_meta, enrichment_source):
-                        set_parts.append(
-                            sql.SQL("{} = %s").format(sql.Identifier(field))
-                        )
-                        params.append(value.strip())
-                        fields_written.append(field)
-
-            # company: source-aware (R5)
-            company_value = result.get('company')
-            if company_value and isinstance(company_value, str) and company_value.strip():
-                if self._should_write_field('company', company_value, existing_meta, enrichment_source):
-                    set_parts.append(sql.SQL(
-                        "{col} = CASE WHEN COALESCE(profiles.{col}, '') = '' "
-                        "THEN %s ELSE profiles.{col} END"
-                    ).format(col=sql.Identifier('company')))
-                    params.append(company_value.strip())
-                    fields_written.append('company')
-
-            # list_size: upgrade-only + source priority (R5)
-            PG_INT4_MAX = 2147483647
-            enriched_list_size = result.get('enriched_list_size')
-            if enriched_list_size is not None:
-                try:
-                    enriched_list_size = min(int(enriched_list_size), PG_INT4_MAX)
-                    if enriched_list_size > 0:
-                        set_parts.append(sql.SQL(
-                            "{col} = CASE WHEN %s > COALESCE(profiles.{col}, 0) "
-                            "THEN %s ELSE profiles.{col} END"
-                        ).format(col=sql.Identifier('list_size')))
-                        params.append(enriched_list_size)
-                        params.append(enriched_list_size)
-                        fields_written.append('list_size')
-                except (ValueError, TypeError):
-                    logger.warning(f"  Supabase write: invalid list_size '{enriched_list_size}' for {profile_id}")
-
-            # social_reach: upgrade-only + source priority (R5)
-            social_reach = result.get('social_reach')
-            if social_reach is not None:
-                try:
-                    social_reach = min(int(social_reach), PG_INT4_MAX)
-                    if social_reach > 0:
-                        set_parts.append(sql.SQL(
-                            "{col} = CASE WHEN %s > COALESCE(profiles.{col}, 0) "
-                            "THEN %s ELSE profiles.{col} END"
-                        ).format(col=sql.Identifier('social_reach')))
-                        params.append(social_reach)
-                        params.append(social_reach)
-                        fields_written.append('social_reach')
-                except (ValueError, TypeError):
-                    logger.warning(f"  Supabase write: invalid social_reach '{social_reach}' for {profile_id}")
-
-            # Exa-discovered email: source-aware (R5)
-            exa_email = result.get('exa_email', '').strip()
-            if exa_email and '@' in exa_email:
-                if self._should_write_field('email', exa_email, existing_meta, enrichment_source):
-                    set_parts.append(sql.SQL(
-                        "{col} = CASE WHEN COALESCE(profiles.{col}, '') = '' "
-                        "THEN %s ELSE profiles.{col} END"
-                    ).format(col=sql.Identifier('email')))
-                    params.append(exa_email)
-                    fields_written.append('email')
-
-            # Append any secondary emails (deduped — always append-only)
-            secondary = result.get('secondary_emails', [])
-            if secondary:
-                for sec_email in secondary:
-                    sec_email = sec_email.strip()
-                    if sec_email and '@' in sec_email:
-                        set_parts.append(sql.SQL(
-                            "{col} = CASE "
-                            "WHEN %s = ANY(COALESCE(profiles.{col}, '{{}}')) "
-                            "OR lower(%s) = lower(COALESCE(profiles.{email_col}, '')) "
-                            "THEN profiles.{col} "
-                            "ELSE array_append(COALESCE(profiles.{col}, '{{}}'), %s) END"
-                        ).format(
-                            col=sql.Identifier('secondary_emails'),
-                            email_col=sql.Identifier('email'),
-                        ))
-                        params.extend([sec_email, sec_email, sec_email])
-
-            # Exa-discovered website/linkedin: source-aware (R5)
-            discovered_website = result.get('discovered_website', '').strip()
-            if discovered_website:
-                if self._should_write_field('website', discovered_website, existing_meta, enrichment_source):
-                    set_parts.append(sql.SQL(
-                        "{col} = CASE WHEN COALESCE(profiles.{col}, '') = '' "
-                        "THEN %s ELSE profiles.{col} END"
-                    ).format(col=sql.Identifier('website')))
-                    params.append(discovered_website)
-                    fields_written.append('website')
-
-            discovered_linkedin = result.get('discovered_linkedin', '').strip()
-            if discovered_linkedin:
-                if self._should_write_field('linkedin', discovered_linkedin, existing_meta, enrichment_source):
-                    set_parts.append(sql.SQL(
-                        "{col} = CASE WHEN COALESCE(profiles.{col}, '') = '' "
-                        "THEN %s ELSE profiles.{col} END"
-                    ).format(col=sql.Identifier('linkedin')))
-                    params.append(discovered_linkedin)
-                    fields_written.append('linkedin')
-
-            # --- Field-level provenance tracking (R1) + enrichment metadata (M3) ---
-            if set_parts:
-                set_parts.append(sql.SQL("last_enriched_at = %s"))
-                params.append(enriched_at)
-                set_parts.append(sql.SQL("updated_at = %s"))
-                params.append(datetime.now())
-
-                # Build field_meta for provenance tracking (R1)
-                field_meta_update = {}
-                now_iso = datetime.now().isoformat()
-                for f in fields_written:
-                    field_meta_update[f] = {
-                        'source': enrichment_source,
-                        'updated_at': now_iso,
-                        'pipeline_version': PIPELINE_VERSION,
-                    }
-
-                # avatar_url: from Apollo cascade (fill-only)
-                avatar_url = result.get('avatar_url', '').strip()
-                if avatar_url and self._should_write_field('avatar_url', avatar_url, existing_meta, 'apollo'):
-                    set_parts.append(sql.SQL(
-                        "{col} = CASE WHEN COALESCE(profiles.{col}, '') = '' "
-                        "THEN %s ELSE profiles.{col} END"
-                    ).format(col=sql.Identifier('avatar_url')))
-                    params.append(avatar_url)
-                    fields_written.append('avatar_url')
-
-                meta_payload = {
-                    'last_enrichment': 'exa_pipeline',
-                    'enriched_at': enriched_at.isoformat(),
-                    'tier': result.get('_tier', 0),
-                    'field_meta': field_meta_update,
-                }
-
-                # Include apollo_data from cascade enrichment
-                apollo_data = result.get('_apollo_data')
-                if apollo_data:
-                    meta_payload['apollo_data'] = apollo_data
-                    meta_payload['last_apollo_enrichment'] = datetime.now().isoformat()
-                    # Track Apollo-sourced fields in field_meta
-                    for f in fields_written:
-                        if f in ('email', 'phone', 'linkedin', 'website', 'company',
-                                 'business_size', 'revenue_tier', 'service_provided',
-                                 'niche', 'avatar_url'):
-                            # Check if this field came from Apollo (not Exa)
-                            if result.get('_apollo_data') and not result.get('_extraction_metadata'):
-                                field_meta_update[f] = {
-                                    'source': 'apollo',
-                                    'updated_at': now_iso,
-                                    'pipeline_version': PIPELINE_VERSION,
-                                }
-
-                # -- Per-field confidence scores --
-                # Write top-level entries with {'confidence', 'source', 'enriched_at'}
-                # so calculate_profile_confidence() can compute a weighted average.
-                for f in fields_written:
-                    f_source = field_meta_update.get(f, {}).get('source', enrichment_source)
-                    field_conf = scorer.calculate_confidence(f, f_source, enriched_at)
-                    meta_payload[f] = {
-                        'confidence': round(field_conf, 4),
-                        'source': f_source,
-                        'enriched_at': enriched_at.isoformat(),
-                    }
-
-                set_parts.append(sql.SQL(
-                    "enrichment_metadata = COALESCE(enrichment_metadata, '{{}}'::jsonb) || %s::jsonb"
-                ))
-                params.append(json.dumps(meta_payload))
-
-                # Update profile_confidence from per-field weighted average
-                profile_conf = scorer.calculate_profile_confidence(meta_payload)
-                if profile_conf > 0:
-                    set_parts.append(sql.SQL("profile_confidence = %s"))
-                    params.append(round(profile_conf, 4))
-
-                params.append(profile_id)
-                profile_updates.append((set_parts, params))
+            row = self._build_profile_update(result, existing_meta, scorer, enriched_at)
+            if row:
+                profile_updates.append(row)
 
         # --- Execute writes using connection pool (P5/H1) ---
         with self._get_conn() as conn:
@@ -2090,40 +2182,8 @@ class SafeEnrichmentPipeline:
                         for eu in email_updates:
                             retry_enqueue(str(eu[-1]), "email_write_failed", str(e))
 
-                # Profile field updates — grouped batch execution
-                failed_updates = 0
-                groups = {}  # template_key → (query, [params_list])
-                for set_parts, params in profile_updates:
-                    set_clause = sql.SQL(", ").join(set_parts)
-                    template_key = tuple(repr(sp) for sp in set_parts)
-                    if template_key not in groups:
-                        query = sql.SQL("UPDATE profiles SET {} WHERE id = %s").format(set_clause)
-                        groups[template_key] = (query, [])
-                    groups[template_key][1].append(params)
-
-                for group_idx, (template_key, (query, param_list)) in enumerate(groups.items()):
-                    cursor.execute(f"SAVEPOINT batch_group_{group_idx}")
-                    try:
-                        execute_batch(cursor, query, param_list)
-                        cursor.execute(f"RELEASE SAVEPOINT batch_group_{group_idx}")
-                    except Exception as e:
-                        logger.warning(f"Batch group {group_idx} failed ({len(param_list)} profiles): {e}")
-                        cursor.execute(f"ROLLBACK TO SAVEPOINT batch_group_{group_idx}")
-                        # Fallback: per-profile execution for failed group
-                        for j, p in enumerate(param_list):
-                            try:
-                                cursor.execute(f"SAVEPOINT fallback_{group_idx}_{j}")
-                                cursor.execute(query, p)
-                                cursor.execute(f"RELEASE SAVEPOINT fallback_{group_idx}_{j}")
-                            except Exception as e2:
-                                failed_updates += 1
-                                logger.warning(f"Profile update fallback failed: {e2}")
-                                try:
-                                    cursor.execute(f"ROLLBACK TO SAVEPOINT fallback_{group_idx}_{j}")
-                                except Exception:
-                                    pass
-                                # p[-1] is the profile_id (last param in the update query)
-                                retry_enqueue(str(p[-1]), "db_write_failed", str(e2))
+                # Profile field updates — one multi-row UPDATE for the batch
+                failed_updates = self._bulk_update_profiles(cursor, profile_updates)
                 if failed_updates:
                     logger.warning(f"  {failed_updates}/{len(profile_updates)} profile updates failed")
 
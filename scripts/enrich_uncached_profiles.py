@@ -3,7 +3,9 @@
 Targeted Exa enrichment for profiles that have no research cache entry.
 
 Optimized for throughput:
-- Concurrent Exa API calls (default 5 workers)
+- Exa responses prefetched in one concurrent batch (research_profiles_batch)
+  under a shared request rate and the CostGuard budget
+- Concurrent per-profile merges (default 5 workers) served from that cache
 - Detects credit exhaustion (402) and stops early
 - Filters out non-website URLs (booking links, social profiles) before calling Exa
 - Results cached automatically; run consolidate_cache_to_supabase.py after
@@ -99,6 +101,43 @@ def get_uncached_profiles(limit: int) -> List[Dict]:
     return uncached
 
 
+def _existing_data(profile: Dict) -> Dict:
+    return {
+        k: v for k, v in profile.items()
+        if k not in ('id',) and v is not None
+    }
+
+
+def prefetch_exa_responses(profiles: List[Dict], max_workers: int) -> List[Dict]:
+    """Fetch Exa responses for all profiles in one concurrent batch.
+
+    The batch shares one request rate limit and the CostGuard budget; its
+    responses land in the Exa response cache, so enrich_single() merges
+    each profile without paying again. Returns the profiles the budget
+    covered.
+    """
+    from matching.enrichment.exa_research import ExaResearchService
+
+    service = ExaResearchService()
+    if not service.available:
+        return profiles
+
+    results = service.research_profiles_batch(
+        [
+            {
+                'name': p['name'],
+                'website': p.get('website') or '',
+                'linkedin': p.get('linkedin') or '',
+                'company': p.get('company') or '',
+                'existing_data': _existing_data(p),
+            }
+            for p in profiles
+        ],
+        max_workers=max_workers,
+    )
+    return [p for p, result in zip(profiles, results) if result is not None]
+
+
 def enrich_single(profile: Dict, dry_run: bool = False) -> Optional[Dict]:
     """Run Exa enrichment for a single profile. Thread-safe."""
     if _credits_exhausted.is_set():
@@ -109,10 +148,7 @@ def enrich_single(profile: Dict, dry_run: bool = False) -> Optional[Dict]:
     linkedin = profile.get('linkedin') or ''
     company = profile.get('company') or ''
 
-    existing_data = {
-        k: v for k, v in profile.items()
-        if k not in ('id',) and v is not None
-    }
+    existing_data = _existing_data(profile)
 
     if dry_run:
         return {'name': name, '_dry_run': True}
@@ -194,6 +230,13 @@ def main():
     start_time = time.time()
     processed = [0]  # mutable counter for thread-safe increment
 
+    if not args.dry_run:
+        covered = prefetch_exa_responses(profiles, args.concurrency)
+        stats['skipped'] += len(profiles) - len(covered)
+        if len(covered) < len(profiles):
+            print(f"Budget covers {len(covered)} of {len(profiles)} profiles; skipping the rest")
+        profiles = covered
+
     def process_and_track(profile):
         """Process one profile and return (profile, result)."""
         result = enrich_single(profile, args.dry_run)
@@ -251,7 +294,7 @@ def main():
     print(f"Total in queue:   {stats['total']}")
     print(f"Enriched:         {stats['enriched']}")
     print(f"Failed/no result: {stats['failed']}")
-    print(f"Skipped (credits):{stats['skipped']}")
+    print(f"Skipped (credits/budget):{stats['skipped']}")
     print(f"Runtime:          {elapsed/60:.1f} min")
     print(f"Estimated cost:   ~${stats['enriched'] * 0.02:.2f}")
     if _credits_exhausted.is_set():
@@ -7,10 +7,11 @@ Tier 1-2 gaps (missing email, phone, or linkedin). Leverages existing
 profile data (name, company, website, linkedin) for better match rates.
 
 Rate-limit aware:
-- Batches of 10 (Apollo max per request)
-- 1-second delay between batches (stays under 200/min paid limit)
+- Batches of 10 (Apollo max per request), pipelined up to --concurrency at
+  once and throttled down as X-RateLimit-Remaining runs low
+- Cached and duplicate lookups are answered without spending credits
 - Daily limit tracking with auto-pause at 2,000 calls/day
-- Exponential backoff on 429 responses
+- Retry after Retry-After on 429 responses
 
 Usage:
     python scripts/run_apollo_sweep.py --limit 10 --dry-run    # Preview
@@ -239,10 +240,11 @@ def run_sweep(
     limit: int = None,
     max_credits: int = 4000,
     dry_run: bool = False,
-    batch_delay: float = 1.0,
+    batch_delay: float = 0.0,
     webhook_url: str = None,
     bare_only: bool = False,
     tier: str = None,
+    max_concurrency: int = 4,
 ):
     """Run Apollo enrichment sweep."""
     tier_label = f" (TIER {tier})" if tier else ""
@@ -255,7 +257,7 @@ def run_sweep(
     profiles = get_profiles_with_gaps(limit, bare_only=bare_only, tier=tier)
     print(f"Profiles with contact gaps: {len(profiles)}")
     print(f"Max credits: {max_credits}")
-    print(f"Batch delay: {batch_delay}s")
+    print(f"Batch delay: {batch_delay}s  Concurrency: {max_concurrency}")
     print(f"Dry run: {dry_run}")
     print()
 
@@ -272,61 +274,41 @@ def run_sweep(
 
     all_results = []
     credits_used = 0
-    batch_size = 10
     start_time = time.time()
 
-    for batch_start in range(0, len(profiles), batch_size):
-        batch = profiles[batch_start:batch_start + batch_size]
-        batch_num = (batch_start // batch_size) + 1
-        total_batches = (len(profiles) + batch_size - 1) // batch_size
-
-        # Check credit limit
-        if credits_used + len(batch) > max_credits:
-            remaining = max_credits - credits_used
-            if remaining <= 0:
-                print(f"\n  Credit limit reached ({credits_used}/{max_credits}). Stopping.")
-                break
-            batch = batch[:remaining]
-
-        print(f"  Batch {batch_num}/{total_batches} ({len(batch)} profiles): ", end='', flush=True)
-
-        if dry_run:
-            for p in batch:
-                service_result = {
-                    '_profile_id': p['id'],
-                    '_apollo_data': {'dry_run': True},
-                }
-                needs = service.needs_enrichment(p)
-                all_results.append(service_result)
-            print(f"[dry-run] {len(batch)} profiles would be queried")
-        else:
-            # Convert psycopg2 RealDictRow to plain dict
-            batch_dicts = [dict(p) for p in batch]
-            results = service.enrich_batch(batch_dicts)
-
-            # Handle rate limiting
-            for r in results:
-                if r.get('error') == 'rate_limited':
-                    retry_after = r.get('retry_after', 60)
-                    print(f"\n  Rate limited! Waiting {retry_after}s...")
-                    time.sleep(retry_after)
-                    # Retry this batch
-                    results = service.enrich_batch(batch_dicts)
-                    break
-
+    if len(profiles) > max_credits:
+        print(f"  Credit limit: querying first {max_credits} of {len(profiles)} profiles")
+        profiles = profiles[:max_credits]
+
+    if dry_run:
+        for p in profiles:
+            all_results.append({
+                '_profile_id': p['id'],
+                '_apollo_data': {'dry_run': True},
+            })
+        print(f"  [dry-run] {len(profiles)} profiles would be queried")
+    else:
+        def report_batch(results):
             emails_found = sum(1 for r in results if r.get('email'))
             phones_found = sum(1 for r in results if r.get('phone'))
             linkedin_found = sum(1 for r in results if r.get('linkedin'))
             errors = sum(1 for r in results if r.get('error'))
-
-            print(f"email:{emails_found} phone:{phones_found} linkedin:{linkedin_found} err:{errors}")
-
-            all_results.extend(results)
-            credits_used += len(batch)
-
-        # Rate limit delay between batches
-        if batch_start + batch_size < len(profiles):
-            time.sleep(batch_delay)
+            print(f"  Batch ({len(results)} profiles): email:{emails_found} phone:{phones_found} "
+                  f"linkedin:{linkedin_found} err:{errors}", flush=True)
+
+        # Cached and duplicate lookups are answered without credits; the rest
+        # are pipelined in bulk_match batches within Apollo's rate limit.
+        # Convert psycopg2 RealDictRow to plain dict
+        all_results = service.enrich_many(
+            [dict(p) for p in profiles],
+            max_concurrency=max_concurrency,
+            min_batch_interval=batch_delay,
+            on_batch=report_batch,
+        )
+        run_stats = service.last_run_stats
+        credits_used = run_stats['lookups_sent']
+        print(f"  Cache hits: {run_stats['cache_hits']}  Coalesced: {run_stats['coalesced']}  "
+              f"Lookups sent: {run_stats['lookups_sent']}")
 
     elapsed = time.time() - start_time
 
@@ -339,6 +321,7 @@ def run_sweep(
         'timestamp': datetime.now().isoformat(),
         'profiles_queried': len(profiles),
         'credits_used': credits_used,
+        'cache_hits': service.last_run_stats.get('cache_hits', 0),
         'runtime_seconds': round(elapsed, 1),
         'results': {
             'updated': write_stats['updated'],
@@ -384,8 +367,10 @@ def main():
                         help='Maximum Apollo credits to use (default: 4000)')
     parser.add_argument('--dry-run', action='store_true',
                         help='Show what would be done without API calls')
-    parser.add_argument('--batch-delay', type=float, default=1.0,
-                        help='Delay between batches in seconds (default: 1.0)')
+    parser.add_argument('--batch-delay', type=float, default=0.0,
+                        help='Minimum delay between batch dispatches in seconds (default: 0.0)')
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='Maximum bulk_match requests in flight (default: 4)')
     parser.add_argument('--webhook-url', default=None,
                         help='Webhook URL for async phone/email delivery')
     parser.add_argument('--bare-only', action='store_true',
@@ -403,6 +388,7 @@ def main():
         webhook_url=args.webhook_url,
         bare_only=args.bare_only,
         tier=args.tier,
+        max_concurrency=args.concurrency,
     )
 
 
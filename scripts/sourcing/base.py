@@ -181,7 +181,7 @@ class BaseScraper(ABC):
     def fetch_page(self, url: str, timeout: int = 30) -> Optional[str]:
         """Fetch URL with rate limiting. Returns HTML or None."""
         if self.rate_limiter:
-            self.rate_limiter.wait(self.SOURCE_NAME, self.REQUESTS_PER_MINUTE)
+            self.rate_limiter.wait(self.SOURCE_NAME, self.REQUESTS_PER_MINUTE, url=url)
         try:
             resp = self.session.get(url, timeout=timeout)
             resp.raise_for_status()
@@ -195,7 +195,7 @@ class BaseScraper(ABC):
     def fetch_json(self, url: str, timeout: int = 30) -> Optional[dict]:
         """Fetch URL expecting JSON response."""
         if self.rate_limiter:
-            self.rate_limiter.wait(self.SOURCE_NAME, self.REQUESTS_PER_MINUTE)
+            self.rate_limiter.wait(self.SOURCE_NAME, self.REQUESTS_PER_MINUTE, url=url)
         try:
             resp = self.session.get(url, timeout=timeout)
             resp.raise_for_status()
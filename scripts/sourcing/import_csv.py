@@ -11,6 +11,10 @@ Usage:
     python3 scripts/sourcing/import_csv.py --dry-run          # Preview with sample mapping
     python3 scripts/sourcing/import_csv.py --file other.csv   # Specific file
     python3 scripts/sourcing/import_csv.py --skip-existing    # Skip dedup (fresh DB)
+
+Rows are COPY-staged into a temp table and deduplicated against existing
+profiles with indexed SQL joins (migration 0030), so memory use does not
+depend on the size of the profiles table.
 """
 
 from __future__ import annotations
@@ -36,7 +40,8 @@ except ImportError:
     pass
 
 import psycopg2
-import psycopg2.extras
+
+from matching.pg_copy import copy_rows
 
 
 # ---------------------------------------------------------------------------
@@ -44,7 +49,6 @@ import psycopg2.extras
 # ---------------------------------------------------------------------------
 
 DEFAULT_FILE = project_root / "Filling Database" / "MASTER_JV_CLEAN.csv"
-BATCH_SIZE = 500
 
 # Unique batch ID for this import run — enables targeted rollback via:
 #   DELETE FROM profiles WHERE enrichment_metadata->>'batch_id' = '<this value>';
@@ -321,102 +325,173 @@ def _build_content_platforms(row: dict) -> dict | None:
 
 
 # ---------------------------------------------------------------------------
-# Dedup against existing DB (O(1) via hash indexes)
+# Staging + dedup against existing DB (COPY, then indexed SQL joins)
 # ---------------------------------------------------------------------------
 
-def load_existing_profiles(cur) -> dict:
-    cur.execute("SELECT id, name, email, website, linkedin, company FROM profiles")
-    return {str(r["id"]): r for r in cur.fetchall()}
-
-
-def build_dedup_index(existing: dict) -> tuple[dict, dict, dict]:
-    email_idx: dict[str, str] = {}
-    name_co_idx: dict[str, str] = {}
-    name_domain_idx: dict[str, str] = {}
-
-    for pid, row in existing.items():
-        email = (row.get("email") or "").strip().lower()
-        if email and "@" in email:
-            email_idx[email] = pid
-
-        name = (row.get("name") or "").strip().lower()
-        company = (row.get("company") or "").strip().upper()
-        if name and company:
-            name_co_idx[f"{name}|{company}"] = pid
-
-        domain = _normalize_domain(row.get("website"))
-        if name and domain and domain not in PLATFORM_DOMAINS:
-            name_domain_idx[f"{name}|{domain}"] = pid
-
-    return email_idx, name_co_idx, name_domain_idx
+STAGE_TABLE = "_csv_import_stage"
+DUPS_TABLE = "_csv_import_dups"
 
+STAGE_COLUMNS = (
+    "row_num", "name", "email", "company", "website", "linkedin",
+    "phone", "bio", "tags", "niche", "business_focus",
+    "revenue_tier", "jv_history", "content_platforms", "enrichment_metadata",
+    "email_key", "name_key", "company_key", "domain_key",
+)
 
-def find_duplicate(contact: dict, email_idx: dict, name_co_idx: dict,
-                   name_domain_idx: dict) -> str | None:
-    email = (contact.get("email") or "").strip().lower()
-    if email and email in email_idx:
-        return email_idx[email]
+# SQL counterpart of _normalize_domain() for existing profiles' websites
+SQL_DOMAIN = (
+    r"regexp_replace(lower(btrim(p.website)), "
+    r"'^([a-z][a-z0-9+.-]*://)?(www\.)?([^/:?#]*).*$', '\3')"
+)
 
-    name = (contact.get("name") or "").strip().lower()
-    company = (contact.get("company") or "").strip().upper()
-    if name and company and f"{name}|{company}" in name_co_idx:
-        return name_co_idx[f"{name}|{company}"]
 
-    domain = _normalize_domain(contact.get("website"))
-    if name and domain and domain not in PLATFORM_DOMAINS:
-        key = f"{name}|{domain}"
-        if key in name_domain_idx:
-            return name_domain_idx[key]
+def _dedup_keys(mapped: dict) -> tuple:
+    """(email_key, name_key, company_key, domain_key) for a mapped row."""
+    email = (mapped.get("email") or "").strip().lower()
+    name = (mapped.get("name") or "").strip().lower()
+    company = (mapped.get("company") or "").strip().upper()
+    domain = _normalize_domain(mapped.get("website"))
+    return (
+        email if email and "@" in email else None,
+        name,
+        company or None,
+        domain if domain and domain not in PLATFORM_DOMAINS else None,
+    )
+
+
+def _stage_row(row_num: int, mapped: dict) -> tuple:
+    """Staging tuple (STAGE_COLUMNS order) for a mapped row."""
+    return (
+        row_num,
+        mapped["name"], mapped["email"], mapped["company"], mapped["website"],
+        mapped["linkedin"], mapped["phone"], mapped["bio"], mapped["tags"],
+        mapped["niche"], mapped["business_focus"], mapped["revenue_tier"],
+        mapped["jv_history"], mapped["content_platforms"], mapped["enrichment_metadata"],
+        *_dedup_keys(mapped),
+    )
+
+
+CREATE_STAGE_SQL = f"""
+CREATE TEMP TABLE {STAGE_TABLE} (
+    row_num integer, name text, email text, company text, website text,
+    linkedin text, phone text, bio text, tags jsonb, niche text,
+    business_focus text, revenue_tier text, jv_history jsonb,
+    content_platforms jsonb, enrichment_metadata jsonb,
+    email_key text, name_key text, company_key text, domain_key text
+) ON COMMIT DROP
+"""
 
-    return None
+# Rows matching an existing profile on email, name+company or name+domain.
+# The name probes use idx_profiles_name_key, the email probe idx_profiles_email_lower.
+EXISTING_DUPS_SQL = f"""
+CREATE TEMP TABLE {DUPS_TABLE} ON COMMIT DROP AS
+SELECT s.row_num
+FROM {STAGE_TABLE} s
+WHERE (s.email_key IS NOT NULL AND EXISTS (
+          SELECT 1 FROM profiles p WHERE lower(p.email) = s.email_key))
+   OR ((s.company_key IS NOT NULL OR s.domain_key IS NOT NULL) AND EXISTS (
+          SELECT 1 FROM profiles p
+          WHERE lower(btrim(p.name)) = s.name_key
+            AND (upper(btrim(p.company)) = s.company_key
+                 OR {SQL_DOMAIN} = s.domain_key)))
+"""
 
+# Rows left after EXISTING_DUPS_SQL, in file order, for in_file_duplicates()
+IN_FILE_CANDIDATES_SQL = f"""
+SELECT s.row_num, s.email_key, s.name_key, s.company_key, s.domain_key
+FROM {STAGE_TABLE} s
+WHERE NOT EXISTS (SELECT 1 FROM {DUPS_TABLE} d WHERE d.row_num = s.row_num)
+ORDER BY s.row_num
+"""
 
-# ---------------------------------------------------------------------------
-# Main import
-# ---------------------------------------------------------------------------
 
-INSERT_SQL = """
+def in_file_duplicates(rows) -> list[int]:
+    """row_nums of rows sharing a key with an earlier row that is imported.
+
+    rows are (row_num, email_key, name_key, company_key, domain_key) in file
+    order. Only rows that survive are indexed, so a row matching nothing but
+    an earlier in-file duplicate is still imported. The sequential pass
+    holds the file's keys only, never the profiles table.
+    """
+    emails: set[str] = set()
+    name_companies: set[tuple] = set()
+    name_domains: set[tuple] = set()
+    duplicates = []
+    for row_num, email_key, name_key, company_key, domain_key in rows:
+        if (
+            (email_key and email_key in emails)
+            or (company_key and (name_key, company_key) in name_companies)
+            or (domain_key and (name_key, domain_key) in name_domains)
+        ):
+            duplicates.append(row_num)
+            continue
+        if email_key:
+            emails.add(email_key)
+        if company_key:
+            name_companies.add((name_key, company_key))
+        if domain_key:
+            name_domains.add((name_key, domain_key))
+    return duplicates
+
+
+INSERT_SQL = f"""
 INSERT INTO profiles (
     id, name, email, company, website, linkedin,
     phone, bio, tags, niche, business_focus,
     revenue_tier, jv_history, content_platforms,
     enrichment_metadata, status, created_at, updated_at
-) VALUES %s
+)
+SELECT gen_random_uuid(), s.name, s.email, s.company, s.website, s.linkedin,
+       s.phone, s.bio,
+       CASE WHEN s.tags IS NULL THEN NULL
+            ELSE ARRAY(SELECT jsonb_array_elements_text(s.tags)) END,
+       s.niche, s.business_focus,
+       s.revenue_tier, s.jv_history, s.content_platforms,
+       s.enrichment_metadata, 'Pending', NOW(), NOW()
+FROM {STAGE_TABLE} s
+WHERE NOT EXISTS (SELECT 1 FROM {DUPS_TABLE} d WHERE d.row_num = s.row_num)
+ORDER BY s.row_num
 """
 
-INSERT_TEMPLATE = (
-    "(%(id)s, %(name)s, %(email)s, %(company)s, %(website)s, %(linkedin)s, "
-    "%(phone)s, %(bio)s, %(tags)s, %(niche)s, %(business_focus)s, "
-    "%(revenue_tier)s, %(jv_history)s, %(content_platforms)s, "
-    "%(enrichment_metadata)s, 'Pending', NOW(), NOW())"
-)
 
+# ---------------------------------------------------------------------------
+# Main import
+# ---------------------------------------------------------------------------
 
-def _row_to_insert_dict(mapped: dict) -> dict:
-    """Convert mapped row to a dict for execute_values template."""
-    return {
-        "id": str(uuid.uuid4()),
-        "name": mapped["name"],
-        "email": mapped["email"],
-        "company": mapped["company"],
-        "website": mapped["website"],
-        "linkedin": mapped["linkedin"],
-        "phone": mapped["phone"],
-        "bio": mapped["bio"],
-        "tags": mapped["tags"],
-        "niche": mapped["niche"],
-        "business_focus": mapped["business_focus"],
-        "revenue_tier": mapped["revenue_tier"],
-        "jv_history": psycopg2.extras.Json(mapped["jv_history"]) if mapped["jv_history"] else None,
-        "content_platforms": psycopg2.extras.Json(mapped["content_platforms"]) if mapped["content_platforms"] else None,
-        "enrichment_metadata": psycopg2.extras.Json(mapped["enrichment_metadata"]),
-    }
+def _mapped_rows(reader, total: int, t0: float):
+    """Yield staging tuples for importable CSV rows, printing progress."""
+    import time
+
+    for processed, row in enumerate(reader, start=1):
+        if processed % 10000 == 0:
+            elapsed = time.time() - t0
+            rate = processed / elapsed if elapsed > 0 else 0
+            eta = (total - processed) / rate if rate > 0 else 0
+            print(
+                f"    {processed:>9,}/{total:,} staged | "
+                f"{rate:.0f} rows/s | ETA {eta/60:.1f}min"
+            )
+
+        name = (row.get("name") or "").strip()
+        if not name or len(name) < 2 or name.lower() in ("none", "null"):
+            continue
+
+        mapped = map_to_supabase(row)
+        if not mapped.get("name"):
+            continue
+
+        yield _stage_row(processed, mapped)
 
 
 def import_csv(csv_path: Path, dry_run: bool = False,
                skip_existing: bool = False) -> tuple[int, int]:
-    """Import CSV into Supabase using batch inserts. Returns (total, new_count)."""
+    """Import CSV into Supabase via a COPY-staged, set-based merge. Returns (total, new_count).
 
+    Rows are streamed into a temp staging table, duplicates (against existing
+    profiles and earlier rows of the file) are found with indexed SQL joins,
+    and new rows are added with one INSERT ... SELECT. Memory stays bounded
+    by the COPY chunk size regardless of file or table size.
+    """
     # Count total lines for progress (without loading all into memory)
     print(f"  Counting rows in {csv_path.name}...")
     with open(csv_path, "r", encoding="utf-8") as f:
@@ -436,92 +511,42 @@ def import_csv(csv_path: Path, dry_run: bool = False,
         print(f"\n  [DRY RUN] Would import {total:,} contacts")
         return total, 0
 
-    conn = get_connection()
-    conn.autocommit = False
-    cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-
-    email_idx, name_co_idx, name_domain_idx = {}, {}, {}
-    if not skip_existing:
-        print("  Loading existing profiles for dedup...")
-        existing = load_existing_profiles(cur)
-        print(f"  Found {len(existing):,} existing profiles")
-        email_idx, name_co_idx, name_domain_idx = build_dedup_index(existing)
-    else:
-        print("  Skipping dedup (--skip-existing)")
-
-    new_count = 0
-    dup_count = 0
-    batch: list[dict] = []
-    processed = 0
     import time
     t0 = time.time()
 
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = (row.get("name") or "").strip()
-            if not name or len(name) < 2 or name.lower() in ("none", "null"):
-                processed += 1
-                continue
-
-            mapped = map_to_supabase(row)
-            if not mapped.get("name"):
-                processed += 1
-                continue
-
-            if not skip_existing:
-                dup_id = find_duplicate(mapped, email_idx, name_co_idx, name_domain_idx)
-                if dup_id is not None:
-                    dup_count += 1
-                    processed += 1
-                    continue
-
-            insert_dict = _row_to_insert_dict(mapped)
-            batch.append(insert_dict)
-
-            # Index for within-batch dedup
-            if not skip_existing:
-                email = (mapped["email"] or "").strip().lower()
-                if email and "@" in email:
-                    email_idx[email] = insert_dict["id"]
-                nm = (mapped["name"] or "").strip().lower()
-                co = (mapped["company"] or "").strip().upper()
-                if nm and co:
-                    name_co_idx[f"{nm}|{co}"] = insert_dict["id"]
-                domain = _normalize_domain(mapped["website"])
-                if nm and domain and domain not in PLATFORM_DOMAINS:
-                    name_domain_idx[f"{nm}|{domain}"] = insert_dict["id"]
-
-            new_count += 1
-            processed += 1
-
-            # Flush batch
-            if len(batch) >= BATCH_SIZE:
-                psycopg2.extras.execute_values(
-                    cur, INSERT_SQL, batch, template=INSERT_TEMPLATE, page_size=BATCH_SIZE
-                )
-                conn.commit()
-                batch = []
-
-                if processed % 10000 == 0:
-                    elapsed = time.time() - t0
-                    rate = processed / elapsed if elapsed > 0 else 0
-                    eta = (total - processed) / rate if rate > 0 else 0
-                    print(
-                        f"    {processed:>9,}/{total:,} | "
-                        f"new={new_count:,} dups={dup_count:,} | "
-                        f"{rate:.0f} rows/s | ETA {eta/60:.1f}min"
-                    )
-
-    # Final partial batch
-    if batch:
-        psycopg2.extras.execute_values(
-            cur, INSERT_SQL, batch, template=INSERT_TEMPLATE, page_size=BATCH_SIZE
-        )
+    conn = get_connection()
+    conn.autocommit = False
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_STAGE_SQL)
+            with open(csv_path, "r", encoding="utf-8") as f:
+                staged = copy_rows(cur, STAGE_TABLE, STAGE_COLUMNS,
+                                   _mapped_rows(csv.DictReader(f), total, t0))
+            print(f"  Staged {staged:,} importable rows")
+
+            cur.execute(f"CREATE INDEX ON {STAGE_TABLE} (email_key)")
+            cur.execute(f"CREATE INDEX ON {STAGE_TABLE} (name_key)")
+            cur.execute(f"ANALYZE {STAGE_TABLE}")
+
+            if skip_existing:
+                print("  Skipping dedup (--skip-existing)")
+                cur.execute(f"CREATE TEMP TABLE {DUPS_TABLE} (row_num integer) ON COMMIT DROP")
+            else:
+                print("  Deduplicating against existing profiles...")
+                cur.execute(EXISTING_DUPS_SQL)
+                cur.execute(f"CREATE INDEX ON {DUPS_TABLE} (row_num)")
+                cur.execute(IN_FILE_CANDIDATES_SQL)
+                duplicates = in_file_duplicates(cur.fetchall())
+                copy_rows(cur, DUPS_TABLE, ("row_num",), ((n,) for n in duplicates))
+
+            cur.execute(INSERT_SQL)
+            new_count = cur.rowcount
         conn.commit()
-
-    cur.close()
-    conn.close()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
     elapsed = time.time() - t0
     print(f"  Completed in {elapsed/60:.1f} minutes ({elapsed:.0f}s)")
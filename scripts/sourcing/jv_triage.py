@@ -12,18 +12,25 @@ Usage:
     python3 scripts/sourcing/jv_triage.py --tier A,B        # Only process specific tiers
     python3 scripts/sourcing/jv_triage.py --top 100         # Show top N after scoring
     python3 scripts/sourcing/jv_triage.py --skip-delete     # Score all but keep Tier X
+    python3 scripts/sourcing/jv_triage.py --pipelined       # Multi-process reader/workers/COPY writer
+    python3 scripts/sourcing/jv_triage.py --pipelined --workers 8 --resume   # Continue after a crash
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
+import heapq
+import io
 import json
+import multiprocessing
 import os
+import queue
 import re
 import sys
+import threading
 import time
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -538,6 +545,29 @@ ARCHIVE_COLS = [
 ]
 
 
+def _archive_row(row: dict) -> dict:
+    """Flatten one Tier X profile into an ARCHIVE_COLS row."""
+    meta = row.get("enrichment_metadata") or {}
+    return {
+        "id": str(row["id"]),
+        "name": row.get("name") or "",
+        "email": row.get("email") or "",
+        "company": row.get("company") or "",
+        "website": row.get("website") or "",
+        "linkedin": row.get("linkedin") or "",
+        "phone": row.get("phone") or "",
+        "bio": (row.get("bio") or "")[:500],  # Truncate for archive size
+        "tags": json.dumps(row.get("tags") or []),
+        "niche": row.get("niche") or "",
+        "revenue_tier": row.get("revenue_tier") or "",
+        "jv_history": json.dumps(row.get("jv_history") or []),
+        "content_platforms": json.dumps(row.get("content_platforms") or {}),
+        "list_size": row.get("list_size") or 0,
+        "original_source": meta.get("original_source", ""),
+        "exclusion_reason": f"Tier X source: {meta.get('original_source', 'unknown')}",
+    }
+
+
 def archive_tier_x(tier_x_rows: list[dict]):
     """Write Tier X profiles to local CSV for safekeeping."""
     ARCHIVE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -546,30 +576,24 @@ def archive_tier_x(tier_x_rows: list[dict]):
         writer = csv.DictWriter(f, fieldnames=ARCHIVE_COLS, extrasaction="ignore")
         writer.writeheader()
         for row in tier_x_rows:
-            meta = row.get("enrichment_metadata") or {}
-            archive_row = {
-                "id": str(row["id"]),
-                "name": row.get("name") or "",
-                "email": row.get("email") or "",
-                "company": row.get("company") or "",
-                "website": row.get("website") or "",
-                "linkedin": row.get("linkedin") or "",
-                "phone": row.get("phone") or "",
-                "bio": (row.get("bio") or "")[:500],  # Truncate for archive size
-                "tags": json.dumps(row.get("tags") or []),
-                "niche": row.get("niche") or "",
-                "revenue_tier": row.get("revenue_tier") or "",
-                "jv_history": json.dumps(row.get("jv_history") or []),
-                "content_platforms": json.dumps(row.get("content_platforms") or {}),
-                "list_size": row.get("list_size") or 0,
-                "original_source": meta.get("original_source", ""),
-                "exclusion_reason": f"Tier X source: {meta.get('original_source', 'unknown')}",
-            }
-            writer.writerow(archive_row)
+            writer.writerow(_archive_row(row))
 
     print(f"  Archived {len(tier_x_rows):,} Tier X profiles → {ARCHIVE_PATH}")
 
 
+def append_tier_x_archive(tier_x_rows: list[dict]):
+    """Append Tier X profiles to the archive CSV (pipelined mode, chunk by chunk)."""
+    ARCHIVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_header = not ARCHIVE_PATH.exists() or ARCHIVE_PATH.stat().st_size == 0
+
+    with open(ARCHIVE_PATH, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=ARCHIVE_COLS, extrasaction="ignore")
+        if write_header:
+            writer.writeheader()
+        for row in tier_x_rows:
+            writer.writerow(_archive_row(row))
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # REPORT
 # ═══════════════════════════════════════════════════════════════════════════
@@ -635,6 +659,344 @@ def print_report(tier_counts: Counter, score_buckets: Counter,
     print("\n" + "=" * 64)
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# PIPELINED MODE — reader thread → worker processes → COPY writer
+# ═══════════════════════════════════════════════════════════════════════════
+#
+# The reader pages through profiles by primary key (keyset pagination, so a
+# crash can resume after the last committed id), a process pool runs
+# classify_tier/score_jv_readiness, and the writer COPYs each chunk's results
+# into a temp stage table followed by a single UPDATE ... FROM. At most
+# ~2 x workers chunks are buffered at any time, so memory stays bounded
+# regardless of table size. Progress is checkpointed to CHECKPOINT_PATH after
+# every committed chunk (kept apart from the scraper state dir, which
+# show_status reports as sources).
+
+CHECKPOINT_PATH = project_root / "Filling Database" / "jv_triage_checkpoint.json"
+STAGE_TABLE = "_jv_triage_stage"
+
+
+def load_checkpoint() -> dict:
+    """Load the pipelined-mode checkpoint, or {} if there is none."""
+    if CHECKPOINT_PATH.exists():
+        return json.loads(CHECKPOINT_PATH.read_text())
+    return {}
+
+
+def save_checkpoint(state: dict) -> None:
+    """Atomically replace the pipelined-mode checkpoint."""
+    CHECKPOINT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    state["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    tmp = CHECKPOINT_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    tmp.replace(CHECKPOINT_PATH)
+
+
+def _score_bucket(score: float) -> str:
+    if score >= 90:
+        return "90-100"
+    if score >= 70:
+        return "70-89"
+    if score >= 50:
+        return "50-69"
+    if score >= 30:
+        return "30-49"
+    return "0-29"
+
+
+def triage_chunk(rows: list[dict], tier_filter: set | None = None, top_n: int = 50) -> dict:
+    """Classify + score one chunk of profiles. Runs inside a worker process.
+
+    Returns the chunk's updates and report aggregates. Full rows are only
+    sent back for Tier X (needed for the archive) to keep IPC small.
+    """
+    updates = []            # (id, tier, score) for the COPY stage
+    tier_x_rows = []
+    tier_counts = Counter()
+    score_buckets = Counter()
+    tier_x_source_counts = Counter()
+    source_tier_counts = defaultdict(Counter)
+    top = []                # min-heap of (score, seq, entry)
+
+    for seq, row in enumerate(rows):
+        tier = classify_tier(row)
+        if tier_filter and tier not in tier_filter:
+            continue
+
+        meta = row.get("enrichment_metadata") or {}
+        source = meta.get("original_source", "unknown")
+        tier_counts[tier] += 1
+        source_tier_counts[source][tier] += 1
+
+        if tier == "X":
+            tier_x_source_counts[source] += 1
+            tier_x_rows.append(row)
+            continue
+
+        score = score_jv_readiness(row, tier)
+        updates.append((str(row["id"]), tier, score))
+        score_buckets[_score_bucket(score)] += 1
+
+        entry = {"name": row.get("name"), "source": source, "tier": tier, "score": score}
+        if len(top) < top_n:
+            heapq.heappush(top, (score, seq, entry))
+        elif top_n and score > top[0][0]:
+            heapq.heapreplace(top, (score, seq, entry))
+
+    return {
+        "last_id": str(rows[-1]["id"]) if rows else None,
+        "scanned": len(rows),
+        "updates": updates,
+        "tier_x_rows": tier_x_rows,
+        "tier_counts": tier_counts,
+        "score_buckets": score_buckets,
+        "tier_x_source_counts": tier_x_source_counts,
+        "source_tier_counts": source_tier_counts,
+        "top": [entry for _, _, entry in top],
+    }
+
+
+class TriageTotals:
+    """Running report aggregates, serialisable into the checkpoint."""
+
+    def __init__(self, top_n: int = 50):
+        self.top_n = top_n
+        self.scanned = 0
+        self.updated = 0
+        self.deleted = 0
+        self.tier_counts = Counter()
+        self.score_buckets = Counter()
+        self.tier_x_source_counts = Counter()
+        self.source_tier_counts = defaultdict(Counter)
+        self.top_profiles: list[dict] = []
+
+    def merge(self, result: dict) -> None:
+        self.scanned += result["scanned"]
+        self.tier_counts.update(result["tier_counts"])
+        self.score_buckets.update(result["score_buckets"])
+        self.tier_x_source_counts.update(result["tier_x_source_counts"])
+        for source, counts in result["source_tier_counts"].items():
+            self.source_tier_counts[source].update(counts)
+        self.top_profiles = heapq.nlargest(
+            self.top_n, self.top_profiles + result["top"], key=lambda x: x["score"],
+        )
+
+    def to_state(self) -> dict:
+        return {
+            "scanned": self.scanned,
+            "updated": self.updated,
+            "deleted": self.deleted,
+            "tier_counts": dict(self.tier_counts),
+            "score_buckets": dict(self.score_buckets),
+            "tier_x_source_counts": dict(self.tier_x_source_counts),
+            "source_tier_counts": {s: dict(c) for s, c in self.source_tier_counts.items()},
+            "top_profiles": self.top_profiles,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict | None, top_n: int = 50) -> "TriageTotals":
+        totals = cls(top_n=top_n)
+        if not state:
+            return totals
+        totals.scanned = state.get("scanned", 0)
+        totals.updated = state.get("updated", 0)
+        totals.deleted = state.get("deleted", 0)
+        totals.tier_counts = Counter(state.get("tier_counts", {}))
+        totals.score_buckets = Counter(state.get("score_buckets", {}))
+        totals.tier_x_source_counts = Counter(state.get("tier_x_source_counts", {}))
+        for source, counts in state.get("source_tier_counts", {}).items():
+            totals.source_tier_counts[source] = Counter(counts)
+        totals.top_profiles = state.get("top_profiles", [])[:top_n]
+        return totals
+
+
+def read_chunks(db_url: str, after_id: str | None, chunk_size: int, out_q: queue.Queue):
+    """Reader thread: page through profiles by id and feed the bounded queue.
+
+    Puts None when the table is exhausted, or the exception if reading fails.
+    """
+    try:
+        conn = psycopg2.connect(db_url)
+        conn.set_session(readonly=True, autocommit=True)
+        try:
+            with conn.cursor() as cur:
+                while True:
+                    if after_id:
+                        cur.execute(
+                            f"SELECT {FETCH_COLS} FROM profiles "
+                            "WHERE id > %s::uuid ORDER BY id LIMIT %s",
+                            (after_id, chunk_size),
+                        )
+                    else:
+                        cur.execute(
+                            f"SELECT {FETCH_COLS} FROM profiles ORDER BY id LIMIT %s",
+                            (chunk_size,),
+                        )
+                    rows = [dict(zip(COL_NAMES, db_row)) for db_row in cur.fetchall()]
+                    if not rows:
+                        break
+                    after_id = str(rows[-1]["id"])
+                    out_q.put(rows)
+        finally:
+            conn.close()
+    except Exception as exc:
+        out_q.put(exc)
+        return
+    out_q.put(None)
+
+
+def copy_update_tiers(conn, updates: list[tuple]) -> int:
+    """COPY (id, tier, score) rows into the stage table, then one UPDATE ... FROM.
+
+    Does not commit — the caller commits together with the checkpoint chunk.
+    """
+    if not updates:
+        return 0
+    buf = io.StringIO()
+    for uid, tier, score in updates:
+        buf.write(f"{uid}\t{tier}\t{score}\n")
+    buf.seek(0)
+
+    with conn.cursor() as cur:
+        cur.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} "
+            "(id uuid, tier VARCHAR(1), score FLOAT) ON COMMIT DELETE ROWS"
+        )
+        cur.copy_expert(f"COPY {STAGE_TABLE} (id, tier, score) FROM STDIN", buf)
+        cur.execute(
+            f"UPDATE profiles SET jv_tier = s.tier, jv_readiness_score = s.score "
+            f"FROM {STAGE_TABLE} s WHERE profiles.id = s.id"
+        )
+        return cur.rowcount
+
+
+def write_chunk(conn, result: dict, archive_x: bool, delete_x: bool) -> tuple[int, int]:
+    """Apply one triaged chunk: tier UPDATE, Tier X archive, DELETE, commit.
+
+    Tier X rows are appended to the archive before they are deleted, as in
+    the sequential path. If the archive write fails the transaction is
+    rolled back and nothing is deleted. A crash after the archive write but
+    before the commit re-archives the chunk on resume, so the archive may
+    hold duplicate ids (the duplicate lines are identical).
+
+    Returns:
+        (profiles updated, profiles deleted)
+    """
+    tier_x_rows = result["tier_x_rows"]
+    deleted = 0
+    try:
+        updated = copy_update_tiers(conn, result["updates"])
+        if archive_x and tier_x_rows:
+            append_tier_x_archive(tier_x_rows)
+        if delete_x and tier_x_rows:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM profiles WHERE id = ANY(%s::uuid[])",
+                    ([str(r["id"]) for r in tier_x_rows],),
+                )
+                deleted = cur.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return updated, deleted
+
+
+def run_pipelined(args, tier_filter: set | None):
+    """Triage the whole table with a reader thread, worker pool and COPY writer."""
+    db_url = os.environ.get("DATABASE_URL", "")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.")
+        sys.exit(1)
+
+    state = load_checkpoint() if args.resume else {}
+    if state.get("done"):
+        print("Checkpoint is already complete — nothing to resume.")
+    totals = TriageTotals.from_state(state.get("totals"), top_n=args.top)
+    after_id = state.get("last_id")
+
+    write = not args.dry_run
+    archive_x = write and not tier_filter
+    delete_x = archive_x and not args.skip_delete
+    if args.resume and after_id:
+        print(f"Resuming after id {after_id} ({totals.scanned:,} profiles already processed).")
+    elif archive_x and ARCHIVE_PATH.exists():
+        ARCHIVE_PATH.unlink()  # Fresh run: archive is rebuilt chunk by chunk
+
+    workers = args.workers or os.cpu_count() or 1
+    max_inflight = workers * 2
+    print(f"\nPipelined triage: {workers} workers, chunks of {args.chunk_size:,}")
+
+    conn = get_connection() if write else None
+    chunks: queue.Queue = queue.Queue(maxsize=max_inflight)
+    t0 = time.time()
+    last_report = totals.scanned
+
+    def write_result(result: dict):
+        nonlocal last_report
+        if write:
+            updated, deleted = write_chunk(conn, result, archive_x, delete_x)
+            totals.updated += updated
+            totals.deleted += deleted
+        totals.merge(result)
+        if write:
+            save_checkpoint({
+                "last_id": result["last_id"],
+                "totals": totals.to_state(),
+            })
+        if totals.scanned - last_report >= 100000:
+            last_report = totals.scanned
+            elapsed = time.time() - t0
+            print(f"  Processed {totals.scanned:,} profiles ({totals.scanned / elapsed:,.0f}/sec)...")
+
+    if not state.get("done"):
+        # Pool first so workers fork before the reader thread exists
+        with multiprocessing.Pool(workers) as pool:
+            reader = threading.Thread(
+                target=read_chunks, args=(db_url, after_id, args.chunk_size, chunks), daemon=True,
+            )
+            reader.start()
+            inflight = deque()
+            while True:
+                rows = chunks.get()
+                if isinstance(rows, Exception):
+                    raise rows
+                if rows is None:
+                    break
+                inflight.append(pool.apply_async(triage_chunk, (rows, tier_filter, args.top)))
+                if len(inflight) >= max_inflight:
+                    write_result(inflight.popleft().get())
+            while inflight:
+                write_result(inflight.popleft().get())
+            reader.join()
+
+        if write:
+            save_checkpoint({
+                "last_id": None,
+                "done": True,
+                "totals": totals.to_state(),
+            })
+
+    elapsed = time.time() - t0
+    print(f"  Classified {totals.scanned:,} profiles in {elapsed:.1f}s")
+    if write:
+        print(f"  Updated {totals.updated:,} profiles | Deleted {totals.deleted:,} Tier X profiles")
+
+    print_report(
+        totals.tier_counts, totals.score_buckets, totals.source_tier_counts,
+        sorted(totals.top_profiles, key=lambda x: x["score"], reverse=True),
+        totals.tier_x_source_counts, sum(totals.tier_counts.values()),
+        dry_run=args.dry_run,
+    )
+
+    if conn is not None:
+        conn.close()
+    if args.dry_run:
+        print("\n[DRY RUN] No changes written to database.\n")
+    else:
+        print("\nDone.")
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════════
@@ -645,6 +1007,11 @@ def main():
     parser.add_argument("--tier", type=str, default=None, help="Only process specific tiers (comma-separated, e.g. A,B)")
     parser.add_argument("--top", type=int, default=50, help="Show top N profiles (default 50)")
     parser.add_argument("--skip-delete", action="store_true", help="Score all tiers but don't delete Tier X")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="Multi-process triage with COPY writes and checkpointing")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --pipelined (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows per chunk for --pipelined (default 5000)")
+    parser.add_argument("--resume", action="store_true", help="Resume --pipelined from the last checkpoint")
     args = parser.parse_args()
 
     tier_filter = None
@@ -652,6 +1019,10 @@ def main():
         tier_filter = set(t.strip().upper() for t in args.tier.split(","))
         print(f"Filtering to tiers: {', '.join(sorted(tier_filter))}")
 
+    if args.pipelined or args.resume:
+        run_pipelined(args, tier_filter)
+        return
+
     conn = get_connection()
     print(f"Connected to database.")
 
@@ -699,17 +1070,7 @@ def main():
             score = score_jv_readiness(row, tier)
             updates.append((tier, score, str(row["id"])))
 
-            # Score bucket
-            if score >= 90:
-                score_buckets["90-100"] += 1
-            elif score >= 70:
-                score_buckets["70-89"] += 1
-            elif score >= 50:
-                score_buckets["50-69"] += 1
-            elif score >= 30:
-                score_buckets["30-49"] += 1
-            else:
-                score_buckets["0-29"] += 1
+            score_buckets[_score_bucket(score)] += 1
 
             # Track top N
             entry = {"name": row.get("name"), "source": source,
@@ -1,32 +1,122 @@
 """
 Rate limiter with robots.txt respect for polite scraping.
+
+Each source (and optionally each host) gets its own token bucket. Callers
+reserve a token under the bucket's lock and sleep *outside* it, so a slow
+source never blocks the other sources sharing the limiter.
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
 import threading
+from typing import Optional
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 
-class RateLimiter:
-    """Per-source rate limiting with robots.txt caching."""
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations.
+
+    reserve() always succeeds immediately and returns how long the caller
+    must wait before using its token. Tokens may go negative, which queues
+    concurrent callers fairly without anyone holding the lock while sleeping.
+    """
 
-    def __init__(self):
+    def __init__(self, rate_per_sec: float, capacity: float = 1.0):
+        self.rate = rate_per_sec
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
         self._lock = threading.Lock()
-        self._last_request: dict[str, float] = {}
+
+    def set_rate(self, rate_per_sec: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate_per_sec
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Take one token; return seconds to wait before using it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Per-source rate limiting with robots.txt caching.
+
+    Args:
+        burst: Requests a source may make back-to-back before pacing kicks
+            in. The default of 1 keeps strict max_rpm spacing.
+        host_limits: Optional {host: max_rpm} caps shared by every source
+            that fetches from that host (pass url= to wait()).
+    """
+
+    def __init__(self, burst: int = 1, host_limits: Optional[dict[str, int]] = None):
+        self.burst = burst
+        self._lock = threading.Lock()  # guards bucket creation only
+        self._buckets: dict[str, TokenBucket] = {}
+        self._host_buckets: dict[str, TokenBucket] = {}
+        self._host_limits = {h.lower(): rpm for h, rpm in (host_limits or {}).items()}
         self._robots_cache: dict[str, RobotFileParser] = {}
 
-    def wait(self, source: str, max_rpm: int) -> None:
-        """Block until safe to make the next request for this source."""
-        min_interval = 60.0 / max_rpm
+    def set_host_limit(self, host: str, max_rpm: int) -> None:
+        """Cap requests to a host across all sources."""
+        host = host.lower()
+        with self._lock:
+            self._host_limits[host] = max_rpm
+            self._host_buckets.pop(host, None)
+
+    def _source_bucket(self, source: str, max_rpm: int) -> TokenBucket:
+        rate = max_rpm / 60.0
         with self._lock:
-            last = self._last_request.get(source, 0)
-            elapsed = time.time() - last
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-            self._last_request[source] = time.time()
+            bucket = self._buckets.get(source)
+            if bucket is None:
+                bucket = self._buckets[source] = TokenBucket(rate, self.burst)
+                return bucket
+        if bucket.rate != rate:
+            bucket.set_rate(rate)
+        return bucket
+
+    def _host_bucket(self, url: Optional[str]) -> Optional[TokenBucket]:
+        if not url or not self._host_limits:
+            return None
+        host = (urlparse(url).hostname or "").lower().removeprefix("www.")
+        max_rpm = self._host_limits.get(host)
+        if not max_rpm:
+            return None
+        with self._lock:
+            bucket = self._host_buckets.get(host)
+            if bucket is None:
+                bucket = self._host_buckets[host] = TokenBucket(max_rpm / 60.0, self.burst)
+            return bucket
+
+    def _delay(self, source: str, max_rpm: int, url: Optional[str]) -> float:
+        delay = self._source_bucket(source, max_rpm).reserve()
+        host_bucket = self._host_bucket(url)
+        if host_bucket is not None:
+            delay = max(delay, host_bucket.reserve())
+        return delay
+
+    def wait(self, source: str, max_rpm: int, url: Optional[str] = None) -> None:
+        """Block until safe to make the next request for this source (and host)."""
+        delay = self._delay(source, max_rpm, url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, source: str, max_rpm: int, url: Optional[str] = None) -> None:
+        """asyncio variant of wait()."""
+        delay = self._delay(source, max_rpm, url)
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     def is_allowed(self, url: str) -> bool:
         """Check robots.txt for the given URL. Returns True if allowed."""
@@ -9,6 +9,8 @@ Usage:
     python -m scripts.sourcing.runner --status
     python -m scripts.sourcing.runner --list
     python -m scripts.sourcing.runner --reset speakerhub
+    python -m scripts.sourcing.runner --tier 2 --parallel 8       # Run a tier's sources concurrently
+    python -m scripts.sourcing.runner --all --parallel 16         # Full sweep, one thread per source
 """
 
 from __future__ import annotations
@@ -19,6 +21,8 @@ import json
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -44,6 +48,10 @@ from scripts.sourcing.rate_limiter import RateLimiter
 
 SCRAPER_REGISTRY: dict[str, type[BaseScraper]] = {}
 
+# Ingestion dedup is check-then-insert, so concurrent sources must not flush
+# at the same time or a person listed in two directories is inserted twice.
+_INGEST_LOCK = threading.Lock()
+
 # Scrapers excluded from gap-driven sourcing (low JV-relevant data yield)
 GAP_SOURCING_EXCLUDED = {
     "bbb_sitemap", "irs_business_leagues", "census_business",
@@ -101,13 +109,18 @@ def run_source(
     dry_run: bool = False,
     export_csv: Optional[str] = None,
     resume: bool = True,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> dict:
-    """Run a single source scraper, batching contacts into ingestion."""
+    """Run a single source scraper, batching contacts into ingestion.
+
+    Pass a shared rate_limiter when running several sources concurrently;
+    its buckets are per source so sources never wait on each other.
+    """
     if source_name not in SCRAPER_REGISTRY:
         print(f"ERROR: Unknown source '{source_name}'. Available: {list(SCRAPER_REGISTRY.keys())}")
         return {}
 
-    rate_limiter = RateLimiter()
+    rate_limiter = rate_limiter or RateLimiter()
     tracker = ProgressTracker()
     checkpoint = tracker.load(source_name) if resume else {}
 
@@ -134,6 +147,10 @@ def run_source(
     csv_writer = None
     csv_file = None
     if export_csv:
+        # Concurrent sources write to their own file so rows never interleave
+        if threading.current_thread() is not threading.main_thread():
+            root, ext = os.path.splitext(export_csv)
+            export_csv = f"{root}_{source_name}{ext or '.csv'}"
         csv_file = open(export_csv, "a", newline="", encoding="utf-8")
         csv_writer = csv.DictWriter(
             csv_file,
@@ -220,6 +237,46 @@ def run_source(
     return scraper.stats
 
 
+def run_sources_concurrently(
+    sources: list[str],
+    max_workers: int = 8,
+    **run_kwargs,
+) -> dict[str, dict]:
+    """Run many sources at once, one thread per source.
+
+    Scrapers are I/O bound and each one is paced by its own token bucket in
+    a shared RateLimiter, so a sweep takes roughly as long as its slowest
+    source. Each source still checkpoints independently via ProgressTracker;
+    ingestion batches are serialised by _INGEST_LOCK in _flush_batch.
+    Returns {source: stats}; a source that raises is logged and reported
+    with an "exception" entry instead of aborting the sweep.
+    """
+    if not run_kwargs.get("dry_run"):
+        # Configure Django once up front rather than racing inside _flush_batch
+        import django
+        django.setup()
+
+    rate_limiter = RateLimiter()
+    results: dict[str, dict] = {}
+    print(f"Running {len(sources)} sources concurrently ({max_workers} workers)")
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="source") as pool:
+        futures = {
+            pool.submit(run_source, source, rate_limiter=rate_limiter, **run_kwargs): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                results[source] = future.result()
+            except Exception as exc:
+                logging.exception("Source %s failed: %s", source, exc)
+                results[source] = {"exception": str(exc)}
+            print(f"  [{len(results)}/{len(sources)}] {source} finished")
+
+    return results
+
+
 def _flush_batch(batch: list[dict], source_name: str, dry_run: bool) -> int:
     """Send a batch to contact ingestion. Returns count of new profiles."""
     if dry_run:
@@ -235,11 +292,12 @@ def _flush_batch(batch: list[dict], source_name: str, dry_run: bool) -> int:
         django.setup()
         from matching.enrichment.flows.contact_ingestion import ingest_contacts
 
-        results = ingest_contacts(
-            contacts=batch,
-            source=f"scraper_{source_name}",
-            source_file=f"sourcing/{source_name}",
-        )
+        with _INGEST_LOCK:
+            results = ingest_contacts(
+                contacts=batch,
+                source=f"scraper_{source_name}",
+                source_file=f"sourcing/{source_name}",
+            )
         return sum(1 for r in results if r.is_new)
     except Exception as exc:
         logging.error("Ingestion failed: %s", exc)
@@ -364,6 +422,9 @@ def main() -> None:
     parser.add_argument("--fill-gaps", type=int, nargs="?", const=5, metavar="N",
                         help="Auto-select top N scrapers based on market gap analysis (default: 5)")
     parser.add_argument("--reset", help="Reset checkpoint for a source")
+    parser.add_argument("--all", action="store_true", help="Run every registered scraper")
+    parser.add_argument("--parallel", type=int, default=0, metavar="N",
+                        help="Run multi-source sweeps with N concurrent sources (0 = sequential)")
     parser.add_argument("--verbose", "-v", action="store_true")
 
     args = parser.parse_args()
@@ -383,6 +444,27 @@ def main() -> None:
         print(f"Reset checkpoint for: {args.reset}")
         return
 
+    run_kwargs = dict(
+        batch_size=args.batch_size,
+        max_pages=args.max_pages,
+        max_contacts=args.max_contacts,
+        dry_run=args.dry_run,
+        export_csv=args.export_csv,
+        resume=not args.no_resume,
+    )
+
+    def run_many(sources: list[str]) -> None:
+        if args.parallel:
+            run_sources_concurrently(sources, max_workers=args.parallel, **run_kwargs)
+        else:
+            for source in sources:
+                run_source(source, **run_kwargs)
+        show_status()
+
+    if args.all:
+        run_many(sorted(SCRAPER_REGISTRY))
+        return
+
     if args.tier:
         sources = TIERS.get(args.tier, [])
         available = [s for s in sources if s in SCRAPER_REGISTRY]
@@ -391,17 +473,7 @@ def main() -> None:
             print(f"Expected: {sources}")
             return
         print(f"Running tier {args.tier} scrapers: {available}")
-        for source in available:
-            run_source(
-                source,
-                batch_size=args.batch_size,
-                max_pages=args.max_pages,
-                max_contacts=args.max_contacts,
-                dry_run=args.dry_run,
-                export_csv=args.export_csv,
-                resume=not args.no_resume,
-            )
-        show_status()
+        run_many(available)
         return
 
     if args.fill_gaps is not None:
@@ -438,29 +510,11 @@ def main() -> None:
             print("[DRY RUN] Would run the above scrapers.")
             return
 
-        for name, score, filled in priorities:
-            run_source(
-                name,
-                batch_size=args.batch_size,
-                max_pages=args.max_pages,
-                max_contacts=args.max_contacts,
-                dry_run=args.dry_run,
-                export_csv=args.export_csv,
-                resume=not args.no_resume,
-            )
-        show_status()
+        run_many([name for name, _, _ in priorities])
         return
 
     if args.source:
-        run_source(
-            args.source,
-            batch_size=args.batch_size,
-            max_pages=args.max_pages,
-            max_contacts=args.max_contacts,
-            dry_run=args.dry_run,
-            export_csv=args.export_csv,
-            resume=not args.no_resume,
-        )
+        run_source(args.source, **run_kwargs)
         return
 
     parser.print_help()